@@ -11,6 +11,17 @@
 # *****************************************************************************
 
 from CCDD import CcddScriptDataAccessHandler
+import os
+import sys
+
+# Add the script's folder to the module search path so that the shared script
+# support package can be imported
+scriptPath = os.path.dirname(os.path.abspath(ccdd.getScriptName()))
+
+if scriptPath not in sys.path:
+    sys.path.insert(0, scriptPath)
+
+from ccddlib import output
 
 #* Functions ******************************************************************
 
@@ -22,17 +33,17 @@ from CCDD import CcddScriptDataAccessHandler
 #******************************************************************************
 def outputFileCreationInfo(file):
     # Add the build information and header to the output file
-    ccdd.writeToFileLn(file, "/* Created : " + ccdd.getDateAndTime() + "\n   User    : " + ccdd.getUser() + "\n   Project : " + ccdd.getProject() + "\n   Script  : " + ccdd.getScriptName())
+    file.writeLn("/* Created : " + ccdd.getDateAndTime() + "\n   User    : " + ccdd.getUser() + "\n   Project : " + ccdd.getProject() + "\n   Script  : " + ccdd.getScriptName())
 
     # Check if any table is associated with the script
     if ccdd.getTableNumRows() != 0:
-        ccdd.writeToFileLn(file, "   Table(s): " + (",\n             ").join(sorted(ccdd.getTableNames())))
+        file.writeLn("   Table(s): " + (",\n             ").join(sorted(ccdd.getTableNames())))
 
     # Check if any groups is associated with the script
     if len(ccdd.getAssociatedGroupNames()) != 0:
-        ccdd.writeToFileLn(file, "   Group(s): " + (",\n             ").join(sorted(ccdd.getAssociatedGroupNames())))
+        file.writeLn("   Group(s): " + (",\n             ").join(sorted(ccdd.getAssociatedGroupNames())))
 
-    ccdd.writeToFileLn(file, "*/")
+    file.writeLn("*/")
 #* End functions **************************************************************
 
 #* Main ***********************************************************************
@@ -51,199 +62,203 @@ COMMAND1 = "0xC000"
 COMMAND2 = "0x0001"
 COMMAND3 = "0x0000"
 
-# Create the message definition table *****************************************
-
-# Define the initial minimum column widths
-columnWidth = [10, 6, 6, 6]
-
-# Create the message definition table output file name
-mdtFileName = ccdd.getOutputPath() + "sch_def_msgtbl.c"
-
-# Open the message definition table output file
-mdtFile = ccdd.openOutputFile(mdtFileName)
-
-# Check if the output file successfully opened
-if mdtFile is not None:
-    # Add a header to the output file
-    outputFileCreationInfo(mdtFile)
-
-    # Get the message definition table entries
-    mdtEntries = ccdd.getApplicationMessageDefinitionTable()
-
-      # Check if there are any entries in the message definition table
-    if len(mdtEntries) > 0:
-        # Adjust the minimum column widths
-        columnWidth[ENABLE_STATUS] = ccdd.getLongestString(mdtEntries, columnWidth[ENABLE_STATUS])
-
-    # Build the format string for an occupied entry
-    formatUsed = "    { {%-" + str(columnWidth[ENABLE_STATUS]) + "s, %" + str(columnWidth[TYPE]) + "s, %" + str(columnWidth[FREQUENCY]) + "s, %" + str(columnWidth[REMAINDER]) + "s} } \n"
-
-    # Write the include statements for the standard cFE and HK headers
-    ccdd.writeToFileLn(mdtFile, "")
-    ccdd.writeToFileLn(mdtFile, "/*")
-    ccdd.writeToFileLn(mdtFile, "** Include Files")
-    ccdd.writeToFileLn(mdtFile, "*/")
-    ccdd.writeToFileLn(mdtFile, "#include \"cfe.h\"")
-    ccdd.writeToFileLn(mdtFile, "#include \"cfe_tbl_filedef.h\"")
-    ccdd.writeToFileLn(mdtFile, "#include \"sch_platform_cfg.h\"")
-    ccdd.writeToFileLn(mdtFile, "#include \"sch_msgdefs.h\"")
-    ccdd.writeToFileLn(mdtFile, "#include \"sch_tbldefs.h\"")
-    ccdd.writeToFileLn(mdtFile, "")
-
-    # Get the array containing the application names
-    applicationNames = ccdd.getApplicationNames()
-
-    # Step through each application name
-    for name in range(len(applicationNames)):
-        # Write the application message ID include statements for the header
-        # files
-        ccdd.writeToFileLn(mdtFile, "#include \"" + applicationNames[name].lower() + "_msgids.h\"")
-
-    ccdd.writeToFileLn(mdtFile, "")
-    ccdd.writeToFileLn(mdtFile, "/*")
-    ccdd.writeToFileLn(mdtFile, "** Default message table data")
-    ccdd.writeToFileLn(mdtFile, "*/")
-    ccdd.writeToFileLn(mdtFile, "SCH_MessageEntry_t SCH_DefaultMessageTable[SCH_MAX_MESSAGES] =")
-    ccdd.writeToFileLn(mdtFile, "{")
-    ccdd.writeToFileLn(mdtFile, "    /*---------------------------------------------------------*/")
-    ccdd.writeToFileLn(mdtFile, "    /* DO NOT USE -- Entry #0 reserved for \"unused\" command ID */")
-    ccdd.writeToFile(mdtFile, "    /*---------------------------------------------------------*/")
-
-    # Step through each message definition table entry
-    for row in range(len(mdtEntries)):
-        ccdd.writeToFileLn(mdtFile, "\n    /* command ID #%d */" % row)
-        comma = ","
-
-        # Check if this is the last entry
-        if row == len(mdtEntries) - 1:
-            comma = " "
-
-        # Check if this slot is occupied
-        if mdtEntries[row] != "SCH_UNUSED_MID":
-            ccdd.writeToFileFormat(mdtFile,
-                                   formatUsed,
-                                   mdtEntries[row],
-                                   COMMAND1,
-                                   COMMAND2,
-                                   COMMAND3,
-                                   comma)
-        # The slot is not used
-        else:
-            ccdd.writeToFileFormat(mdtFile, "    { { %s } } \n", mdtEntries[row])
-
-    # Terminate the message definition table statement
-    ccdd.writeToFileLn(mdtFile, "};")
-
-    # Close the output file
-    ccdd.closeFile(mdtFile)
-# The output file cannot be opened
-else:
-    # Display an error dialog
-    ccdd.showErrorDialog("<html><b>Error opening output file '</b>" + mdtFileName + "<b>'")
-
-# Create the schedule definition table output file name
-sdtFileName = ccdd.getOutputPath() + "sch_def_schtbl.c"
-
-# Create the schedule definition table ****************************************
-
-# Open the schedule definition table output file
-sdtFile = ccdd.openOutputFile(sdtFileName)
-
-# Check if the output file successfully opened
-if sdtFile is not None:
-    # Add a header to the output files
-    outputFileCreationInfo(sdtFile)
-
-    # Write the include statements for the standard cFE and HK headers
-    ccdd.writeToFileLn(sdtFile, "")
-    ccdd.writeToFileLn(sdtFile, "/*")
-    ccdd.writeToFileLn(sdtFile, "** Include Files")
-    ccdd.writeToFileLn(sdtFile, "*/")
-    ccdd.writeToFileLn(sdtFile, "#include \"cfe.h\"")
-    ccdd.writeToFileLn(sdtFile, "#include \"cfe_tbl_filedef.h\"")
-    ccdd.writeToFileLn(sdtFile, "#include \"sch_platform_cfg.h\"")
-    ccdd.writeToFileLn(sdtFile, "#include \"sch_msgdefs.h\"")
-    ccdd.writeToFileLn(sdtFile, "#include \"sch_tbldefs.h\"")
-    ccdd.writeToFileLn(sdtFile, "")
-
-    # Get the list of defined parameters
-    defines = ccdd.getApplicationScheduleDefinitionTableDefines()
-
-    # Build the format for the defined parameters
-    formatDefines = "#define %-" + str(columnWidth[ENABLE_STATUS]) + "s  %s \n"
-
-    # Step through each defined parameter
-    for define in range(len(defines)):
-        # Output the define statement to the file
-        ccdd.writeToFileFormat(sdtFile, formatDefines, defines[define][0], defines[define][1])
-
-    # Output the table file header
-    ccdd.writeToFileLn(sdtFile, "")
-    ccdd.writeToFileLn(sdtFile, "/*")
-    ccdd.writeToFileLn(sdtFile, "** Table file header")
-    ccdd.writeToFileLn(sdtFile, "*/")
-    ccdd.writeToFileLn(sdtFile, "static CFE_TBL_FileDef_t CFE_TBL_FileDef =")
-    ccdd.writeToFileLn(sdtFile, "{")
-    ccdd.writeToFileLn(sdtFile, "    \"SCH_DefaultScheduleTable\",")
-    ccdd.writeToFileLn(sdtFile, "    \"SCH.SCHED_DEF\",")
-    ccdd.writeToFileLn(sdtFile, "    \"SCH schedule table\",")
-    ccdd.writeToFileLn(sdtFile, "    \"sch_def_schtbl.tbl\",")
-    ccdd.writeToFileLn(sdtFile, "    (sizeof (SCH_ScheduleEntry_t) * SCH_TABLE_ENTRIES)")
-    ccdd.writeToFileLn(sdtFile, "};")
-    ccdd.writeToFileLn(sdtFile, "")
-
-    # Output the schedule definition table header
-    ccdd.writeToFileLn(sdtFile, "/*")
-    ccdd.writeToFileLn(sdtFile, "** Default schedule table data")
-    ccdd.writeToFileLn(sdtFile, "*/")
-    ccdd.writeToFileLn(sdtFile, "SCH_ScheduleEntry_t SCH_DefaultScheduleTable[SCH_TABLE_ENTRIES] =")
-    ccdd.writeToFileLn(sdtFile, "{")
-    ccdd.writeToFileLn(sdtFile, "    /*")
-    ccdd.writeToFileLn(sdtFile, "    **    uint8     EnableState  -- SCH_UNUSED, SCH_ENABLED")
-    ccdd.writeToFileLn(sdtFile, "    **    uint8     Type         -- 0 or SCH_ACTIVITY_SEND_MSG")
-    ccdd.writeToFileLn(sdtFile, "    **    uint16    Frequency    -- how many seconds between Activity execution")
-    ccdd.writeToFileLn(sdtFile, "    **    uint16    Remainder    -- seconds offset to perform Activity")
-    ccdd.writeToFileLn(sdtFile, "    **    uint16    MessageIndex -- Message index into Message Definition table")
-    ccdd.writeToFileLn(sdtFile, "    **    uint32    GroupData    -- Group and Multi-Group membership definitions")
-    ccdd.writeToFileLn(sdtFile, "    */")
-
-    # Step through each schedule definition table time slot
-    for timeSlot in range(ccdd.getNumberOfTimeSlots()):
-        ccdd.writeToFileLn(sdtFile, "")
-        ccdd.writeToFileFormat(sdtFile, "    /* Slot #%s */\n", str(timeSlot + 1))
-
-        # Get the schedule definition table entries
-        sdtEntries = ccdd.getApplicationScheduleDefinitionTable(timeSlot)
-
-        # Define the initial minimum column widths
-        columnWidth = [1, 1, 1, 1, 1, 1]
-
-        # Check if there are any entries in the schedule definition table
-        if len(sdtEntries) > 0:
-            # Adjust the minimum column widths
-            columnWidth = ccdd.getLongestStrings(sdtEntries, columnWidth)
- 
-        # Build the format string
-        formatBody = "    {%-" + str(columnWidth[ENABLE_STATUS]) + "s, %" + str(columnWidth[TYPE]) + "s, %" + str(columnWidth[FREQUENCY]) + "s, %" + str(columnWidth[REMAINDER]) + "s, %" + str(columnWidth[MESSAGE_INDEX]) + "s, %-" + str(columnWidth[GROUP_DATA]) + "s}%s\n"
+try:
+    # Create the message definition table *************************************
 
-        # Step through each schedule definition table entry
-        for row in range(len(sdtEntries)):
-            comma = ","
+    # Define the initial minimum column widths
+    columnWidth = [10, 6, 6, 6]
 
-            # Check if this is the last row
-            if timeSlot == ccdd.getNumberOfTimeSlots() - 1 and row == len(sdtEntries) - 1:
-                # Don't append a comma
-                comma = " "
+    # Create the message definition table output file name
+    mdtFileName = ccdd.getOutputPath() + "sch_def_msgtbl.c"
 
-            # Output the entry to the schedule definition table file
-            ccdd.writeToFileFormat(sdtFile, formatBody, sdtEntries[row][ENABLE_STATUS], sdtEntries[row][TYPE], sdtEntries[row][FREQUENCY], sdtEntries[row][REMAINDER], sdtEntries[row][MESSAGE_INDEX], sdtEntries[row][GROUP_DATA], comma)
+    # Open the message definition table output file
+    mdtFile = output.openOutputFile(ccdd, mdtFileName)
 
-    # Terminate the schedule definition table
-    ccdd.writeToFileLn(sdtFile, "};")
+    # Check if the output file successfully opened
+    if mdtFile is not None:
+        # Add a header to the output file
+        outputFileCreationInfo(mdtFile)
+
+        # Get the message definition table entries
+        mdtEntries = ccdd.getApplicationMessageDefinitionTable()
+
+          # Check if there are any entries in the message definition table
+        if len(mdtEntries) > 0:
+            # Adjust the minimum column widths
+            columnWidth[ENABLE_STATUS] = ccdd.getLongestString(mdtEntries, columnWidth[ENABLE_STATUS])
+
+        # Build the format string for an occupied entry
+        formatUsed = "    { {%-" + str(columnWidth[ENABLE_STATUS]) + "s, %" + str(columnWidth[TYPE]) + "s, %" + str(columnWidth[FREQUENCY]) + "s, %" + str(columnWidth[REMAINDER]) + "s} } \n"
+
+        # Write the include statements for the standard cFE and HK headers
+        mdtFile.writeLn("")
+        mdtFile.writeLn("/*")
+        mdtFile.writeLn("** Include Files")
+        mdtFile.writeLn("*/")
+        mdtFile.writeLn("#include \"cfe.h\"")
+        mdtFile.writeLn("#include \"cfe_tbl_filedef.h\"")
+        mdtFile.writeLn("#include \"sch_platform_cfg.h\"")
+        mdtFile.writeLn("#include \"sch_msgdefs.h\"")
+        mdtFile.writeLn("#include \"sch_tbldefs.h\"")
+        mdtFile.writeLn("")
+
+        # Get the array containing the application names
+        applicationNames = ccdd.getApplicationNames()
+
+        # Step through each application name
+        for name in range(len(applicationNames)):
+            # Write the application message ID include statements for the header
+            # files
+            mdtFile.writeLn("#include \"" + applicationNames[name].lower() + "_msgids.h\"")
+
+        mdtFile.writeLn("")
+        mdtFile.writeLn("/*")
+        mdtFile.writeLn("** Default message table data")
+        mdtFile.writeLn("*/")
+        mdtFile.writeLn("SCH_MessageEntry_t SCH_DefaultMessageTable[SCH_MAX_MESSAGES] =")
+        mdtFile.writeLn("{")
+        mdtFile.writeLn("    /*---------------------------------------------------------*/")
+        mdtFile.writeLn("    /* DO NOT USE -- Entry #0 reserved for \"unused\" command ID */")
+        mdtFile.write("    /*---------------------------------------------------------*/")
+
+        # Step through each message definition table entry
+        for row in range(len(mdtEntries)):
+            mdtFile.writeLn("\n    /* command ID #%d */" % row)
+            comma = ","
+
+            # Check if this is the last entry
+            if row == len(mdtEntries) - 1:
+                comma = " "
 
-    # Close the output file
-    ccdd.closeFile(sdtFile)
-# The output file cannot be opened
-else:
-    # Display an error dialog
-    ccdd.showErrorDialog("<html><b>Error opening output file '</b>" + sdtFileName + "<b>'")
+            # Check if this slot is occupied
+            if mdtEntries[row] != "SCH_UNUSED_MID":
+                mdtFile.writeFormat(formatUsed,
+                                    mdtEntries[row],
+                                    COMMAND1,
+                                    COMMAND2,
+                                    COMMAND3,
+                                    comma)
+            # The slot is not used
+            else:
+                mdtFile.writeFormat("    { { %s } } \n", mdtEntries[row])
+
+        # Terminate the message definition table statement
+        mdtFile.writeLn("};")
+
+        # Close the output file
+        mdtFile.close()
+    # The output file cannot be opened
+    else:
+        # Display an error dialog
+        ccdd.showErrorDialog("<html><b>Error opening output file '</b>" + mdtFileName + "<b>'")
+
+    # Create the schedule definition table output file name
+    sdtFileName = ccdd.getOutputPath() + "sch_def_schtbl.c"
+
+    # Create the schedule definition table ************************************
+
+    # Open the schedule definition table output file
+    sdtFile = output.openOutputFile(ccdd, sdtFileName)
+
+    # Check if the output file successfully opened
+    if sdtFile is not None:
+        # Add a header to the output files
+        outputFileCreationInfo(sdtFile)
+
+        # Write the include statements for the standard cFE and HK headers
+        sdtFile.writeLn("")
+        sdtFile.writeLn("/*")
+        sdtFile.writeLn("** Include Files")
+        sdtFile.writeLn("*/")
+        sdtFile.writeLn("#include \"cfe.h\"")
+        sdtFile.writeLn("#include \"cfe_tbl_filedef.h\"")
+        sdtFile.writeLn("#include \"sch_platform_cfg.h\"")
+        sdtFile.writeLn("#include \"sch_msgdefs.h\"")
+        sdtFile.writeLn("#include \"sch_tbldefs.h\"")
+        sdtFile.writeLn("")
+
+        # Get the list of defined parameters
+        defines = ccdd.getApplicationScheduleDefinitionTableDefines()
+
+        # Build the format for the defined parameters
+        formatDefines = "#define %-" + str(columnWidth[ENABLE_STATUS]) + "s  %s \n"
+
+        # Step through each defined parameter
+        for define in range(len(defines)):
+            # Output the define statement to the file
+            sdtFile.writeFormat(formatDefines, defines[define][0], defines[define][1])
+
+        # Output the table file header
+        sdtFile.writeLn("")
+        sdtFile.writeLn("/*")
+        sdtFile.writeLn("** Table file header")
+        sdtFile.writeLn("*/")
+        sdtFile.writeLn("static CFE_TBL_FileDef_t CFE_TBL_FileDef =")
+        sdtFile.writeLn("{")
+        sdtFile.writeLn("    \"SCH_DefaultScheduleTable\",")
+        sdtFile.writeLn("    \"SCH.SCHED_DEF\",")
+        sdtFile.writeLn("    \"SCH schedule table\",")
+        sdtFile.writeLn("    \"sch_def_schtbl.tbl\",")
+        sdtFile.writeLn("    (sizeof (SCH_ScheduleEntry_t) * SCH_TABLE_ENTRIES)")
+        sdtFile.writeLn("};")
+        sdtFile.writeLn("")
+
+        # Output the schedule definition table header
+        sdtFile.writeLn("/*")
+        sdtFile.writeLn("** Default schedule table data")
+        sdtFile.writeLn("*/")
+        sdtFile.writeLn("SCH_ScheduleEntry_t SCH_DefaultScheduleTable[SCH_TABLE_ENTRIES] =")
+        sdtFile.writeLn("{")
+        sdtFile.writeLn("    /*")
+        sdtFile.writeLn("    **    uint8     EnableState  -- SCH_UNUSED, SCH_ENABLED")
+        sdtFile.writeLn("    **    uint8     Type         -- 0 or SCH_ACTIVITY_SEND_MSG")
+        sdtFile.writeLn("    **    uint16    Frequency    -- how many seconds between Activity execution")
+        sdtFile.writeLn("    **    uint16    Remainder    -- seconds offset to perform Activity")
+        sdtFile.writeLn("    **    uint16    MessageIndex -- Message index into Message Definition table")
+        sdtFile.writeLn("    **    uint32    GroupData    -- Group and Multi-Group membership definitions")
+        sdtFile.writeLn("    */")
+
+        # Step through each schedule definition table time slot
+        for timeSlot in range(ccdd.getNumberOfTimeSlots()):
+            sdtFile.writeLn("")
+            sdtFile.writeFormat("    /* Slot #%s */\n", str(timeSlot + 1))
+
+            # Get the schedule definition table entries
+            sdtEntries = ccdd.getApplicationScheduleDefinitionTable(timeSlot)
+
+            # Define the initial minimum column widths
+            columnWidth = [1, 1, 1, 1, 1, 1]
+
+            # Check if there are any entries in the schedule definition table
+            if len(sdtEntries) > 0:
+                # Adjust the minimum column widths
+                columnWidth = ccdd.getLongestStrings(sdtEntries, columnWidth)
+
+            # Build the format string
+            formatBody = "    {%-" + str(columnWidth[ENABLE_STATUS]) + "s, %" + str(columnWidth[TYPE]) + "s, %" + str(columnWidth[FREQUENCY]) + "s, %" + str(columnWidth[REMAINDER]) + "s, %" + str(columnWidth[MESSAGE_INDEX]) + "s, %-" + str(columnWidth[GROUP_DATA]) + "s}%s\n"
+
+            # Step through each schedule definition table entry
+            for row in range(len(sdtEntries)):
+                comma = ","
+
+                # Check if this is the last row
+                if timeSlot == ccdd.getNumberOfTimeSlots() - 1 and row == len(sdtEntries) - 1:
+                    # Don't append a comma
+                    comma = " "
+
+                # Output the entry to the schedule definition table file
+                sdtFile.writeFormat(formatBody, sdtEntries[row][ENABLE_STATUS], sdtEntries[row][TYPE], sdtEntries[row][FREQUENCY], sdtEntries[row][REMAINDER], sdtEntries[row][MESSAGE_INDEX], sdtEntries[row][GROUP_DATA], comma)
+
+        # Terminate the schedule definition table
+        sdtFile.writeLn("};")
+
+        # Close the output file
+        sdtFile.close()
+    # The output file cannot be opened
+    else:
+        # Display an error dialog
+        ccdd.showErrorDialog("<html><b>Error opening output file '</b>" + sdtFileName + "<b>'")
+
+finally:
+    # Close any output files that remain open (e.g., due to an error)
+    output.closeOpenFiles()
@@ -10,6 +10,17 @@
 #******************************************************************************
 
 import CCDD.CcddScriptDataAccessHandler
+import os
+import sys
+
+# Add the script's folder to the module search path so that the shared script
+# support package can be imported
+scriptPath = os.path.dirname(os.path.abspath(ccdd.getScriptName()))
+
+if scriptPath not in sys.path:
+    sys.path.insert(0, scriptPath)
+
+from ccddlib import output
 
 # cFE ES start-up script table type name
 ES_STARTUP_TYPE = "ES Start-up Script"
@@ -36,17 +47,17 @@ numRows = ccdd.getTableNumRows(ES_STARTUP_TYPE)
 #******************************************************************************
 def outputFileCreationInfo(file):
     # Add the build information and header to the output file
-    ccdd.writeToFileLn(file, "/* Created : " + ccdd.getDateAndTime() + "\n   User    : " + ccdd.getUser() + "\n   Project : " + ccdd.getProject() + "\n   Script  : " + ccdd.getScriptName())
+    file.writeLn("/* Created : " + ccdd.getDateAndTime() + "\n   User    : " + ccdd.getUser() + "\n   Project : " + ccdd.getProject() + "\n   Script  : " + ccdd.getScriptName())
 
     # Check if any table is associated with the script
     if ccdd.getTableNumRows() != 0:
-        ccdd.writeToFileLn(file, "   Table(s): " + (",\n             ").join(sorted(ccdd.getTableNames())))
+        file.writeLn("   Table(s): " + (",\n             ").join(sorted(ccdd.getTableNames())))
 
     # Check if any groups is associated with the script
     if len(ccdd.getAssociatedGroupNames()) != 0:
-        ccdd.writeToFileLn(file, "   Group(s): " + (",\n             ").join(sorted(ccdd.getAssociatedGroupNames())))
+        file.writeLn("   Group(s): " + (",\n             ").join(sorted(ccdd.getAssociatedGroupNames())))
 
-    ccdd.writeToFileLn(file, "*/\n")
+    file.writeLn("*/\n")
 
 #******************************************************************************
 # Output the cFE ES start-up script file
@@ -59,7 +70,7 @@ def makeESStartupFile(baseFileName):
     startupFileName = ccdd.getOutputPath() + baseFileName + ".scr"
 
     # Open the cFE ES start-up script file
-    startupFile = ccdd.openOutputFile(startupFileName)
+    startupFile = output.openOutputFile(ccdd, startupFileName)
 
     # Check if the cFE ES start-up script file successfully opened
     if startupFile is not None:
@@ -77,24 +88,26 @@ def makeESStartupFile(baseFileName):
             # Get the values of the start-up script table columns
             startupEntries.append([ccdd.getTableData(ES_STARTUP_TYPE, "Module Type", row), ccdd.getTableData(ES_STARTUP_TYPE, "Path & File", row), ccdd.getTableData(ES_STARTUP_TYPE, "Entry Point", row), ccdd.getTableData(ES_STARTUP_TYPE, "cFE Name", row), ccdd.getTableData(ES_STARTUP_TYPE, "Priority", row), ccdd.getTableData(ES_STARTUP_TYPE, "Stack Size", row), ccdd.getTableData(ES_STARTUP_TYPE, "Exception Action", row)])
 
-        # Adjust the minimum column widths
-        columnWidth = ccdd.getLongestStrings(startupEntries, columnWidth)
+        # Check if there are any start-up script entries
+        if len(startupEntries) > 0:
+            # Adjust the minimum column widths
+            columnWidth = ccdd.getLongestStrings(startupEntries, columnWidth)
 
         # Build the format strings so that the columns in each row are aligned
         formatHeader = "/* %-" + str(columnWidth[MODULE_TYPE]) + "s | %-" + str(columnWidth[PATH_NAME]) + "s | %-" + str(columnWidth[ENTRY_POINT]) + "s | %-" + str(columnWidth[CFE_NAME]) + "s | %-" + str(columnWidth[PRIORITY]) + "s | %-" + str(columnWidth[STACK_SIZE]) + "s | %-6s | %s */\n"
         formatBody = "   %-" + str(columnWidth[MODULE_TYPE]) + "s , %-" + str(columnWidth[PATH_NAME]) + "s , %-" + str(columnWidth[ENTRY_POINT]) + "s , %-" + str(columnWidth[CFE_NAME]) + "s , %-" + str(columnWidth[PRIORITY]) + "s , %-" + str(columnWidth[STACK_SIZE]) + "s , %-6s , %s;\n"
 
         # Output the column titles
-        ccdd.writeToFileFormat(startupFile, formatHeader, "Module", "Path &", "Entry", "cFE", "Priority", "Stack", "Unused", "Exception")
-        ccdd.writeToFileFormat(startupFile, formatHeader, "Type", "File", "Point", "Name", "", "Size", "", "Action")
+        startupFile.writeFormat(formatHeader, "Module", "Path &", "Entry", "cFE", "Priority", "Stack", "Unused", "Exception")
+        startupFile.writeFormat(formatHeader, "Type", "File", "Point", "Name", "", "Size", "", "Action")
 
         # Step through each ES start-up script entry
         for row in range(len(startupEntries)):
             # Write the entry to the cFE ES start-up script file
-            ccdd.writeToFileFormat(startupFile, formatBody, startupEntries[row][MODULE_TYPE], startupEntries[row][PATH_NAME], startupEntries[row][ENTRY_POINT], startupEntries[row][CFE_NAME], startupEntries[row][PRIORITY], startupEntries[row][STACK_SIZE], "0x0", startupEntries[row][EXCEPTION_ACTION])
+            startupFile.writeFormat(formatBody, startupEntries[row][MODULE_TYPE], startupEntries[row][PATH_NAME], startupEntries[row][ENTRY_POINT], startupEntries[row][CFE_NAME], startupEntries[row][PRIORITY], startupEntries[row][STACK_SIZE], "0x0", startupEntries[row][EXCEPTION_ACTION])
 
         # Close the cFE ES start-up script file
-        ccdd.closeFile(startupFile)
+        startupFile.close()
     # The cFE ES start-up script file failed to open
     else:
         # Display an error dialog
@@ -104,11 +117,16 @@ def makeESStartupFile(baseFileName):
 
 #** Main **********************************************************************
 
-# Check if ES start-up script data is supplied
-if numRows != 0:
-    # Output the cFE ES start-up script file
-    makeESStartupFile("cfe_es_startup")
-# No ES start-up script data is supplied
-else:
-    # Display an error dialog
-    ccdd.showErrorDialog("<html><b>No cFE ES start-up script data supplied for script '</b>" + ccdd.getScriptName() + "<b>'")
+try:
+    # Check if ES start-up script data is supplied
+    if numRows != 0:
+        # Output the cFE ES start-up script file
+        makeESStartupFile("cfe_es_startup")
+    # No ES start-up script data is supplied
+    else:
+        # Display an error dialog
+        ccdd.showErrorDialog("<html><b>No cFE ES start-up script data supplied for script '</b>" + ccdd.getScriptName() + "<b>'")
+
+finally:
+    # Close any output files that remain open (e.g., due to an error)
+    output.closeOpenFiles()
@@ -0,0 +1,11 @@
+#******************************************************************************
+# Description: Shared support package for the CCDD data output scripts
+#
+# The modules in this package are used by the Python (Jython) data output
+# scripts. A script makes the package available for import by adding the
+# script's folder to the module search path
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
@@ -0,0 +1,686 @@
+#******************************************************************************
+# Description: Data output script benchmark
+#
+# This module generates synthetic CCDD projects in the CSV import format (the
+# format of the files in the tables folder) and times the data output scripts
+# against them using the headless data access handler. The size of the
+# generated project is configurable: the number of structures, the number of
+# rows per structure, the structure nesting depth, and the number of arrays,
+# bit-packed fields, rate columns, limit sets, polynomial conversions, and
+# commands. For each script the wall time, the peak memory allocated, and the
+# number of calls made to each data access handler method are reported in JSON
+# format. The report can be compared to that of a previous run in order to
+# detect a script whose execution time or number of data access calls has
+# increased
+#
+# A project containing a single structure with a large array (by default
+# 10,000 members) can be added to the runs. Its execution time exposes any
+# processing that grows with the square of the number of a structure's
+# members, such as searching a list of the variable names already output
+#
+# Usage:
+#   python -m ccddlib.benchmark [options] [-x script.py ...]
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+import csv
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import traceback
+import tracemalloc
+
+from ccddlib import headless
+from ccddlib.profiler import ProfilingHandler
+
+# Data output scripts executed by default (those in the scripts folder)
+DEFAULT_SCRIPTS = ["appScheduler.py",
+                   "cFEESStartup.py",
+                   "cfs_ros_msg_gen.py",
+                   "copyTable.py",
+                   "itosPage.py",
+                   "itosRecFile.py",
+                   "msgidHeader.py",
+                   "numpyTypes.py",
+                   "sharedTypesHeader.py",
+                   "testPython.py",
+                   "typesHeader.py"]
+
+# Scripts the regression check applies to by default
+DEFAULT_CHECKED_SCRIPTS = ["itosRecFile.py", "typesHeader.py"]
+
+# Primitive data types used in the generated structures: user name, C name,
+# size (bytes), and base type
+PRIMITIVE_TYPES = [["uint8", "unsigned char", "1", "unsigned integer"],
+                   ["uint16", "unsigned short", "2", "unsigned integer"],
+                   ["uint32", "unsigned int", "4", "unsigned integer"],
+                   ["int8", "signed char", "1", "signed integer"],
+                   ["int16", "short", "2", "signed integer"],
+                   ["int32", "int", "4", "signed integer"],
+                   ["float", "float", "4", "floating point"],
+                   ["double", "double", "8", "floating point"]]
+
+# Integer data types; bit-packed fields use these
+INTEGER_TYPES = ["uint8", "uint16", "uint32", "int16"]
+
+# Name of the generated telemetry table type
+TELEMETRY_TYPE = "Telemetry"
+
+# Number of commands in each generated command table
+COMMANDS_PER_TABLE = 20
+
+# First telemetry message ID. The command message IDs begin 0x1000 above this
+MESSAGE_ID_BASE = 0x0800
+
+# Default number of array members in the large structure project
+LARGE_STRUCTURE_MEMBERS = 10000
+
+#** Classes *******************************************************************
+
+#******************************************************************************
+# Synthetic project size parameters
+#******************************************************************************
+class ProjectParameters(object):
+    #**************************************************************************
+    # Synthetic project size parameters class constructor
+    #
+    # @param structures
+    #            number of structure tables
+    #
+    # @param rows
+    #            number of rows (variables) in each structure table
+    #
+    # @param depth
+    #            structure nesting depth; 1 if no structure contains another
+    #
+    # @param arrays
+    #            number of array variables in each structure table
+    #
+    # @param bitFields
+    #            number of bit-packed variables in each structure table
+    #
+    # @param rateColumns
+    #            number of rate columns in the telemetry table type
+    #
+    # @param limitSets
+    #            number of variables with limits in each structure table
+    #
+    # @param polynomials
+    #            number of variables with a polynomial conversion in each
+    #            structure table
+    #
+    # @param commands
+    #            total number of commands
+    #
+    # @param arraySize
+    #            number of members in each array variable
+    #
+    # @param seed
+    #            random number generator seed; the same seed and parameters
+    #            always generate the same project
+    #**************************************************************************
+    def __init__(self,
+                 structures=50,
+                 rows=20,
+                 depth=3,
+                 arrays=2,
+                 bitFields=4,
+                 rateColumns=1,
+                 limitSets=2,
+                 polynomials=2,
+                 commands=40,
+                 arraySize=4,
+                 seed=1):
+        self.structures = structures
+        self.rows = rows
+        self.depth = depth
+        self.arrays = arrays
+        self.bitFields = bitFields
+        self.rateColumns = rateColumns
+        self.limitSets = limitSets
+        self.polynomials = polynomials
+        self.commands = commands
+        self.arraySize = arraySize
+        self.seed = seed
+
+    #**************************************************************************
+    # Get the parameters as a dictionary, for inclusion in the report
+    #
+    # @return Dictionary of the parameter values keyed by parameter name
+    #**************************************************************************
+    def toDictionary(self):
+        return dict(self.__dict__)
+
+    #**************************************************************************
+    # Get a copy of the parameters with the counts that determine the project
+    # size multiplied by the specified factor
+    #
+    # @param factor
+    #            scale factor
+    #
+    # @return Scaled copy of the parameters
+    #**************************************************************************
+    def scale(self, factor):
+        scaled = ProjectParameters(**self.__dict__)
+        scaled.structures = max(1, int(self.structures * factor))
+        scaled.commands = int(self.commands * factor)
+        return scaled
+
+#** Functions *****************************************************************
+
+#******************************************************************************
+# Get the parameters for a project containing a single root structure with
+# one array variable having the specified number of members
+#
+# @param members
+#            number of members in the structure's array variable
+#
+# @param seed
+#            random number generator seed
+#
+# @return Large structure project parameters
+#******************************************************************************
+def getLargeStructureParameters(members, seed):
+    return ProjectParameters(structures=1,
+                             depth=1,
+                             arrays=1,
+                             bitFields=0,
+                             limitSets=0,
+                             polynomials=0,
+                             commands=0,
+                             arraySize=members,
+                             seed=seed)
+
+#******************************************************************************
+# Write a row to a CSV import file, with every value quoted
+#
+# @param writer
+#            CSV writer
+#
+# @param values
+#            list of the row's values
+#******************************************************************************
+def writeRow(writer, values):
+    writer.writerow([str(value) for value in values])
+
+#******************************************************************************
+# Get the name of a generated structure table
+#
+# @param level
+#            structure nesting level; 0 for a root structure
+#
+# @param index
+#            structure index within the project
+#
+# @return Structure table name
+#******************************************************************************
+def getStructureName(level, index):
+    return "Struct%d_L%d_t" % (index, level)
+
+#******************************************************************************
+# Generate a synthetic project and write it to a CSV import file. The
+# structures are divided among the nesting levels; each structure below the
+# deepest level contains a variable (every other one an array) of a structure
+# in the next level. The structures in the first level are the root tables,
+# each of which has a system name and a telemetry message ID. The commands are
+# stored in command tables of up to COMMANDS_PER_TABLE commands each
+#
+# @param fileName
+#            CSV import file path + name
+#
+# @param parameters
+#            project size parameters
+#******************************************************************************
+def generateProject(fileName, parameters):
+    rand = random.Random(parameters.seed)
+    outputFile = open(fileName, "w")
+
+    try:
+        writer = csv.writer(outputFile, quoting=csv.QUOTE_ALL, lineterminator="\n")
+        outputFile.write("# Synthetic CCDD project: " + json.dumps(parameters.toDictionary(), sort_keys=True) + "\n\n")
+
+        # Write the data type definitions
+        outputFile.write("_data_type_\n")
+
+        for dataType in PRIMITIVE_TYPES:
+            writeRow(writer, dataType)
+
+        # Write the telemetry table type definition. The column definitions
+        # contain the name, description, input type, and the unique,
+        # required, structure allowed, and pointer allowed flags
+        outputFile.write("\n_table_type_\n")
+        writeRow(writer, [TELEMETRY_TYPE, "Telemetry with limits and conversions"])
+        columns = [["Variable Name", "Parameter name", "Variable name", "true", "true", "true", "true"],
+                   ["Description", "Parameter description", "Description", "false", "false", "true", "true"],
+                   ["Units", "Parameter units", "Units", "false", "false", "true", "true"],
+                   ["Data Type", "Parameter data type", "Primitive & Structure", "false", "true", "true", "true"],
+                   ["Array Size", "Parameter array size", "Array index", "false", "false", "true", "true"],
+                   ["Bit Length", "Parameter bit length", "Bit length", "false", "false", "true", "true"],
+                   ["Enumeration", "Enumerated parameters", "Enumeration", "false", "false", "true", "false"],
+                   ["Limit Sets", "Limit sets", "Text", "false", "false", "true", "false"],
+                   ["Polynomial Coefficients", "Polynomial coefficients", "Text", "false", "false", "true", "false"]]
+        # Add the rate columns. A structure table type requires at least one
+        for rateIndex in range(max(1, parameters.rateColumns)):
+            columns.append(["Rate" if rateIndex == 0 else "Rate " + str(rateIndex + 1), "Downlink rate", "Rate", "false", "false", "true", "true"])
+
+        for column in columns:
+            writeRow(writer, column)
+
+        # Write the group containing the global values used by the scripts
+        outputFile.write("\n_group_\n")
+        writeRow(writer, ["globals", "Global values", "false", ""])
+        outputFile.write("_group_data_fields_\n")
+        writeRow(writer, ["MID_delta", "", "4", "Integer", "false", "All", "0x0100"])
+        writeRow(writer, ["FC_Offset", "", "20", "Text", "false", "All", "0x0200"])
+        writeRow(writer, ["prefix", "", "8", "Text", "false", "All", "fsw"])
+        writeRow(writer, ["NumComputers", "", "2", "Integer", "false", "All", "2"])
+
+        # Write the macro used for the array sizes
+        outputFile.write("\n_macros_\n")
+        writeRow(writer, ["ARRAY_SIZE", str(parameters.arraySize)])
+        writeRow(writer, ["DOUBLE_ARRAY_SIZE", "##ARRAY_SIZE##*2"])
+
+        # Divide the structures among the nesting levels, with at least one
+        # structure in each level
+        depth = max(1, min(parameters.depth, parameters.structures))
+        levels = [[] for level in range(depth)]
+
+        for index in range(parameters.structures):
+            level = index % depth if index < depth else rand.randrange(depth)
+            levels[level].append(getStructureName(level, index))
+
+        systemNames = ["SYS" + str(index + 1) for index in range(max(1, len(levels[0]) // 10))]
+        columnNames = [column[0] for column in columns]
+
+        # Step through each nesting level, deepest first
+        for level in range(depth - 1, -1, -1):
+            # Step through each structure in this level
+            for structIndex in range(len(levels[level])):
+                structureName = levels[level][structIndex]
+                outputFile.write("\n_name_type_\n")
+                writeRow(writer, [structureName, TELEMETRY_TYPE])
+                outputFile.write("_column_data_\n")
+                writeRow(writer, columnNames)
+                rowIndex = 0
+
+                # Check if this structure contains a child structure
+                if level < depth - 1:
+                    childName = rand.choice(levels[level + 1])
+                    writeRow(writer, ["child", "Child structure", "", childName, "##ARRAY_SIZE##" if structIndex % 2 else "", "", "", "", ""] + ["1"] * max(1, parameters.rateColumns))
+                    rowIndex += 1
+
+                # Step through the remaining rows, assigning each row's
+                # characteristics in turn
+                for row in range(rowIndex, parameters.rows):
+                    dataType = rand.choice(PRIMITIVE_TYPES)[0]
+                    arraySize = ""
+                    bitLength = ""
+                    enumeration = ""
+                    limitSets = ""
+                    polynomial = ""
+                    rates = [rand.choice(["1", "0.5", "2", ""]) for rate in range(max(1, parameters.rateColumns))]
+                    index = row - rowIndex
+
+                    # Check if this row is an array
+                    if index < parameters.arrays:
+                        arraySize = "##DOUBLE_ARRAY_SIZE##" if index % 3 == 2 else str(parameters.arraySize)
+                    # Check if this row is a bit-packed field
+                    elif index < parameters.arrays + parameters.bitFields:
+                        dataType = INTEGER_TYPES[(index // 4) % len(INTEGER_TYPES)]
+                        bitLength = str(rand.randint(1, 4))
+
+                        # Give every other bit-packed field an enumeration
+                        if index % 2:
+                            enumeration = "0 | OFF, 1 | ON"
+                    else:
+                        limitIndex = index - parameters.arrays - parameters.bitFields
+
+                        # Check if this row has limits
+                        if limitIndex < parameters.limitSets:
+                            # Alternate between a single limit and a context
+                            # dependent limit set
+                            if limitIndex % 2 == 0:
+                                limitSets = "-10|-5|40|50"
+                            else:
+                                limitSets = "mode\\;1..5|-10|-5|40|50\\;6..9|-20|-10|80|100"
+                        # Check if this row has a polynomial conversion
+                        elif limitIndex < parameters.limitSets + parameters.polynomials:
+                            # Alternate between a single conversion and one
+                            # per flight computer
+                            if limitIndex % 2 == 0:
+                                polynomial = "0|1.5|0.01"
+                            else:
+                                polynomial = "0|1|0.5\\;1|2|0.25"
+
+                    writeRow(writer, ["var%d" % row, "Variable %d of %s" % (row, structureName), "counts" if polynomial else "", dataType, arraySize, bitLength, enumeration, limitSets, polynomial] + rates)
+
+                # Give each root structure a system name and message ID
+                if level == 0:
+                    outputFile.write("_data_fields_\n")
+                    writeRow(writer, ["System", "", "10", "Text", "false", "All", systemNames[structIndex % len(systemNames)]])
+                    writeRow(writer, ["Message ID", "", "8", "Message ID", "false", "All", "0x%04X" % (MESSAGE_ID_BASE + structIndex)])
+                    writeRow(writer, ["Message ID Name", "", "20", "Text", "false", "All", structureName.upper() + "_MID"])
+
+        # Step through each command table
+        for tableIndex in range((parameters.commands + COMMANDS_PER_TABLE - 1) // COMMANDS_PER_TABLE):
+            outputFile.write("\n_name_type_\n")
+            writeRow(writer, ["Cmd%d" % tableIndex, "Command"])
+            outputFile.write("_column_data_\n")
+            writeRow(writer, ["Command Name", "Command Code", "Description", "Arg 1 Name", "Arg 1 Description", "Arg 1 Units", "Arg 1 Data Type", "Arg 1 Array Size", "Arg 1 Bit Length", "Arg 1 Enumeration", "Arg 1 Minimum", "Arg 1 Maximum"])
+
+            # Step through each command in the table
+            for command in range(tableIndex * COMMANDS_PER_TABLE, min(parameters.commands, (tableIndex + 1) * COMMANDS_PER_TABLE)):
+                writeRow(writer, ["CMD_%d" % command, "0x%02X" % (command % COMMANDS_PER_TABLE), "Command %d" % command, "arg", "Argument", "", "uint16", "", "", "0 | OFF, 1 | ON" if command % 2 else "", "0", "100"])
+
+            outputFile.write("_data_fields_\n")
+            writeRow(writer, ["System", "", "10", "Text", "false", "All", systemNames[tableIndex % len(systemNames)]])
+            writeRow(writer, ["Message ID", "", "8", "Message ID", "false", "All", "0x%04X" % (MESSAGE_ID_BASE + 0x1000 + tableIndex)])
+            writeRow(writer, ["Message ID Name", "", "20", "Text", "false", "All", "CMD%d_MID" % tableIndex])
+    finally:
+        outputFile.close()
+
+#******************************************************************************
+# Execute a script and measure its execution
+#
+# @param ccdd
+#            headless data access handler containing the loaded project data
+#
+# @param scriptFileName
+#            script file path + name
+#
+# @param repeat
+#            number of timed executions; the shortest time is reported
+#
+# @param measureMemory
+#            True to measure the peak memory allocated. Tracing the memory
+#            allocations slows the script's execution considerably, so this
+#            is done in an execution separate from those timed
+#
+# @return Dictionary containing the script name, wall time (seconds), peak
+#         memory allocated (bytes; None if not measured), number of calls to
+#         each data access handler method, and any error messages
+#******************************************************************************
+def measureScript(ccdd, scriptFileName, repeat=1, measureMemory=True):
+    times = []
+    errors = []
+    stdout = sys.stdout
+
+    # Discard any text the script prints
+    sys.stdout = open(os.devnull, "w")
+
+    try:
+        # Time the script without instrumentation
+        for execution in range(repeat):
+            handler = ccdd.getScriptHandler(scriptFileName)
+            startTime = time.time()
+
+            try:
+                headless.runScript(scriptFileName, handler)
+            except Exception:
+                handler.errorMessages.append(traceback.format_exc())
+
+            times.append(time.time() - startTime)
+            errors = handler.errorMessages
+
+        # Execute the script once more to count the data access calls and
+        # measure the memory allocated
+        handler = ProfilingHandler(ccdd.getScriptHandler(scriptFileName))
+        peakMemory = None
+
+        if measureMemory:
+            tracemalloc.start()
+
+        try:
+            headless.runScript(scriptFileName, handler)
+        except Exception:
+            pass
+        finally:
+            if measureMemory:
+                peakMemory = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    return {"script": os.path.basename(scriptFileName),
+            "wallTime": min(times),
+            "peakMemory": peakMemory,
+            "apiCalls": handler.getCallCounts(),
+            "totalApiCalls": sum(handler.getCallCounts().values()),
+            "errors": errors}
+
+#******************************************************************************
+# Generate a synthetic project and measure each script's execution against it
+#
+# @param parameters
+#            project size parameters
+#
+# @param scriptFileNames
+#            list of the script file names
+#
+# @param repeat
+#            number of timed executions of each script
+#
+# @param measureMemory
+#            True to measure the peak memory allocated by each script
+#
+# @param workFolder
+#            folder in which to store the project import file and the script
+#            output files
+#
+# @return Dictionary containing the project parameters, the project load
+#         time, and the measurements for each script
+#******************************************************************************
+def runBenchmark(parameters, scriptFileNames, repeat, measureMemory, workFolder):
+    workFolder = os.path.abspath(workFolder)
+    scriptFileNames = [os.path.abspath(scriptFileName) for scriptFileName in scriptFileNames]
+    importFileName = os.path.join(workFolder, "project.csv")
+    generateProject(importFileName, parameters)
+
+    startTime = time.time()
+    ccdd = headless.createHandler([importFileName],
+                                  groupNames=["globals"],
+                                  outputPath=workFolder,
+                                  projectName="benchmark",
+                                  radioButtonSelection="Big",
+                                  dateAndTime="Sun Jan 01 00:00:00 UTC 2017")
+    loadTime = time.time() - startTime
+
+    # The data access calls are counted by the benchmark, so the profile
+    # report, if requested by the environment, isn't written
+    ccdd.profileFileName = None
+
+    # Some scripts open their output files using a name that doesn't include
+    # the output path, which is then relative to the current folder. Execute
+    # the scripts from the work folder so that these files are stored there
+    currentFolder = os.getcwd()
+    os.chdir(workFolder)
+
+    try:
+        measurements = [measureScript(ccdd, scriptFileName, repeat, measureMemory) for scriptFileName in scriptFileNames]
+    finally:
+        os.chdir(currentFolder)
+
+    return {"project": parameters.toDictionary(),
+            "structureRows": ccdd.getStructureTableNumRows(),
+            "commandRows": ccdd.getCommandTableNumRows(),
+            "loadTime": loadTime,
+            "scripts": measurements}
+
+#******************************************************************************
+# Compare a benchmark report to a baseline report
+#
+# @param report
+#            benchmark report
+#
+# @param baseline
+#            baseline benchmark report
+#
+# @param scriptNames
+#            list of the names of the scripts to check
+#
+# @param tolerance
+#            allowed fractional increase in a script's wall time
+#
+# @return List of the regressions found; each is a text description
+#******************************************************************************
+def findRegressions(report, baseline, scriptNames, tolerance):
+    regressions = []
+
+    # Step through each project in the report
+    for run in report["runs"]:
+        baseRun = None
+
+        # Find the baseline run for the same project parameters
+        for candidate in baseline.get("runs", []):
+            if candidate["project"] == run["project"]:
+                baseRun = candidate
+                break
+
+        # Check if the project isn't in the baseline
+        if baseRun is None:
+            continue
+
+        baseResults = dict((result["script"], result) for result in baseRun["scripts"])
+
+        # Step through each script result
+        for result in run["scripts"]:
+            baseResult = baseResults.get(result["script"])
+
+            # Check if the script isn't checked or isn't in the baseline
+            if result["script"] not in scriptNames or baseResult is None:
+                continue
+
+            label = "%s (%d structure rows)" % (result["script"], run["structureRows"])
+
+            if result["wallTime"] > baseResult["wallTime"] * (1.0 + tolerance):
+                regressions.append("%s: wall time %.3fs exceeds baseline %.3fs" % (label, result["wallTime"], baseResult["wallTime"]))
+
+            if result["totalApiCalls"] > baseResult["totalApiCalls"]:
+                regressions.append("%s: %d data access calls exceeds baseline %d" % (label, result["totalApiCalls"], baseResult["totalApiCalls"]))
+
+            if result["errors"] and not baseResult["errors"]:
+                regressions.append("%s: script failed" % label)
+
+    return regressions
+
+#******************************************************************************
+# Command line entry point
+#
+# @param args
+#            command line arguments
+#
+# @return Exit status; 1 if a regression is found
+#******************************************************************************
+def main(args=None):
+    import argparse
+
+    defaults = ProjectParameters()
+    parser = argparse.ArgumentParser(description="Time the CCDD data output scripts against synthetic projects")
+    parser.add_argument("-x", "--script", action="append", dest="scripts", help="script file to execute; repeat for each script (default: the scripts in the scripts folder)")
+    parser.add_argument("--structures", type=int, default=defaults.structures, help="number of structure tables")
+    parser.add_argument("--rows", type=int, default=defaults.rows, help="number of rows in each structure table")
+    parser.add_argument("--depth", type=int, default=defaults.depth, help="structure nesting depth")
+    parser.add_argument("--arrays", type=int, default=defaults.arrays, help="number of arrays in each structure table")
+    parser.add_argument("--array-size", type=int, default=defaults.arraySize, dest="arraySize", help="number of members in each array")
+    parser.add_argument("--bit-fields", type=int, default=defaults.bitFields, dest="bitFields", help="number of bit-packed fields in each structure table")
+    parser.add_argument("--rates", type=int, default=defaults.rateColumns, dest="rateColumns", help="number of rate columns")
+    parser.add_argument("--limits", type=int, default=defaults.limitSets, dest="limitSets", help="number of variables with limits in each structure table")
+    parser.add_argument("--polynomials", type=int, default=defaults.polynomials, help="number of variables with polynomial conversions in each structure table")
+    parser.add_argument("--commands", type=int, default=defaults.commands, help="number of commands")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="random number generator seed")
+    parser.add_argument("--large-structure", type=int, nargs="?", const=LARGE_STRUCTURE_MEMBERS, default=None, dest="largeStructure", help="add a run for a project with a single structure containing an array of the specified number of members (default: " + str(LARGE_STRUCTURE_MEMBERS) + ")")
+    parser.add_argument("--scale", default="1", help="comma-separated factors by which to multiply the number of structures and commands; a project is generated for each (default: 1)")
+    parser.add_argument("--repeat", type=int, default=1, help="number of timed executions of each script")
+    parser.add_argument("--no-memory", action="store_false", dest="measureMemory", help="don't measure the peak memory allocated by each script")
+    parser.add_argument("-o", "--output", default=None, help="report file (default: standard output)")
+    parser.add_argument("-b", "--baseline", default=None, help="baseline report file with which to compare the results")
+    parser.add_argument("--check", action="append", default=None, help="script to check against the baseline; repeat for each script (default: " + ", ".join(DEFAULT_CHECKED_SCRIPTS) + ")")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed fractional increase in wall time relative to the baseline")
+    parser.add_argument("--keep", default=None, help="folder in which to keep the generated projects and script output")
+    options = parser.parse_args(args)
+
+    parameters = ProjectParameters(options.structures,
+                                   options.rows,
+                                   options.depth,
+                                   options.arrays,
+                                   options.bitFields,
+                                   options.rateColumns,
+                                   options.limitSets,
+                                   options.polynomials,
+                                   options.commands,
+                                   options.arraySize,
+                                   options.seed)
+    scriptFileNames = options.scripts
+
+    # Check if no script is specified
+    if not scriptFileNames:
+        scriptFolder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        scriptFileNames = [os.path.join(scriptFolder, name) for name in DEFAULT_SCRIPTS]
+
+    report = {"python": sys.version.split()[0], "runs": []}
+    runs = [("scale_" + str(factor), parameters.scale(factor)) for factor in [float(value) for value in options.scale.split(",")]]
+
+    # Check if the large structure project is included
+    if options.largeStructure is not None:
+        runs.append(("large_" + str(options.largeStructure), getLargeStructureParameters(options.largeStructure, options.seed)))
+
+    # Step through each project
+    for runName, runParameters in runs:
+        # Check if the generated files are kept
+        if options.keep is not None:
+            workFolder = os.path.join(options.keep, runName)
+
+            if not os.path.exists(workFolder):
+                os.makedirs(workFolder)
+        else:
+            workFolder = tempfile.mkdtemp(prefix="ccdd_benchmark_")
+
+        try:
+            report["runs"].append(runBenchmark(runParameters, scriptFileNames, options.repeat, options.measureMemory, workFolder))
+        finally:
+            if options.keep is None:
+                shutil.rmtree(workFolder, ignore_errors=True)
+
+    # Output the report
+    if options.output is None:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write("\n")
+    else:
+        reportFile = open(options.output, "w")
+
+        try:
+            json.dump(report, reportFile, indent=2, sort_keys=True)
+            reportFile.write("\n")
+        finally:
+            reportFile.close()
+
+    # Check if the results are compared to a baseline
+    if options.baseline is not None:
+        baselineFile = open(options.baseline)
+
+        try:
+            baseline = json.load(baselineFile)
+        finally:
+            baselineFile.close()
+
+        regressions = findRegressions(report, baseline, options.check or DEFAULT_CHECKED_SCRIPTS, options.tolerance)
+
+        # Step through each regression found
+        for regression in regressions:
+            sys.stderr.write("Regression: " + regression + "\n")
+
+        if regressions:
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
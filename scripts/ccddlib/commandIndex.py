@@ -0,0 +1,123 @@
+#******************************************************************************
+# Description: Command table row index
+#
+# This module provides an index of the command table rows supplied to a
+# script, grouped by the system to which each row's command table belongs (as
+# given by the table's 'System' data field). The index is built with a single
+# pass through the command rows, and each command table's data fields are
+# retrieved once, so that a script can step through the commands for a system
+# without scanning every command row and retrieving the table's data fields for
+# each row
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+# Name of the command table data field containing the system name
+SYSTEM_FIELD = "System"
+
+# Name of the command table data field containing the message ID
+MESSAGE_ID_FIELD = "Message ID"
+
+#******************************************************************************
+# Command table row index
+#******************************************************************************
+class CommandRowIndex(object):
+    #**************************************************************************
+    # Command table row index class constructor
+    #
+    # @param ccdd
+    #            script data access handler
+    #
+    # @param dataFields
+    #            data field value cache from which the tables' data fields are
+    #            retrieved (refer to DataFieldCache); None to retrieve the data
+    #            fields from the data access handler
+    #**************************************************************************
+    def __init__(self, ccdd, dataFields=None):
+        self.tableNames = list(ccdd.getCommandTableNames())
+        self.tableSystems = {}
+        self.tableMessageIDs = {}
+        self.rowTableNames = []
+        self.allRows = []
+        self.systemRows = {}
+
+        # Check if no data field value cache is supplied
+        if dataFields is None:
+            dataFields = ccdd
+
+        # Step through each command table row
+        for row in range(ccdd.getCommandTableNumRows()):
+            # Get the name of the command table to which the row belongs
+            tableName = ccdd.getCommandTableNameByRow(row)
+
+            # Check if this is the first row for the table
+            if tableName not in self.tableSystems:
+                # Get the table's system name and message ID
+                self.tableSystems[tableName] = dataFields.getTableDataFieldValue(tableName, SYSTEM_FIELD)
+                self.tableMessageIDs[tableName] = dataFields.getTableDataFieldValue(tableName, MESSAGE_ID_FIELD)
+
+            self.rowTableNames.append(tableName)
+            self.allRows.append(row)
+            systemName = self.tableSystems[tableName]
+
+            # Check if the table has a system name
+            if systemName is not None:
+                self.systemRows.setdefault(systemName, []).append(row)
+
+        # Step through each command table
+        for tableName in self.tableNames:
+            # Check if the table has no rows
+            if tableName not in self.tableSystems:
+                # Get the table's system name
+                self.tableSystems[tableName] = dataFields.getTableDataFieldValue(tableName, SYSTEM_FIELD)
+
+    #**************************************************************************
+    # Get the names of the command tables
+    #
+    # @return List of the command table names
+    #**************************************************************************
+    def getTableNames(self):
+        return self.tableNames
+
+    #**************************************************************************
+    # Get the system name for the specified command table
+    #
+    # @param tableName
+    #            command table name
+    #
+    # @return Value of the table's 'System' data field; None if the table
+    #         doesn't have the data field
+    #**************************************************************************
+    def getTableSystem(self, tableName):
+        return self.tableSystems.get(tableName)
+
+    #**************************************************************************
+    # Get the rows belonging to the command tables for the specified system
+    #
+    # @param systemName
+    #            system name; None to get every command table row
+    #
+    # @return List of row indices for the system, in table row order; an
+    #         empty list if the system has no rows
+    #**************************************************************************
+    def getRows(self, systemName):
+        # Check if no system is specified
+        if systemName is None:
+            return self.allRows
+
+        return self.systemRows.get(systemName, [])
+
+    #**************************************************************************
+    # Get the message ID for the command table to which the specified row
+    # belongs
+    #
+    # @param row
+    #            command table row index
+    #
+    # @return Value of the command table's 'Message ID' data field; None if
+    #         the table doesn't have the data field
+    #**************************************************************************
+    def getMessageID(self, row):
+        return self.tableMessageIDs[self.rowTableNames[row]]
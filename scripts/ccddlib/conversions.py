@@ -0,0 +1,305 @@
+#******************************************************************************
+# Description: Parsed enumeration, limit set, and polynomial conversion values
+#
+# This module provides parsed representations of the delimited strings found
+# in the enumeration, limit sets, and polynomial coefficients columns, along
+# with a cache that parses each distinct string once. Variables commonly share
+# the same enumeration or limit set, and a script can output a variable's
+# conversions for several flight computers, so a script obtaining the values
+# from the cache parses each string only the first time it's encountered
+#
+# The strings are parsed using the data access handler's getArrayFromString()
+# method, so the parsed values are the same as those the scripts obtained by
+# calling the method directly
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+# Separators between the parameters of an enumerated value or limit, and
+# between the enumerated values or limits
+PARAMETER_SEPARATOR = "|"
+VALUE_SEPARATOR = ","
+
+# Separator between the polynomial coefficient sets
+POLYNOMIAL_SET_SEPARATOR = "\\;"
+
+#******************************************************************************
+# Parsed enumeration. The expected format for the enumeration is:
+# <Discrete Value> | <Display Name> | <Text Color> | <Background Color>
+# [, repeat for each discrete value...]
+#******************************************************************************
+class Enumeration(object):
+    # Enumerated value parameter indices
+    VALUE = 0
+    DISPLAY_NAME = 1
+    TEXT_COLOR = 2
+    BACKGROUND_COLOR = 3
+
+    #**************************************************************************
+    # Parsed enumeration class constructor
+    #
+    # @param ccdd
+    #            script data access handler
+    #
+    # @param text
+    #            enumeration text
+    #**************************************************************************
+    def __init__(self, ccdd, text):
+        values = ccdd.getArrayFromString(text, PARAMETER_SEPARATOR, VALUE_SEPARATOR)
+        self.values = [list(value) for value in values] if values is not None else []
+
+    #**************************************************************************
+    # Get the number of enumerated values
+    #
+    # @return Number of enumerated values
+    #**************************************************************************
+    def getNumValues(self):
+        return len(self.values)
+
+    #**************************************************************************
+    # Get the number of parameters supplied for the first enumerated value
+    #
+    # @return Number of parameters for the first enumerated value; 0 if the
+    #         enumeration is empty
+    #**************************************************************************
+    def getNumParameters(self):
+        return len(self.values[0]) if self.values else 0
+
+    #**************************************************************************
+    # Get the discrete value of the specified enumerated value
+    #
+    # @param index
+    #            enumerated value index
+    #
+    # @return Discrete value
+    #**************************************************************************
+    def getValue(self, index):
+        return self.values[index][self.VALUE]
+
+    #**************************************************************************
+    # Get the display name of the specified enumerated value
+    #
+    # @param index
+    #            enumerated value index
+    #
+    # @return Display name
+    #**************************************************************************
+    def getDisplayName(self, index):
+        return self.values[index][self.DISPLAY_NAME]
+
+    #**************************************************************************
+    # Get the text color of the specified enumerated value
+    #
+    # @param index
+    #            enumerated value index
+    #
+    # @return Text color; blank if none is supplied
+    #**************************************************************************
+    def getTextColor(self, index):
+        return self.values[index][self.TEXT_COLOR]
+
+    #**************************************************************************
+    # Get the background color of the specified enumerated value
+    #
+    # @param index
+    #            enumerated value index
+    #
+    # @return Background color; blank if none is supplied
+    #**************************************************************************
+    def getBackgroundColor(self, index):
+        return self.values[index][self.BACKGROUND_COLOR]
+
+#******************************************************************************
+# Parsed limit or limit set. A single limit has the format:
+# <red-low> | <yellow-low> | <yellow-high> | <red-high>
+# A limit set has the format:
+# <context mnemonic>, <context range> | <limits> [, repeat for each limit...]
+#******************************************************************************
+class LimitSet(object):
+    #**************************************************************************
+    # Parsed limit set class constructor
+    #
+    # @param ccdd
+    #            script data access handler
+    #
+    # @param text
+    #            limit or limit set text
+    #**************************************************************************
+    def __init__(self, ccdd, text):
+        limits = ccdd.getArrayFromString(text, PARAMETER_SEPARATOR, VALUE_SEPARATOR)
+        self.limits = [list(limit) for limit in limits] if limits is not None else None
+
+    #**************************************************************************
+    # Check if the text contains a limit or limit set
+    #
+    # @return True if the text contains a limit or limit set
+    #**************************************************************************
+    def isDefined(self):
+        return self.limits is not None
+
+    #**************************************************************************
+    # Check if the text contains a single limit
+    #
+    # @return True if the text contains a single limit
+    #**************************************************************************
+    def isSingleLimit(self):
+        return self.limits is not None and len(self.limits) == 1
+
+    #**************************************************************************
+    # Check if the text contains a limit set
+    #
+    # @return True if the text contains a limit set
+    #**************************************************************************
+    def isLimitSet(self):
+        return self.limits is not None and len(self.limits) > 1
+
+    #**************************************************************************
+    # Get the limit set's context mnemonic
+    #
+    # @return Context mnemonic
+    #**************************************************************************
+    def getContextMnemonic(self):
+        return self.limits[0][0]
+
+    #**************************************************************************
+    # Get the number of limits. For a limit set this includes the context
+    # mnemonic, which has index 0
+    #
+    # @return Number of limits
+    #**************************************************************************
+    def getNumLimits(self):
+        return len(self.limits)
+
+    #**************************************************************************
+    # Get the values of the specified limit
+    #
+    # @param index
+    #            limit index. For a limit set the first limit has index 1
+    #
+    # @return List of the limit values
+    #**************************************************************************
+    def getLimits(self, index):
+        return self.limits[index]
+
+#******************************************************************************
+# Parsed polynomial coefficient sets. The sets are separated by '\;', and the
+# coefficients in each set by '|'. A set is parsed the first time its
+# coefficients are requested
+#******************************************************************************
+class PolynomialSets(object):
+    #**************************************************************************
+    # Parsed polynomial coefficient sets class constructor
+    #
+    # @param ccdd
+    #            script data access handler
+    #
+    # @param text
+    #            polynomial coefficients text
+    #**************************************************************************
+    def __init__(self, ccdd, text):
+        self.ccdd = ccdd
+        self.sets = text.split(POLYNOMIAL_SET_SEPARATOR)
+        self.coefficients = {}
+
+    #**************************************************************************
+    # Get the number of coefficient sets
+    #
+    # @return Number of coefficient sets
+    #**************************************************************************
+    def getNumSets(self):
+        return len(self.sets)
+
+    #**************************************************************************
+    # Get the coefficients of the specified set
+    #
+    # @param index
+    #            coefficient set index
+    #
+    # @return Array of the coefficients
+    #**************************************************************************
+    def getCoefficients(self, index):
+        coefficients = self.coefficients.get(index)
+
+        # Check if the set hasn't been parsed
+        if coefficients is None:
+            coefficients = self.ccdd.getArrayFromString(self.sets[index], PARAMETER_SEPARATOR)
+            self.coefficients[index] = coefficients
+
+        return coefficients
+
+#******************************************************************************
+# Cache of the parsed enumerations, limit sets, and polynomial coefficient
+# sets, keyed by the text from which each is parsed
+#******************************************************************************
+class ConversionCache(object):
+    #**************************************************************************
+    # Conversion cache class constructor
+    #
+    # @param ccdd
+    #            script data access handler
+    #**************************************************************************
+    def __init__(self, ccdd):
+        self.ccdd = ccdd
+        self.enumerations = {}
+        self.limitSets = {}
+        self.polynomialSets = {}
+
+    #**************************************************************************
+    # Get the parsed value for the specified text, parsing the text if it
+    # isn't in the cache
+    #
+    # @param cache
+    #            dictionary of the parsed values, keyed by text
+    #
+    # @param parsedClass
+    #            class used to parse the text
+    #
+    # @param text
+    #            text to parse
+    #
+    # @return Parsed value
+    #**************************************************************************
+    def getParsedValue(self, cache, parsedClass, text):
+        value = cache.get(text)
+
+        # Check if the text hasn't been parsed
+        if value is None:
+            value = parsedClass(self.ccdd, text)
+            cache[text] = value
+
+        return value
+
+    #**************************************************************************
+    # Get the parsed enumeration
+    #
+    # @param text
+    #            enumeration text
+    #
+    # @return Parsed enumeration
+    #**************************************************************************
+    def getEnumeration(self, text):
+        return self.getParsedValue(self.enumerations, Enumeration, text)
+
+    #**************************************************************************
+    # Get the parsed limit or limit set
+    #
+    # @param text
+    #            limit or limit set text
+    #
+    # @return Parsed limit set
+    #**************************************************************************
+    def getLimitSet(self, text):
+        return self.getParsedValue(self.limitSets, LimitSet, text)
+
+    #**************************************************************************
+    # Get the parsed polynomial coefficient sets
+    #
+    # @param text
+    #            polynomial coefficients text
+    #
+    # @return Parsed polynomial coefficient sets
+    #**************************************************************************
+    def getPolynomialSets(self, text):
+        return self.getParsedValue(self.polynomialSets, PolynomialSets, text)
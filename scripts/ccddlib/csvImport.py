@@ -0,0 +1,646 @@
+#******************************************************************************
+# Description: CCDD CSV import file reader
+#
+# This module reads project definitions stored in the CCDD CSV import format
+# (see the files in the tables folder) into an in-memory project description.
+# The tags recognized are those written by the CCDD CSV export: table
+# definitions (_name_type_, _description_, _column_data_, _data_fields_), table
+# type definitions (_table_type_, _table_type_data_fields_), data types
+# (_data_type_), macros (_macros_), reserved message IDs (_reserved_msg_ids_),
+# project data fields (_project_data_fields_), and groups (_group_,
+# _group_data_fields_). Array member rows are generated from the array
+# definitions in the same manner as the CCDD table editor
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+import csv
+import re
+
+# Generic table type names
+TYPE_STRUCTURE = "Structure"
+TYPE_COMMAND = "Command"
+
+# Default input type names
+INPUT_ARGUMENT_NAME = "Argument name"
+INPUT_ARRAY_INDEX = "Array index"
+INPUT_BIT_LENGTH = "Bit length"
+INPUT_COMMAND_CODE = "Command code"
+INPUT_COMMAND_NAME = "Command name"
+INPUT_DESCRIPTION = "Description"
+INPUT_ENUMERATION = "Enumeration"
+INPUT_MAXIMUM = "Maximum"
+INPUT_MESSAGE_NAME_AND_ID = "Message name & ID"
+INPUT_MINIMUM = "Minimum"
+INPUT_PRIMITIVE = "Primitive"
+INPUT_PRIM_AND_STRUCT = "Primitive & Structure"
+INPUT_RATE = "Rate"
+INPUT_UNITS = "Units"
+INPUT_VARIABLE = "Variable name"
+INPUT_VARIABLE_PATH = "Variable path"
+
+# Input types that must be present for a table type to represent a structure
+# or a command
+STRUCTURE_INPUT_TYPES = [INPUT_VARIABLE, INPUT_PRIM_AND_STRUCT, INPUT_ARRAY_INDEX, INPUT_BIT_LENGTH, INPUT_RATE]
+COMMAND_INPUT_TYPES = [INPUT_COMMAND_NAME, INPUT_COMMAND_CODE]
+
+# Default table type column definitions: column name, description, input type
+DEFAULT_STRUCTURE_COLUMNS = [["Variable Name", "Parameter name", INPUT_VARIABLE],
+                             ["Description", "Parameter description", INPUT_DESCRIPTION],
+                             ["Units", "Parameter units", INPUT_UNITS],
+                             ["Data Type", "Parameter data type", INPUT_PRIM_AND_STRUCT],
+                             ["Array Size", "Parameter array size", INPUT_ARRAY_INDEX],
+                             ["Bit Length", "Parameter number of bits (bit values only)", INPUT_BIT_LENGTH],
+                             ["Enumeration", "Enumerated parameters", INPUT_ENUMERATION],
+                             ["Minimum", "Minimum value", INPUT_MINIMUM],
+                             ["Maximum", "Maximum value", INPUT_MAXIMUM],
+                             ["Rate", "Downlink data rate, samples/second", INPUT_RATE]]
+DEFAULT_COMMAND_COLUMNS = [["Command Name", "Command name", INPUT_COMMAND_NAME],
+                           ["Command Code", "Command function code", INPUT_COMMAND_CODE],
+                           ["Description", "Command description", INPUT_DESCRIPTION],
+                           ["Arg 1 Name", "Command argument 1 name", INPUT_ARGUMENT_NAME],
+                           ["Arg 1 Description", "Command argument 1 description", INPUT_DESCRIPTION],
+                           ["Arg 1 Units", "Command argument 1 units", INPUT_UNITS],
+                           ["Arg 1 Data Type", "Command argument 1 data type", INPUT_PRIMITIVE],
+                           ["Arg 1 Array Size", "Command argument 1 array size", INPUT_ARRAY_INDEX],
+                           ["Arg 1 Bit Length", "Command argument 1 bit length", INPUT_BIT_LENGTH],
+                           ["Arg 1 Enumeration", "Command argument 1 enumeration", INPUT_ENUMERATION],
+                           ["Arg 1 Minimum", "Command argument 1 minimum value", INPUT_MINIMUM],
+                           ["Arg 1 Maximum", "Command argument 1 maximum value", INPUT_MAXIMUM]]
+
+# Default primitive data type definitions: user name, C name, size (bytes), and
+# base type
+DEFAULT_DATA_TYPES = [["int8_t", "signed char", "1", "signed integer"],
+                      ["int16_t", "signed short int", "2", "signed integer"],
+                      ["int32_t", "signed int", "4", "signed integer"],
+                      ["int64_t", "signed long int", "8", "signed integer"],
+                      ["uint8_t", "unsigned char", "1", "unsigned integer"],
+                      ["uint16_t", "unsigned short int", "2", "unsigned integer"],
+                      ["uint32_t", "unsigned int", "4", "unsigned integer"],
+                      ["uint64_t", "unsigned long int", "8", "unsigned integer"],
+                      ["float", "float", "4", "floating point"],
+                      ["double", "double", "8", "floating point"],
+                      ["char", "char", "1", "character"],
+                      ["string", "char", "2", "character"],
+                      ["address", "void *", "4", "pointer"],
+                      ["", "void *", "4", "pointer"]]
+
+# Regular expression for removing trailing empty columns from an import row
+TRAILING_EMPTY_COLUMNS = re.compile(r'(?:[,\s*]|"\s*",|,"\s*")*$')
+
+#** Classes *******************************************************************
+
+#******************************************************************************
+# Table type definition
+#******************************************************************************
+class TableTypeDefinition(object):
+    #**************************************************************************
+    # Table type definition class constructor
+    #
+    # @param typeName
+    #            table type name
+    #
+    # @param description
+    #            table type description
+    #
+    # @param columns
+    #            list of column definitions; each definition is a list
+    #            containing the column name, description, and input type name
+    #**************************************************************************
+    def __init__(self, typeName, description, columns):
+        self.typeName = typeName
+        self.description = description
+        self.columnNames = [column[0] for column in columns]
+        self.columnDescriptions = [column[1] for column in columns]
+        self.inputTypes = [column[2] for column in columns]
+        self.isStructure = self.hasInputTypes(STRUCTURE_INPUT_TYPES)
+        self.isCommand = self.hasInputTypes(COMMAND_INPUT_TYPES) and not self.isStructure
+
+    #**************************************************************************
+    # Check if the table type includes a column for every supplied input type
+    #
+    # @param inputTypes
+    #            list of input type names
+    #
+    # @return true if every input type is present
+    #**************************************************************************
+    def hasInputTypes(self, inputTypes):
+        for inputType in inputTypes:
+            if self.getColumnIndexByInputType(inputType) == -1:
+                return False
+
+        return True
+
+    #**************************************************************************
+    # Get the index of the first column having the specified input type
+    #
+    # @param inputType
+    #            input type name
+    #
+    # @return Column index; -1 if no column has the input type
+    #**************************************************************************
+    def getColumnIndexByInputType(self, inputType):
+        for column in range(len(self.inputTypes)):
+            if self.inputTypes[column].lower() == inputType.lower():
+                return column
+
+        return -1
+
+    #**************************************************************************
+    # Get the indices of every column having the specified input type
+    #
+    # @param inputType
+    #            input type name
+    #
+    # @return List of column indices
+    #**************************************************************************
+    def getColumnIndicesByInputType(self, inputType):
+        return [column for column in range(len(self.inputTypes)) if self.inputTypes[column].lower() == inputType.lower()]
+
+    #**************************************************************************
+    # Get the index of the column with the specified name (case insensitive)
+    #
+    # @param columnName
+    #            column name
+    #
+    # @return Column index; -1 if the column doesn't exist
+    #**************************************************************************
+    def getColumnIndexByUserName(self, columnName):
+        if columnName is not None:
+            for column in range(len(self.columnNames)):
+                if self.columnNames[column].lower() == columnName.lower():
+                    return column
+
+        return -1
+
+    #**************************************************************************
+    # Get the command argument column groupings. An argument begins at a column
+    # with the argument name input type and includes the columns that follow
+    # it, up to the next argument name column
+    #
+    # @return List of dictionaries, one per argument, mapping the input type
+    #         name to the column index. Columns with other input types are
+    #         listed under the key 'other'
+    #**************************************************************************
+    def getCommandArgumentColumns(self):
+        arguments = []
+        argument = None
+
+        for column in range(len(self.inputTypes)):
+            inputType = self.inputTypes[column]
+
+            # Check if this column begins a new command argument
+            if inputType == INPUT_ARGUMENT_NAME:
+                argument = {"name": column, "other": []}
+                arguments.append(argument)
+            # Check if the column belongs to a command argument
+            elif argument is not None:
+                key = {INPUT_PRIMITIVE: "dataType",
+                       INPUT_ARRAY_INDEX: "arraySize",
+                       INPUT_BIT_LENGTH: "bitLength",
+                       INPUT_DESCRIPTION: "description",
+                       INPUT_UNITS: "units",
+                       INPUT_ENUMERATION: "enumeration",
+                       INPUT_MINIMUM: "minimum",
+                       INPUT_MAXIMUM: "maximum"}.get(inputType)
+
+                if key is not None and key not in argument:
+                    argument[key] = column
+                else:
+                    argument["other"].append(column)
+
+        return arguments
+
+#******************************************************************************
+# Data field definition
+#******************************************************************************
+class DataField(object):
+    #**************************************************************************
+    # Data field class constructor
+    #
+    # @param ownerName
+    #            name of the table, group, or type owning the field
+    #
+    # @param values
+    #            list containing the field name, description, size, input
+    #            type, required flag, applicability, value, and inherited flag
+    #**************************************************************************
+    def __init__(self, ownerName, values):
+        values = values + [""] * (8 - len(values))
+        self.ownerName = ownerName
+        self.fieldName = values[0]
+        self.description = values[1]
+        self.size = values[2]
+        self.inputType = values[3]
+        self.required = values[4]
+        self.applicability = values[5]
+        self.value = values[6]
+        self.inherited = values[7]
+
+#******************************************************************************
+# Table definition, as read from the import file
+#******************************************************************************
+class TableDefinition(object):
+    #**************************************************************************
+    # Table definition class constructor
+    #
+    # @param tableName
+    #            table name (prototype name or instance path)
+    #
+    # @param typeName
+    #            table type name
+    #**************************************************************************
+    def __init__(self, tableName, typeName):
+        self.tableName = tableName
+        self.typeName = typeName
+        self.description = ""
+        self.data = []
+        self.dataFields = []
+
+#******************************************************************************
+# Group definition
+#******************************************************************************
+class GroupDefinition(object):
+    #**************************************************************************
+    # Group definition class constructor
+    #
+    # @param values
+    #            list containing the group name, description, application
+    #            flag, and the table members separated by semicolons
+    #**************************************************************************
+    def __init__(self, values):
+        values = values + [""] * (4 - len(values))
+        self.name = values[0]
+        self.description = values[1]
+        self.isApplication = values[2].lower() == "true"
+        self.tables = [member.strip() for member in values[3].split(";") if member.strip()]
+        self.dataFields = []
+
+#******************************************************************************
+# In-memory project definition built from one or more CSV import files
+#******************************************************************************
+class ProjectDefinition(object):
+    #**************************************************************************
+    # Project definition class constructor
+    #**************************************************************************
+    def __init__(self):
+        self.tableTypes = [TableTypeDefinition(TYPE_STRUCTURE, "Default structure table type", DEFAULT_STRUCTURE_COLUMNS),
+                           TableTypeDefinition(TYPE_COMMAND, "Default command table type", DEFAULT_COMMAND_COLUMNS)]
+        self.dataTypes = [list(dataType) for dataType in DEFAULT_DATA_TYPES]
+        self.macros = []
+        self.reservedMsgIDs = []
+        self.tables = []
+        self.projectFields = []
+        self.typeFields = []
+        self.groups = []
+
+    #**************************************************************************
+    # Get the table type definition for the specified type name
+    #
+    # @param typeName
+    #            table type name (case insensitive)
+    #
+    # @return Table type definition; None if the type doesn't exist
+    #**************************************************************************
+    def getTypeDefinition(self, typeName):
+        for typeDefn in self.tableTypes:
+            if typeDefn.typeName.lower() == typeName.lower():
+                return typeDefn
+
+        return None
+
+    #**************************************************************************
+    # Add or replace a table type definition
+    #
+    # @param typeDefn
+    #            table type definition
+    #**************************************************************************
+    def setTypeDefinition(self, typeDefn):
+        for index in range(len(self.tableTypes)):
+            if self.tableTypes[index].typeName.lower() == typeDefn.typeName.lower():
+                self.tableTypes[index] = typeDefn
+                return
+
+        self.tableTypes.append(typeDefn)
+
+    #**************************************************************************
+    # Add or replace a data type definition
+    #
+    # @param dataType
+    #            list containing the user name, C name, size, and base type
+    #**************************************************************************
+    def setDataType(self, dataType):
+        name = (dataType[0] or dataType[1]).lower()
+
+        for index in range(len(self.dataTypes)):
+            if (self.dataTypes[index][0] or self.dataTypes[index][1]).lower() == name:
+                self.dataTypes[index] = dataType
+                return
+
+        self.dataTypes.append(dataType)
+
+    #**************************************************************************
+    # Add or replace a macro definition
+    #
+    # @param name
+    #            macro name
+    #
+    # @param value
+    #            macro value
+    #**************************************************************************
+    def setMacro(self, name, value):
+        for macro in self.macros:
+            if macro[0].lower() == name.lower():
+                macro[1] = value
+                return
+
+        self.macros.append([name, value])
+
+    #**************************************************************************
+    # Get the table definition with the specified name
+    #
+    # @param tableName
+    #            table name
+    #
+    # @return Table definition; None if no table has the name
+    #**************************************************************************
+    def getTable(self, tableName):
+        for table in self.tables:
+            if table.tableName == tableName:
+                return table
+
+        return None
+
+#** Functions *****************************************************************
+
+#******************************************************************************
+# Split an import file row into its column values
+#
+# @param line
+#            import file row, with trailing empty columns removed
+#
+# @return List of column values with the surrounding quotes removed
+#******************************************************************************
+def splitRow(line):
+    return [value.strip() for value in next(csv.reader([line], skipinitialspace=True))]
+
+#******************************************************************************
+# Read the rows from a CSV import file, skipping blank and comment lines and
+# joining multiple-line quoted values
+#
+# @param fileName
+#            import file name
+#
+# @return List of rows, each a list of column values
+#******************************************************************************
+def readRows(fileName):
+    rows = []
+    importFile = open(fileName)
+
+    try:
+        lines = importFile.read().splitlines()
+    finally:
+        importFile.close()
+
+    index = 0
+
+    while index < len(lines):
+        line = lines[index]
+        index += 1
+        trimmedLine = line.strip()
+
+        # Check that the row isn't empty and isn't a comment line
+        if trimmedLine and not trimmedLine.startswith("#"):
+            # Check if the line contains an odd number of double quotes, which
+            # indicates a value that spans multiple lines
+            if trimmedLine.count('"') % 2 != 0:
+                while index < len(lines):
+                    nextLine = lines[index]
+                    index += 1
+                    line += "\n" + nextLine
+
+                    if nextLine.count('"') % 2 != 0:
+                        break
+
+                trimmedLine = line.strip()
+
+            rows.append(splitRow(TRAILING_EMPTY_COLUMNS.sub("", trimmedLine, 1)))
+
+    return rows
+
+#******************************************************************************
+# Get the array index values for an array size, e.g., "2, 3" -> [2, 3]
+#
+# @param arraySize
+#            array size with any macros expanded
+#
+# @return List of array dimension sizes; an empty list if the size is blank or
+#         not an array size
+#******************************************************************************
+def getArrayDimensions(arraySize):
+    dimensions = []
+
+    for dim in re.split(r"\s*,\s*", arraySize.strip()):
+        if not re.match(r"^\d+$", dim):
+            return []
+
+        dimensions.append(int(dim))
+
+    return dimensions
+
+#******************************************************************************
+# Add the array member rows following each array definition in a structure
+# table's data. Each member is a copy of the definition row with the array
+# index appended to the variable name
+#
+# @param typeDefn
+#            table type definition
+#
+# @param data
+#            list of table rows (array definitions only)
+#
+# @param expandMacros
+#            function that expands the macros in the supplied text
+#
+# @return List of table rows including the array members
+#******************************************************************************
+def addArrayMembers(typeDefn, data, expandMacros):
+    variableColumn = typeDefn.getColumnIndexByInputType(INPUT_VARIABLE)
+    arraySizeColumn = typeDefn.getColumnIndexByInputType(INPUT_ARRAY_INDEX)
+
+    if variableColumn == -1 or arraySizeColumn == -1:
+        return data
+
+    expanded = []
+
+    for row in data:
+        expanded.append(row)
+
+        # Check if the row is an array definition that isn't followed by its
+        # members already
+        if row[arraySizeColumn] and not row[variableColumn].endswith("]"):
+            dimensions = getArrayDimensions(expandMacros(row[arraySizeColumn]))
+            numMembers = 1
+
+            for dim in dimensions:
+                numMembers *= dim
+
+            # An array size of one has no members
+            if numMembers == 1:
+                numMembers = 0
+
+            counter = [0] * len(dimensions)
+
+            for member in range(numMembers):
+                memberRow = list(row)
+                memberRow[variableColumn] += "".join(["[" + str(index) + "]" for index in counter])
+                expanded.append(memberRow)
+
+                # Advance the array index, starting with the last dimension
+                for dim in range(len(counter) - 1, -1, -1):
+                    counter[dim] += 1
+
+                    if counter[dim] < dimensions[dim]:
+                        break
+
+                    counter[dim] = 0
+
+    return expanded
+
+#******************************************************************************
+# Read a CSV import file into the project definition
+#
+# @param project
+#            project definition to update
+#
+# @param fileName
+#            import file name
+#
+# @param isDefinitionPass
+#            true to read the table type, data type, macro, reserved message
+#            ID, project data field, and group definitions; false to read the
+#            table definitions
+#******************************************************************************
+def importFile(project, fileName, isDefinitionPass):
+    tag = None
+    table = None
+    columnIndex = None
+    typeDefn = None
+    tableTypeDefn = None
+    tableTypeColumns = None
+    group = None
+
+    # Step through each row in the import file
+    for columnValues in readRows(fileName):
+        firstColumn = columnValues[0].lower()
+
+        # Check if this row is a tag
+        if len(columnValues) == 1 and firstColumn.startswith("_") and firstColumn.endswith("_"):
+            tag = firstColumn
+
+            if tag == "_name_type_":
+                table = None
+            elif tag == "_table_type_":
+                tableTypeDefn = None
+            elif tag == "_group_":
+                group = None
+
+            continue
+
+        # Check if this tag's information isn't read during this pass
+        if isDefinitionPass == (tag in ["_name_type_", "_description_", "_column_data_", "_cell_data_", "_data_fields_"]):
+            # Skip the row, but note the transition to table data
+            if tag == "_column_data_":
+                tag = "_cell_data_"
+
+            continue
+
+        if tag == "_name_type_":
+            # Create the table definition and get its type definition
+            table = TableDefinition(columnValues[0], columnValues[1] if len(columnValues) > 1 else "")
+            typeDefn = project.getTypeDefinition(table.typeName)
+
+            if typeDefn is None:
+                raise ValueError("Unknown table type '" + table.typeName + "' in import file '" + fileName + "'")
+
+            project.tables.append(table)
+        elif tag == "_description_" and table is not None:
+            table.description = columnValues[0]
+        elif tag == "_column_data_" and table is not None:
+            # Map the column names to the type definition's columns, then treat
+            # the following rows as table data
+            columnIndex = [typeDefn.getColumnIndexByUserName(name) for name in columnValues]
+            tag = "_cell_data_"
+        elif tag == "_cell_data_" and table is not None:
+            rowData = [""] * len(typeDefn.columnNames)
+
+            for index in range(len(columnValues)):
+                if index < len(columnIndex) and columnIndex[index] != -1:
+                    rowData[columnIndex[index]] = columnValues[index]
+
+            table.data.append(rowData)
+        elif tag == "_data_fields_" and table is not None:
+            table.dataFields.append(DataField(table.tableName, columnValues))
+        elif tag == "_table_type_":
+            # Check if this is the table type name and description row
+            if tableTypeDefn is None:
+                tableTypeColumns = []
+                tableTypeDefn = TableTypeDefinition(columnValues[0], columnValues[1] if len(columnValues) > 1 else "", [])
+            # This is a column definition row
+            else:
+                tableTypeColumns.append([columnValues[0], columnValues[1] if len(columnValues) > 1 else "", columnValues[2] if len(columnValues) > 2 else "Text"])
+
+            project.setTypeDefinition(TableTypeDefinition(tableTypeDefn.typeName, tableTypeDefn.description, tableTypeColumns))
+        elif tag == "_table_type_data_fields_" and tableTypeDefn is not None:
+            project.typeFields.append(DataField(tableTypeDefn.typeName, columnValues))
+        elif tag == "_data_type_":
+            project.setDataType((columnValues + [""] * 4)[:4])
+        elif tag == "_macros_":
+            project.setMacro(columnValues[0], columnValues[1] if len(columnValues) > 1 else "")
+        elif tag == "_reserved_msg_ids_":
+            project.reservedMsgIDs.append((columnValues + [""])[:2])
+        elif tag == "_project_data_fields_":
+            project.projectFields.append(DataField("", columnValues))
+        elif tag == "_group_":
+            group = GroupDefinition(columnValues)
+            project.groups.append(group)
+        elif tag == "_group_data_fields_" and group is not None:
+            group.dataFields.append(DataField(group.name, columnValues))
+
+#******************************************************************************
+# Read the specified CSV import files into a project definition
+#
+# @param fileNames
+#            list of import file names
+#
+# @return Project definition
+#******************************************************************************
+def readProject(fileNames):
+    project = ProjectDefinition()
+
+    # Read the files in two passes so that the table types, macros, and data
+    # types are known regardless of the order in which they appear
+    for isDefinitionPass in [True, False]:
+        for fileName in fileNames:
+            importFile(project, fileName, isDefinitionPass)
+
+    return project
+
+#******************************************************************************
+# Create the array member rows for each structure table in the project
+#
+# @param project
+#            project definition
+#
+# @param expandMacros
+#            function that expands the macros in the supplied text; used to
+#            determine the array sizes
+#******************************************************************************
+def addProjectArrayMembers(project, expandMacros):
+    for table in project.tables:
+        typeDefn = project.getTypeDefinition(table.typeName)
+
+        if typeDefn.isStructure:
+            table.data = addArrayMembers(typeDefn, table.data, expandMacros)
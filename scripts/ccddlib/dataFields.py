@@ -0,0 +1,155 @@
+#******************************************************************************
+# Description: Data field value cache
+#
+# This module provides a cache of the table and group data field values
+# supplied to a script. The values of every data field belonging to the tables
+# and groups are read with a single call to the data access handler the first
+# time a value is requested, so that a script retrieving the same data field
+# repeatedly (e.g., a structure's 'Message ID' for each output file) obtains it
+# from memory instead of from the data access handler. A table or group that
+# has data fields in the bulk read has no others, so a request for a field it
+# doesn't have is answered without a further call. A value for a table or group
+# that isn't in the bulk read (e.g., an instance table path) is retrieved from
+# the handler and retained
+#
+# The script data access handler doesn't alter the project data, other than by
+# a database query that modifies the data field table. A script that alters the
+# data fields in this way must perform the query using the cache's
+# getDatabaseQuery() method, or call invalidate() afterwards, so that the
+# values are read again on the next request
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+#******************************************************************************
+# Data field value cache
+#******************************************************************************
+class DataFieldCache(object):
+    #**************************************************************************
+    # Data field value cache class constructor
+    #
+    # @param ccdd
+    #            script data access handler
+    #**************************************************************************
+    def __init__(self, ccdd):
+        self.ccdd = ccdd
+        self.tableFields = None
+        self.groupFields = None
+        self.tableOwners = None
+        self.groupOwners = None
+
+    #**************************************************************************
+    # Read the values of every table and group data field using a single call
+    # to the data access handler
+    #**************************************************************************
+    def load(self):
+        self.tableFields = {}
+        self.groupFields = {}
+        self.tableOwners = set()
+        self.groupOwners = set()
+
+        # Step through each table and group data field. Each contains the
+        # owner type, owner name, field name, and field value. The names are
+        # stored in lower case since the handler matches them case
+        # insensitively; if names differ only in case the first is used, as
+        # by the handler
+        for ownerType, ownerName, fieldName, value in self.ccdd.getAllDataFieldValues():
+            # Check if the field belongs to a group
+            if ownerType == "Group":
+                self.groupFields.setdefault((ownerName.lower(), fieldName.lower()), value)
+                self.groupOwners.add(ownerName.lower())
+            # The field belongs to a table
+            else:
+                self.tableFields.setdefault((ownerName.lower(), fieldName.lower()), value)
+                self.tableOwners.add(ownerName.lower())
+
+    #**************************************************************************
+    # Discard the cached values. The values are read again on the next request
+    #**************************************************************************
+    def invalidate(self):
+        self.tableFields = None
+        self.groupFields = None
+        self.tableOwners = None
+        self.groupOwners = None
+
+    #**************************************************************************
+    # Get the value for the specified table's specified data field
+    #
+    # @param tableName
+    #            name of the table, including the path if this table references
+    #            a structure, for which the field is a member
+    #
+    # @param fieldName
+    #            data field name (case insensitive)
+    #
+    # @return Data field value; None if the table name or field name is
+    #         invalid
+    #**************************************************************************
+    def getTableDataFieldValue(self, tableName, fieldName):
+        # Check if the values haven't been read
+        if self.tableFields is None:
+            self.load()
+
+        key = (tableName.lower(), fieldName.lower())
+
+        # Check if the value isn't in the cache
+        if key not in self.tableFields:
+            # Check if the table's data fields are in the cache, in which case
+            # the table doesn't have the field
+            if key[0] in self.tableOwners:
+                self.tableFields[key] = None
+            # The table's data fields weren't read
+            else:
+                self.tableFields[key] = self.ccdd.getTableDataFieldValue(tableName, fieldName)
+
+        return self.tableFields[key]
+
+    #**************************************************************************
+    # Get the value for the specified group's specified data field
+    #
+    # @param groupName
+    #            name of the group for which the field is a member
+    #
+    # @param fieldName
+    #            data field name (case insensitive)
+    #
+    # @return Data field value; None if the group name or field name is
+    #         invalid
+    #**************************************************************************
+    def getGroupDataFieldValue(self, groupName, fieldName):
+        # Check if the values haven't been read
+        if self.groupFields is None:
+            self.load()
+
+        key = (groupName.lower(), fieldName.lower())
+
+        # Check if the value isn't in the cache
+        if key not in self.groupFields:
+            # Check if the group's data fields are in the cache, in which case
+            # the group doesn't have the field
+            if key[0] in self.groupOwners:
+                self.groupFields[key] = None
+            # The group's data fields weren't read
+            else:
+                self.groupFields[key] = self.ccdd.getGroupDataFieldValue(groupName, fieldName)
+
+        return self.groupFields[key]
+
+    #**************************************************************************
+    # Perform a query on the currently open database. Since the query can
+    # modify the data fields the cached values are discarded
+    #
+    # @param sqlCommand
+    #            PostgreSQL-compatible database query statement
+    #
+    # @return Two-dimensional array representing the rows and columns of data
+    #         returned by the database query; None if the query produces an
+    #         error, or an empty array if there are no results
+    #**************************************************************************
+    def getDatabaseQuery(self, sqlCommand):
+        try:
+            return self.ccdd.getDatabaseQuery(sqlCommand)
+        finally:
+            self.invalidate()
@@ -0,0 +1,294 @@
+#******************************************************************************
+# Description: Multiple script generation driver
+#
+# This module executes several data output scripts (e.g., typesHeader.py,
+# msgidHeader.py, itosRecFile.py) using a single load of the project data. The
+# project definitions are read from the CCDD CSV import file(s) once, and each
+# script is given a headless data access handler that shares the loaded data.
+# The scripts are independent of one another and are executed concurrently
+# using a pool of processes (or threads). The time taken to execute each
+# script is reported
+#
+# If incremental regeneration is selected a manifest, stored by default in the
+# output folder, records a hash of each script's inputs and of each of its
+# output files. A script is executed only if its inputs changed since the
+# previous generation, and an output file is rewritten only if its contents
+# (excluding the creation date and time) changed
+#
+# Usage:
+#   python -m ccddlib.driver [options] -x script.py [-x script.py ...]
+#       import.csv [import.csv ...]
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from ccddlib import headless
+from ccddlib.manifest import ArtifactManifest, MANIFEST_FILE_NAME, computeInputHash, computeProjectHash
+
+# Data access handler containing the loaded project data. This is set prior to
+# creating the process pool so that the worker processes inherit the data
+sharedHandler = None
+
+# Artifact manifest used to track the scripts' output files; None if the
+# output files aren't tracked
+sharedManifest = None
+
+#******************************************************************************
+# Script execution result
+#******************************************************************************
+class ScriptResult(object):
+    #**************************************************************************
+    # Script execution result class constructor
+    #
+    # @param scriptFileName
+    #            name of the script file executed
+    #
+    # @param elapsedTime
+    #            script execution time, in seconds
+    #
+    # @param errors
+    #            list of the error messages issued by the script, including
+    #            the traceback if the script terminated due to an exception
+    #
+    # @param outputHashes
+    #            dictionary containing the content hashes of the script's
+    #            output files; None if the output files aren't tracked
+    #
+    # @param isSkipped
+    #            True if the script wasn't executed since its inputs are
+    #            unchanged
+    #**************************************************************************
+    def __init__(self, scriptFileName, elapsedTime, errors, outputHashes=None, isSkipped=False):
+        self.scriptFileName = scriptFileName
+        self.elapsedTime = elapsedTime
+        self.errors = errors
+        self.outputHashes = outputHashes
+        self.isSkipped = isSkipped
+
+    #**************************************************************************
+    # Check if the script executed without error
+    #
+    # @return True if the script issued no error
+    #**************************************************************************
+    def isSuccessful(self):
+        return len(self.errors) == 0
+
+#******************************************************************************
+# Execute a script using a data access handler that shares the loaded project
+# data
+#
+# @param scriptFileName
+#            name of the script file to execute
+#
+# @return Script execution result
+#******************************************************************************
+def executeScript(scriptFileName):
+    ccdd = sharedHandler.getScriptHandler(scriptFileName, sharedManifest)
+    startTime = time.time()
+
+    try:
+        headless.runScript(scriptFileName, ccdd)
+    except Exception:
+        ccdd.errorMessages.append(traceback.format_exc())
+
+    return ScriptResult(scriptFileName, time.time() - startTime, ccdd.errorMessages, ccdd.outputHashes)
+
+#******************************************************************************
+# Get the values, other than the project data, that affect a script's output
+#
+# @param ccdd
+#            data access handler for the script
+#
+# @return List of the values affecting the script's output
+#******************************************************************************
+def getScriptParameters(ccdd):
+    return [os.path.abspath(ccdd.getScriptName()),
+            ccdd.getUser(),
+            ccdd.getProject(),
+            ccdd.getOutputPath(),
+            ccdd.radioButtonSelection,
+            list(ccdd.getAssociatedGroupNames())]
+
+#******************************************************************************
+# Execute the scripts concurrently using a single load of the project data
+#
+# @param ccdd
+#            headless data access handler containing the loaded project data
+#
+# @param scriptFileNames
+#            list of the names of the script files to execute
+#
+# @param workers
+#            maximum number of scripts to execute concurrently; None to use
+#            the number of processors
+#
+# @param useThreads
+#            True to execute the scripts using threads instead of processes.
+#            Threads are also used if the operating system can't create a
+#            process that inherits the loaded data (i.e., fork() isn't
+#            supported)
+#
+# @param manifest
+#            artifact manifest for incremental regeneration; None to execute
+#            every script. If supplied, only the scripts whose inputs changed
+#            are executed, and the manifest is updated and saved
+#
+# @return List of the script execution results, in the order of the script
+#         file names
+#******************************************************************************
+def runScripts(ccdd, scriptFileNames, workers=None, useThreads=False, manifest=None):
+    global sharedHandler, sharedManifest
+    sharedHandler = ccdd
+    sharedManifest = manifest
+    results = {}
+    inputHashes = {}
+
+    # Check if incremental regeneration is selected
+    if manifest is not None:
+        projectHash = computeProjectHash(ccdd)
+
+        # Step through each script
+        for scriptFileName in scriptFileNames:
+            inputHash = computeInputHash(scriptFileName,
+                                         projectHash,
+                                         getScriptParameters(ccdd.getScriptHandler(scriptFileName)))
+
+            # Check if the script's inputs and output files are unchanged
+            if manifest.isUpToDate(scriptFileName, inputHash):
+                results[scriptFileName] = ScriptResult(scriptFileName, 0.0, [], isSkipped=True)
+            # The script must be executed
+            else:
+                inputHashes[scriptFileName] = inputHash
+
+    pending = [scriptFileName for scriptFileName in scriptFileNames if scriptFileName not in results]
+
+    # Check if the number of concurrent scripts isn't specified
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+
+    workers = max(1, min(workers, len(pending)))
+
+    # Check if only one script is executed at a time
+    if workers == 1:
+        executed = [executeScript(scriptFileName) for scriptFileName in pending]
+    # Execute the scripts concurrently
+    else:
+        # Check if processes are used and can inherit the loaded data
+        if not useThreads and "fork" in multiprocessing.get_all_start_methods():
+            executor = ProcessPoolExecutor(workers, multiprocessing.get_context("fork"))
+        # Use threads
+        else:
+            executor = ThreadPoolExecutor(workers)
+
+        try:
+            executed = list(executor.map(executeScript, pending))
+        finally:
+            executor.shutdown()
+
+    # Step through each executed script's result
+    for result in executed:
+        results[result.scriptFileName] = result
+
+        # Check if the manifest is updated and the script executed without
+        # error. A script that failed is executed again on the next generation
+        if manifest is not None and result.isSuccessful():
+            manifest.setArtifact(result.scriptFileName,
+                                 inputHashes[result.scriptFileName],
+                                 result.outputHashes)
+
+    # Check if incremental regeneration is selected
+    if manifest is not None:
+        manifest.save()
+
+    return [results[scriptFileName] for scriptFileName in scriptFileNames]
+
+#******************************************************************************
+# Output the script execution times and status
+#
+# @param results
+#            list of the script execution results
+#
+# @param loadTime
+#            time taken to load the project data, in seconds
+#
+# @param totalTime
+#            total elapsed time, in seconds
+#
+# @param outputFile
+#            file to which to write the report
+#******************************************************************************
+def outputReport(results, loadTime, totalTime, outputFile):
+    nameWidth = max([len("Project data")] + [len(os.path.basename(result.scriptFileName)) for result in results])
+    outputFile.write("%-*s %9s  %s\n" % (nameWidth, "Artifact", "Time (s)", "Status"))
+    outputFile.write("%-*s %9.3f\n" % (nameWidth, "Project data", loadTime))
+
+    # Step through each script's result
+    for result in results:
+        outputFile.write("%-*s %9.3f  %s\n" % (nameWidth,
+                                               os.path.basename(result.scriptFileName),
+                                               result.elapsedTime,
+                                               "unchanged" if result.isSkipped else "ok" if result.isSuccessful() else "failed"))
+
+        # Step through each error issued by the script
+        for error in result.errors:
+            outputFile.write("    " + error.rstrip().replace("\n", "\n    ") + "\n")
+
+    outputFile.write("%-*s %9.3f\n" % (nameWidth, "Total", totalTime))
+
+#******************************************************************************
+# Command line entry point
+#
+# @param args
+#            command line arguments
+#
+# @return Exit status
+#******************************************************************************
+def main(args=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Execute CCDD data output scripts without the CCDD application using a single load of the project data")
+    parser.add_argument("-x", "--script", action="append", dest="scripts", required=True, help="script file to execute; repeat for each script")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="maximum number of scripts executed concurrently (default: number of processors)")
+    parser.add_argument("--threads", action="store_true", help="execute the scripts using threads instead of processes")
+    parser.add_argument("-i", "--incremental", action="store_true", help="execute only the scripts whose inputs changed since the previous generation")
+    parser.add_argument("-m", "--manifest", default=None, help="incremental regeneration manifest file (default: " + MANIFEST_FILE_NAME + " in the output folder)")
+    headless.addHandlerArguments(parser)
+    options = parser.parse_args(args)
+
+    startTime = time.time()
+
+    # Check if the date and time isn't specified
+    if options.date is None:
+        # Use the same date and time for every script's output
+        options.date = time.strftime("%a %b %d %H:%M:%S %Z %Y")
+
+    ccdd = headless.createHandlerFromArguments(options)
+    loadTime = time.time() - startTime
+    manifest = None
+
+    # Check if incremental regeneration is selected
+    if options.incremental or options.manifest is not None:
+        manifest = ArtifactManifest(options.manifest or os.path.join(options.output, MANIFEST_FILE_NAME))
+
+    results = runScripts(ccdd, options.scripts, options.jobs, options.threads, manifest)
+    outputReport(results, loadTime, time.time() - startTime, sys.stdout)
+
+    # Check if any script issued an error
+    for result in results:
+        if not result.isSuccessful():
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
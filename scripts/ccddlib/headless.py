@@ -0,0 +1,1700 @@
+#******************************************************************************
+# Description: Headless script data access handler
+#
+# This module provides a pure-Python stand-in for the CCDD script data access
+# handler (the 'ccdd' object supplied to scripts by the CCDD application). The
+# project data is read from files in the CCDD CSV import format instead of the
+# project database, so the data output scripts can be executed without the
+# CCDD application, Java, or PostgreSQL. The table data supplied to a script is
+# assembled in the same manner as CCDD: each associated table's rows are
+# followed by the rows of any child structure tables, with the table type and
+# path appended to each row
+#
+# Usage:
+#   python -m ccddlib.headless [options] script.py import.csv [import.csv ...]
+#
+# Information not stored in the CSV import format (telemetry scheduler links,
+# copy table entries, and application scheduler data) is returned as empty
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+import copy
+import getpass
+import os
+import re
+import sys
+import time
+import types
+
+from ccddlib import csvImport
+from ccddlib import profiler
+from ccddlib.macroExpansion import MacroExpander
+from ccddlib.manifest import ContentHash
+from ccddlib.csvImport import TYPE_STRUCTURE, TYPE_COMMAND
+
+# Pattern for removing the data types from a variable path
+DATA_TYPE_PATTERN = re.compile(r",[^\.]*\.")
+
+# Pattern for an array member variable name
+ARRAY_MEMBER_PATTERN = re.compile(r"^.+\[\d+\](?:\[\d+\])*$")
+
+# Pattern for the first array member; used to find the array definition path
+FIRST_ARRAY_MEMBER_PATTERN = re.compile(r"^(.+)(?:\[0\])+$")
+
+# Extension appended to an output file's name while the file is written
+TEMPORARY_FILE_EXTENSION = ".ccddtmp"
+
+#** Classes *******************************************************************
+
+#******************************************************************************
+# Output file writer. This takes the place of the Java PrintWriter returned by
+# openOutputFile(). When the output is tracked for incremental regeneration the
+# text is written to a temporary file and a hash of the text is kept; on
+# closing, the existing output file is replaced only if the text differs from
+# that of the previous generation
+#******************************************************************************
+class HeadlessPrintWriter(object):
+    #**************************************************************************
+    # Output file writer class constructor
+    #
+    # @param fileName
+    #            output file name
+    #
+    # @param contentHash
+    #            output file content hash; None if the output isn't tracked
+    #
+    # @param previousHash
+    #            content hash of the output file from the previous generation;
+    #            None if the file wasn't previously generated
+    #**************************************************************************
+    def __init__(self, fileName, contentHash=None, previousHash=None):
+        self.fileName = fileName
+        self.contentHash = contentHash
+        self.previousHash = previousHash
+        self.hashValue = None
+
+        # Check if the output isn't tracked
+        if contentHash is None:
+            self.tempFileName = None
+            self.file = open(fileName, "w")
+        # The output is tracked
+        else:
+            # Create the temporary file in the output file's folder so that it
+            # can be renamed to the output file
+            self.tempFileName = fileName + TEMPORARY_FILE_EXTENSION
+            self.file = open(self.tempFileName, "w")
+
+    #**************************************************************************
+    # Output text to the file
+    #
+    # @param text
+    #            text to output
+    #**************************************************************************
+    def write(self, text):
+        self.file.write(text)
+
+        # Check if the output is tracked
+        if self.contentHash is not None:
+            self.contentHash.update(text)
+
+    #**************************************************************************
+    # Close the file
+    #**************************************************************************
+    def close(self):
+        self.file.close()
+
+        # Check if the output is tracked
+        if self.contentHash is not None:
+            self.hashValue = self.contentHash.hexdigest()
+
+            # Check if the text is unchanged from the previous generation
+            if self.hashValue == self.previousHash and os.path.exists(self.fileName):
+                # Keep the existing file so that it remains byte-for-byte the
+                # same
+                os.remove(self.tempFileName)
+            # The text changed or the file doesn't exist
+            else:
+                os.replace(self.tempFileName, self.fileName)
+
+#******************************************************************************
+# Combined table data for a table type. Structure and command tables are
+# combined under the generic type names 'Structure' and 'Command'
+#******************************************************************************
+class TableInformation(object):
+    #**************************************************************************
+    # Table information class constructor
+    #
+    # @param tableType
+    #            table type name
+    #**************************************************************************
+    def __init__(self, tableType):
+        self.tableType = tableType
+        self.data = []
+        self.typeNames = []
+        self.paths = []
+
+#******************************************************************************
+# Headless script data access handler. The data access methods have the same
+# names, parameters, and return values as those of the CCDD application's
+# CcddScriptDataAccessHandler class; refer to that class for their descriptions
+#******************************************************************************
+class HeadlessScriptDataAccessHandler(object):
+    #**************************************************************************
+    # Headless script data access handler class constructor
+    #
+    # @param project
+    #            project definition read from the CSV import file(s)
+    #
+    # @param scriptFileName
+    #            name of the script file being executed
+    #
+    # @param tableNames
+    #            list of the names of the tables associated with the script;
+    #            None to associate every root table
+    #
+    # @param groupNames
+    #            list of the names of the groups associated with the script
+    #
+    # @param outputPath
+    #            script output folder path; blank to use the current folder
+    #
+    # @param projectName
+    #            project name
+    #
+    # @param radioButtonSelection
+    #            text of the button to select whenever the script requests a
+    #            radio button dialog selection; None to cancel the dialog
+    #
+    # @param dateAndTime
+    #            date and time text returned to the script; None to use the
+    #            current date and time. A fixed value allows the script output
+    #            to be compared between executions
+    #
+    # @param profileFileName
+    #            file to which to write the profile of the script's data
+    #            access calls (refer to the profiler module); None to use the
+    #            file named by the CCDD_PROFILE environment variable, if set
+    #**************************************************************************
+    def __init__(self,
+                 project,
+                 scriptFileName="",
+                 tableNames=None,
+                 groupNames=None,
+                 outputPath="",
+                 projectName="headless",
+                 radioButtonSelection=None,
+                 dateAndTime=None,
+                 profileFileName=None):
+        self.project = project
+        self.scriptFileName = scriptFileName
+        self.groupNames = groupNames if groupNames is not None else []
+        self.outputPath = outputPath
+        self.projectName = projectName
+        self.radioButtonSelection = radioButtonSelection
+        self.dateAndTime = dateAndTime
+        self.profileFileName = profileFileName or os.environ.get(profiler.PROFILE_ENVIRONMENT_VARIABLE)
+        self.errorMessages = []
+
+        # Output file tracking for incremental regeneration; refer to
+        # getScriptHandler()
+        self.manifest = None
+        self.previousOutputHashes = {}
+        self.outputHashes = None
+
+        # Create the data type look-up and the list of prototype structure
+        # names
+        self.dataTypes = {}
+
+        for dataType in project.dataTypes:
+            self.dataTypes.setdefault((dataType[0] or dataType[1]).lower(), dataType)
+
+        self.prototypes = {}
+
+        for table in project.tables:
+            if "," not in table.tableName:
+                self.prototypes[table.tableName] = table
+
+        # Create the macro expander. The stored expansions are discarded once
+        # the structure sizes are known since a sizeof() call can reference a
+        # structure
+        self.macroExpander = MacroExpander(project.macros, self.getDataTypeSizeInBytes)
+
+        # Build the variable paths, offsets, and structure sizes
+        self.buildPathAndOffsetLists()
+        self.macroExpander.clearStoredValues()
+
+        # Associate every root table with the script if no tables are specified
+        if tableNames is None:
+            tableNames = self.getProjectRootTableNames()
+
+        # Load the table data for the associated tables
+        self.tableInformation = []
+        self.loadedTablePaths = set()
+
+        for tableName in tableNames:
+            self.readTable(tableName)
+
+    #**************************************************************************
+    # Get the names of the project's root tables. A root table is any table
+    # that isn't referenced as a data type in a structure table
+    #
+    # @return List of root table names, sorted alphabetically
+    #**************************************************************************
+    def getProjectRootTableNames(self):
+        children = set()
+
+        for table in self.prototypes.values():
+            typeDefn = self.project.getTypeDefinition(table.typeName)
+
+            if typeDefn.isStructure:
+                dataTypeColumn = typeDefn.getColumnIndexByInputType(csvImport.INPUT_PRIM_AND_STRUCT)
+
+                for row in table.data:
+                    if not self.isPrimitive(row[dataTypeColumn]):
+                        children.add(row[dataTypeColumn])
+
+        return sorted([name for name in self.prototypes if name not in children])
+
+    #**************************************************************************
+    # Get the table information for the specified table type
+    #
+    # @param tableType
+    #            table type (case insensitive). Structure and command table
+    #            types are referenced by the generic type names
+    #
+    # @param create
+    #            true to create the table information if it doesn't exist
+    #
+    # @return Table information; None if no table of the type is loaded
+    #**************************************************************************
+    def getTableInformation(self, tableType, create=False):
+        typeDefn = self.project.getTypeDefinition(tableType)
+
+        # Convert the type to the generic type if it represents one
+        if typeDefn is not None:
+            if typeDefn.isStructure:
+                tableType = TYPE_STRUCTURE
+            elif typeDefn.isCommand:
+                tableType = TYPE_COMMAND
+
+        for info in self.tableInformation:
+            if info.tableType.lower() == tableType.lower():
+                return info
+
+        if create:
+            info = TableInformation(tableType)
+            self.tableInformation.append(info)
+            return info
+
+        return None
+
+    #**************************************************************************
+    # Load a table's data, and the data of any child tables it references, into
+    # the combined table data
+    #
+    # @param tablePath
+    #            table path
+    #**************************************************************************
+    def readTable(self, tablePath):
+        # Check if the table is not already loaded
+        if tablePath not in self.loadedTablePaths:
+            self.loadedTablePaths.add(tablePath)
+            table = self.prototypes.get(self.getPrototypeName(tablePath))
+
+            # Check if the table exists and isn't empty
+            if table is not None and table.data:
+                typeDefn = self.project.getTypeDefinition(table.typeName)
+                info = self.getTableInformation(table.typeName, True)
+                variableColumn = typeDefn.getColumnIndexByInputType(csvImport.INPUT_VARIABLE)
+                dataTypeColumn = typeDefn.getColumnIndexByInputType(csvImport.INPUT_PRIM_AND_STRUCT)
+                arraySizeColumn = typeDefn.getColumnIndexByInputType(csvImport.INPUT_ARRAY_INDEX)
+
+                for row in table.data:
+                    info.data.append(row)
+                    info.typeNames.append(table.typeName)
+                    info.paths.append(tablePath)
+
+                    # Check if this row references a child structure that isn't
+                    # an array definition
+                    if dataTypeColumn != -1 \
+                       and variableColumn != -1 \
+                       and not self.isPrimitive(row[dataTypeColumn]) \
+                       and (row[dataTypeColumn] or row[variableColumn]) \
+                       and (arraySizeColumn == -1 or not row[arraySizeColumn] or self.isArrayMember(row[variableColumn])):
+                        self.readTable(tablePath + "," + row[dataTypeColumn] + "." + row[variableColumn])
+
+    #**************************************************************************
+    # Get the variable members of a prototype structure in the order used to
+    # determine the variable offsets. Array definitions are omitted (the first
+    # member marks the array's location) and the children of each structure
+    # variable follow the variable
+    #
+    # @param structureName
+    #            prototype structure name
+    #
+    # @param path
+    #            path to the structure
+    #
+    # @param members
+    #            list to which the members are appended. Each member is a list
+    #            containing the variable path, data type, and bit length
+    #
+    # @param ancestors
+    #            list of the structure names in the path; used to prevent a
+    #            structure that references itself from being followed endlessly
+    #**************************************************************************
+    def getStructureMembers(self, structureName, path, members, ancestors):
+        table = self.prototypes.get(structureName)
+
+        # Check if the structure exists and isn't referenced by itself
+        if table is not None and structureName not in ancestors:
+            typeDefn = self.project.getTypeDefinition(table.typeName)
+            variableColumn = typeDefn.getColumnIndexByInputType(csvImport.INPUT_VARIABLE)
+            dataTypeColumn = typeDefn.getColumnIndexByInputType(csvImport.INPUT_PRIM_AND_STRUCT)
+            arraySizeColumn = typeDefn.getColumnIndexByInputType(csvImport.INPUT_ARRAY_INDEX)
+            bitLengthColumn = typeDefn.getColumnIndexByInputType(csvImport.INPUT_BIT_LENGTH)
+
+            for row in table.data:
+                variableName = row[variableColumn]
+                dataType = row[dataTypeColumn]
+
+                # Skip array definitions
+                if row[arraySizeColumn] and not self.isArrayMember(variableName):
+                    continue
+
+                variablePath = self.getMacroExpansion(path + "," + dataType + "." + variableName)
+                members.append([variablePath, dataType, self.getMacroExpansion(row[bitLengthColumn])])
+
+                # Check if the variable is a structure
+                if not self.isPrimitive(dataType):
+                    self.getStructureMembers(dataType, variablePath, members, ancestors + [structureName])
+
+    #**************************************************************************
+    # Build the lists of structure and variable paths and the corresponding
+    # offsets (structure sizes for the structure names). The offsets account
+    # for bit-packing of adjacent bit fields with the same data type
+    #**************************************************************************
+    def buildPathAndOffsetLists(self):
+        self.variableOffsets = {}
+        self.structureSizes = {}
+        self.variablePaths = []
+
+        for structureName in sorted(self.prototypes.keys()):
+            typeDefn = self.project.getTypeDefinition(self.prototypes[structureName].typeName)
+
+            if not typeDefn.isStructure:
+                continue
+
+            members = []
+            self.getStructureMembers(structureName, structureName, members, [])
+            offset = 0
+            bitCount = 0
+            lastByteSize = 0
+            lastDataType = ""
+            lastBitLength = 0
+
+            for member in members:
+                variablePath, dataType, bitLength = member
+
+                # Check if this references a primitive data type
+                if self.isPrimitive(dataType):
+                    byteSize = self.getPrimitiveSizeInBytes(dataType)
+                    bits = int(bitLength) if re.match(r"^\d+$", bitLength) else 0
+                    bitCount += bits
+
+                    # Check if the current or previous variable has no bit
+                    # length, the data type changed, or the data type has no
+                    # room for the bits
+                    if bits == 0 or lastBitLength == 0 or dataType != lastDataType or bitCount > byteSize * 8:
+                        bitCount = bits
+                        offset += lastByteSize
+
+                    lastByteSize = byteSize
+                    lastDataType = dataType
+                    lastBitLength = bits
+                # The variable is a structure
+                else:
+                    offset += lastByteSize
+                    bitCount = 0
+                    lastByteSize = 0
+                    lastDataType = ""
+                    lastBitLength = 0
+
+                # Check if this is the first member of an array
+                match = FIRST_ARRAY_MEMBER_PATTERN.match(variablePath)
+
+                if match is not None:
+                    self.variableOffsets.setdefault(match.group(1), offset)
+                    self.variablePaths.append(match.group(1))
+
+                self.variableOffsets.setdefault(variablePath, offset)
+                self.variablePaths.append(variablePath)
+
+            # Account for the final variable's size and store the structure
+            # size
+            if lastDataType:
+                offset += self.getPrimitiveSizeInBytes(lastDataType)
+            else:
+                offset += lastByteSize
+
+            self.structureSizes[structureName] = offset
+
+        self.convertedNames = {}
+
+    #**************************************************************************
+    # Expand the macros and sizeof() calls in the supplied text. If the result
+    # is a mathematical expression then the expression's integer value is
+    # returned
+    #
+    # @param text
+    #            text string
+    #
+    # @return Text with the macros replaced by their values
+    #**************************************************************************
+    def getMacroExpansion(self, text):
+        return self.macroExpander.getMacroExpansion(text)
+
+    #**************************************************************************
+    # Get a data access handler for executing the specified script. The
+    # handler shares this handler's project and table data, which are not
+    # altered by the scripts, so the data needn't be loaded for each script
+    #
+    # @param scriptFileName
+    #            name of the script file being executed
+    #
+    # @param manifest
+    #            artifact manifest used to track the script's output files;
+    #            None if the output files aren't tracked. If tracked, the
+    #            content hash of each output file is stored in the handler's
+    #            outputHashes, keyed by the file name relative to the
+    #            manifest's folder, and an output file is rewritten only if
+    #            its contents changed since the previous generation
+    #
+    # @return Data access handler for the script
+    #**************************************************************************
+    def getScriptHandler(self, scriptFileName, manifest=None):
+        handler = copy.copy(self)
+        handler.scriptFileName = scriptFileName
+        handler.errorMessages = []
+        handler.manifest = manifest
+        handler.previousOutputHashes = {}
+        handler.outputHashes = None
+
+        # Check if the script's output files are tracked
+        if manifest is not None:
+            handler.previousOutputHashes = manifest.getOutputHashes(scriptFileName)
+            handler.outputHashes = {}
+
+        return handler
+
+    #** Script information ****************************************************
+
+    def getScriptName(self):
+        return self.scriptFileName
+
+    def getUser(self):
+        try:
+            return getpass.getuser()
+        except Exception:
+            return ""
+
+    def getDatabase(self):
+        return self.projectName.lower()
+
+    def getProject(self):
+        return self.projectName
+
+    def getProjectDescription(self):
+        return ""
+
+    def getOutputPath(self):
+        return "" if not self.outputPath else os.path.join(self.outputPath, "")
+
+    def getLongestString(self, strgArray, minWidth):
+        if minWidth is None:
+            minWidth = 0
+
+        for strg in strgArray:
+            if len(strg) > minWidth:
+                minWidth = len(strg)
+
+        return minWidth
+
+    def getLongestStrings(self, strgArray, minWidths):
+        if len(strgArray) != 0 and len(strgArray[0]) != 0 and (minWidths is None or len(minWidths) == 0 or len(minWidths) >= len(strgArray[0])):
+            if minWidths is None or len(minWidths) == 0:
+                minWidths = [1] * len(strgArray[0])
+            else:
+                minWidths = list(minWidths)
+
+            for strg in strgArray:
+                for column in range(len(strg)):
+                    if len(strg[column]) > minWidths[column]:
+                        minWidths[column] = len(strg[column])
+        else:
+            minWidths = None
+
+        return minWidths
+
+    def getDateAndTime(self):
+        if self.dateAndTime is not None:
+            return self.dateAndTime
+
+        return time.strftime("%a %b %d %H:%M:%S %Z %Y")
+
+    #** Data types ************************************************************
+
+    def getDataTypeByName(self, dataType):
+        if dataType is None:
+            return None
+
+        return self.dataTypes.get(dataType.lower())
+
+    def getDataTypeDefinitions(self):
+        return [list(dataType) for dataType in self.project.dataTypes]
+
+    def isPrimitive(self, dataType):
+        return self.getDataTypeByName(dataType) is not None
+
+    def isDataTypePrimitive(self, dataType):
+        return self.isPrimitive(dataType)
+
+    def isDataTypeInteger(self, dataType):
+        return self.getBaseDataType(dataType) in ["signed integer", "unsigned integer"]
+
+    def isDataTypeUnsignedInt(self, dataType):
+        return self.getBaseDataType(dataType) == "unsigned integer"
+
+    def isDataTypeFloat(self, dataType):
+        return self.getBaseDataType(dataType) == "floating point"
+
+    def isDataTypeCharacter(self, dataType):
+        return self.getBaseDataType(dataType) == "character"
+
+    def isDataTypeString(self, dataType):
+        definition = self.getDataTypeByName(dataType)
+        return definition is not None and definition[3] == "character" and int(definition[2]) > 1
+
+    def isDataTypePointer(self, dataType):
+        return self.getBaseDataType(dataType) == "pointer"
+
+    def getCDataType(self, dataType):
+        definition = self.getDataTypeByName(dataType)
+        return definition[1] if definition is not None else None
+
+    def getBaseDataType(self, dataType):
+        definition = self.getDataTypeByName(dataType)
+        return definition[3] if definition is not None else None
+
+    def getPrimitiveSizeInBytes(self, dataType):
+        definition = self.getDataTypeByName(dataType)
+
+        if definition is None:
+            return 0
+
+        if self.isDataTypeString(dataType):
+            return 1
+
+        return int(definition[2])
+
+    def getDataTypeSizeInBytes(self, dataType):
+        if self.isPrimitive(dataType):
+            return self.getPrimitiveSizeInBytes(dataType)
+
+        return self.structureSizes.get(dataType, 0)
+
+    def getDataTypeSizeInBits(self, dataType):
+        return self.getDataTypeSizeInBytes(dataType) * 8
+
+    def getITOSEncodedDataType(self, dataType, encoding):
+        encodedType = None
+
+        if self.isPrimitive(dataType):
+            if self.isDataTypeInteger(dataType):
+                encodedType = "U" if self.isDataTypeUnsignedInt(dataType) else "I"
+            elif self.isDataTypeFloat(dataType):
+                encodedType = "F"
+            elif self.isDataTypeCharacter(dataType):
+                encodedType = "S"
+            elif self.isDataTypePointer(dataType):
+                encodedType = "U"
+            else:
+                encodedType = "R"
+
+            if encodedType != "R":
+                size = 1 if encodedType == "S" else self.getPrimitiveSizeInBytes(dataType)
+                encoding = encoding.upper()
+
+                if encoding == "BIG_ENDIAN":
+                    encodedType += "".join([str(index) for index in range(1, size + 1)])
+                elif encoding == "BIG_ENDIAN_SWAP":
+                    if size == 1:
+                        encodedType += "1"
+                    else:
+                        encodedType += "".join([str(index + 1) + str(index) for index in range(1, size + 1, 2)])
+                elif encoding == "LITTLE_ENDIAN":
+                    encodedType += "".join([str(index) for index in range(size, 0, -1)])
+                elif encoding == "LITTLE_ENDIAN_SWAP":
+                    if size == 1:
+                        encodedType += "1"
+                    else:
+                        encodedType += "".join([str(index - 1) + str(index) for index in range(size, 0, -2)])
+                elif encoding == "TWO_CHAR":
+                    encodedType += str(size)
+            elif encoding.upper() != "SINGLE_CHAR":
+                encodedType += "0"
+        elif dataType in self.prototypes:
+            encodedType = dataType
+
+        return encodedType
+
+    def getITOSLimitName(self, index):
+        limitNames = ["redLow", "yellowLow", "yellowHigh", "redHigh", ""]
+
+        if index < 0 or index > len(limitNames) - 1:
+            index = len(limitNames) - 1
+
+        return limitNames[index]
+
+    #** Table names, types, and paths *****************************************
+
+    def getRootStructureTableNames(self):
+        return self.getRootTableNames(TYPE_STRUCTURE)
+
+    def getRootTableNames(self, tableType):
+        names = []
+        info = self.getTableInformation(tableType)
+
+        if info is not None:
+            for path in info.paths:
+                root = path.split(",")[0]
+
+                if root not in names:
+                    names.append(root)
+
+        return names
+
+    def getStructureTableNumRows(self):
+        return self.getTableNumRows(TYPE_STRUCTURE)
+
+    def getCommandTableNumRows(self):
+        return self.getTableNumRows(TYPE_COMMAND)
+
+    def getTableNumRows(self, tableType=None):
+        if tableType is None:
+            return sum([len(info.data) for info in self.tableInformation])
+
+        info = self.getTableInformation(tableType)
+        return len(info.data) if info is not None else -1
+
+    def getStructureTableNameByRow(self, row):
+        return self.getTablePathByRow(TYPE_STRUCTURE, row, "prototype", True)
+
+    def getCommandTableNameByRow(self, row):
+        return self.getTablePathByRow(TYPE_COMMAND, row, "prototype", True)
+
+    def getTableNameByRow(self, tableType, row):
+        return self.getTablePathByRow(tableType, row, "prototype", True)
+
+    def getStructureTablePaths(self):
+        return self.getTableNames(TYPE_STRUCTURE, False)
+
+    def getStructureTableNames(self):
+        return self.getTableNames(TYPE_STRUCTURE, True)
+
+    def getCommandTableNames(self):
+        return self.getTableNames(TYPE_COMMAND)
+
+    def getTableNames(self, tableType=None, prototypeOnly=False):
+        names = []
+
+        if tableType is None:
+            infos = self.tableInformation
+        else:
+            info = self.getTableInformation(tableType)
+            infos = [info] if info is not None else []
+
+        for info in infos:
+            for path in info.paths:
+                name = self.getPrototypeName(path) if prototypeOnly else path
+
+                if name not in names:
+                    names.append(name)
+
+        return names
+
+    def getPrototypeName(self, tableName):
+        prototype = tableName[tableName.rfind(",") + 1:]
+        index = prototype.find(".")
+
+        if index != -1:
+            prototype = prototype[:index]
+
+        return prototype
+
+    def getTypeNameByRow(self, tableType, row):
+        info = self.getTableInformation(tableType)
+
+        if info is not None and row < len(info.data):
+            return info.typeNames[row]
+
+        return ""
+
+    def getStructureTypeNameByRow(self, row):
+        return self.getTypeNameByRow(TYPE_STRUCTURE, row)
+
+    def getCommandTypeNameByRow(self, row):
+        return self.getTypeNameByRow(TYPE_COMMAND, row)
+
+    def getTypeNameByTable(self, tableName):
+        typeName = ""
+
+        for info in self.tableInformation:
+            for row in range(len(info.data)):
+                if info.paths[row] == tableName:
+                    typeName = info.typeNames[row]
+                    break
+
+        return typeName
+
+    def getTableColumnNames(self, tableType, row):
+        typeDefn = self.project.getTypeDefinition(self.getTypeNameByRow(tableType, row))
+        return list(typeDefn.columnNames) if typeDefn is not None else None
+
+    def getStructureTableColumnNames(self, row):
+        return self.getTableColumnNames(TYPE_STRUCTURE, row)
+
+    def getCommandTableColumnNames(self, row):
+        return self.getTableColumnNames(TYPE_COMMAND, row)
+
+    def getTableColumnNamesByType(self, typeName):
+        typeDefn = self.project.getTypeDefinition(typeName)
+        return list(typeDefn.columnNames) if typeDefn is not None else None
+
+    def getTablePathByRow(self, tableType, row, pathType, expandMacros):
+        structurePath = ""
+        info = self.getTableInformation(tableType)
+
+        if info is not None and row >= 0 and row < len(info.data):
+            structurePath = info.paths[row]
+
+            if pathType == "prototype":
+                structurePath = self.getPrototypeName(structurePath)
+            elif pathType == "variable":
+                structurePath = DATA_TYPE_PATTERN.sub(",", structurePath)
+            elif pathType == "itos":
+                structurePath = DATA_TYPE_PATTERN.sub(".", structurePath)
+
+        if expandMacros:
+            structurePath = self.getMacroExpansion(structurePath)
+
+        return structurePath
+
+    def getStructurePathByRow(self, row):
+        return self.getTablePathByRow(TYPE_STRUCTURE, row, "path", True)
+
+    def getStructurePathByRowWithMacros(self, row):
+        return self.getTablePathByRow(TYPE_STRUCTURE, row, "path", False)
+
+    def getPathByRow(self, tableType, row):
+        return self.getTablePathByRow(tableType, row, "path", True)
+
+    def getPathByRowWithMacros(self, tableType, row):
+        return self.getTablePathByRow(tableType, row, "path", False)
+
+    def getStructureTableVariablePathByRow(self, row):
+        return self.getTablePathByRow(TYPE_STRUCTURE, row, "variable", True)
+
+    def getStructureTableVariablePathByRowWithMacros(self, row):
+        return self.getTablePathByRow(TYPE_STRUCTURE, row, "variable", False)
+
+    def getStructureTableITOSPathByRow(self, row):
+        return self.getTablePathByRow(TYPE_STRUCTURE, row, "itos", True)
+
+    def getStructureTableITOSPathByRowWithMacros(self, row):
+        return self.getTablePathByRow(TYPE_STRUCTURE, row, "itos", False)
+
+    def getStructureParentRowByChildRow(self, row):
+        path = self.getPathByRow(TYPE_STRUCTURE, row)
+        index = path.rfind(",")
+
+        if index != -1:
+            path = path[:index]
+
+        info = self.getTableInformation(TYPE_STRUCTURE)
+
+        if info is not None:
+            for tableRow in range(len(info.data)):
+                if info.paths[tableRow] == path:
+                    return tableRow
+
+        return -1
+
+    def getStructureTablesByReferenceOrder(self):
+        allStructs = []
+        orderedNames = []
+        structureNames = self.getStructureTableNames()
+
+        if structureNames:
+            for row in range(self.getStructureTableNumRows()):
+                dataType = self.getStructureDataType(row)
+
+                if dataType is not None and dataType in structureNames:
+                    allStructs.append(dataType)
+
+            if allStructs:
+                orderedNames.append(allStructs[-1])
+
+                for index in range(len(allStructs) - 2, -1, -1):
+                    if allStructs[index] not in orderedNames:
+                        orderedNames.append(allStructs[index])
+
+            for structureName in structureNames:
+                if structureName not in orderedNames:
+                    orderedNames.append(structureName)
+
+        return orderedNames
+
+    def isStructureShared(self, structureName):
+        if not structureName:
+            return False
+
+        roots = set()
+
+        for path in self.getStructureTablePaths():
+            if self.getPrototypeName(path) == structureName:
+                roots.add(path.split(",")[0])
+
+        return len(roots) > 1
+
+    #** Table data ************************************************************
+
+    def getColumnValue(self, tableType, inputType, row, expandMacros, requiredType):
+        typeDefn = self.project.getTypeDefinition(self.getTypeNameByRow(tableType, row))
+
+        if typeDefn is not None and (typeDefn.isStructure if requiredType == TYPE_STRUCTURE else typeDefn.isCommand):
+            column = typeDefn.getColumnIndexByInputType(inputType)
+
+            if column != -1:
+                value = self.getTableInformation(tableType).data[row][column]
+                return self.getMacroExpansion(value) if expandMacros else value
+
+        return None
+
+    def getStructureVariableName(self, row):
+        return self.getColumnValue(TYPE_STRUCTURE, csvImport.INPUT_VARIABLE, row, True, TYPE_STRUCTURE)
+
+    def getStructureVariableNameWithMacros(self, row):
+        return self.getColumnValue(TYPE_STRUCTURE, csvImport.INPUT_VARIABLE, row, False, TYPE_STRUCTURE)
+
+    def getStructureDataType(self, row):
+        return self.getColumnValue(TYPE_STRUCTURE, csvImport.INPUT_PRIM_AND_STRUCT, row, False, TYPE_STRUCTURE)
+
+    def getStructureArraySize(self, row):
+        return self.getColumnValue(TYPE_STRUCTURE, csvImport.INPUT_ARRAY_INDEX, row, True, TYPE_STRUCTURE)
+
+    def getStructureArraySizeWithMacros(self, row):
+        return self.getColumnValue(TYPE_STRUCTURE, csvImport.INPUT_ARRAY_INDEX, row, False, TYPE_STRUCTURE)
+
+    def getStructureBitLength(self, row):
+        return self.getColumnValue(TYPE_STRUCTURE, csvImport.INPUT_BIT_LENGTH, row, True, TYPE_STRUCTURE)
+
+    def getStructureBitLengthWithMacros(self, row):
+        return self.getColumnValue(TYPE_STRUCTURE, csvImport.INPUT_BIT_LENGTH, row, False, TYPE_STRUCTURE)
+
+    def getStructureDescription(self, row):
+        return self.getColumnValue(TYPE_STRUCTURE, csvImport.INPUT_DESCRIPTION, row, True, TYPE_STRUCTURE)
+
+    def getStructureDescriptionWithMacros(self, row):
+        return self.getColumnValue(TYPE_STRUCTURE, csvImport.INPUT_DESCRIPTION, row, False, TYPE_STRUCTURE)
+
+    def getStructureUnits(self, row):
+        return self.getColumnValue(TYPE_STRUCTURE, csvImport.INPUT_UNITS, row, True, TYPE_STRUCTURE)
+
+    def getStructureUnitsWithMacros(self, row):
+        return self.getColumnValue(TYPE_STRUCTURE, csvImport.INPUT_UNITS, row, False, TYPE_STRUCTURE)
+
+    def getColumnValues(self, inputType, row, expandMacros):
+        values = []
+        typeDefn = self.project.getTypeDefinition(self.getStructureTypeNameByRow(row))
+
+        if typeDefn is not None and typeDefn.isStructure:
+            data = self.getTableInformation(TYPE_STRUCTURE).data[row]
+
+            for column in typeDefn.getColumnIndicesByInputType(inputType):
+                values.append(self.getMacroExpansion(data[column]) if expandMacros else data[column])
+
+        return values
+
+    def getStructureEnumerations(self, row):
+        return self.getColumnValues(csvImport.INPUT_ENUMERATION, row, True)
+
+    def getStructureEnumerationsWithMacros(self, row):
+        return self.getColumnValues(csvImport.INPUT_ENUMERATION, row, False)
+
+    def getStructureRates(self, row):
+        return self.getColumnValues(csvImport.INPUT_RATE, row, False)
+
+    def getCommandName(self, row):
+        return self.getColumnValue(TYPE_COMMAND, csvImport.INPUT_COMMAND_NAME, row, True, TYPE_COMMAND)
+
+    def getCommandNameWithMacros(self, row):
+        return self.getColumnValue(TYPE_COMMAND, csvImport.INPUT_COMMAND_NAME, row, False, TYPE_COMMAND)
+
+    def getCommandCode(self, row):
+        return self.getColumnValue(TYPE_COMMAND, csvImport.INPUT_COMMAND_CODE, row, True, TYPE_COMMAND)
+
+    def getCommandCodeWithMacros(self, row):
+        return self.getColumnValue(TYPE_COMMAND, csvImport.INPUT_COMMAND_CODE, row, False, TYPE_COMMAND)
+
+    def getNumCommandArguments(self, rowOrType):
+        tableType = self.getCommandTypeNameByRow(rowOrType) if isinstance(rowOrType, int) else rowOrType
+        typeDefn = self.project.getTypeDefinition(tableType)
+
+        if typeDefn is not None and typeDefn.isCommand:
+            return len(typeDefn.getCommandArgumentColumns())
+
+        return -1
+
+    def getCommandArgValue(self, argumentNumber, row, key, expandMacros):
+        typeDefn = self.project.getTypeDefinition(self.getCommandTypeNameByRow(row))
+
+        if typeDefn is not None and typeDefn.isCommand:
+            arguments = typeDefn.getCommandArgumentColumns()
+
+            if argumentNumber < len(arguments) and key in arguments[argumentNumber]:
+                value = self.getTableInformation(TYPE_COMMAND).data[row][arguments[argumentNumber][key]]
+                return self.getMacroExpansion(value) if expandMacros else value
+
+        return None
+
+    def getCommandArgName(self, argumentNumber, row):
+        return self.getCommandArgValue(argumentNumber, row, "name", True)
+
+    def getCommandArgNameWithMacros(self, argumentNumber, row):
+        return self.getCommandArgValue(argumentNumber, row, "name", False)
+
+    def getCommandArgDataType(self, argumentNumber, row):
+        return self.getCommandArgValue(argumentNumber, row, "dataType", False)
+
+    def getCommandArgArraySize(self, argumentNumber, row):
+        return self.getCommandArgValue(argumentNumber, row, "arraySize", True)
+
+    def getCommandArgArraySizeWithMacros(self, argumentNumber, row):
+        return self.getCommandArgValue(argumentNumber, row, "arraySize", False)
+
+    def getCommandArgBitLength(self, argumentNumber, row):
+        return self.getCommandArgValue(argumentNumber, row, "bitLength", True)
+
+    def getCommandArgBitLengthWithMacros(self, argumentNumber, row):
+        return self.getCommandArgValue(argumentNumber, row, "bitLength", False)
+
+    def getCommandArgEnumeration(self, argumentNumber, row):
+        return self.getCommandArgValue(argumentNumber, row, "enumeration", True)
+
+    def getCommandArgEnumerationWithMacros(self, argumentNumber, row):
+        return self.getCommandArgValue(argumentNumber, row, "enumeration", False)
+
+    def getCommandArgMinimum(self, argumentNumber, row):
+        return self.getCommandArgValue(argumentNumber, row, "minimum", True)
+
+    def getCommandArgMinimumWithMacros(self, argumentNumber, row):
+        return self.getCommandArgValue(argumentNumber, row, "minimum", False)
+
+    def getCommandArgMaximum(self, argumentNumber, row):
+        return self.getCommandArgValue(argumentNumber, row, "maximum", True)
+
+    def getCommandArgMaximumWithMacros(self, argumentNumber, row):
+        return self.getCommandArgValue(argumentNumber, row, "maximum", False)
+
+    def getTableDataValue(self, tableType, columnName, row, expandMacros):
+        info = self.getTableInformation(tableType)
+
+        if info is not None and row < len(info.data):
+            typeDefn = self.project.getTypeDefinition(info.typeNames[row])
+            column = typeDefn.getColumnIndexByUserName(columnName)
+
+            if column != -1:
+                value = info.data[row][column]
+                return self.getMacroExpansion(value) if expandMacros else value
+
+        return None
+
+    def getStructureTableData(self, columnName, row):
+        return self.getTableDataValue(TYPE_STRUCTURE, columnName, row, True)
+
+    def getCommandTableData(self, columnName, row):
+        return self.getTableDataValue(TYPE_COMMAND, columnName, row, True)
+
+    def getTableData(self, tableType, columnName, row):
+        return self.getTableDataValue(tableType, columnName, row, True)
+
+    def getStructureTableDataWithMacros(self, columnName, row):
+        return self.getTableDataValue(TYPE_STRUCTURE, columnName, row, False)
+
+    def getCommandTableDataWithMacros(self, columnName, row):
+        return self.getTableDataValue(TYPE_COMMAND, columnName, row, False)
+
+    def getTableDataWithMacros(self, tableType, columnName, row):
+        return self.getTableDataValue(tableType, columnName, row, False)
+
+    def getStructureTableColumns(self):
+        numRows = self.getStructureTableNumRows()
+
+        if numRows == 0:
+            return []
+
+        columnNames = []
+        typeNames = []
+
+        # Combine the columns of every structure table type in the data
+        for row in range(numRows):
+            typeName = self.getStructureTypeNameByRow(row)
+
+            if typeName not in typeNames:
+                typeNames.append(typeName)
+
+                for columnName in self.getStructureTableColumnNames(row):
+                    if columnName.lower() not in [name.lower() for name in columnNames]:
+                        columnNames.append(columnName)
+
+        columns = [[columnName] + [self.getStructureTableData(columnName, row) for row in range(numRows)] for columnName in columnNames]
+        derived = {}
+
+        for name, getter in [("@table name", self.getStructureTableNameByRow),
+                             ("@table path", self.getStructurePathByRow),
+                             ("@table type", self.getStructureTypeNameByRow),
+                             ("@variable name", self.getStructureVariableName),
+                             ("@data type", self.getStructureDataType),
+                             ("@array size", self.getStructureArraySize),
+                             ("@bit length", self.getStructureBitLength),
+                             ("@description", self.getStructureDescription),
+                             ("@units", self.getStructureUnits),
+                             ("@enumeration", lambda row: (self.getStructureEnumerations(row) or [None])[0]),
+                             ("@rates", lambda row: ", ".join(self.getStructureRates(row))),
+                             ("@full variable name", self.getFullVariableName)]:
+            derived[name] = [name] + [getter(row) for row in range(numRows)]
+            columns.append(derived[name])
+
+        offsets = ["@variable offset"]
+
+        # Get the offset of each variable within its prototype structure; an
+        # array definition uses the offset of its first member
+        for row in range(numRows):
+            variableName = derived["@variable name"][row + 1]
+            dataType = derived["@data type"][row + 1]
+            arraySize = derived["@array size"][row + 1]
+            offset = None
+
+            if variableName is not None and dataType is not None:
+                variablePath = derived["@table name"][row + 1] + "," + dataType + "." + variableName
+
+                if arraySize and not variableName.endswith("]"):
+                    variablePath += "[0]" * len(arraySize.split(","))
+
+                offset = str(self.getVariableOffset(variablePath))
+
+            offsets.append(offset)
+
+        columns.append(offsets)
+        return columns
+
+    def getFullVariableNames(self, varPathSeparator):
+        return [self.getFullVariableName(row, varPathSeparator) for row in range(self.getStructureTableNumRows())]
+
+    def getTableDataByColumnName(self, tableType, tablePath, matchColumnName, matchName, dataColumnName, expandMacros=True):
+        info = self.getTableInformation(tableType)
+
+        if info is not None:
+            for row in range(len(info.data)):
+                typeDefn = self.project.getTypeDefinition(info.typeNames[row])
+                matchColumn = typeDefn.getColumnIndexByUserName(matchColumnName)
+                dataColumn = typeDefn.getColumnIndexByUserName(dataColumnName)
+
+                if matchColumn != -1 and dataColumn != -1 and info.paths[row] == tablePath and info.data[row][matchColumn] == matchName:
+                    value = info.data[row][dataColumn]
+                    return self.getMacroExpansion(value) if expandMacros else value
+
+        return None
+
+    def getTableDataByColumnNameWithMacros(self, tableType, tablePath, matchColumnName, matchName, dataColumnName):
+        return self.getTableDataByColumnName(tableType, tablePath, matchColumnName, matchName, dataColumnName, False)
+
+    def getStructureDataByVariableName(self, tablePath, variableName, columnName):
+        return self.getTableDataByColumnName(TYPE_STRUCTURE, tablePath, "Variable Name", variableName, columnName)
+
+    def getStructureDataByVariableNameWithMacros(self, tablePath, variableName, columnName):
+        return self.getTableDataByColumnName(TYPE_STRUCTURE, tablePath, "Variable Name", variableName, columnName, False)
+
+    def getTableDescription(self, tableName):
+        table = self.project.getTable(tableName)
+        description = table.description.strip() if table is not None else ""
+
+        # Use the prototype's description if the instance has none
+        if not description and "," in tableName:
+            description = self.getTableDescription(self.getPrototypeName(tableName))
+
+        return description
+
+    def getTableDescriptionByRow(self, tableType, row):
+        return self.getTableDescription(self.getPathByRow(tableType, row))
+
+    def getMacroDefinitions(self):
+        return [list(macro) for macro in self.project.macros]
+
+    #** Variable names and offsets ********************************************
+
+    def getFullVariableNameRaw(self, row):
+        dataType = self.getStructureDataType(row)
+        variableName = self.getStructureVariableName(row)
+
+        if dataType is None or variableName is None:
+            return ""
+
+        return self.getPathByRow(TYPE_STRUCTURE, row) + "," + dataType + "." + variableName
+
+    def getFullVariableName(self, *args):
+        # Check if the variable is specified by row
+        if isinstance(args[0], int):
+            dataType = self.getStructureDataType(args[0])
+            variableName = self.getStructureVariableNameWithMacros(args[0])
+
+            if dataType is None or variableName is None:
+                return ""
+
+            args = (self.getPathByRow(TYPE_STRUCTURE, args[0]), dataType + "." + variableName) + tuple(args[1:])
+
+            if len(args) == 2:
+                args = args + ("_",)
+        # Check if the variable path and name are supplied separately
+        elif len(args) in [3, 5] and not isinstance(args[2], bool):
+            if not args[0] or not args[1]:
+                return ""
+
+            args = (args[0], args[1]) + tuple(args[2:])
+        # The full variable path and name is supplied as a single string
+        else:
+            args = (args[0], None) + tuple(args[1:])
+
+        variablePath, variableName = args[0], args[1]
+        varPathSeparator = args[2]
+        excludeDataTypes = args[3] if len(args) > 3 else True
+        typeNameSeparator = args[4] if len(args) > 4 else ""
+        fullName = variablePath if variableName is None else variablePath + "," + variableName
+
+        return self.convertVariableName(self.getMacroExpansion(fullName), varPathSeparator, excludeDataTypes, typeNameSeparator)
+
+    def convertVariableName(self, fullName, varPathSeparator, excludeDataTypes, typeNameSeparator):
+        if not fullName:
+            return ""
+
+        key = (varPathSeparator, excludeDataTypes, typeNameSeparator)
+        names = self.convertedNames.get(key)
+
+        # Check if the converted names for these separators haven't been built
+        if names is None:
+            names = {}
+            used = set()
+
+            for path in self.variablePaths:
+                if path not in names:
+                    converted = self.convertName(path, varPathSeparator, excludeDataTypes, typeNameSeparator)
+
+                    # Append underscores until the name is unique
+                    while converted in used:
+                        converted += "_"
+
+                    used.add(converted)
+                    names[path] = converted
+
+            self.convertedNames[key] = names
+
+        return names.get(re.sub(r":\d+$", "", fullName), "")
+
+    def convertName(self, fullName, varPathSeparator, excludeDataTypes, typeNameSeparator):
+        if excludeDataTypes:
+            fullName = DATA_TYPE_PATTERN.sub(",", fullName)
+        else:
+            fullName = fullName.replace(".", "@~~@")
+
+        fullName = fullName.replace(",", varPathSeparator).replace("@~~@", typeNameSeparator).replace("[", "_").replace("]", "")
+        return re.sub(r":\d+$", "", fullName)
+
+    def getVariableOffset(self, path):
+        target = re.sub(r":.+$", "", self.getMacroExpansion(path), 1)
+
+        if "," not in path:
+            return 0 if target in self.structureSizes else -1
+
+        return self.variableOffsets.get(target, -1)
+
+    def getVariablePaths(self):
+        return list(self.variablePaths)
+
+    def isArrayMember(self, variableName):
+        return variableName is not None and ARRAY_MEMBER_PATTERN.match(str(variableName)) is not None
+
+    def getArrayIndexFromSize(self, arrayString):
+        return csvImport.getArrayDimensions(arrayString)
+
+    def formatArrayIndex(self, arrayIndex):
+        return "".join(["[" + str(index) + "]" for index in arrayIndex])
+
+    #** Data fields ***********************************************************
+
+    def getDataField(self, fields, ownerName, fieldName):
+        # The owner and field names are case insensitive, as in the
+        # application's field handler
+        for field in fields:
+            if field.ownerName.lower() == ownerName.lower() and field.fieldName.lower() == fieldName.lower():
+                return field
+
+        return None
+
+    def getOwnerFields(self, ownerName):
+        table = self.project.getTable(ownerName)
+
+        if table is not None:
+            return table.dataFields
+
+        # Check if the table is an instance with no fields of its own
+        if "," in ownerName:
+            return self.getOwnerFields(self.getPrototypeName(ownerName))
+
+        return []
+
+    def getGroup(self, groupName):
+        for group in self.project.groups:
+            if group.name == groupName:
+                return group
+
+        return None
+
+    def getFieldValue(self, field):
+        if field is None:
+            return None
+
+        if field.inputType == csvImport.INPUT_MESSAGE_NAME_AND_ID:
+            return re.sub(r"\s*\(protected\)", "", field.value, 1)
+
+        return field.value
+
+    def getTableDataFieldNames(self, tableName):
+        return [field.fieldName for field in self.getOwnerFields(tableName)]
+
+    def getGroupDataFieldNames(self, groupName):
+        group = self.getGroup(groupName)
+        return [field.fieldName for field in group.dataFields] if group is not None else []
+
+    def getTypeDataFieldNames(self, typeName):
+        return [field.fieldName for field in self.project.typeFields if field.ownerName == typeName]
+
+    def getProjectFieldNames(self):
+        return [field.fieldName for field in self.project.projectFields]
+
+    def getTableDataFieldValue(self, tableName, fieldName):
+        return self.getFieldValue(self.getDataField(self.getOwnerFields(tableName), tableName if self.project.getTable(tableName) is not None else self.getPrototypeName(tableName), fieldName))
+
+    def getGroupDataFieldValue(self, groupName, fieldName):
+        group = self.getGroup(groupName)
+        return self.getFieldValue(self.getDataField(group.dataFields, groupName, fieldName)) if group is not None else None
+
+    def getTypeDataFieldValue(self, typeName, fieldName):
+        return self.getFieldValue(self.getDataField(self.project.typeFields, typeName, fieldName))
+
+    def getProjectDataFieldValue(self, fieldName):
+        return self.getFieldValue(self.getDataField(self.project.projectFields, "", fieldName))
+
+    def getTableDataFieldValues(self, tableType, fieldName=None):
+        if fieldName is None:
+            fieldName = tableType
+            tableType = None
+
+        values = []
+
+        for tableName in self.getTableNames(tableType):
+            value = self.getTableDataFieldValue(tableName, fieldName)
+
+            if value is not None:
+                values.append([tableName, value])
+
+        return values
+
+    def getAllDataFieldValues(self):
+        values = []
+
+        for tableName in self.getTableNames():
+            for fieldName in self.getTableDataFieldNames(tableName):
+                values.append(["Table", tableName, fieldName, self.getTableDataFieldValue(tableName, fieldName)])
+
+        for groupName in self.getGroupNames(False):
+            for fieldName in self.getGroupDataFieldNames(groupName):
+                values.append(["Group", groupName, fieldName, self.getGroupDataFieldValue(groupName, fieldName)])
+
+        return values
+
+    def getStructureTableDataFieldValues(self, fieldName):
+        return self.getTableDataFieldValues(TYPE_STRUCTURE, fieldName)
+
+    def getCommandTableDataFieldValues(self, fieldName):
+        return self.getTableDataFieldValues(TYPE_COMMAND, fieldName)
+
+    def getTableDataFieldDescription(self, tableName, fieldName):
+        field = self.getDataField(self.getOwnerFields(tableName), tableName, fieldName)
+        return field.description if field is not None else ""
+
+    def getProjectFields(self):
+        return [[field.fieldName, field.description, field.size, field.inputType, field.required, field.applicability, field.value] for field in self.project.projectFields]
+
+    #** Groups ****************************************************************
+
+    def getAssociatedGroupNames(self):
+        return list(self.groupNames)
+
+    def getGroupNames(self, applicationOnly):
+        return [group.name for group in self.project.groups if group.isApplication or not applicationOnly]
+
+    def getApplicationNames(self):
+        return self.getGroupNames(True)
+
+    def getGroupDescription(self, groupName):
+        group = self.getGroup(groupName)
+        return group.description if group is not None else None
+
+    def getGroupTables(self, groupName):
+        group = self.getGroup(groupName)
+        return list(group.tables) if group is not None else []
+
+    def getGroupFields(self, groupName):
+        group = self.getGroup(groupName)
+
+        if group is None:
+            return []
+
+        return [[field.fieldName, field.description, field.size, field.inputType, field.required, field.applicability, field.value] for field in group.dataFields]
+
+    #** Data streams, links, and scheduler ************************************
+
+    def getDataStreamNames(self):
+        names = []
+
+        for typeDefn in self.project.tableTypes:
+            if typeDefn.isStructure:
+                for column in typeDefn.getColumnIndicesByInputType(csvImport.INPUT_RATE):
+                    if typeDefn.columnNames[column] not in names:
+                        names.append(typeDefn.columnNames[column])
+
+        return names
+
+    def getTelemetryMessageIDs(self, streamName):
+        return []
+
+    def getCopyTableEntries(self, streamName, headerSize, messageIDNameField, optimize):
+        return []
+
+    def getCopyTableEntriesWithMacros(self, streamName, headerSize, messageIDNameField, optimize):
+        return []
+
+    def getLinkDescription(self, streamName, linkName):
+        return None
+
+    def getLinkRate(self, streamName, linkName):
+        return None
+
+    def getVariableLinks(self, variableName):
+        return []
+
+    def getApplicationScheduleDefinitionTableDefines(self):
+        return []
+
+    def getApplicationScheduleDefinitionTable(self, row):
+        return []
+
+    def getApplicationMessageDefinitionTable(self):
+        return []
+
+    def getNumberOfTimeSlots(self):
+        return 0
+
+    #** Strings ***************************************************************
+
+    def getArrayFromString(self, text, columnSeparator, rowSeparator=None):
+        if not text:
+            return None if rowSeparator is not None else None
+
+        rows = splitJava(text, r"\s*[" + re.escape(rowSeparator) + r"]\s*") if rowSeparator is not None else [text]
+        array = [splitJava(row, r"\s*[" + re.escape(columnSeparator) + r"]\s*") for row in rows]
+
+        return array if rowSeparator is not None else array[0]
+
+    def parseEnumerationParameters(self, enumeration):
+        match = re.match(r"^\s*[^\s,|]+\s*([^\w\s])", enumeration or "")
+
+        if match is None:
+            return None
+
+        enumSeparator = match.group(1)
+        pairs = re.split(r"\s*" + re.escape(enumSeparator) + r"\s*", enumeration, 1)
+
+        if len(pairs) < 2:
+            return None
+
+        match = re.match(r"^[^\w\s]*\w[^" + re.escape(enumSeparator) + r"]*?([^\w\s" + re.escape(enumSeparator) + r"])", pairs[1])
+        return self.getArrayFromString(enumeration, enumSeparator, match.group(1)) if match is not None else None
+
+    #** Dialogs and logs ******************************************************
+
+    def showInformationDialog(self, text):
+        sys.stderr.write("Information: " + stripHtml(text) + "\n")
+
+    def showWarningDialog(self, text):
+        sys.stderr.write("Warning: " + stripHtml(text) + "\n")
+
+    def showErrorDialog(self, text):
+        self.errorMessages.append(stripHtml(text))
+        sys.stderr.write("Error: " + stripHtml(text) + "\n")
+
+    def getInputDialog(self, labelText):
+        return None
+
+    def getRadioButtonDialog(self, label, buttonInfo):
+        return self.radioButtonSelection
+
+    def getCheckBoxDialog(self, label, boxInfo):
+        return [True] * len(boxInfo)
+
+    def getDatabaseQuery(self, sqlCommand):
+        return None
+
+    def writeSuccessLogEntry(self, logMessage):
+        sys.stderr.write("Success: " + logMessage + "\n")
+
+    def writeFailLogEntry(self, logMessage):
+        sys.stderr.write("Fail: " + logMessage + "\n")
+
+    def writeStatusLogEntry(self, logMessage):
+        sys.stderr.write("Status: " + logMessage + "\n")
+
+    #** Output files **********************************************************
+
+    def openOutputFile(self, outputFileName):
+        try:
+            # Check if the output files aren't tracked
+            if self.manifest is None:
+                return HeadlessPrintWriter(outputFileName)
+
+            return HeadlessPrintWriter(outputFileName,
+                                       ContentHash(self.getDateAndTime()),
+                                       self.previousOutputHashes.get(self.manifest.getOutputName(outputFileName)))
+        except (IOError, OSError):
+            self.showErrorDialog("Cannot create output file '" + outputFileName + "'")
+            return None
+
+    def writeToFile(self, printWriter, text):
+        if printWriter is not None:
+            printWriter.write(text)
+
+    def writeToFileLn(self, printWriter, text):
+        if printWriter is not None:
+            printWriter.write(text + "\n")
+
+    def writeToFileFormat(self, printWriter, format, *args):
+        if printWriter is not None:
+            printWriter.write(formatJava(format, args))
+
+    def closeFile(self, printWriter):
+        if printWriter is not None:
+            printWriter.close()
+
+            # Check if the output file is tracked
+            if printWriter.hashValue is not None:
+                self.outputHashes[self.manifest.getOutputName(printWriter.fileName)] = printWriter.hashValue
+
+#** Functions *****************************************************************
+
+#******************************************************************************
+# Split a string using the supplied regular expression, removing any trailing
+# empty strings (as does the Java String.split() method)
+#
+# @param text
+#            text to split
+#
+# @param separator
+#            regular expression at which to split the text
+#
+# @return List of the text's parts
+#******************************************************************************
+def splitJava(text, separator):
+    parts = re.split(separator, text)
+
+    while len(parts) > 1 and parts[-1] == "":
+        parts.pop()
+
+    return parts
+
+#******************************************************************************
+# Format text using a Java format string
+#
+# @param format
+#            Java format string; the conversions used by the scripts (%s, %d,
+#            and the width and left-justify flags) are the same as Python's
+#
+# @param args
+#            format arguments
+#
+# @return Formatted text
+#******************************************************************************
+def formatJava(format, args):
+    return format.replace("%n", "\n") % tuple(args)
+
+#******************************************************************************
+# Remove the HTML tags from a dialog message
+#
+# @param text
+#            message text
+#
+# @return Message text without the HTML tags
+#******************************************************************************
+def stripHtml(text):
+    return re.sub(r"<[^>]*>", "", text)
+
+#******************************************************************************
+# Execute a script using the headless data access handler. If the handler has
+# a profile report file name the script's calls to the handler are counted and
+# timed, and the profile is written to the file when the script ends
+#
+# @param scriptFileName
+#            name of the script file to execute
+#
+# @param ccdd
+#            headless data access handler
+#
+# @return Script's global namespace following execution
+#******************************************************************************
+def runScript(scriptFileName, ccdd):
+    # The scripts import the CCDD data access handler class in order to make it
+    # available under Jython; provide placeholder modules in its place. Both
+    # the 'from CCDD import ...' and 'import CCDD....' forms are supported
+    if "CCDD" not in sys.modules:
+        ccddModule = types.ModuleType("CCDD")
+        handlerModule = types.ModuleType("CCDD.CcddScriptDataAccessHandler")
+        handlerModule.CcddScriptDataAccessHandler = HeadlessScriptDataAccessHandler
+        ccddModule.CcddScriptDataAccessHandler = HeadlessScriptDataAccessHandler
+        sys.modules["CCDD"] = ccddModule
+        sys.modules["CCDD.CcddScriptDataAccessHandler"] = handlerModule
+
+    scriptFile = open(scriptFileName)
+
+    try:
+        source = scriptFile.read()
+    finally:
+        scriptFile.close()
+
+    profileFileName = ccdd.profileFileName
+
+    # Check if the script's data access calls are profiled
+    if profileFileName:
+        ccdd = profiler.ProfilingHandler(ccdd, scriptFileName)
+
+    namespace = {"__name__": "__main__",
+                 "__file__": scriptFileName,
+                 "ccdd": ccdd,
+                 "ccdds": ccdd}
+
+    try:
+        exec(compile(source, scriptFileName, "exec"), namespace)
+    finally:
+        # Check if the script's data access calls are profiled
+        if profileFileName:
+            ccdd.writeReport(profiler.getReportFileName(profileFileName, scriptFileName))
+
+    return namespace
+
+#******************************************************************************
+# Create a headless data access handler for the supplied import files
+#
+# @param importFileNames
+#            list of CSV import file names
+#
+# @param scriptFileName
+#            name of the script file to execute
+#
+# @param kwargs
+#            additional HeadlessScriptDataAccessHandler constructor arguments
+#
+# @return Headless data access handler
+#******************************************************************************
+def createHandler(importFileNames, scriptFileName="", **kwargs):
+    project = csvImport.readProject(importFileNames)
+
+    # The array sizes may contain macros; use a handler with no associated
+    # tables to expand them while creating the array members
+    csvImport.addProjectArrayMembers(project, HeadlessScriptDataAccessHandler(project, tableNames=[]).getMacroExpansion)
+
+    return HeadlessScriptDataAccessHandler(project, scriptFileName, **kwargs)
+
+#******************************************************************************
+# Add the command line arguments that define the project data and the script
+# environment to the supplied argument parser
+#
+# @param parser
+#            command line argument parser
+#******************************************************************************
+def addHandlerArguments(parser):
+    parser.add_argument("imports", nargs="+", help="CCDD CSV import file(s) containing the project definitions")
+    parser.add_argument("-t", "--table", action="append", dest="tables", help="table to associate with the script (default: all root tables)")
+    parser.add_argument("-g", "--group", action="append", dest="groups", default=[], help="group to associate with the script")
+    parser.add_argument("-o", "--output", default="", help="script output folder")
+    parser.add_argument("-p", "--project", default="headless", help="project name")
+    parser.add_argument("-s", "--select", default=None, help="radio button dialog selection")
+    parser.add_argument("-d", "--date", default=None, help="fixed date and time text (default: current date and time)")
+    parser.add_argument("--profile", default=None, help="file to which to write a flame graph (folded stacks) profile of each script's data access calls; '" + profiler.SCRIPT_NAME_PLACEHOLDER + "' is replaced by the script name (default: the " + profiler.PROFILE_ENVIRONMENT_VARIABLE + " environment variable)")
+
+#******************************************************************************
+# Create a headless data access handler using the parsed command line
+# arguments added by addHandlerArguments()
+#
+# @param options
+#            parsed command line arguments
+#
+# @param scriptFileName
+#            name of the script file to execute
+#
+# @return Headless data access handler
+#******************************************************************************
+def createHandlerFromArguments(options, scriptFileName=""):
+    return createHandler(options.imports,
+                         scriptFileName,
+                         tableNames=options.tables,
+                         groupNames=options.groups,
+                         outputPath=options.output,
+                         projectName=options.project,
+                         radioButtonSelection=options.select,
+                         dateAndTime=options.date,
+                         profileFileName=options.profile)
+
+#******************************************************************************
+# Command line entry point
+#
+# @param args
+#            command line arguments
+#
+# @return Exit status
+#******************************************************************************
+def main(args=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Execute a CCDD data output script without the CCDD application")
+    parser.add_argument("script", help="script file to execute")
+    addHandlerArguments(parser)
+    options = parser.parse_args(args)
+
+    ccdd = createHandlerFromArguments(options, options.script)
+    runScript(options.script, ccdd)
+    return 1 if ccdd.errorMessages else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
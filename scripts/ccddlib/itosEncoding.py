@@ -0,0 +1,264 @@
+#******************************************************************************
+# Description: ITOS encoded data type table
+#
+# This module provides a table of the ITOS encoded forms and sizes of the
+# primitive data types, built once from the project's data type definitions,
+# for use in place of calling the data access handler's
+# getITOSEncodedDataType() and getDataTypeSizeInBytes() methods for every row.
+# The encodings are derived from each data type's base type and size in the
+# same manner as the handler. A data type that isn't a primitive (i.e., a
+# structure) is passed to the handler the first time it's requested and the
+# result is retained
+#
+# The table also holds the output format for each encoded data type used on
+# the ITOS display pages
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+# Encoding styles accepted by getITOSEncodedDataType()
+ENCODINGS = ["SINGLE_CHAR",
+             "TWO_CHAR",
+             "BIG_ENDIAN",
+             "BIG_ENDIAN_SWAP",
+             "LITTLE_ENDIAN",
+             "LITTLE_ENDIAN_SWAP"]
+
+# Data type definition column indices
+USER_NAME = 0
+C_NAME = 1
+SIZE = 2
+BASE_TYPE = 3
+
+#******************************************************************************
+# Get the ITOS encoding character for a base data type
+#
+# @param baseType
+#            base data type name (e.g., 'unsigned integer')
+#
+# @return ITOS encoding character; 'R' (raw) if the base type isn't recognized
+#******************************************************************************
+def getEncodingCharacter(baseType):
+    # Check if the base type is an unsigned integer or a pointer
+    if baseType == "unsigned integer" or baseType == "pointer":
+        return "U"
+
+    # Check if the base type is a signed integer
+    if baseType == "signed integer":
+        return "I"
+
+    # Check if the base type is a floating point
+    if baseType == "floating point":
+        return "F"
+
+    # Check if the base type is a character or string
+    if baseType == "character":
+        return "S"
+
+    return "R"
+
+#******************************************************************************
+# Get the ITOS encoded form of a primitive data type
+#
+# @param encodedType
+#            ITOS encoding character
+#
+# @param size
+#            data type size, in bytes. Character and string types use 1
+#
+# @param encoding
+#            encoding style (refer to ENCODINGS)
+#
+# @return ITOS encoded form of the data type in the requested style
+#******************************************************************************
+def encodeDataType(encodedType, size, encoding):
+    # Check if the data type is unrecognized ('raw')
+    if encodedType == "R":
+        # Check if the request is not for the single character encoding
+        if encoding != "SINGLE_CHAR":
+            encodedType += "0"
+    # Check if the byte order is big endian (example: 12345678)
+    elif encoding == "BIG_ENDIAN":
+        encodedType += "".join([str(index) for index in range(1, size + 1)])
+    # Check if the byte order is big endian swapped (example: 21436587)
+    elif encoding == "BIG_ENDIAN_SWAP":
+        # Check if the data type is a single byte
+        if size == 1:
+            encodedType += "1"
+        else:
+            encodedType += "".join([str(index + 1) + str(index) for index in range(1, size + 1, 2)])
+    # Check if the byte order is little endian (example: 87654321)
+    elif encoding == "LITTLE_ENDIAN":
+        encodedType += "".join([str(index) for index in range(size, 0, -1)])
+    # Check if the byte order is little endian swapped (example: 78563412)
+    elif encoding == "LITTLE_ENDIAN_SWAP":
+        # Check if the data type is a single byte
+        if size == 1:
+            encodedType += "1"
+        else:
+            encodedType += "".join([str(index - 1) + str(index) for index in range(size, 0, -2)])
+    # Check if the encoding includes the size (example: U8)
+    elif encoding == "TWO_CHAR":
+        encodedType += str(size)
+
+    return encodedType
+
+#******************************************************************************
+# Get the ITOS display page output format for an encoded data type
+#
+# @param itosEncode
+#            data type in ITOS encoded form (e.g., 'I1234')
+#
+# @return List containing the output format string, the number of digits
+#         displayed (None if the data type has no format), and True if the
+#         data type occupies a wide field (i.e., fewer fit on a line)
+#******************************************************************************
+def getDisplayFormat(itosEncode):
+    dataTypeChar = itosEncode[0:1]
+    numBytes = len(itosEncode) - 1
+
+    # Check if the data type is a floating point
+    if dataTypeChar == "F":
+        # Check if the number of bytes is greater than 4 (i.e., it's a double
+        # precision floating point)
+        if numBytes > 4:
+            return ["%13.3f", 14, True]
+
+        return ["%6.3f", 7, True]
+
+    # Check if the data type is a signed or unsigned integer
+    if dataTypeChar == "I" or dataTypeChar == "U":
+        # Determine the number of digits required to display the largest
+        # possible value for the (unsigned) integer with the specified number
+        # of bytes, adding a digit for the sign if the integer is signed
+        nDigits = 2 * numBytes + 1 + numBytes // 4
+
+        if dataTypeChar == "I":
+            nDigits += 1
+
+        return ["%" + str(nDigits) + "d", nDigits, numBytes > 2]
+
+    # Check if the data type is a character or string
+    if dataTypeChar == "S":
+        return ["%s", 10, True]
+
+    return ["", None, False]
+
+#******************************************************************************
+# ITOS encoded data type table
+#******************************************************************************
+class ITOSEncodingTable(object):
+    #**************************************************************************
+    # ITOS encoded data type table class constructor
+    #
+    # @param ccdd
+    #            script data access handler
+    #**************************************************************************
+    def __init__(self, ccdd):
+        self.ccdd = ccdd
+        self.encodedTypes = {}
+        self.sizes = {}
+        self.otherEncodedTypes = {}
+        self.otherSizes = {}
+        self.displayFormats = {}
+
+        # Step through each data type definition
+        for definition in ccdd.getDataTypeDefinitions():
+            # The data type's name is its user-defined name, if present, else
+            # its C-language name. Names are case insensitive and the first
+            # definition for a name is used
+            name = (definition[USER_NAME] or definition[C_NAME]).lower()
+
+            # Check if a data type with this name hasn't already been stored
+            if name not in self.sizes:
+                size = int(definition[SIZE])
+                baseType = definition[BASE_TYPE]
+                encodedType = getEncodingCharacter(baseType)
+
+                # Check if the data type is a string; the size of a string is
+                # treated as one byte
+                if baseType == "character" and size > 1:
+                    size = 1
+
+                self.sizes[name] = size
+
+                # Step through each encoding style
+                for encoding in ENCODINGS:
+                    self.encodedTypes[(name, encoding)] = encodeDataType(encodedType, size, encoding)
+
+    #**************************************************************************
+    # Get the ITOS encoded form of a data type. This is the equivalent of the
+    # data access handler's getITOSEncodedDataType method
+    #
+    # @param dataType
+    #            name of the data type (e.g., 'uint16' or 'double')
+    #
+    # @param encoding
+    #            encoding style (refer to ENCODINGS; case insensitive)
+    #
+    # @return ITOS encoded form of the data type in the style requested;
+    #         the data type, unmodified, if the data type is a structure, or
+    #         None if the data type is unrecognized
+    #**************************************************************************
+    def getITOSEncodedDataType(self, dataType, encoding):
+        # Check if the data type is a primitive
+        if dataType is not None:
+            encodedType = self.encodedTypes.get((dataType.lower(), encoding.upper()))
+
+            if encodedType is not None:
+                return encodedType
+
+        key = (dataType, encoding)
+
+        # Check if the handler hasn't been asked for this data type and
+        # encoding
+        if key not in self.otherEncodedTypes:
+            self.otherEncodedTypes[key] = self.ccdd.getITOSEncodedDataType(dataType, encoding)
+
+        return self.otherEncodedTypes[key]
+
+    #**************************************************************************
+    # Get the size of a data type in bytes. This is the equivalent of the data
+    # access handler's getDataTypeSizeInBytes method
+    #
+    # @param dataType
+    #            structure name or primitive data type
+    #
+    # @return Number of bytes required to store the data type; 0 if the data
+    #         type doesn't exist
+    #**************************************************************************
+    def getDataTypeSizeInBytes(self, dataType):
+        # Check if the data type is a primitive
+        if dataType is not None:
+            size = self.sizes.get(dataType.lower())
+
+            if size is not None:
+                return size
+
+        # Check if the handler hasn't been asked for this data type
+        if dataType not in self.otherSizes:
+            self.otherSizes[dataType] = self.ccdd.getDataTypeSizeInBytes(dataType)
+
+        return self.otherSizes[dataType]
+
+    #**************************************************************************
+    # Get the ITOS display page output format for an encoded data type
+    #
+    # @param itosEncode
+    #            data type in ITOS encoded form
+    #
+    # @return List containing the output format string, the number of digits
+    #         displayed (None if the data type has no format), and True if the
+    #         data type occupies a wide field
+    #**************************************************************************
+    def getDisplayFormat(self, itosEncode):
+        displayFormat = self.displayFormats.get(itosEncode)
+
+        # Check if the format for this encoding hasn't been determined
+        if displayFormat is None:
+            displayFormat = getDisplayFormat(itosEncode)
+            self.displayFormats[itosEncode] = displayFormat
+
+        return displayFormat
@@ -0,0 +1,372 @@
+#******************************************************************************
+# Description: Memoized macro expansion
+#
+# This module provides the macro expansion used by the data output scripts and
+# the headless data access handler. Macro names, enclosed by '##', are replaced
+# by the macro values, which can reference other macros; sizeof() calls are
+# replaced by the data type size; and the result is evaluated as a
+# mathematical expression if possible. The expansion follows that of the CCDD
+# application's macro handler. Each macro value and each expanded text string
+# is evaluated once and is stored; the stored values are discarded whenever
+# the macro definitions change (i.e., the stored values are kept per version
+# of the macro set). The integer values of array sizes and bit lengths are
+# stored in the same manner so that a script can convert these without
+# reevaluating the text
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+import ast
+import re
+
+# Macro identifier and the pattern for locating a macro in a text string
+MACRO_IDENTIFIER = "##"
+MACRO_PATTERN = re.compile(r"##([a-zA-Z_][a-zA-Z0-9_]*)##")
+
+# Pattern for a sizeof() call in a text string
+SIZEOF_PATTERN = re.compile(r"sizeof\(+\s*([a-zA-Z_][a-zA-Z0-9_\*\s]*?)\s*\)")
+
+# Pattern for the characters allowed in a mathematical expression
+EXPRESSION_PATTERN = re.compile(r"^[\d\s\.\+\-\*/%\(\)]+$")
+
+# Pattern for an integer value
+INTEGER_PATTERN = re.compile(r"^\s*[\+\-]?\d+\s*$")
+
+# Macro expanders created for the data access handlers; used by getExpander()
+expanders = []
+
+#******************************************************************************
+# Memoized macro expander
+#******************************************************************************
+class MacroExpander(object):
+    #**************************************************************************
+    # Macro expander class constructor
+    #
+    # @param macros
+    #            list of the macro definitions; each definition is a list
+    #            containing the macro name and its unexpanded value
+    #
+    # @param sizeofFunction
+    #            function that accepts a data type name and returns its size
+    #            in bytes; None if sizeof() calls aren't replaced
+    #**************************************************************************
+    def __init__(self, macros, sizeofFunction=None):
+        self.sizeofFunction = sizeofFunction
+        self.version = 0
+        self.setMacros(macros)
+
+    #**************************************************************************
+    # Set the macro definitions. The stored expansions are discarded and the
+    # macro set version is incremented
+    #
+    # @param macros
+    #            list of the macro definitions; each definition is a list
+    #            containing the macro name and its unexpanded value
+    #**************************************************************************
+    def setMacros(self, macros):
+        self.macros = {}
+
+        # Step through each macro definition. Macro names are case insensitive
+        for macro in macros:
+            self.macros.setdefault(macro[0].lower(), macro[1])
+
+        self.definitions = [[macro[0], macro[1]] for macro in macros]
+        self.clearStoredValues()
+
+    #**************************************************************************
+    # Discard the stored macro values and expansions, and increment the macro
+    # set version. This is done whenever the macro definitions change, and
+    # whenever a data type size referenced by a sizeof() call can change
+    #**************************************************************************
+    def clearStoredValues(self):
+        self.version += 1
+        self.macroValues = {}
+        self.expansions = {}
+        self.integers = {}
+        self.dimensions = {}
+
+    #**************************************************************************
+    # Check if the supplied macro definitions differ from those in use
+    #
+    # @param macros
+    #            list of the macro definitions; each definition is a list
+    #            containing the macro name and its unexpanded value
+    #
+    # @return True if the macro definitions differ
+    #**************************************************************************
+    def isChanged(self, macros):
+        return [[macro[0], macro[1]] for macro in macros] != self.definitions
+
+    #**************************************************************************
+    # Replace the sizeof() calls in the supplied text with the data type sizes
+    #
+    # @param text
+    #            text string
+    #
+    # @return Text with the sizeof() calls replaced by the data type sizes
+    #**************************************************************************
+    def replaceSizeof(self, text):
+        # Check if sizeof() calls are replaced and the text contains one
+        if self.sizeofFunction is not None and "sizeof(" in text:
+            text = SIZEOF_PATTERN.sub(lambda match: str(self.sizeofFunction(match.group(1))), text)
+
+        return text
+
+    #**************************************************************************
+    # Get the value of the specified macro with any macros it references
+    # replaced by their values. The referenced macros' values are inserted
+    # as-is (i.e., without evaluating them as expressions)
+    #
+    # @param macroName
+    #            macro name
+    #
+    # @param references
+    #            list of the macro names being expanded; used to detect a macro
+    #            that references itself
+    #
+    # @return Macro value; None if the macro doesn't exist or references
+    #         itself
+    #**************************************************************************
+    def getRawMacroValue(self, macroName, references):
+        value = self.macros.get(macroName.lower())
+
+        # Check if the macro exists and doesn't reference itself
+        if value is None or macroName.lower() in references:
+            return None
+
+        value = self.replaceSizeof(value)
+
+        def replaceMacro(match):
+            macroValue = self.getRawMacroValue(match.group(1), references + [macroName.lower()])
+
+            # Check if the referenced macro doesn't exist
+            if macroValue is None:
+                return match.group(0)
+
+            return macroValue
+
+        return MACRO_PATTERN.sub(replaceMacro, value)
+
+    #**************************************************************************
+    # Get the expanded value of the specified macro. If the value is a
+    # mathematical expression then the expression's integer value is returned
+    #
+    # @param macroName
+    #            macro name
+    #
+    # @return Expanded macro value; None if the macro doesn't exist
+    #**************************************************************************
+    def getMacroValue(self, macroName):
+        key = macroName.lower()
+
+        # Check if the macro's value hasn't already been determined
+        if key not in self.macroValues:
+            value = self.getRawMacroValue(macroName, [])
+
+            # Check if the macro exists
+            if value is not None:
+                result = evaluateExpression(value)
+
+                # Check if the value is a mathematical expression
+                if result is not None:
+                    value = str(int(result))
+
+            self.macroValues[key] = value
+
+        return self.macroValues[key]
+
+    #**************************************************************************
+    # Replace the macros and sizeof() calls in the supplied text with their
+    # values. If the result is a mathematical expression (or comma-separated
+    # expressions, as used for the array size of a multi-dimensional array)
+    # then the expression's integer value is returned
+    #
+    # @param text
+    #            text string
+    #
+    # @return Text with the macros replaced by their values; the text as-is if
+    #         it contains no macro or sizeof() call
+    #**************************************************************************
+    def getMacroExpansion(self, text):
+        # Check if the text contains no macro or sizeof() call
+        if text is None or (MACRO_IDENTIFIER not in text and "sizeof(" not in text):
+            return text
+
+        expandedText = self.expansions.get(text)
+
+        # Check if the text hasn't already been expanded
+        if expandedText is None:
+            def replaceMacro(match):
+                macroValue = self.getMacroValue(match.group(1))
+
+                # Check if the macro doesn't exist
+                if macroValue is None:
+                    return match.group(0)
+
+                return macroValue
+
+            expandedText = MACRO_PATTERN.sub(replaceMacro, self.replaceSizeof(text))
+            values = []
+
+            # Evaluate each comma-separated part as an expression
+            for part in re.split(r"\s*,\s*", expandedText):
+                result = evaluateExpression(part)
+
+                # Check if the part isn't a mathematical expression
+                if result is None:
+                    values = None
+                    break
+
+                values.append(str(int(result)))
+
+            # Check if every part is a mathematical expression
+            if values is not None:
+                expandedText = ", ".join(values)
+
+            self.expansions[text] = expandedText
+
+        return expandedText
+
+    #**************************************************************************
+    # Get the integer value of the supplied text (e.g., a bit length), with
+    # any macros replaced by their values
+    #
+    # @param text
+    #            text string
+    #
+    # @return Integer value of the text; None if the text is blank or isn't an
+    #         integer
+    #**************************************************************************
+    def getInteger(self, text):
+        # Check if the text is blank
+        if not text:
+            return None
+
+        # Check if the text hasn't already been converted
+        if text not in self.integers:
+            expandedText = self.getMacroExpansion(text)
+            value = None
+
+            # Check if the text is an integer
+            if INTEGER_PATTERN.match(expandedText):
+                value = int(expandedText)
+
+            self.integers[text] = value
+
+        return self.integers[text]
+
+    #**************************************************************************
+    # Get the dimensions of the supplied array size, with any macros replaced
+    # by their values
+    #
+    # @param arraySize
+    #            array size in the format #[, #[, ...]]
+    #
+    # @return List containing the integer value of each array dimension; an
+    #         empty list if the array size is blank or isn't valid
+    #**************************************************************************
+    def getArrayDimensions(self, arraySize):
+        # Check if the array size is blank
+        if not arraySize:
+            return []
+
+        # Check if the array size hasn't already been converted
+        if arraySize not in self.dimensions:
+            dimensions = []
+
+            # Step through each dimension in the array size
+            for dimension in re.split(r"\s*,\s*", self.getMacroExpansion(arraySize).strip()):
+                # Check if the dimension isn't an integer
+                if not INTEGER_PATTERN.match(dimension):
+                    dimensions = []
+                    break
+
+                dimensions.append(int(dimension))
+
+            self.dimensions[arraySize] = dimensions
+
+        # Return a copy so that the stored dimensions can't be altered
+        return list(self.dimensions[arraySize])
+
+#******************************************************************************
+# Get the macro expander for the supplied data access handler. The expander is
+# created when first requested for the handler; on subsequent requests the
+# handler's macro definitions are checked and, if these have changed, the
+# stored expansions are discarded
+#
+# @param ccdd
+#            script data access handler
+#
+# @return Macro expander for the data access handler
+#******************************************************************************
+def getExpander(ccdd):
+    macros = ccdd.getMacroDefinitions()
+
+    # Step through the expanders already created
+    for handler, expander in expanders:
+        # Check if the expander belongs to the supplied handler
+        if handler is ccdd:
+            # Check if the macro definitions have changed
+            if expander.isChanged(macros):
+                expander.setMacros(macros)
+
+            return expander
+
+    expander = MacroExpander(macros, ccdd.getDataTypeSizeInBytes)
+    expanders.append((ccdd, expander))
+    return expander
+
+#******************************************************************************
+# Evaluate a simple mathematical expression
+#
+# @param expression
+#            expression containing numbers, parentheses, and the operators +,
+#            -, *, /, and %
+#
+# @return Expression value; None if the text isn't a valid expression
+#******************************************************************************
+def evaluateExpression(expression):
+    if not EXPRESSION_PATTERN.match(expression) or not re.search(r"\d", expression):
+        return None
+
+    try:
+        return evaluateNode(ast.parse(expression.strip(), mode="eval").body)
+    except (SyntaxError, ValueError, ZeroDivisionError):
+        return None
+
+#******************************************************************************
+# Evaluate a node of a parsed mathematical expression
+#
+# @param node
+#            expression node
+#
+# @return Node value
+#******************************************************************************
+def evaluateNode(node):
+    if isinstance(node, ast.BinOp):
+        left = evaluateNode(node.left)
+        right = evaluateNode(node.right)
+
+        if isinstance(node.op, ast.Add):
+            return left + right
+        elif isinstance(node.op, ast.Sub):
+            return left - right
+        elif isinstance(node.op, ast.Mult):
+            return left * right
+        elif isinstance(node.op, ast.Div):
+            return float(left) / right
+        elif isinstance(node.op, ast.Mod):
+            return left % right
+    elif isinstance(node, ast.UnaryOp):
+        if isinstance(node.op, ast.USub):
+            return -evaluateNode(node.operand)
+        elif isinstance(node.op, ast.UAdd):
+            return evaluateNode(node.operand)
+    elif hasattr(ast, "Constant") and isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    elif hasattr(ast, "Num") and isinstance(node, getattr(ast, "Num")):
+        return node.n
+
+    raise ValueError("Invalid expression")
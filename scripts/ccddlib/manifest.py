@@ -0,0 +1,303 @@
+#******************************************************************************
+# Description: Artifact manifest for incremental regeneration
+#
+# This module provides the manifest used to regenerate only those artifacts
+# whose inputs have changed. For each script the manifest records a hash of
+# the script's inputs (the script itself, the ccddlib modules alongside it, the
+# structure tables in reference order, the command tables, the data fields,
+# the macros, and the data type definitions) and, for each output file the
+# script created, a hash of the file's contents. The output file hashes
+# exclude the script's creation date and time text (as output by the scripts'
+# outputFileCreationInfo functions), so an output file whose contents are
+# otherwise unchanged isn't rewritten and remains byte-for-byte the same
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+import hashlib
+import json
+import os
+
+# Default manifest file name. The manifest is stored in the script output
+# folder
+MANIFEST_FILE_NAME = "ccdd_manifest.json"
+
+# Manifest format version. A manifest with a different version is ignored.
+# The version is included in the input hashes
+MANIFEST_VERSION = 2
+
+#******************************************************************************
+# Artifact manifest
+#******************************************************************************
+class ArtifactManifest(object):
+    #**************************************************************************
+    # Artifact manifest class constructor. The manifest is read from the
+    # specified file if it exists
+    #
+    # @param fileName
+    #            manifest file path + name
+    #**************************************************************************
+    def __init__(self, fileName):
+        self.fileName = fileName
+        self.artifacts = {}
+
+        # Check if the manifest file exists
+        if os.path.exists(fileName):
+            try:
+                manifestFile = open(fileName)
+
+                try:
+                    manifest = json.load(manifestFile)
+                finally:
+                    manifestFile.close()
+
+                # Check if the manifest is in the expected format
+                if manifest.get("version") == MANIFEST_VERSION:
+                    self.artifacts = manifest.get("artifacts", {})
+            except (IOError, OSError, ValueError):
+                # Ignore a manifest that can't be read; every artifact is
+                # regenerated
+                self.artifacts = {}
+
+    #**************************************************************************
+    # Get the name by which an artifact's script is stored in the manifest
+    #
+    # @param scriptFileName
+    #            script file path + name
+    #
+    # @return Script file name without the path
+    #**************************************************************************
+    def getArtifactName(self, scriptFileName):
+        return os.path.basename(scriptFileName)
+
+    #**************************************************************************
+    # Get the path of an output file relative to the manifest's folder
+    #
+    # @param outputFileName
+    #            output file path + name
+    #
+    # @return Output file path + name relative to the manifest's folder
+    #**************************************************************************
+    def getOutputName(self, outputFileName):
+        return os.path.relpath(os.path.abspath(outputFileName),
+                               os.path.dirname(os.path.abspath(self.fileName)))
+
+    #**************************************************************************
+    # Check if an artifact is up to date. The artifact is up to date if its
+    # input hash matches that in the manifest and each of its output files
+    # exists
+    #
+    # @param scriptFileName
+    #            script file path + name
+    #
+    # @param inputHash
+    #            hash of the script's inputs
+    #
+    # @return True if the artifact doesn't need to be regenerated
+    #**************************************************************************
+    def isUpToDate(self, scriptFileName, inputHash):
+        artifact = self.artifacts.get(self.getArtifactName(scriptFileName))
+
+        # Check if the artifact isn't in the manifest or its inputs changed
+        if artifact is None or artifact.get("inputs") != inputHash:
+            return False
+
+        folder = os.path.dirname(os.path.abspath(self.fileName))
+
+        # Step through each of the artifact's output files
+        for outputName in artifact.get("outputs", {}):
+            # Check if the output file no longer exists
+            if not os.path.exists(os.path.join(folder, outputName)):
+                return False
+
+        return True
+
+    #**************************************************************************
+    # Get the content hashes of an artifact's output files from the previous
+    # generation
+    #
+    # @param scriptFileName
+    #            script file path + name
+    #
+    # @return Dictionary containing the output file content hashes, keyed by
+    #         the output file path + name relative to the manifest's folder
+    #**************************************************************************
+    def getOutputHashes(self, scriptFileName):
+        artifact = self.artifacts.get(self.getArtifactName(scriptFileName), {})
+        return dict(artifact.get("outputs", {}))
+
+    #**************************************************************************
+    # Store an artifact's input hash and output file content hashes
+    #
+    # @param scriptFileName
+    #            script file path + name
+    #
+    # @param inputHash
+    #            hash of the script's inputs
+    #
+    # @param outputHashes
+    #            dictionary containing the output file content hashes, keyed
+    #            by the output file path + name relative to the manifest's
+    #            folder
+    #**************************************************************************
+    def setArtifact(self, scriptFileName, inputHash, outputHashes):
+        self.artifacts[self.getArtifactName(scriptFileName)] = {"inputs": inputHash,
+                                                                 "outputs": outputHashes}
+
+    #**************************************************************************
+    # Write the manifest to its file
+    #**************************************************************************
+    def save(self):
+        manifestFile = open(self.fileName, "w")
+
+        try:
+            json.dump({"version": MANIFEST_VERSION, "artifacts": self.artifacts},
+                      manifestFile,
+                      indent=2,
+                      sort_keys=True)
+            manifestFile.write("\n")
+        finally:
+            manifestFile.close()
+
+#******************************************************************************
+# Output file content hash, excluding the script's creation date and time
+#******************************************************************************
+class ContentHash(object):
+    #**************************************************************************
+    # Output file content hash class constructor
+    #
+    # @param dateAndTime
+    #            creation date and time text supplied to the script; this text
+    #            is excluded from the hash
+    #**************************************************************************
+    def __init__(self, dateAndTime):
+        self.dateAndTime = dateAndTime
+        self.hash = hashlib.sha1()
+        self.pending = ""
+
+    #**************************************************************************
+    # Add text to the hash
+    #
+    # @param text
+    #            text output to the file
+    #**************************************************************************
+    def update(self, text):
+        # The date and time text can be split between successive writes, so
+        # retain enough of the text's end to detect the date and time in the
+        # next write
+        text = self.pending + text
+
+        # Check if the date and time is excluded
+        if self.dateAndTime:
+            text = text.replace(self.dateAndTime, "")
+            split = max(0, len(text) - len(self.dateAndTime) + 1)
+        # The date and time isn't excluded
+        else:
+            split = len(text)
+
+        self.pending = text[split:]
+        self.hash.update(text[:split].encode("utf-8"))
+
+    #**************************************************************************
+    # Get the hash of the text
+    #
+    # @return Hash of the text, as a hexadecimal string
+    #**************************************************************************
+    def hexdigest(self):
+        final = self.hash.copy()
+        final.update(self.pending.encode("utf-8"))
+        return final.hexdigest()
+
+#******************************************************************************
+# Compute the hash of the project data supplied to the scripts by a data access
+# handler: the structure tables in the order in which they are referenced, the
+# structure and command table data, the data fields, the macros, and the data
+# type definitions. Scripts executed using the same handler share this hash
+#
+# @param ccdd
+#            script data access handler
+#
+# @return Hash of the project data, as a hexadecimal string
+#******************************************************************************
+def computeProjectHash(ccdd):
+    projectHash = hashlib.sha1()
+
+    def add(*values):
+        projectHash.update((repr(values) + "\n").encode("utf-8"))
+
+    # Add the structure tables in the order in which they are referenced,
+    # followed by the structure table data
+    add(list(ccdd.getStructureTablesByReferenceOrder()))
+
+    for column in ccdd.getStructureTableColumns():
+        add(list(column))
+
+    # Add the command table data
+    for row in range(ccdd.getCommandTableNumRows()):
+        columnNames = list(ccdd.getCommandTableColumnNames(row))
+        add(columnNames, [ccdd.getCommandTableData(columnName, row) for columnName in columnNames])
+
+    # Add the data fields of the tables, groups, and project
+    for tableName in sorted(ccdd.getTableNames()):
+        for fieldName in ccdd.getTableDataFieldNames(tableName):
+            add(tableName, fieldName, ccdd.getTableDataFieldValue(tableName, fieldName))
+
+    for groupName in sorted(ccdd.getGroupNames(False)):
+        for fieldName in ccdd.getGroupDataFieldNames(groupName):
+            add(groupName, fieldName, ccdd.getGroupDataFieldValue(groupName, fieldName))
+
+    for fieldName in ccdd.getProjectFieldNames():
+        add(fieldName, ccdd.getProjectDataFieldValue(fieldName))
+
+    # Add the macros and data type definitions
+    for macro in ccdd.getMacroDefinitions():
+        add(list(macro))
+
+    for dataType in ccdd.getDataTypeDefinitions():
+        add(list(dataType))
+
+    return projectHash.hexdigest()
+
+#******************************************************************************
+# Compute the hash of a script's inputs: the script itself, the script support
+# package modules it can import (those in the ccddlib folder alongside the
+# script), the manifest format version, the values that affect its output, and
+# the project data
+#
+# @param scriptFileName
+#            script file path + name
+#
+# @param projectHash
+#            hash of the project data supplied to the script (refer to
+#            computeProjectHash())
+#
+# @param parameters
+#            list of additional values that affect the script's output (e.g.,
+#            the radio button selection); these are included in the hash
+#
+# @return Hash of the script's inputs, as a hexadecimal string
+#******************************************************************************
+def computeInputHash(scriptFileName, projectHash, parameters=None):
+    inputHash = hashlib.sha1()
+    sourceFileNames = [scriptFileName]
+    libraryPath = os.path.join(os.path.dirname(os.path.abspath(scriptFileName)), "ccddlib")
+
+    # Check if the script support package exists. Any change to one of its
+    # modules can change the script's output, so all of them are included
+    if os.path.isdir(libraryPath):
+        sourceFileNames += [os.path.join(libraryPath, fileName) for fileName in sorted(os.listdir(libraryPath)) if fileName.endswith(".py")]
+
+    # Step through the script and support package source files
+    for sourceFileName in sourceFileNames:
+        sourceFile = open(sourceFileName, "rb")
+
+        try:
+            inputHash.update((os.path.basename(sourceFileName) + "\n").encode("utf-8"))
+            inputHash.update(sourceFile.read())
+        finally:
+            sourceFile.close()
+
+    inputHash.update((str(MANIFEST_VERSION) + "\n" + repr(parameters) + "\n" + projectHash).encode("utf-8"))
+    return inputHash.hexdigest()
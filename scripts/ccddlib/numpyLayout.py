@@ -0,0 +1,410 @@
+#******************************************************************************
+# Description: NumPy structured data type layout
+#
+# This module builds, for a structure, the list of members from which a NumPy
+# structured data type (dtype) is created: each member's name, NumPy type code
+# (without the byte order) or structure name, byte offset, and array
+# dimensions. The offsets are those of CCDD, so the data type describes the
+# packed telemetry layout, with the CCSDS headers included for a structure
+# having a message ID. Bit fields that share a storage unit are stored in the
+# data type as a single unsigned integer member, and each bit field's bit
+# position and length within the unit are provided so that the field can be
+# extracted with a shift and a mask
+#
+# The source code that creates the data types from the member lists, decodes
+# packets into columns, and splits a file of recorded CCSDS packets by
+# application ID, is also provided. The NumPy types script outputs this along
+# with the member lists and the structure for each application ID, so the
+# output module requires only NumPy
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+import re
+
+from ccddlib.orderedSet import OrderedSet
+from ccddlib.structureLayout import CCSDS_HEADER_SIZE
+
+# Names of the CCSDS header members added to a structure that has a message
+# ID, and the size of each in bytes
+CCSDS_HEADER_MEMBERS = [["CFS_PRI_HEADER", 6],
+                        ["CFS_SEC_HEADER", CCSDS_HEADER_SIZE - 6]]
+
+# Sizes, in bytes, of the integer and floating point types supported by NumPy
+INTEGER_SIZES = [1, 2, 4, 8]
+FLOAT_SIZES = [2, 4, 8]
+
+# Bits of a message ID, and of a CCSDS packet's stream ID, that contain the
+# application ID
+APPLICATION_ID_MASK = 0x7ff
+
+# Pattern for a hexadecimal message ID
+MESSAGE_ID_PATTERN = re.compile(r"^(0x)?[0-9a-fA-F]+$")
+
+# Source code that creates the data types and decodes the packets. The bit
+# positions of the fields in a storage unit begin with the least significant
+# bit in little endian byte order, and with the most significant bit in big
+# endian byte order (as is the case for the GNU C compiler)
+DECODER_SOURCE = '''_dtypes = {}
+
+def getDtype(structureName, byteOrder=">"):
+    """Get the NumPy structured data type for a structure. byteOrder is '>'
+    for big endian or '<' for little endian. Bit fields are held in a member
+    named BIT_FIELD_UNIT_PREFIX plus the storage unit's byte offset"""
+    key = (structureName, byteOrder)
+
+    if key not in _dtypes:
+        size, members = STRUCTURES[structureName]
+        names = []
+        formats = []
+        offsets = []
+
+        for name, format, offset, shape, bitField in members:
+            if bitField is not None:
+                name = BIT_FIELD_UNIT_PREFIX + str(offset)
+
+                if name in names:
+                    continue
+
+            if format in STRUCTURES:
+                format = getDtype(format, byteOrder)
+            elif format[0] in "uif":
+                format = byteOrder + format
+
+            names.append(name)
+            formats.append((format, shape) if shape else format)
+            offsets.append(offset)
+
+        _dtypes[key] = np.dtype({"names": names,
+                                 "formats": formats,
+                                 "offsets": offsets,
+                                 "itemsize": size})
+
+    return _dtypes[key]
+
+def decode(data, structureName, byteOrder=">", count=-1, offset=0):
+    """Decode consecutive packets of a structure (e.g., bytes, a memory map,
+    or a NumPy array) into a dictionary of columns keyed by the members' full
+    names, with the names in a member structure separated by '.'. Each column
+    holds the member's value (an array for an array member) for every
+    packet"""
+    records = np.frombuffer(data, dtype=getDtype(structureName, byteOrder), count=count, offset=offset)
+    columns = OrderedDict()
+    _addColumns(records, structureName, byteOrder, "", columns)
+    return columns
+
+def _addColumns(records, structureName, byteOrder, prefix, columns):
+    for name, format, offset, shape, bitField in STRUCTURES[structureName][1]:
+        if bitField is not None:
+            unit = records[BIT_FIELD_UNIT_PREFIX + str(offset)]
+            position, length, isSigned = bitField
+
+            if byteOrder == "<":
+                shift = position
+            else:
+                shift = unit.dtype.itemsize * 8 - position - length
+
+            value = (unit >> shift) & ((1 << length) - 1)
+
+            if isSigned:
+                value = value.astype(np.int64)
+                value[value >= 1 << (length - 1)] -= 1 << length
+
+            columns[prefix + name] = value
+        elif format in STRUCTURES:
+            _addColumns(records[name], format, byteOrder, prefix + name + ".", columns)
+        else:
+            columns[prefix + name] = records[name]
+'''
+
+# Source code that splits a buffer or file of consecutive CCSDS packets by
+# application ID and decodes each application's packets using the structure
+# having the application ID. The packet boundaries are found with a single
+# sweep through the primary headers, after which each application's packets
+# are gathered and decoded with vectorized operations
+DEMULTIPLEXER_SOURCE = '''# CCSDS primary header: stream ID (which contains the application ID),
+# sequence, and packet data length (the packet size less 7)
+_primaryHeader = struct.Struct(">HHH")
+
+def indexPackets(data, offset=0):
+    """Find the boundaries of the consecutive CCSDS packets in a buffer (e.g.,
+    bytes or a memory map) with a single sweep through the primary headers.
+    Returns a dictionary of the packets' byte offsets, as NumPy arrays, keyed
+    by application ID, and the offset following the last complete packet"""
+    unpack = _primaryHeader.unpack_from
+    size = len(data)
+    end = size - _primaryHeader.size
+    offsets = {}
+
+    while offset <= end:
+        streamID, sequence, length = unpack(data, offset)
+        packetSize = length + 7
+
+        if offset + packetSize > size:
+            break
+
+        applicationID = streamID & APPLICATION_ID_MASK
+        applicationOffsets = offsets.get(applicationID)
+
+        if applicationOffsets is None:
+            applicationOffsets = []
+            offsets[applicationID] = applicationOffsets
+
+        applicationOffsets.append(offset)
+        offset += packetSize
+
+    return dict((applicationID, np.array(applicationOffsets, dtype=np.int64)) for applicationID, applicationOffsets in offsets.items()), offset
+
+def decodePackets(data, offsets, structureName, byteOrder=">"):
+    """Decode the packets of a structure at the specified byte offsets in a
+    buffer into columns (refer to decode()). A packet shorter than the
+    structure is skipped"""
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    size = getDtype(structureName, byteOrder).itemsize
+    lengths = (buffer[offsets + 4].astype(np.int64) << 8 | buffer[offsets + 5]) + 7
+    offsets = offsets[lengths >= size]
+
+    if len(offsets) == 0:
+        return decode(b"", structureName, byteOrder)
+
+    packets = np.lib.stride_tricks.sliding_window_view(buffer, size)[offsets]
+    return decode(packets, structureName, byteOrder)
+
+def demultiplex(fileName, byteOrder=">"):
+    """Split a file of recorded CCSDS packets by application ID, reading the
+    file through a memory map, and decode each application's packets using
+    the structure having the application ID. Returns a dictionary, keyed by
+    application ID, containing the structure name (None if no structure has
+    the application ID), the packets' byte offsets, and the decoded columns
+    (None if no structure has the application ID)"""
+    applications = OrderedDict()
+
+    with open(fileName, "rb") as packetFile:
+        if os.fstat(packetFile.fileno()).st_size == 0:
+            return applications
+
+        data = mmap.mmap(packetFile.fileno(), 0, access=mmap.ACCESS_READ)
+
+    offsets = indexPackets(data)[0]
+
+    for applicationID in sorted(offsets):
+        structureName = APPLICATION_IDS.get(applicationID)
+        columns = None
+
+        if structureName is not None:
+            columns = decodePackets(data, offsets[applicationID], structureName, byteOrder)
+
+        applications[applicationID] = [structureName, offsets[applicationID], columns]
+
+    return applications
+'''
+
+#******************************************************************************
+# Get the application ID from a message ID
+#
+# @param msgID
+#            message ID, as a hexadecimal value
+#
+# @return Application ID (the last 11 bits of the message ID); None if the
+#         message ID isn't a hexadecimal value
+#******************************************************************************
+def getApplicationID(msgID):
+    msgID = msgID.strip()
+
+    # Check if the ID isn't a hexadecimal number
+    if not MESSAGE_ID_PATTERN.match(msgID):
+        return None
+
+    return int(msgID, 16) & APPLICATION_ID_MASK
+
+#******************************************************************************
+# Get the NumPy type code, without the byte order, for a primitive data type
+#
+# @param baseType
+#            base data type name (e.g., 'unsigned integer')
+#
+# @param size
+#            data type size, in bytes
+#
+# @return NumPy type code (e.g., 'u4'); a raw ('V') type if the base type isn't
+#         recognized or NumPy has no type of the size
+#******************************************************************************
+def getNumpyFormat(baseType, size):
+    # Check if the base type is an unsigned integer or a pointer
+    if (baseType == "unsigned integer" or baseType == "pointer") and size in INTEGER_SIZES:
+        return "u" + str(size)
+
+    # Check if the base type is a signed integer
+    if baseType == "signed integer" and size in INTEGER_SIZES:
+        return "i" + str(size)
+
+    # Check if the base type is a floating point
+    if baseType == "floating point" and size in FLOAT_SIZES:
+        return "f" + str(size)
+
+    # Check if the base type is a character or string
+    if baseType == "character":
+        return "S" + str(size)
+
+    return "V" + str(size)
+
+#******************************************************************************
+# Structure member as described in a NumPy structured data type
+#******************************************************************************
+class NumpyMember(object):
+    #**************************************************************************
+    # NumPy structure member class constructor
+    #
+    # @param name
+    #            member name
+    #
+    # @param format
+    #            NumPy type code, without the byte order, for a primitive; the
+    #            structure name for a structure
+    #
+    # @param offset
+    #            member's byte offset within the structure, including any
+    #            CCSDS header. For a bit field this is the offset of the
+    #            storage unit
+    #
+    # @param shape
+    #            list of the array dimensions; an empty list if the member
+    #            isn't an array
+    #
+    # @param bitField
+    #            list containing the bit field's bit position within its
+    #            storage unit, its length in bits, and True if the field is
+    #            signed; None if the member isn't a bit field
+    #**************************************************************************
+    def __init__(self, name, format, offset, shape, bitField=None):
+        self.name = name
+        self.format = format
+        self.offset = offset
+        self.shape = shape
+        self.bitField = bitField
+
+    #**************************************************************************
+    # Get the member as Python source text: a list containing the name,
+    # format, offset, shape (as a tuple), and bit field information
+    #
+    # @return Member source text
+    #**************************************************************************
+    def toSource(self):
+        # Check if the member isn't an array
+        if not self.shape:
+            shape = "()"
+        # Check if the member is a one-dimensional array
+        elif len(self.shape) == 1:
+            shape = "(" + str(self.shape[0]) + ",)"
+        else:
+            shape = "(" + ", ".join([str(dimension) for dimension in self.shape]) + ")"
+
+        # Check if the member isn't a bit field
+        if self.bitField is None:
+            bitField = "None"
+        else:
+            bitField = "[" + str(self.bitField[0]) + ", " + str(self.bitField[1]) + ", " + str(self.bitField[2]) + "]"
+
+        return "[\"" + self.name + "\", \"" + self.format + "\", " + str(self.offset) + ", " + shape + ", " + bitField + "]"
+
+#******************************************************************************
+# Build the NumPy data type members for a structure
+#
+# @param ccdd
+#            script data access handler
+#
+# @param rows
+#            list of the structure's row indices (refer to StructureRowIndex)
+#
+# @param structureData
+#            structure table data snapshot (refer to StructureSnapshot)
+#
+# @param macroExpander
+#            macro expander used to convert the array sizes and bit lengths
+#
+# @param isCCSDS
+#            True if the structure has a message ID, in which case the CCSDS
+#            header members are added and the offsets of the remaining members
+#            are adjusted to follow them
+#
+# @return List of the structure's members (refer to NumpyMember), in member
+#         order
+#******************************************************************************
+def getNumpyMembers(ccdd, rows, structureData, macroExpander, isCCSDS):
+    members = []
+    usedVariableNames = OrderedSet()
+    headerOffset = 0
+    lastBitFieldOffset = -1
+    lastBitFieldType = None
+    lastBitLength = 0
+    bitPosition = 0
+
+    # Check if the structure has a CCSDS header
+    if isCCSDS:
+        # Step through each header member
+        for name, size in CCSDS_HEADER_MEMBERS:
+            members.append(NumpyMember(name, "u1", headerOffset, [size]))
+            headerOffset += size
+
+    # Step through each row belonging to the structure
+    for row in rows:
+        variableName = structureData.getVariableName(row)
+
+        # Check if this is an array member or a variable that has already been
+        # processed (i.e., it belongs to another instance of the structure);
+        # array definitions are used, but not the members
+        if variableName.endswith("]") or not usedVariableNames.add(variableName):
+            continue
+
+        offset = structureData.getVariableOffset(row)
+
+        # Check if the variable has no offset (e.g., its array size can't be
+        # resolved); it can't be placed in the data type
+        if offset < 0:
+            continue
+
+        dataType = structureData.getDataType(row)
+        offset += headerOffset
+        bitLength = structureData.getBitLength(row)
+
+        # Check if the variable has a bit length
+        if bitLength:
+            size = ccdd.getDataTypeSizeInBytes(dataType)
+            length = int(macroExpander.getMacroExpansion(bitLength))
+
+            # Check if the field shares the previous bit field's storage unit
+            if offset == lastBitFieldOffset and dataType == lastBitFieldType:
+                bitPosition += lastBitLength
+            else:
+                bitPosition = 0
+
+            members.append(NumpyMember(variableName,
+                                       "u" + str(size),
+                                       offset,
+                                       [],
+                                       [bitPosition, length, ccdd.getBaseDataType(dataType) == "signed integer"]))
+            lastBitFieldOffset = offset
+            lastBitFieldType = dataType
+            lastBitLength = length
+            continue
+
+        shape = macroExpander.getArrayDimensions(structureData.getArraySize(row))
+
+        # Check if the data type is a primitive
+        if ccdd.isDataTypePrimitive(dataType):
+            baseType = ccdd.getBaseDataType(dataType)
+            format = getNumpyFormat(baseType, ccdd.getDataTypeSizeInBytes(dataType))
+
+            # Check if the variable is an array of single characters; the
+            # last dimension becomes the length of a string
+            if format == "S1" and shape:
+                format = "S" + str(shape.pop())
+        # The variable is a structure
+        else:
+            format = dataType
+
+        members.append(NumpyMember(variableName, format, offset, shape))
+
+    return members
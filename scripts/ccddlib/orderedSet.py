@@ -0,0 +1,86 @@
+#******************************************************************************
+# Description: Insertion-ordered set
+#
+# This module provides a set that retains the order in which its items are
+# added. The scripts use it to track the variable names already processed for
+# a structure (e.g., so that the members of a structure referenced as an array
+# are output once), where a list's membership test examines every name added
+# so far and the time to process a structure with many members grows with the
+# square of the number of members. Membership is tested using a dictionary, so
+# each test takes the same time regardless of the number of items
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+#******************************************************************************
+# Insertion-ordered set
+#******************************************************************************
+class OrderedSet(object):
+    #**************************************************************************
+    # Insertion-ordered set class constructor
+    #
+    # @param items
+    #            items with which to initialize the set; None for an empty set
+    #**************************************************************************
+    def __init__(self, items=None):
+        self.indices = {}
+        self.items = []
+
+        # Check if initial items are supplied
+        if items is not None:
+            for item in items:
+                self.add(item)
+
+    #**************************************************************************
+    # Add an item to the set if it isn't already a member
+    #
+    # @param item
+    #            item to add
+    #
+    # @return True if the item is added; False if it's already a member
+    #**************************************************************************
+    def add(self, item):
+        # Check if the item is already a member
+        if item in self.indices:
+            return False
+
+        self.indices[item] = len(self.items)
+        self.items.append(item)
+        return True
+
+    #**************************************************************************
+    # Get the index of an item in the order the items were added
+    #
+    # @param item
+    #            set member
+    #
+    # @return Index of the item; -1 if the item isn't a member
+    #**************************************************************************
+    def indexOf(self, item):
+        return self.indices.get(item, -1)
+
+    #**************************************************************************
+    # Remove every item from the set
+    #**************************************************************************
+    def clear(self):
+        self.indices.clear()
+        del self.items[:]
+
+    #**************************************************************************
+    # Get a list of the items, in the order they were added
+    #
+    # @return List of the set's items
+    #**************************************************************************
+    def toList(self):
+        return list(self.items)
+
+    def __contains__(self, item):
+        return item in self.indices
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
@@ -0,0 +1,451 @@
+#******************************************************************************
+# Description: Buffered script output file
+#
+# This module provides a buffered output file for use by the data output
+# scripts in place of writing each line to the file through the script data
+# access handler. The text is collected in memory and is written to the file
+# in chunks, each using a single call to the data access handler. The files
+# opened using this module are tracked so that the script can close any that
+# remain open if an error occurs. A group of output files can be written as
+# one, so that text that is the same for several files (e.g., the variants of
+# a file for different byte orders) is generated once. Files whose text
+# differs only by a parameter value (e.g., the flight computer name) can be
+# written as a parameterized group, where the text is generated once with a
+# placeholder in place of the parameter. A spill buffer collects text that is
+# written to an output file later (e.g., one section of a file whose sections
+# are generated together); the text beyond a fixed amount is kept in a
+# temporary file so that the memory used doesn't depend on the text's length
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+import codecs
+import os
+import tempfile
+import threading
+
+# Number of characters collected before the buffered text is written to the
+# file
+CHUNK_SIZE = 65536
+
+# Number of characters a spill buffer keeps in memory before the text is
+# written to its temporary file
+SPILL_SIZE = 1048576
+
+# Placeholder in the text written to a parameterized file group that is
+# replaced by each file's parameter value. The null character doesn't occur in
+# the project data
+PARAMETER_PLACEHOLDER = "\0"
+
+# Lists of the output files that are currently open. A separate list is kept
+# for each thread so that scripts executing concurrently don't close each
+# other's files
+openFileLists = threading.local()
+
+#******************************************************************************
+# Buffered output file
+#******************************************************************************
+class BufferedOutputFile(object):
+    #**************************************************************************
+    # Buffered output file class constructor
+    #
+    # @param ccdd
+    #            script data access handler
+    #
+    # @param printWriter
+    #            output file PrintWriter object obtained from the data access
+    #            handler's openOutputFile method
+    #
+    # @param chunkSize
+    #            number of characters collected before the buffered text is
+    #            written to the file
+    #**************************************************************************
+    def __init__(self, ccdd, printWriter, chunkSize=CHUNK_SIZE):
+        self.ccdd = ccdd
+        self.printWriter = printWriter
+        self.chunkSize = chunkSize
+        self.buffer = []
+        self.bufferSize = 0
+
+    #**************************************************************************
+    # Write the supplied text to the file
+    #
+    # @param text
+    #            text to write to the output file
+    #**************************************************************************
+    def write(self, text):
+        # Output a null text string in the same manner as the data access
+        # handler
+        if text is None:
+            text = "null"
+
+        self.buffer.append(text)
+        self.bufferSize += len(text)
+
+        # Check if the buffer has reached the size at which it's written
+        if self.bufferSize >= self.chunkSize:
+            self.flush()
+
+    #**************************************************************************
+    # Write the supplied text to the file and append a line feed character
+    #
+    # @param text
+    #            text to write to the output file
+    #**************************************************************************
+    def writeLn(self, text):
+        self.write(text)
+        self.write(os.linesep)
+
+    #**************************************************************************
+    # Write the supplied formatted text in the indicated format to the file
+    #
+    # @param format
+    #            print format. The conversions used by the scripts (%s, %d,
+    #            and their width and justification flags) are the same as
+    #            those of the Java printf method; %n is output as a line feed
+    #
+    # @param args
+    #            arguments referenced by the format specifiers in the format
+    #            string
+    #**************************************************************************
+    def writeFormat(self, format, *args):
+        self.write(formatText(format, args))
+
+    #**************************************************************************
+    # Write any buffered text to the file
+    #**************************************************************************
+    def flush(self):
+        # Check if there is buffered text to write
+        if self.buffer:
+            text = "".join(self.buffer)
+            self.buffer = []
+            self.bufferSize = 0
+            self.ccdd.writeToFile(self.printWriter, text)
+
+    #**************************************************************************
+    # Write any buffered text to the file and close the file. The file is
+    # closed even if the buffered text can't be written
+    #**************************************************************************
+    def close(self):
+        # Check if the file is open
+        if self.printWriter is not None:
+            try:
+                self.flush()
+            finally:
+                self.ccdd.closeFile(self.printWriter)
+                self.printWriter = None
+
+                if self in getOpenFiles():
+                    getOpenFiles().remove(self)
+
+#******************************************************************************
+# Group of output files written as one. The text written to the group is
+# written to each of its files
+#******************************************************************************
+class OutputFileGroup(object):
+    #**************************************************************************
+    # Output file group class constructor
+    #
+    # @param files
+    #            list of the output files in the group
+    #**************************************************************************
+    def __init__(self, files):
+        self.files = files
+
+    #**************************************************************************
+    # Write the supplied text to each file in the group
+    #
+    # @param text
+    #            text to write to the output files
+    #**************************************************************************
+    def write(self, text):
+        for outputFile in self.files:
+            outputFile.write(text)
+
+    #**************************************************************************
+    # Write the supplied text to each file in the group and append a line feed
+    # character
+    #
+    # @param text
+    #            text to write to the output files
+    #**************************************************************************
+    def writeLn(self, text):
+        for outputFile in self.files:
+            outputFile.writeLn(text)
+
+    #**************************************************************************
+    # Write the supplied formatted text in the indicated format to each file
+    # in the group. The text is formatted once
+    #
+    # @param format
+    #            print format (refer to BufferedOutputFile.writeFormat)
+    #
+    # @param args
+    #            arguments referenced by the format specifiers in the format
+    #            string
+    #**************************************************************************
+    def writeFormat(self, format, *args):
+        self.write(formatText(format, args))
+
+    #**************************************************************************
+    # Close each file in the group
+    #**************************************************************************
+    def close(self):
+        for outputFile in self.files:
+            outputFile.close()
+
+#******************************************************************************
+# Group of output files whose text differs only by a parameter value. The text
+# written to the group is written to each of its files with any parameter
+# placeholder replaced by the file's parameter value
+#******************************************************************************
+class ParameterizedFileGroup(OutputFileGroup):
+    #**************************************************************************
+    # Parameterized output file group class constructor
+    #
+    # @param files
+    #            list of the output files in the group
+    #
+    # @param values
+    #            list of the parameter values, one for each output file
+    #**************************************************************************
+    def __init__(self, files, values):
+        OutputFileGroup.__init__(self, files)
+        self.values = values
+
+    #**************************************************************************
+    # Write the supplied text to each file in the group, replacing any
+    # parameter placeholder with the file's parameter value
+    #
+    # @param text
+    #            text to write to the output files
+    #**************************************************************************
+    def write(self, text):
+        # Check if the text doesn't contain the parameter
+        if text is None or PARAMETER_PLACEHOLDER not in text:
+            OutputFileGroup.write(self, text)
+        # The text contains the parameter
+        else:
+            for index in range(len(self.files)):
+                self.files[index].write(text.replace(PARAMETER_PLACEHOLDER, self.values[index]))
+
+    #**************************************************************************
+    # Write the supplied text to each file in the group, replacing any
+    # parameter placeholder with the file's parameter value, and append a line
+    # feed character
+    #
+    # @param text
+    #            text to write to the output files
+    #**************************************************************************
+    def writeLn(self, text):
+        # Check if the text doesn't contain the parameter
+        if text is None or PARAMETER_PLACEHOLDER not in text:
+            OutputFileGroup.writeLn(self, text)
+        # The text contains the parameter
+        else:
+            for index in range(len(self.files)):
+                self.files[index].writeLn(text.replace(PARAMETER_PLACEHOLDER, self.values[index]))
+
+#******************************************************************************
+# Buffer for text that is written to an output file later. The text is kept in
+# memory until its length reaches the spill size, after which the text is
+# written to a temporary file. The temporary file is deleted when the buffer is
+# closed
+#******************************************************************************
+class SpillBuffer(object):
+    #**************************************************************************
+    # Spill buffer class constructor
+    #
+    # @param spillSize
+    #            number of characters kept in memory before the text is
+    #            written to the temporary file
+    #**************************************************************************
+    def __init__(self, spillSize=SPILL_SIZE):
+        self.spillSize = spillSize
+        self.buffer = []
+        self.bufferSize = 0
+        self.spillFile = None
+        getOpenFiles().append(self)
+
+    #**************************************************************************
+    # Write the supplied text to the buffer
+    #
+    # @param text
+    #            text to write to the buffer
+    #**************************************************************************
+    def write(self, text):
+        # Output a null text string in the same manner as the data access
+        # handler
+        if text is None:
+            text = "null"
+
+        self.buffer.append(text)
+        self.bufferSize += len(text)
+
+        # Check if the buffer has reached the size at which it's spilled
+        if self.bufferSize >= self.spillSize:
+            self.spill()
+
+    #**************************************************************************
+    # Write the supplied text to the buffer and append a line feed character
+    #
+    # @param text
+    #            text to write to the buffer
+    #**************************************************************************
+    def writeLn(self, text):
+        self.write(text)
+        self.write(os.linesep)
+
+    #**************************************************************************
+    # Write the supplied formatted text in the indicated format to the buffer
+    #
+    # @param format
+    #            print format (refer to BufferedOutputFile.writeFormat)
+    #
+    # @param args
+    #            arguments referenced by the format specifiers in the format
+    #            string
+    #**************************************************************************
+    def writeFormat(self, format, *args):
+        self.write(formatText(format, args))
+
+    #**************************************************************************
+    # Write the text held in memory to the temporary file
+    #**************************************************************************
+    def spill(self):
+        # Check if there is text held in memory
+        if self.buffer:
+            # Check if the temporary file hasn't been created
+            if self.spillFile is None:
+                self.spillFile = tempfile.TemporaryFile()
+
+            self.spillFile.write("".join(self.buffer).encode("utf-8"))
+            self.buffer = []
+            self.bufferSize = 0
+
+    #**************************************************************************
+    # Write the buffered text to the specified output file
+    #
+    # @param outputFile
+    #            output file (or group of output files) to which to write the
+    #            text
+    #**************************************************************************
+    def copyTo(self, outputFile):
+        # Check if text has been written to the temporary file
+        if self.spillFile is not None:
+            self.spillFile.seek(0)
+            decoder = codecs.getincrementaldecoder("utf-8")()
+
+            # Step through the temporary file's contents, one chunk at a time
+            while True:
+                data = self.spillFile.read(CHUNK_SIZE)
+                text = decoder.decode(data, not data)
+
+                # Check if there is text to write
+                if text:
+                    outputFile.write(text)
+
+                # Check if the end of the temporary file is reached
+                if not data:
+                    break
+
+            self.spillFile.seek(0, os.SEEK_END)
+
+        # Check if there is text held in memory
+        if self.buffer:
+            outputFile.write("".join(self.buffer))
+
+    #**************************************************************************
+    # Discard the buffered text and delete the temporary file
+    #**************************************************************************
+    def close(self):
+        self.buffer = []
+        self.bufferSize = 0
+
+        try:
+            # Check if the temporary file exists
+            if self.spillFile is not None:
+                self.spillFile.close()
+                self.spillFile = None
+        finally:
+            if self in getOpenFiles():
+                getOpenFiles().remove(self)
+
+#******************************************************************************
+# Format the supplied arguments in the indicated format
+#
+# @param format
+#            print format. The conversions used by the scripts (%s, %d, and
+#            their width and justification flags) are the same as those of the
+#            Java printf method; %n is output as a line feed
+#
+# @param args
+#            arguments referenced by the format specifiers in the format string
+#
+# @return Formatted text
+#******************************************************************************
+def formatText(format, args):
+    values = []
+
+    # Output any null argument in the same manner as the data access handler
+    for arg in args:
+        if arg is None:
+            arg = "null"
+
+        values.append(arg)
+
+    return format.replace("%n", os.linesep) % tuple(values)
+
+#******************************************************************************
+# Open the specified output file for buffered output. If the file exists it is
+# replaced
+#
+# @param ccdd
+#            script data access handler
+#
+# @param outputFileName
+#            output file path + name
+#
+# @param chunkSize
+#            number of characters collected before the buffered text is
+#            written to the file
+#
+# @return Buffered output file object; None if the file cannot be created
+#******************************************************************************
+def openOutputFile(ccdd, outputFileName, chunkSize=CHUNK_SIZE):
+    printWriter = ccdd.openOutputFile(outputFileName)
+
+    # Check if the file can't be created
+    if printWriter is None:
+        return None
+
+    outputFile = BufferedOutputFile(ccdd, printWriter, chunkSize)
+    getOpenFiles().append(outputFile)
+    return outputFile
+
+#******************************************************************************
+# Get the list of the output files opened by the current thread that remain
+# open
+#
+# @return List of the open output files
+#******************************************************************************
+def getOpenFiles():
+    # Check if the list doesn't exist for this thread
+    if not hasattr(openFileLists, "files"):
+        openFileLists.files = []
+
+    return openFileLists.files
+
+#******************************************************************************
+# Close the output files that remain open. This is used by a script to close
+# its files, writing any buffered text, when an error terminates the script
+#******************************************************************************
+def closeOpenFiles():
+    # Close the files, most recently opened first. Closing a file removes it
+    # from the list
+    openFiles = getOpenFiles()
+
+    while openFiles:
+        openFiles[-1].close()
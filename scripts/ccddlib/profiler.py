@@ -0,0 +1,250 @@
+#******************************************************************************
+# Description: Data access handler call profiler
+#
+# This module provides a wrapper for the script data access handler (the
+# 'ccdd' object) that counts and times every call a script makes to the
+# handler's methods. Each call is attributed to the chain of Python functions
+# that made it (e.g., outputMnemonicDefinition -> ccdd.getFullVariableName),
+# and the results are written in the 'folded stacks' format accepted by the
+# common flame graph tools (e.g., flamegraph.pl, speedscope), where each line
+# contains the semicolon-separated call chain followed by the time spent in
+# the handler method, in microseconds. A summary of the calls per method and
+# calling function can also be output
+#
+# The headless data access handler applies the wrapper when a profile report
+# file is specified (using its --profile option or the CCDD_PROFILE
+# environment variable), so the scripts needn't be altered
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+import os
+import sys
+import time
+
+# Environment variable containing the profile report file name
+PROFILE_ENVIRONMENT_VARIABLE = "CCDD_PROFILE"
+
+# Text in the profile report file name that is replaced by the script's name
+SCRIPT_NAME_PLACEHOLDER = "{script}"
+
+# Label for the handler methods in the call chains
+HANDLER_LABEL = "ccdd"
+
+#******************************************************************************
+# Data access handler wrapper that counts and times the calls made to the
+# handler's methods
+#******************************************************************************
+class ProfilingHandler(object):
+    #**************************************************************************
+    # Profiling handler class constructor
+    #
+    # @param ccdd
+    #            data access handler to wrap
+    #
+    # @param scriptFileName
+    #            name of the script file being profiled; the call chains end
+    #            at the script's main body. None to use the handler's script
+    #            name
+    #**************************************************************************
+    def __init__(self, ccdd, scriptFileName=None):
+        # The attribute names differ from those of the handler so that the
+        # handler's attributes remain accessible through the wrapper
+        self.profiledHandler = ccdd
+        scriptFileName = scriptFileName or ccdd.getScriptName()
+        self.profiledScripts = set([scriptFileName, os.path.abspath(scriptFileName)])
+        self.profiledCalls = {}
+
+    #**************************************************************************
+    # Get a handler attribute. A method is wrapped so that its calls are
+    # counted and timed
+    #
+    # @param name
+    #            attribute name
+    #
+    # @return Attribute value or wrapped method
+    #**************************************************************************
+    def __getattr__(self, name):
+        value = getattr(self.profiledHandler, name)
+
+        # Check if the attribute isn't a method
+        if not callable(value):
+            return value
+
+        calls = self.profiledCalls
+        getCallers = self.getCallers
+
+        def profileCall(*args):
+            startTime = time.time()
+
+            try:
+                return value(*args)
+            finally:
+                elapsedTime = time.time() - startTime
+                key = (getCallers(sys._getframe(1)), name)
+                callInfo = calls.get(key)
+
+                # Check if this is the first call from this call chain
+                if callInfo is None:
+                    calls[key] = [1, elapsedTime]
+                else:
+                    callInfo[0] += 1
+                    callInfo[1] += elapsedTime
+
+        return profileCall
+
+    #**************************************************************************
+    # Get the chain of code objects for the functions calling a handler method,
+    # from the script's main body to the immediate caller
+    #
+    # @param frame
+    #            stack frame of the function calling the handler method
+    #
+    # @return Tuple of the code objects in the call chain
+    #**************************************************************************
+    def getCallers(self, frame):
+        callers = []
+
+        # Step back through the stack frames
+        while frame is not None:
+            code = frame.f_code
+            callers.append(code)
+
+            # Check if this is the script's main body
+            if code.co_name == "<module>" and code.co_filename in self.profiledScripts:
+                break
+
+            frame = frame.f_back
+
+        callers.reverse()
+        return tuple(callers)
+
+    #**************************************************************************
+    # Get the name of a function in a call chain. The script's functions are
+    # identified by name; other functions are prefixed by their module name
+    #
+    # @param code
+    #            function's code object
+    #
+    # @return Function name
+    #**************************************************************************
+    def getFunctionName(self, code):
+        moduleName = os.path.splitext(os.path.basename(code.co_filename))[0]
+
+        # Check if this is the script's main body or another module's
+        if code.co_name == "<module>":
+            return moduleName
+
+        # Check if this is one of the script's functions
+        if code.co_filename in self.profiledScripts:
+            return code.co_name
+
+        return moduleName + "." + code.co_name
+
+    #**************************************************************************
+    # Get the number of calls made to each handler method
+    #
+    # @return Dictionary containing the number of calls keyed by method name
+    #**************************************************************************
+    def getCallCounts(self):
+        callCounts = {}
+
+        for (callers, name), callInfo in self.profiledCalls.items():
+            callCounts[name] = callCounts.get(name, 0) + callInfo[0]
+
+        return callCounts
+
+    #**************************************************************************
+    # Get the call information for each call chain
+    #
+    # @return List containing, for each call chain, the list of the function
+    #         names in the chain (ending with the handler method), the number
+    #         of calls, and the total time spent in the handler method, in
+    #         seconds; sorted by call chain
+    #**************************************************************************
+    def getCallChains(self):
+        chains = []
+
+        for (callers, name), callInfo in self.profiledCalls.items():
+            chains.append([[self.getFunctionName(code) for code in callers] + [HANDLER_LABEL + "." + name],
+                           callInfo[0],
+                           callInfo[1]])
+
+        chains.sort(key=lambda chain: chain[0])
+        return chains
+
+    #**************************************************************************
+    # Write the call chains to a file in the folded stacks format used by the
+    # flame graph tools. The value for each call chain is the time spent in
+    # the handler method, in microseconds
+    #
+    # @param outputFile
+    #            file to which to write the call chains
+    #**************************************************************************
+    def writeFoldedStacks(self, outputFile):
+        for names, numCalls, elapsedTime in self.getCallChains():
+            outputFile.write(";".join(names) + " " + str(int(round(elapsedTime * 1000000))) + "\n")
+
+    #**************************************************************************
+    # Write a summary of the handler method calls, ordered by the time spent
+    # in each method, with the functions that called each method
+    #
+    # @param outputFile
+    #            file to which to write the summary
+    #**************************************************************************
+    def writeSummary(self, outputFile):
+        methods = {}
+
+        # Total the calls and time for each method and for each caller
+        for names, numCalls, elapsedTime in self.getCallChains():
+            method = methods.setdefault(names[-1], [0, 0.0, {}])
+            method[0] += numCalls
+            method[1] += elapsedTime
+            caller = method[2].setdefault(names[-2] if len(names) > 1 else "", [0, 0.0])
+            caller[0] += numCalls
+            caller[1] += elapsedTime
+
+        outputFile.write("%10s %10s  %s\n" % ("Calls", "Time (s)", "Method / caller"))
+
+        # Step through each method, most time first
+        for name, method in sorted(methods.items(), key=lambda item: -item[1][1]):
+            outputFile.write("%10d %10.4f  %s\n" % (method[0], method[1], name))
+
+            # Step through each function calling the method, most time first
+            for callerName, caller in sorted(method[2].items(), key=lambda item: -item[1][1]):
+                outputFile.write("%10d %10.4f    %s -> %s\n" % (caller[0], caller[1], callerName, name))
+
+    #**************************************************************************
+    # Write the profile report to the specified file in the folded stacks
+    # format
+    #
+    # @param reportFileName
+    #            report file path + name
+    #**************************************************************************
+    def writeReport(self, reportFileName):
+        reportFile = open(reportFileName, "w")
+
+        try:
+            self.writeFoldedStacks(reportFile)
+        finally:
+            reportFile.close()
+
+#******************************************************************************
+# Get the profile report file name for a script. Any occurrence of '{script}'
+# in the report file name is replaced by the script's file name, without the
+# path and extension, so that the scripts executed together can each have a
+# report
+#
+# @param reportFileName
+#            report file path + name
+#
+# @param scriptFileName
+#            script file path + name
+#
+# @return Report file path + name for the script
+#******************************************************************************
+def getReportFileName(reportFileName, scriptFileName):
+    return reportFileName.replace(SCRIPT_NAME_PLACEHOLDER,
+                                  os.path.splitext(os.path.basename(scriptFileName))[0])
@@ -0,0 +1,72 @@
+#******************************************************************************
+# Description: Structure table row index
+#
+# This module provides an index of the structure table rows supplied to a
+# script, grouped by the prototype structure to which each row belongs. The
+# index is built with a single pass through the structure rows, so that a
+# script can step through the rows of a specific structure without scanning
+# every structure row for each structure
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+#******************************************************************************
+# Structure table row index
+#******************************************************************************
+class StructureRowIndex(object):
+    #**************************************************************************
+    # Structure table row index class constructor
+    #
+    # @param ccdd
+    #            script data access handler
+    #
+    # @param rowOrder
+    #            list of structure row indices specifying the order in which
+    #            the rows are indexed; None to index the rows in table order
+    #**************************************************************************
+    def __init__(self, ccdd, rowOrder=None):
+        self.structureNames = []
+        self.structureRows = {}
+
+        # Use the table row order if no order is specified
+        if rowOrder is None:
+            rowOrder = range(ccdd.getStructureTableNumRows())
+
+        # Step through each structure table row
+        for row in rowOrder:
+            # Get the name of the structure to which the row belongs
+            structureName = ccdd.getStructureTableNameByRow(row)
+            rows = self.structureRows.get(structureName)
+
+            # Check if this is the first row for the structure
+            if rows is None:
+                rows = []
+                self.structureRows[structureName] = rows
+                self.structureNames.append(structureName)
+
+            rows.append(row)
+
+    #**************************************************************************
+    # Get the rows belonging to the specified structure. Since a structure can
+    # be referenced in more than one location the rows for all instances of
+    # the structure are included, in the order in which they were indexed
+    #
+    # @param structureName
+    #            prototype structure name
+    #
+    # @return List of row indices for the structure; an empty list if the
+    #         structure has no rows
+    #**************************************************************************
+    def getRows(self, structureName):
+        return self.structureRows.get(structureName, [])
+
+    #**************************************************************************
+    # Get the names of the indexed structures
+    #
+    # @return List of structure names, in the order in which the structures are
+    #         first encountered
+    #**************************************************************************
+    def getStructureNames(self):
+        return self.structureNames
@@ -0,0 +1,229 @@
+#******************************************************************************
+# Description: Structure type definition layout
+#
+# This module provides the layout of a structure's C type definition, built
+# with a single pass through the structure's rows: the structure's size and
+# description, whether a CCSDS header is added, and for each member its
+# definition text, byte offset, size comment, rates, and description, along
+# with the width needed to align the comment text that follows the
+# definitions. A script outputs the type definition from the layout without
+# retrieving anything further from the data access handler
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+from ccddlib.orderedSet import OrderedSet
+
+# Size of the CCSDS primary and secondary headers, in bytes, added to a
+# structure that has a message ID
+CCSDS_HEADER_SIZE = 12
+
+# CCSDS header variable definitions: definition, byte offset, and comment
+CCSDS_HEADER_VARIABLES = [["   char CFS_PRI_HEADER[6];", "0", "#CCSDS_PriHdr_t"],
+                          ["   char CFS_SEC_HEADER[6];", "6", "#CCSDS_CmdSecHdr_t"]]
+
+# Size comment for each CCSDS header variable
+CCSDS_HEADER_SIZE_TEXT = "(6 bytes)"
+
+#******************************************************************************
+# Layout of a structure member's definition
+#******************************************************************************
+class MemberLayout(object):
+    #**************************************************************************
+    # Structure member layout class constructor
+    #
+    # @param definition
+    #            member definition, including the data type, array dimensions
+    #            or bit length, and the terminating semicolon
+    #
+    # @param offset
+    #            member's byte offset within the structure, including any
+    #            CCSDS header
+    #
+    # @param sizeText
+    #            size comment (e.g., '(4 bytes)' or '(2x4=8 bytes)'); blank for
+    #            a bit-field
+    #
+    # @param rates
+    #            list containing the data stream name and rate for each data
+    #            stream in which the member has a rate
+    #
+    # @param description
+    #            member description; blank if none
+    #**************************************************************************
+    def __init__(self, definition, offset, sizeText, rates, description):
+        self.definition = definition
+        self.offset = offset
+        self.sizeText = sizeText
+        self.rates = rates
+        self.description = description
+
+#******************************************************************************
+# Layout of a structure's type definition
+#******************************************************************************
+class StructureLayout(object):
+    #**************************************************************************
+    # Structure layout class constructor
+    #
+    # @param ccdd
+    #            script data access handler
+    #
+    # @param structureName
+    #            prototype structure name
+    #
+    # @param rows
+    #            list of the structure's row indices (refer to
+    #            StructureRowIndex)
+    #
+    # @param structureData
+    #            structure table data snapshot (refer to StructureSnapshot)
+    #
+    # @param dataFields
+    #            data field value cache (refer to DataFieldCache)
+    #
+    # @param macroExpander
+    #            macro expander used to convert the array sizes
+    #
+    # @param dataStreams
+    #            list of the data stream names
+    #**************************************************************************
+    def __init__(self, ccdd, structureName, rows, structureData, dataFields, macroExpander, dataStreams):
+        self.structureName = structureName
+        self.hasRows = len(rows) != 0
+        self.isCCSDS = False
+        self.size = 0
+        self.description = ""
+        self.members = []
+        self.definitionWidth = 0
+
+        # Check if the structure has no rows
+        if not self.hasRows:
+            return
+
+        # Get the structure's description and size, in bytes
+        self.description = ccdd.getTableDescriptionByRow("Structure", rows[0])
+        self.size = ccdd.getDataTypeSizeInBytes(structureName)
+
+        # Get the value of the structure's message ID data field
+        msgID = dataFields.getTableDataFieldValue(structureName, "Message ID")
+
+        # Check if the structure table has a message ID
+        if msgID is not None and msgID:
+            # Set the flag to add in CCSDS primary and secondary headers, and
+            # include the headers in the structure's size and the width of the
+            # definitions
+            self.isCCSDS = True
+            self.size += CCSDS_HEADER_SIZE
+            self.definitionWidth = len(CCSDS_HEADER_VARIABLES[0][0] + " ")
+            headerOffset = CCSDS_HEADER_SIZE
+        else:
+            headerOffset = 0
+
+        usedVariableNames = OrderedSet()
+        sizes = {}
+
+        # Step through each row belonging to the structure
+        for row in rows:
+            variableName = structureData.getVariableName(row)
+
+            # Check that this isn't an array member; only array definitions
+            # appear in the type definition
+            if variableName.endswith("]"):
+                continue
+
+            dataType = structureData.getDataType(row)
+            arraySize = structureData.getArraySize(row)
+            bitLength = structureData.getBitLength(row)
+
+            # Determine the length of the variable definition by adding up
+            # the individual parts. Multi-dimensional arrays have the
+            # individual dimensions separated by ', '; in the type definition
+            # each ', ' is replaced with '][' which is the same number of
+            # characters. The width includes every instance of the structure
+            definitionLength = len("   " + dataType + " " + variableName
+                                   + (arraySize + "[]" if arraySize else "")
+                                   + (bitLength + ":" if bitLength else "")
+                                   + "; ")
+
+            # Check if the length exceeds the width found thus far
+            if definitionLength > self.definitionWidth:
+                self.definitionWidth = definitionLength
+
+            # Add the variable name to the set of those already processed, and
+            # check if it had already been processed; the first instance of
+            # the structure is used to create the type definition
+            if not usedVariableNames.add(variableName):
+                continue
+
+            # Get the size of the variable, in bytes
+            byteSize = sizes.get(dataType)
+
+            if byteSize is None:
+                byteSize = ccdd.getDataTypeSizeInBytes(dataType)
+                sizes[dataType] = byteSize
+
+            definition = "   " + dataType + " " + variableName
+            sizeText = "(" + str(byteSize) + " bytes)"
+
+            # Check if the array size is provided; i.e., this is an array
+            # definition
+            if arraySize:
+                totalSize = 1
+                sizeMsg = ""
+
+                # Step through each dimension in the array, totaling the
+                # array's byte requirements
+                for dimension in macroExpander.getArrayDimensions(arraySize):
+                    totalSize *= dimension
+                    sizeMsg += str(dimension) + "x"
+
+                totalSize *= byteSize
+
+                # Place brackets around the array dimensions, and show the
+                # array's byte size
+                definition += "[" + arraySize.replace(", ", "][") + "]"
+                sizeText = "(" + sizeMsg + str(byteSize) + "=" + str(totalSize) + " bytes)"
+            # Check if the bit length is provided
+            elif bitLength:
+                # Append the bit length to the variable
+                definition += ":" + bitLength
+                sizeText = ""
+
+            rates = []
+
+            # Step through each data stream
+            for dataStream in dataStreams:
+                # Get the variable's rate for this data stream
+                rateValue = structureData.getTableData(dataStream, row)
+
+                # Check if the variable has a rate assigned in this stream
+                if rateValue:
+                    rates.append([dataStream, rateValue])
+
+            description = structureData.getDescription(row)
+
+            self.members.append(MemberLayout(definition + ";",
+                                             structureData.getVariableOffset(row) + headerOffset,
+                                             sizeText,
+                                             rates,
+                                             description if description is not None else ""))
+
+    #**************************************************************************
+    # Get the width to which the definitions are padded in order to align the
+    # comment text that follows them
+    #
+    # @param closingLength
+    #            length of the text that ends the type definition (including a
+    #            trailing space). This is used if the structure has no CCSDS
+    #            header and is longer than every member definition
+    #
+    # @return Definition column width
+    #**************************************************************************
+    def getColumnWidth(self, closingLength):
+        # Check if the structure has a CCSDS header
+        if self.isCCSDS:
+            return self.definitionWidth
+
+        return max(closingLength, self.definitionWidth)
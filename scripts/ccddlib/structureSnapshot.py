@@ -0,0 +1,407 @@
+#******************************************************************************
+# Description: Columnar snapshot of the structure table data
+#
+# This module provides a snapshot of the structure table data for use by the
+# data output scripts in place of retrieving each row's values through the
+# script data access handler. The structure data is obtained with a single
+# call and is stored as column arrays keyed by column name, along with the
+# columns derived from the data (the variable's full name, its byte offset
+# within its prototype structure, etc.)
+#
+# Each row's variable path is also stored as a list of segments (the root
+# structure name followed by the names of the variables in the path, without
+# their data types), from which a variable's full name can be rendered for any
+# separator without a further call to the data access handler
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+import re
+
+# Separators for which the full variable names can be rendered from the path
+# segments. A separator containing a character that can appear in a variable
+# name could make two different paths render the same name, so the names for
+# such a separator are obtained from the data access handler
+RENDERED_SEPARATOR_PATTERN = re.compile(r"^[^\w\[\]]+$")
+
+#******************************************************************************
+# Convert an array member variable name by replacing left square brackets with
+# underscores and removing right square brackets (example: a[2] becomes a_2)
+#
+# @param variableName
+#            variable name
+#
+# @return Variable name with the square brackets replaced
+#******************************************************************************
+def convertArrayMember(variableName):
+    return variableName.replace("[", "_").replace("]", "")
+
+#******************************************************************************
+# Structure table data snapshot
+#******************************************************************************
+class StructureSnapshot(object):
+    #**************************************************************************
+    # Structure table data snapshot class constructor
+    #
+    # @param ccdd
+    #            script data access handler
+    #**************************************************************************
+    def __init__(self, ccdd):
+        self.ccdd = ccdd
+        self.columns = {}
+        self.columnNames = []
+        self.fullVariableNames = {}
+        self.pathSegments = None
+        self.isRenderable = None
+
+        # Get every column of the structure table data. The first element of
+        # each column is the column name, followed by the column's value for
+        # each row
+        for column in ccdd.getStructureTableColumns():
+            self.columnNames.append(column[0])
+            self.columns[column[0].lower()] = list(column[1:])
+
+        self.numRows = ccdd.getStructureTableNumRows()
+
+        # Store the derived columns used by the access methods
+        self.tableNames = self.getColumn("@table name")
+        self.tablePaths = self.getColumn("@table path")
+        self.typeNames = self.getColumn("@table type")
+        self.variableNames = self.getColumn("@variable name")
+        self.dataTypes = self.getColumn("@data type")
+        self.arraySizes = self.getColumn("@array size")
+        self.bitLengths = self.getColumn("@bit length")
+        self.descriptions = self.getColumn("@description")
+        self.units = self.getColumn("@units")
+        self.enumerations = self.getColumn("@enumeration")
+        self.rates = self.getColumn("@rates")
+        self.offsets = self.getColumn("@variable offset")
+        self.fullVariableNames["_"] = self.getColumn("@full variable name")
+
+    #**************************************************************************
+    # Get the number of rows in the structure table data
+    #
+    # @return Number of rows in the structure table data
+    #**************************************************************************
+    def getNumRows(self):
+        return self.numRows
+
+    #**************************************************************************
+    # Get the names of the structure table data columns, including the derived
+    # columns (the names of which begin with an '@')
+    #
+    # @return List of the column names
+    #**************************************************************************
+    def getColumnNames(self):
+        return self.columnNames
+
+    #**************************************************************************
+    # Get the values in the specified column of the structure table data
+    #
+    # @param columnName
+    #            column name (case insensitive)
+    #
+    # @return List containing the column's value for each row; the value is
+    #         None if the row's table type doesn't have the column. A list of
+    #         None values is returned if the column doesn't exist
+    #**************************************************************************
+    def getColumn(self, columnName):
+        column = self.columns.get(columnName.lower())
+
+        # Check if the column doesn't exist
+        if column is None:
+            column = [None] * self.numRows
+
+        return column
+
+    #**************************************************************************
+    # Get the structure table data in the specified column and row. This is
+    # the equivalent of the data access handler's getStructureTableData method
+    #
+    # @param columnName
+    #            column name (case insensitive)
+    #
+    # @param row
+    #            table data row index
+    #
+    # @return Contents of the structure table data at the specified column
+    #         and row, with any macro replaced by its corresponding value;
+    #         None if the column doesn't exist for the row
+    #**************************************************************************
+    def getTableData(self, columnName, row):
+        column = self.columns.get(columnName.lower())
+
+        # Check if the column doesn't exist
+        if column is None:
+            return None
+
+        return column[row]
+
+    #**************************************************************************
+    # Get the prototype structure table name for the specified row
+    #
+    # @param row
+    #            table data row index
+    #
+    # @return Prototype structure table name
+    #**************************************************************************
+    def getTableName(self, row):
+        return self.tableNames[row]
+
+    #**************************************************************************
+    # Get the structure table path for the specified row
+    #
+    # @param row
+    #            table data row index
+    #
+    # @return Structure table path
+    #**************************************************************************
+    def getTablePath(self, row):
+        return self.tablePaths[row]
+
+    #**************************************************************************
+    # Get the structure table type name for the specified row
+    #
+    # @param row
+    #            table data row index
+    #
+    # @return Structure table type name
+    #**************************************************************************
+    def getTypeName(self, row):
+        return self.typeNames[row]
+
+    #**************************************************************************
+    # Get the variable name for the specified row
+    #
+    # @param row
+    #            table data row index
+    #
+    # @return Variable name, with any macro replaced by its corresponding
+    #         value; None if the table type has no variable name column
+    #**************************************************************************
+    def getVariableName(self, row):
+        return self.variableNames[row]
+
+    #**************************************************************************
+    # Get the data type for the specified row
+    #
+    # @param row
+    #            table data row index
+    #
+    # @return Data type; None if the table type has no data type column
+    #**************************************************************************
+    def getDataType(self, row):
+        return self.dataTypes[row]
+
+    #**************************************************************************
+    # Get the array size for the specified row
+    #
+    # @param row
+    #            table data row index
+    #
+    # @return Array size, with any macro replaced by its corresponding value;
+    #         None if the table type has no array size column
+    #**************************************************************************
+    def getArraySize(self, row):
+        return self.arraySizes[row]
+
+    #**************************************************************************
+    # Get the bit length for the specified row
+    #
+    # @param row
+    #            table data row index
+    #
+    # @return Bit length, with any macro replaced by its corresponding value;
+    #         None if the table type has no bit length column
+    #**************************************************************************
+    def getBitLength(self, row):
+        return self.bitLengths[row]
+
+    #**************************************************************************
+    # Get the description for the specified row
+    #
+    # @param row
+    #            table data row index
+    #
+    # @return Description, with any macro replaced by its corresponding value;
+    #         None if the table type has no description column
+    #**************************************************************************
+    def getDescription(self, row):
+        return self.descriptions[row]
+
+    #**************************************************************************
+    # Get the units for the specified row
+    #
+    # @param row
+    #            table data row index
+    #
+    # @return Units, with any macro replaced by its corresponding value; None
+    #         if the table type has no units column
+    #**************************************************************************
+    def getUnits(self, row):
+        return self.units[row]
+
+    #**************************************************************************
+    # Get the enumeration for the specified row. If the table type has more
+    # than one enumeration column the first is used
+    #
+    # @param row
+    #            table data row index
+    #
+    # @return Enumeration, with any macro replaced by its corresponding value;
+    #         None if the table type has no enumeration column
+    #**************************************************************************
+    def getEnumeration(self, row):
+        return self.enumerations[row]
+
+    #**************************************************************************
+    # Get the rates for the specified row
+    #
+    # @param row
+    #            table data row index
+    #
+    # @return List containing the values in the row's rate columns; an empty
+    #         list if the table type has no rate column
+    #**************************************************************************
+    def getRates(self, row):
+        rates = self.rates[row]
+
+        # Check if the row has no rate value
+        if not rates:
+            return []
+
+        return rates.split(", ")
+
+    #**************************************************************************
+    # Get the byte offset of the variable in the specified row within its
+    # prototype structure. For an array definition this is the offset of the
+    # array's first member
+    #
+    # @param row
+    #            table data row index
+    #
+    # @return Variable's byte offset within its prototype structure; -1 if the
+    #         row doesn't contain a variable
+    #**************************************************************************
+    def getVariableOffset(self, row):
+        offset = self.offsets[row]
+
+        # Check if the row doesn't contain a variable
+        if offset is None:
+            return -1
+
+        return int(offset)
+
+    #**************************************************************************
+    # Get the variable path segments for the specified row: the root structure
+    # name followed by the name of each variable in the path, ending with the
+    # row's variable, with the data types removed and any array member's
+    # square brackets replaced. The segments for every row are built the first
+    # time they're requested
+    #
+    # @param row
+    #            table data row index
+    #
+    # @return List of the variable path segments; None if the row doesn't
+    #         contain a variable
+    #**************************************************************************
+    def getVariablePathSegments(self, row):
+        # Check if the segments haven't been built
+        if self.pathSegments is None:
+            self.pathSegments = []
+
+            # Step through each row
+            for index in range(self.numRows):
+                variableName = self.variableNames[index]
+
+                # Check if the row doesn't contain a variable
+                if variableName is None or self.dataTypes[index] is None:
+                    self.pathSegments.append(None)
+                else:
+                    members = self.tablePaths[index].split(",")
+                    segments = [members[0]]
+
+                    # Step through each variable in the path, removing its data
+                    # type
+                    for member in members[1:]:
+                        segments.append(convertArrayMember(member[member.find(".") + 1:]))
+
+                    segments.append(convertArrayMember(variableName))
+                    self.pathSegments.append(segments)
+
+        return self.pathSegments[row]
+
+    #**************************************************************************
+    # Check if the full variable names for the specified separator can be
+    # rendered from the path segments. This requires that the separator can't
+    # appear in a variable name, and that the handler didn't have to alter any
+    # of the default ('_' separated) names to make it unique (the handler
+    # appends underscores to a name that would otherwise duplicate another
+    # variable's name)
+    #
+    # @param varPathSeparator
+    #            character(s) to place between variable path members
+    #
+    # @return True if the full variable names can be rendered from the path
+    #         segments
+    #**************************************************************************
+    def isRenderableSeparator(self, varPathSeparator):
+        # Check if the separator can appear in a variable name
+        if not RENDERED_SEPARATOR_PATTERN.match(varPathSeparator):
+            return False
+
+        # Check if the default names haven't been compared to the segments
+        if self.isRenderable is None:
+            self.isRenderable = True
+            defaultNames = self.fullVariableNames["_"]
+
+            # Step through each row
+            for row in range(self.numRows):
+                segments = self.getVariablePathSegments(row)
+
+                # Check if the handler's name differs from the one rendered
+                # from the segments
+                if defaultNames[row] != ("_".join(segments) if segments is not None else ""):
+                    self.isRenderable = False
+                    break
+
+        return self.isRenderable
+
+    #**************************************************************************
+    # Get the full name of the variable in the specified row. The full names
+    # for a separator are built for every row the first time the separator is
+    # used, by rendering them from the cached path segments or, if this isn't
+    # possible, by obtaining them from the data access handler
+    #
+    # @param row
+    #            table data row index
+    #
+    # @param varPathSeparator
+    #            character(s) to place between variable path members
+    #
+    # @return The variable's full path and name with each variable in the
+    #         path separated by the specified separator character(s), and with
+    #         the data types removed; blank if the row doesn't contain a
+    #         variable
+    #**************************************************************************
+    def getFullVariableName(self, row, varPathSeparator="_"):
+        fullNames = self.fullVariableNames.get(varPathSeparator)
+
+        # Check if the full names for this separator haven't been built
+        if fullNames is None:
+            # Check if the names can be rendered from the path segments
+            if self.isRenderableSeparator(varPathSeparator):
+                fullNames = []
+
+                # Step through each row
+                for index in range(self.numRows):
+                    segments = self.getVariablePathSegments(index)
+                    fullNames.append(varPathSeparator.join(segments) if segments is not None else "")
+            else:
+                fullNames = list(self.ccdd.getFullVariableNames(varPathSeparator))
+
+            self.fullVariableNames[varPathSeparator] = fullNames
+
+        return fullNames[row]
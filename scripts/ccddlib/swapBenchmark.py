@@ -0,0 +1,398 @@
+#******************************************************************************
+# Description: Generated byte swap code benchmark
+#
+# This module measures the throughput of the byte swap functions that the
+# types header script generates. A synthetic project is generated (refer to
+# benchmark), the types header script is executed against it using the
+# headless data access handler, once with a swap statement for each member and
+# once with the table-driven swap functions, and each swap source file is
+# compiled with the local C compiler together with a harness that times the
+# byte swap function of every root structure. Each structure is swapped from
+# one buffer to another and in place, and the throughput in megabytes per
+# second is reported in JSON format, along with the time to compile each swap
+# source file and a checksum of the swapped data with which to confirm that
+# the modes agree
+#
+# The generated projects have no bit-packed fields, so only the byte swap
+# functions are measured
+#
+# Usage:
+#   python -m ccddlib.swapBenchmark [options]
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+import glob
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from ccddlib import benchmark
+from ccddlib import headless
+
+# Swap code generation modes: mode name and the value of the types header
+# script's "TableDrivenSwap" data field
+SWAP_MODES = [["member", "false"],
+              ["table", "true"]]
+
+# Number of bytes of structure data in each harness buffer
+BUFFER_SIZE = 256 * 1024
+
+# Default number of megabytes swapped for each measurement
+DEFAULT_MEGABYTES = 64
+
+#** Functions *****************************************************************
+
+#******************************************************************************
+# Add the types header script's table-driven swap data field to the 'globals'
+# group in a generated project import file
+#
+# @param fileName
+#            CSV import file path + name
+#
+# @param value
+#            data field value ('true' or 'false')
+#******************************************************************************
+def setTableDrivenSwap(fileName, value):
+    importFile = open(fileName)
+
+    try:
+        lines = importFile.readlines()
+    finally:
+        importFile.close()
+
+    index = lines.index("_group_data_fields_\n") + 1
+    lines.insert(index, '"TableDrivenSwap","","5","Text","false","All","' + value + '"\n')
+    importFile = open(fileName, "w")
+
+    try:
+        importFile.writelines(lines)
+    finally:
+        importFile.close()
+
+#******************************************************************************
+# Get the C source code for the harness that times the byte swap functions
+#
+# @param swapFileName
+#            generated swap source file name
+#
+# @param structureNames
+#            list of the names of the structures to time
+#
+# @param megabytes
+#            number of megabytes swapped for each measurement
+#
+# @return Harness source code. When executed, the harness outputs a line for
+#         each structure containing the structure name, its size in bytes,
+#         the seconds taken to swap the data to another buffer and in place,
+#         the number of bytes swapped for each, and a checksum of the data
+#         swapped to another buffer
+#******************************************************************************
+def getHarnessSource(swapFileName, structureNames, megabytes):
+    lines = ["#define _POSIX_C_SOURCE 199309L",
+             "#include <stdint.h>",
+             "#include <stdio.h>",
+             "#include <stdlib.h>",
+             "#include <time.h>",
+             "",
+             "/* Data type used by the swap macros, but not defined by the project */",
+             "#ifndef uint64",
+             "#define uint64 uint64_t",
+             "#endif",
+             "",
+             "#include \"" + swapFileName + "\"",
+             "",
+             "/* The buffers are declared as 8-byte words so that they're aligned for any member type */",
+             "#define BUFFER_SIZE " + str(BUFFER_SIZE),
+             "static uint64_t inWords[BUFFER_SIZE / 8];",
+             "static uint64_t outWords[BUFFER_SIZE / 8];",
+             "static unsigned char *inBuffer = (unsigned char *) inWords;",
+             "static unsigned char *outBuffer = (unsigned char *) outWords;",
+             "",
+             "static double get_seconds(void)",
+             "{",
+             "   struct timespec now;",
+             "   clock_gettime(CLOCK_MONOTONIC, &now);",
+             "   return now.tv_sec + now.tv_nsec * 1e-9;",
+             "}",
+             "",
+             "static unsigned long checksum(const unsigned char *data, size_t size)",
+             "{",
+             "   unsigned long sum = 0;",
+             "   size_t i;",
+             "   for (i = 0; i < size; i++)",
+             "   {",
+             "      sum = sum * 31 + data[i];",
+             "   }",
+             "   return sum;",
+             "}",
+             "",
+             "int main(void)",
+             "{",
+             "   size_t i, count, pass, passes;",
+             "   double start, copyTime, inPlaceTime;",
+             "   unsigned long sum;"]
+
+    # Step through each structure
+    for structureName in structureNames:
+        lines += ["   count = BUFFER_SIZE / sizeof(" + structureName + ");",
+                  "   passes = " + str(megabytes * 1000000) + "UL / (count * sizeof(" + structureName + ")) + 1;",
+                  "   srand(1);",
+                  "   for (i = 0; i < BUFFER_SIZE; i++)",
+                  "   {",
+                  "      inBuffer[i] = (unsigned char) rand();",
+                  "   }",
+                  "   byte_swap_" + structureName + "((" + structureName + " *) inBuffer, (" + structureName + " *) outBuffer, 1);",
+                  "   sum = checksum(outBuffer, sizeof(" + structureName + "));",
+                  "   start = get_seconds();",
+                  "   for (pass = 0; pass < passes; pass++)",
+                  "   {",
+                  "      for (i = 0; i < count; i++)",
+                  "      {",
+                  "         byte_swap_" + structureName + "((" + structureName + " *) inBuffer + i, (" + structureName + " *) outBuffer + i, 1);",
+                  "      }",
+                  "   }",
+                  "   copyTime = get_seconds() - start;",
+                  "   start = get_seconds();",
+                  "   for (pass = 0; pass < passes; pass++)",
+                  "   {",
+                  "      for (i = 0; i < count; i++)",
+                  "      {",
+                  "         byte_swap_" + structureName + "((" + structureName + " *) inBuffer + i, (" + structureName + " *) inBuffer + i, 1);",
+                  "      }",
+                  "   }",
+                  "   inPlaceTime = get_seconds() - start;",
+                  "   printf(\"" + structureName + " %lu %.9f %.9f %lu %lu %lu\\n\", (unsigned long) sizeof(" + structureName + "), copyTime, inPlaceTime, (unsigned long) (passes * count * sizeof(" + structureName + ")), sum, checksum(outBuffer, BUFFER_SIZE) ^ checksum(inBuffer, BUFFER_SIZE));"]
+
+    lines += ["   return 0;",
+              "}",
+              ""]
+    return "\n".join(lines)
+
+#******************************************************************************
+# Get the throughput, in megabytes per second
+#
+# @param numBytes
+#            number of bytes swapped
+#
+# @param seconds
+#            time taken, in seconds
+#
+# @return Throughput; None if the time is too short to measure
+#******************************************************************************
+def getThroughput(numBytes, seconds):
+    # Check if the time is too short to measure
+    if seconds <= 0:
+        return None
+
+    return numBytes / seconds / 1000000.0
+
+#******************************************************************************
+# Generate the swap source file for a project in the specified mode, then
+# compile and execute the harness for it
+#
+# @param importFileName
+#            CSV import file path + name of the generated project
+#
+# @param mode
+#            swap code generation mode (refer to SWAP_MODES)
+#
+# @param scriptFileName
+#            types header script path + name
+#
+# @param compiler
+#            C compiler command
+#
+# @param compilerFlags
+#            list of the C compiler flags
+#
+# @param megabytes
+#            number of megabytes swapped for each measurement
+#
+# @param workFolder
+#            folder in which to store the script output and the harness
+#
+# @return Dictionary containing the mode name, the size of the swap source
+#         file, the compile time, and the measurements for each structure;
+#         the compiler's error text if the harness fails to compile
+#******************************************************************************
+def measureMode(importFileName, mode, scriptFileName, compiler, compilerFlags, megabytes, workFolder):
+    modeName, tableDrivenSwap = mode
+    outputFolder = os.path.join(workFolder, modeName)
+    os.makedirs(outputFolder)
+    modeImportFileName = os.path.join(outputFolder, "project.csv")
+    shutil.copyfile(importFileName, modeImportFileName)
+    setTableDrivenSwap(modeImportFileName, tableDrivenSwap)
+
+    # Execute the types header script to generate the swap source file
+    ccdd = headless.createHandler([modeImportFileName],
+                                  groupNames=["globals"],
+                                  outputPath=outputFolder,
+                                  projectName="benchmark",
+                                  radioButtonSelection="Big",
+                                  dateAndTime="Sun Jan 01 00:00:00 UTC 2017")
+    ccdd.profileFileName = None
+    headless.runScript(scriptFileName, ccdd.getScriptHandler(scriptFileName))
+    swapFileName = glob.glob(os.path.join(outputFolder, "*types.c"))[0]
+    structureNames = ccdd.getRootStructureTableNames()
+
+    # Write the harness source file
+    harnessFileName = os.path.join(outputFolder, "harness.c")
+    harnessFile = open(harnessFileName, "w")
+
+    try:
+        harnessFile.write(getHarnessSource(os.path.basename(swapFileName), structureNames, megabytes))
+    finally:
+        harnessFile.close()
+
+    result = {"mode": modeName, "swapFileSize": os.path.getsize(swapFileName)}
+
+    # Compile the harness, which includes the swap source file
+    executableFileName = os.path.join(outputFolder, "harness")
+    startTime = time.time()
+    process = subprocess.Popen([compiler] + compilerFlags + ["-o", executableFileName, harnessFileName],
+                               stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT,
+                               universal_newlines=True)
+    compileOutput = process.communicate()[0]
+    result["compileTime"] = time.time() - startTime
+
+    # Check if the harness failed to compile
+    if process.returncode != 0:
+        result["error"] = compileOutput
+        return result
+
+    # Execute the harness and collect the measurements
+    structures = []
+    totalBytes = 0
+    totalCopyTime = 0.0
+    totalInPlaceTime = 0.0
+
+    for line in subprocess.check_output([executableFileName], universal_newlines=True).splitlines():
+        name, size, copyTime, inPlaceTime, numBytes, firstChecksum, dataChecksum = line.split()
+        copyTime = float(copyTime)
+        inPlaceTime = float(inPlaceTime)
+        numBytes = int(numBytes)
+        totalBytes += numBytes
+        totalCopyTime += copyTime
+        totalInPlaceTime += inPlaceTime
+        structures.append({"structure": name,
+                           "size": int(size),
+                           "copyMBps": getThroughput(numBytes, copyTime),
+                           "inPlaceMBps": getThroughput(numBytes, inPlaceTime),
+                           "checksum": firstChecksum + ":" + dataChecksum})
+
+    result["structures"] = structures
+    result["copyMBps"] = getThroughput(totalBytes, totalCopyTime)
+    result["inPlaceMBps"] = getThroughput(totalBytes, totalInPlaceTime)
+    return result
+
+#******************************************************************************
+# Command line entry point
+#
+# @param args
+#            command line arguments
+#
+# @return Exit status; 1 if a harness fails to compile or the modes' swapped
+#         data differ
+#******************************************************************************
+def main(args=None):
+    import argparse
+
+    defaults = benchmark.ProjectParameters()
+    scriptFolder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description="Measure the throughput of the byte swap functions generated by the types header script")
+    parser.add_argument("-x", "--script", default=os.path.join(scriptFolder, "typesHeader.py"), help="types header script file (default: typesHeader.py in the scripts folder)")
+    parser.add_argument("--structures", type=int, default=defaults.structures, help="number of structure tables")
+    parser.add_argument("--rows", type=int, default=defaults.rows, help="number of rows in each structure table")
+    parser.add_argument("--depth", type=int, default=defaults.depth, help="structure nesting depth")
+    parser.add_argument("--arrays", type=int, default=defaults.arrays, help="number of arrays in each structure table")
+    parser.add_argument("--array-size", type=int, default=defaults.arraySize, dest="arraySize", help="number of members in each array")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="random number generator seed")
+    parser.add_argument("--megabytes", type=int, default=DEFAULT_MEGABYTES, help="number of megabytes swapped for each measurement")
+    parser.add_argument("--cc", default="gcc", help="C compiler command")
+    parser.add_argument("--cflags", default="-std=gnu99 -O2", help="C compiler flags")
+    parser.add_argument("-o", "--output", default=None, help="report file (default: standard output)")
+    parser.add_argument("--keep", default=None, help="folder in which to keep the generated project, swap source files, and harnesses")
+    options = parser.parse_args(args)
+
+    parameters = benchmark.ProjectParameters(structures=options.structures,
+                                             rows=options.rows,
+                                             depth=options.depth,
+                                             arrays=options.arrays,
+                                             bitFields=0,
+                                             commands=0,
+                                             arraySize=options.arraySize,
+                                             seed=options.seed)
+
+    # Check if the generated files are kept
+    if options.keep is not None:
+        workFolder = options.keep
+
+        if not os.path.exists(workFolder):
+            os.makedirs(workFolder)
+    else:
+        workFolder = tempfile.mkdtemp(prefix="ccdd_swap_benchmark_")
+
+    report = {"compiler": options.cc,
+              "compilerFlags": options.cflags,
+              "project": parameters.toDictionary(),
+              "modes": []}
+
+    try:
+        importFileName = os.path.join(workFolder, "project.csv")
+        benchmark.generateProject(importFileName, parameters)
+        stdout = sys.stdout
+
+        # Step through each swap code generation mode
+        for mode in SWAP_MODES:
+            # Discard any text the script prints
+            sys.stdout = open(os.devnull, "w")
+
+            try:
+                result = measureMode(importFileName, mode, options.script, options.cc, options.cflags.split(), options.megabytes, workFolder)
+            finally:
+                sys.stdout.close()
+                sys.stdout = stdout
+
+            report["modes"].append(result)
+    finally:
+        if options.keep is None:
+            shutil.rmtree(workFolder, ignore_errors=True)
+
+    # Output the report
+    if options.output is None:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write("\n")
+    else:
+        reportFile = open(options.output, "w")
+
+        try:
+            json.dump(report, reportFile, indent=2, sort_keys=True)
+            reportFile.write("\n")
+        finally:
+            reportFile.close()
+
+    status = 0
+
+    # Step through each mode's results
+    for result in report["modes"]:
+        # Check if the mode's harness failed to compile
+        if "error" in result:
+            sys.stderr.write("Error: " + result["mode"] + " harness failed to compile\n")
+            status = 1
+        # Check if the swapped data differs from that of the first mode
+        elif [structure["checksum"] for structure in result["structures"]] != [structure["checksum"] for structure in report["modes"][0].get("structures", [])]:
+            sys.stderr.write("Error: " + result["mode"] + " swapped data differs from " + report["modes"][0]["mode"] + "\n")
+            status = 1
+
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+#******************************************************************************
+# Description: Byte swap descriptor table
+#
+# This module builds, for a structure, the list of runs that describe the
+# members requiring their bytes to be swapped when converting between byte
+# orders. Each run gives the first member of the run, the width of each
+# element in bytes, and the number of consecutive elements. An array is a
+# single run, and consecutive members having the same width and no gap between
+# them (according to the members' byte offsets) are merged into a single run.
+# A member that is a structure is described by a run that refers to the
+# member structure's own descriptor table, with the structure's size as the
+# width. The types header script outputs the runs as static tables that a
+# generic swap function steps through, in place of a swap statement for each
+# member
+#
+# A structure containing a bit field (directly or within a member structure)
+# also requires its bit swap function to be called, which the descriptor table
+# can't describe. A member that is such a structure is therefore returned
+# separately, so that the structure's byte swap function can be called for it
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+from ccddlib.orderedSet import OrderedSet
+
+# Widths, in bytes, of the primitive members that are swapped
+SWAPPED_WIDTHS = [2, 4, 8]
+
+# Base data types of the primitive members that are swapped
+SWAPPED_BASE_TYPES = ["character",
+                      "signed integer",
+                      "unsigned integer",
+                      "floating point",
+                      "pointer"]
+
+#******************************************************************************
+# Byte swap run
+#******************************************************************************
+class SwapRun(object):
+    #**************************************************************************
+    # Byte swap run class constructor
+    #
+    # @param variableName
+    #            name of the first member in the run
+    #
+    # @param offset
+    #            byte offset of the first member within its structure
+    #
+    # @param width
+    #            width of each element, in bytes
+    #
+    # @param count
+    #            number of consecutive elements
+    #
+    # @param structureName
+    #            name of the member's structure data type; None if the member
+    #            is a primitive
+    #**************************************************************************
+    def __init__(self, variableName, offset, width, count, structureName=None):
+        self.variableName = variableName
+        self.offset = offset
+        self.width = width
+        self.count = count
+        self.structureName = structureName
+
+    #**************************************************************************
+    # Check if the specified primitive member immediately follows this run and
+    # has the same width, so that it can be merged into the run
+    #
+    # @param offset
+    #            member's byte offset within its structure
+    #
+    # @param width
+    #            width of each of the member's elements, in bytes
+    #
+    # @return True if the member can be merged into the run
+    #**************************************************************************
+    def isAdjacent(self, offset, width):
+        return self.structureName is None and self.width == width and self.offset + self.width * self.count == offset
+
+#******************************************************************************
+# Build the byte swap runs for a structure
+#
+# @param ccdd
+#            script data access handler
+#
+# @param rows
+#            list of the structure's row indices (refer to StructureRowIndex)
+#
+# @param structureData
+#            structure table data snapshot (refer to StructureSnapshot)
+#
+# @param macroExpander
+#            macro expander used to convert the array sizes
+#
+# @param swappedStructures
+#            collection of the names of the structures that have a descriptor
+#            table; a member that is a structure is included only if its
+#            structure is present
+#
+# @param bitFieldStructures
+#            collection of the names of the structures that contain a bit
+#            field, directly or within a member structure
+#
+# @return List containing the list of the structure's byte swap runs, in
+#         member order, the list of the members (as runs) that are structures
+#         containing a bit field, and True if the structure has a bit field
+#         member
+#******************************************************************************
+def getSwapRuns(ccdd, rows, structureData, macroExpander, swappedStructures, bitFieldStructures):
+    runs = []
+    calls = []
+    hasBitField = False
+    usedVariableNames = OrderedSet()
+
+    # Step through each row belonging to the structure
+    for row in rows:
+        variableName = structureData.getVariableName(row)
+
+        # Check if this is an array member or a variable that has already been
+        # processed (i.e., it belongs to another instance of the structure);
+        # array definitions are used, but not the members
+        if variableName.endswith("]") or not usedVariableNames.add(variableName):
+            continue
+
+        dataType = structureData.getDataType(row)
+
+        # Check if the variable has a bit length; bit fields are swapped by
+        # the structure's bit swap function
+        if structureData.getBitLength(row):
+            hasBitField = True
+            continue
+
+        arraySize = structureData.getArraySize(row)
+        count = 1
+
+        # Check if the variable is an array
+        if arraySize:
+            # Determine the total number of array members
+            for dimension in macroExpander.getArrayDimensions(arraySize):
+                count *= dimension
+
+        offset = structureData.getVariableOffset(row)
+
+        # Check if the data type is a primitive
+        if ccdd.isDataTypePrimitive(dataType):
+            width = ccdd.getDataTypeSizeInBytes(dataType)
+
+            # Check if the primitive's bytes don't require swapping
+            if width not in SWAPPED_WIDTHS or ccdd.getBaseDataType(dataType) not in SWAPPED_BASE_TYPES:
+                continue
+
+            # Check if the variable directly follows the previous run and has
+            # the same width
+            if runs and runs[-1].isAdjacent(offset, width):
+                # Add the variable's elements to the previous run
+                runs[-1].count += count
+            else:
+                runs.append(SwapRun(variableName, offset, width, count))
+        # Check if the structure has a descriptor table
+        elif dataType in swappedStructures:
+            run = SwapRun(variableName, offset, ccdd.getDataTypeSizeInBytes(dataType), count, dataType)
+
+            # Check if the structure contains a bit field
+            if dataType in bitFieldStructures:
+                calls.append(run)
+            else:
+                runs.append(run)
+
+    return [runs, calls, hasBitField]
@@ -1,6 +1,18 @@
 
 from CCDD import CcddScriptDataAccessHandler
 from collections import OrderedDict
+import os
+import sys
+
+# Add the script's folder to the module search path so that the shared script
+# support package can be imported
+scriptPath = os.path.dirname(os.path.abspath(ccdd.getScriptName()))
+
+if scriptPath not in sys.path:
+    sys.path.insert(0, scriptPath)
+
+from ccddlib import output
+from ccddlib.orderedSet import OrderedSet
 
 CCDDPrimitiveTypes = ( \
     "int8_t", \
@@ -97,9 +109,11 @@ class ROSMessageDefinition:
 
     def ToMessageFile(self, directoryPath=""):
         
-        file = ccdd.openOutputFile(directoryPath + self.MessageName + ".msg")
-        ccdd.writeToFile(file, self.ToString())
-        ccdd.closeFile(file)
+        file = output.openOutputFile(ccdd, directoryPath + self.MessageName + ".msg")
+
+        if file is not None:
+            file.write(self.ToString())
+            file.close()
 
 
 
@@ -120,7 +134,7 @@ else:
 
         for structIndex in range(len(structureNames)):
 
-            usedVariableNames = []
+            usedVariableNames = OrderedSet()
 
             currentStructName = structureNames[structIndex]
 
@@ -134,9 +148,7 @@ else:
 
                     if not variableName.endswith("]"):
 
-                        if variableName not in usedVariableNames:
-
-                            usedVariableNames.append(variableName)
+                        if usedVariableNames.add(variableName):
 
                             memberType = ccdd.getStructureTableData("data type", rowIndex)
 
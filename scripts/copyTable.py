@@ -11,6 +11,17 @@
 #******************************************************************************
 
 from CCDD import CcddScriptDataAccessHandler
+import os
+import sys
+
+# Add the script's folder to the module search path so that the shared script
+# support package can be imported
+scriptPath = os.path.dirname(os.path.abspath(ccdd.getScriptName()))
+
+if scriptPath not in sys.path:
+    sys.path.insert(0, scriptPath)
+
+from ccddlib import output
 
 usedHKNames = []
 usedHKValues = []
@@ -41,17 +52,17 @@ VARIABLE_NAME = 6
 #******************************************************************************
 def outputFileCreationInfo(file):
     # Add the build information and header to the output file
-    ccdd.writeToFileLn(file, "/* Created : " + ccdd.getDateAndTime() + "\n   User    : " + ccdd.getUser() + "\n   Project : " + ccdd.getProject() + "\n   Script  : " + ccdd.getScriptName())
+    file.writeLn("/* Created : " + ccdd.getDateAndTime() + "\n   User    : " + ccdd.getUser() + "\n   Project : " + ccdd.getProject() + "\n   Script  : " + ccdd.getScriptName())
 
     # Check if any table is associated with the script
     if ccdd.getTableNumRows() != 0:
-        ccdd.writeToFileLn(file, "   Table(s): " + [].slice.call(ccdd.getTableNames()).sort().join(",\n             "))
+        file.writeLn("   Table(s): " + (",\n             ").join(sorted(ccdd.getTableNames())))
 
     # Check if any group is associated with the script
     if len(ccdd.getAssociatedGroupNames()) != 0:
-        ccdd.writeToFileLn(file, "   Group(s): " + [].slice.call(ccdd.getAssociatedGroupNames()).sort().join(",\n             "))
+        file.writeLn("   Group(s): " + (",\n             ").join(sorted(ccdd.getAssociatedGroupNames())))
 
-    ccdd.writeToFileLn(file, "*/\n")
+    file.writeLn("*/\n")
 
 #******************************************************************************
 # Output the copy table file
@@ -61,7 +72,7 @@ def makeCopyTableFile():
     copyTableFileName = ccdd.getOutputPath() + "hk_cpy_tbl.c"
 
     # Open the copy table output file
-    copyTableFile = ccdd.openOutputFile(copyTableFileName)
+    copyTableFile = output.openOutputFile(ccdd, copyTableFileName)
 
     # Check if the copy table file successfully opened
     if copyTableFile is not None:
@@ -129,13 +140,13 @@ def makeCopyTableFile():
                 columnWidth[OUTPUT_MSG_ID] = len("HK_UNDEFINED_ENTRY")
         
         # Write the standard include files to the copy table file
-        ccdd.writeToFileLn(copyTableFile, "#include \"cfe.h\"")
-        ccdd.writeToFileLn(copyTableFile, "#include \"hk_utils.h\"")
-        ccdd.writeToFileLn(copyTableFile, "#include \"hk_app.h\"")
-        ccdd.writeToFileLn(copyTableFile, "#include \"hk_msgids.h\"")
-        ccdd.writeToFileLn(copyTableFile, "#include \"hk_tbldefs.h\"")
-        ccdd.writeToFileLn(copyTableFile, "#include \"cfe_tbl_filedef.h\"")
-        ccdd.writeToFileLn(copyTableFile, "")
+        copyTableFile.writeLn("#include \"cfe.h\"")
+        copyTableFile.writeLn("#include \"hk_utils.h\"")
+        copyTableFile.writeLn("#include \"hk_app.h\"")
+        copyTableFile.writeLn("#include \"hk_msgids.h\"")
+        copyTableFile.writeLn("#include \"hk_tbldefs.h\"")
+        copyTableFile.writeLn("#include \"cfe_tbl_filedef.h\"")
+        copyTableFile.writeLn("")
  
         # Get the number of rows for the Includes table data
         numIncludeRows = ccdd.getTableNumRows("Includes")
@@ -145,19 +156,19 @@ def makeCopyTableFile():
             # Step through each row of Includes data
             for row in range(numIncludeRows):
                 # Output the Includes table's 'includes' column data
-                ccdd.writeToFileLn(copyTableFile, ccdd.getTableData("Includes", "includes", row))
+                copyTableFile.writeLn(ccdd.getTableData("Includes", "includes", row))
 
-            ccdd.writeToFileLn(copyTableFile, "")
+            copyTableFile.writeLn("")
         
         # Build the format strings so that the columns in each row are aligned
         formatHeader = "/* %-" + str(columnWidth[INPUT_MSG_ID]) + "s| %-" + str(columnWidth[INPUT_OFFSET]) + "s| %-" + str(columnWidth[OUTPUT_MSG_ID]) + "s| %-" + str(columnWidth[OUTPUT_OFFSET]) + "s| %-" + str(columnWidth[VARIABLE_BYTES]) + "s */\n"
         formatBody = "  {%-" + str(columnWidth[INPUT_MSG_ID]) + "s, %" + str(columnWidth[INPUT_OFFSET]) + "s, %-" + str(columnWidth[OUTPUT_MSG_ID]) + "s, %" + str(columnWidth[OUTPUT_OFFSET]) + "s, %" + str(columnWidth[VARIABLE_BYTES]) + "s}%s  /* (%" + str(len(str(HK_COPY_TABLE_ENTRIES))) + "s) %s : %s */\n"
 
         # Write the copy table definition statement
-        ccdd.writeToFileLn(copyTableFile, "hk_copy_table_entry_t HK_CopyTable[HK_COPY_TABLE_ENTRIES] =")
-        ccdd.writeToFileLn(copyTableFile, "{")
-        ccdd.writeToFileFormat(copyTableFile, formatHeader, "Input", "Input", "Output", "Output", "Num")
-        ccdd.writeToFileFormat(copyTableFile, formatHeader, "Message ID", "Offset", "Message ID", "Offset", "Bytes")
+        copyTableFile.writeLn("hk_copy_table_entry_t HK_CopyTable[HK_COPY_TABLE_ENTRIES] =")
+        copyTableFile.writeLn("{")
+        copyTableFile.writeFormat(formatHeader, "Input", "Input", "Output", "Output", "Num")
+        copyTableFile.writeFormat(formatHeader, "Message ID", "Offset", "Message ID", "Offset", "Bytes")
 
         # Step through each entry in the copy table
         for copyTable in range(len(copyTables)):
@@ -177,7 +188,7 @@ def makeCopyTableFile():
                         comma = ","
  
                     # Write the entry to the copy table file
-                    ccdd.writeToFileFormat(copyTableFile, formatBody, copyTableEntries[row][INPUT_MSG_ID], copyTableEntries[row][INPUT_OFFSET], copyTableEntries[row][OUTPUT_MSG_ID], copyTableEntries[row][OUTPUT_OFFSET], copyTableEntries[row][VARIABLE_BYTES], comma, str(entryIndex), copyTableEntries[row][VARIABLE_PARENT], copyTableEntries[row][VARIABLE_NAME])
+                    copyTableFile.writeFormat(formatBody, copyTableEntries[row][INPUT_MSG_ID], copyTableEntries[row][INPUT_OFFSET], copyTableEntries[row][OUTPUT_MSG_ID], copyTableEntries[row][OUTPUT_OFFSET], copyTableEntries[row][VARIABLE_BYTES], comma, str(entryIndex), copyTableEntries[row][VARIABLE_PARENT], copyTableEntries[row][VARIABLE_NAME])
 
                     # Check if no available rows remain in the copy table
                     if entryIndex == HK_COPY_TABLE_ENTRIES:
@@ -204,16 +215,16 @@ def makeCopyTableFile():
                     comma = ","
 
                 # Add the blank entry to the copy table
-                ccdd.writeToFileFormat(copyTableFile, emptyFormatBody, "HK_UNDEFINED_ENTRY", "0", "HK_UNDEFINED_ENTRY", "0", "0", comma, str(entryIndex))
+                copyTableFile.writeFormat(emptyFormatBody, "HK_UNDEFINED_ENTRY", "0", "HK_UNDEFINED_ENTRY", "0", "0", comma, str(entryIndex))
 
                 # Increment the copy table entry index
                 entryIndex += 1
 
         # Terminate the table definition statement
-        ccdd.writeToFileLn(copyTableFile, "};")
-        ccdd.writeToFileLn(copyTableFile, "")
-        ccdd.writeToFileLn(copyTableFile, "CFE_TBL_FILEDEF(HK_CopyTable, HK.CopyTable, HK Copy Tbl, hk_cpy_tbl.tbl)")
-        ccdd.closeFile(copyTableFile)
+        copyTableFile.writeLn("};")
+        copyTableFile.writeLn("")
+        copyTableFile.writeLn("CFE_TBL_FILEDEF(HK_CopyTable, HK.CopyTable, HK Copy Tbl, hk_cpy_tbl.tbl)")
+        copyTableFile.close()
     # The copy table file failed to open
     else:
         # Display an error dialog
@@ -229,7 +240,7 @@ def makeIDDefinitionFile():
     headerIncludeFlag = "_" + baseFileName.upper() + "_H_"
 
     # Open the types header output file
-    idDefinesFile = ccdd.openOutputFile(idDefinesFileName)
+    idDefinesFile = output.openOutputFile(ccdd, idDefinesFileName)
 
     # Check if the types header file successfully opened
     if idDefinesFile is not None:
@@ -237,9 +248,9 @@ def makeIDDefinitionFile():
         outputFileCreationInfo(idDefinesFile)
 
         # Add the header include to prevent loading the file more than once
-        ccdd.writeToFileLn(idDefinesFile, "#ifndef " + headerIncludeFlag)
-        ccdd.writeToFileLn(idDefinesFile, "#define " + headerIncludeFlag)
-        ccdd.writeToFileLn(idDefinesFile, "")
+        idDefinesFile.writeLn("#ifndef " + headerIncludeFlag)
+        idDefinesFile.writeLn("#define " + headerIncludeFlag)
+        idDefinesFile.writeLn("")
 
         # Get the number of rows for the Includes table data
         numIncludeRows = ccdd.getTableNumRows("Includes")
@@ -249,9 +260,9 @@ def makeIDDefinitionFile():
             # Step through each row of Includes data
             for row in range(numIncludeRows):
                 # Output the Includes table's 'includes' column data
-                ccdd.writeToFileLn(idDefinesFile, ccdd.getTableData("Includes", "includes", row))
+                idDefinesFile.writeLn(ccdd.getTableData("Includes", "includes", row))
 
-            ccdd.writeToFileLn(idDefinesFile, "")
+            idDefinesFile.writeLn("")
 
         minimumLength = 1
 
@@ -265,14 +276,14 @@ def makeIDDefinitionFile():
         # Step through the list of names that are used
         for index in range(len(usedHKNames)):
             # Output the ID name and ID to the file
-            ccdd.writeToFileFormat(idDefinesFile, "#define %-" + str(minimumLength) + "s  (%7s + FC_OFFSET )\n", usedHKNames[index], usedHKValues[index])
+            idDefinesFile.writeFormat("#define %-" + str(minimumLength) + "s  (%7s + FC_OFFSET )\n", usedHKNames[index], usedHKValues[index])
 
         # Finish and close the ID definitions header output file
-        ccdd.writeToFileLn(idDefinesFile, "")
-        ccdd.writeToFileLn(idDefinesFile, "#endif  /* " + headerIncludeFlag + " */")
+        idDefinesFile.writeLn("")
+        idDefinesFile.writeLn("#endif  /* " + headerIncludeFlag + " */")
 
         # Close the output file
-        ccdd.closeFile(idDefinesFile)
+        idDefinesFile.close()
     # The combined ID file failed to open
     else:
         # Display an error dialog
@@ -282,8 +293,13 @@ def makeIDDefinitionFile():
 
 #** Main **********************************************************************
 
-# Output the copy table file
-makeCopyTableFile()
+try:
+    # Output the copy table file
+    makeCopyTableFile()
+
+    # Output the ID definitions file
+    makeIDDefinitionFile()
 
-# Output the ID definitions file
-makeIDDefinitionFile()
+finally:
+    # Close any output files that remain open (e.g., due to an error)
+    output.closeOpenFiles()
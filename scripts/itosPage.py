@@ -12,8 +12,23 @@
 #*****************************************************************************/
 
 from CCDD import CcddScriptDataAccessHandler
+import os
 import re
 import math
+import sys
+
+# Add the script's folder to the module search path so that the shared script
+# support package can be imported
+scriptPath = os.path.dirname(os.path.abspath(ccdd.getScriptName()))
+
+if scriptPath not in sys.path:
+    sys.path.insert(0, scriptPath)
+
+from ccddlib import macroExpansion
+from ccddlib import output
+from ccddlib.dataFields import DataFieldCache
+from ccddlib.itosEncoding import ITOSEncodingTable
+from ccddlib.structureSnapshot import StructureSnapshot, convertArrayMember
 
 #  Functions ******************************************************************
 
@@ -25,17 +40,17 @@ import math
 #*****************************************************************************/
 def outputFileCreationInfo(file):
     # Add the build information and header to the output file
-    ccdd.writeToFileLn(file, "# Created : " + ccdd.getDateAndTime() + "\n# User    : " + ccdd.getUser() + "\n# Project : " + ccdd.getProject() + "\n# Script  : " + ccdd.getScriptName())
+    file.writeLn("# Created : " + ccdd.getDateAndTime() + "\n# User    : " + ccdd.getUser() + "\n# Project : " + ccdd.getProject() + "\n# Script  : " + ccdd.getScriptName())
 
     # Check if any table is associated with the script
     if ccdd.getTableNumRows() != 0:
-        ccdd.writeToFileLn(file, "   Table(s): " + (",\n#            ").join(sorted(ccdd.getTableNames())))
+        file.writeLn("   Table(s): " + (",\n#            ").join(sorted(ccdd.getTableNames())))
 
     # Check if any groups is associated with the script
     if len(ccdd.getAssociatedGroupNames()) != 0:
-        ccdd.writeToFileLn(file, "   Group(s): " + (",\n#            ").join(sorted(ccdd.getAssociatedGroupNames())))
+        file.writeLn("   Group(s): " + (",\n#            ").join(sorted(ccdd.getAssociatedGroupNames())))
 
-    ccdd.writeToFileLn(file, "")
+    file.writeLn("")
 
 # *****************************************************************************
 # Determine if the row containing the specified variable is not an array
@@ -55,18 +70,6 @@ def isVariable(variableName, arraySize):
     # definitions)
     return variableName is not None and arraySize is not None and (arraySize == "" or variableName.endswith("]"))
 
-# *****************************************************************************
-# Convert an array member variable name by replacing left square brackets with
-# underscores and removing right square brackets (example: a[2] becomes a_2)
-# 
-# @param variableName
-#            variable name
-# 
-# @return Variable name with the square brackets replaced
-#*****************************************************************************/
-def convertArrayMember(variableName):
-    return variableName.replace("[", "_").replace("]", "")
-
 # *****************************************************************************
 # Adjust the row counter to the next row. If the number of rows exceeds the
 # maximum start a new column
@@ -116,17 +119,17 @@ def nextRow(pageFile, variableName, fullVariableName, row):
 
         # Go to the next column
         columnCount = columnCount + 1
-        ccdd.writeToFileLn(pageFile, "## col_max_len going from " + str(maxColumnLength) + " back to " + str(columnStep))
+        pageFile.writeLn("## col_max_len going from " + str(maxColumnLength) + " back to " + str(columnStep))
         rowCount = 1
         columnOffset = columnOffset + maxColumnLength + 2
         maxColumnLength = columnStep
 
         # Check if the current variable is a member within an array
         if inMiddleOfArray:
-            ccdd.writeToFileLn(pageFile, "array_fmt(1, " + str(columnOffset) + ",\"" + nextColumnHeader + "\")")
+            pageFile.writeLn("array_fmt(1, " + str(columnOffset) + ",\"" + nextColumnHeader + "\")")
         # Not a variable within an array
         else:
-            ccdd.writeToFileLn(pageFile, "(1, " + str(columnOffset) + ",\"" + lastSubStructureName + "\")")
+            pageFile.writeLn("(1, " + str(columnOffset) + ",\"" + lastSubStructureName + "\")")
     # Not at the maximum row
     else:
         rowCount = rowCount + 1
@@ -184,61 +187,18 @@ def setITOSFormatFlag(itosEncode):
     global modNumDefault
     global modNum
 
-    itosFormat = ""
-    withSign = 0
-    modNum = modNumDefault
-    dataTypeChar = itosEncode[0:1]
-    
-    # Floating point
-    if dataTypeChar == "F":
-        # Get the number of bytes that define the floating point
-        numBytes = len(itosEncode) - 1
-
-        # Check if the number of bytes is greater than 4 (i.e., it's a
-        # double precision floating point)
-        if numBytes > 4:
-            # Set the format string and parameters for a double
-            itosFormat = "%13.3f"
-            numITOSDigits = 14
-            modNum = modNumDefault / 2
-        # The number of bytes is equal to or less than 4 (i.e., it's a
-        # single precision floating point)
-        else:
-            # Set the format string and parameters for a float
-            itosFormat = "%6.3f"
-            numITOSDigits = 7
-            modNum = modNumDefault / 2
-    # Signed or unsigned integer
-    elif dataTypeChar == "I" or dataTypeChar == "U":
-        if dataTypeChar == "I":
-            # Set the value to add a space for the sign
-            withSign = 1
-
-        # Get the number of bytes that define the (unsigned) integer
-        numBytes = len(itosEncode) - 1
-
-        # Determine the number of digits required to display the largest
-        # possible value for the (unsigned) integer with the specified
-        # number of bytes
-        nDigits = int(2 * numBytes + 1 + math.floor(numBytes / 4))
-
-        # Add a digit for a +/- if signed integer
-        nDigits += withSign
-
-        # Set the format string and parameters for a (unsigned) integer
-        itosFormat = "%" + str(int(nDigits)) + "d"
-        numITOSDigits = nDigits
-
-        # Check if the number of bytes is greater than 2
-        if numBytes > 2:
-            # Set the format parameter
-            modNum = modNumDefault / 2
-    # Character or string
-    elif dataTypeChar == "S":
-        # Set the format string and parameters for a character or string
-        itosFormat = "%s"
-        numITOSDigits = 10
-        modNum = modNumDefault / 2
+    # Get the output format for the encoded data type
+    itosFormat, numDigits, isWide = encodings.getDisplayFormat(itosEncode)
+
+    # Check if the data type has a format
+    if numDigits is not None:
+        numITOSDigits = numDigits
+
+    # Check if the data type occupies a wide field
+    if isWide:
+        modNum = modNumDefault // 2
+    else:
+        modNum = modNumDefault
 
     return itosFormat
 
@@ -278,11 +238,11 @@ def outputMnemonic(pageFile, row, fltCompName):
     isOutput = False
     itosFormat = ""
 
-    variableName = ccdd.getStructureVariableName(row)
-    dataType = ccdd.getStructureDataType(row)
+    variableName = structureData.getVariableName(row)
+    dataType = structureData.getDataType(row)
  
     # Get the ITOS encoded form of the data type
-    itosEncode = ccdd.getITOSEncodedDataType(dataType, "BIG_ENDIAN")
+    itosEncode = encodings.getITOSEncodedDataType(dataType, "BIG_ENDIAN")
 
     # Check if this data type is a recognized base type or structure
     if itosEncode is not None:
@@ -292,14 +252,14 @@ def outputMnemonic(pageFile, row, fltCompName):
             itosFormat = setITOSFormatFlag(itosEncode)
 
         # Get the variable name and array size
-        arraySize = ccdd.getStructureArraySize(row)
-        fullVariableName = ccdd.getFullVariableName(row)
+        arraySize = structureData.getArraySize(row)
+        fullVariableName = structureData.getFullVariableName(row)
 
         # See if this row would exceed the maximum. If so start another column
         nextRow(pageFile, variableName, fullVariableName, row)
 
         # Get the full variable name (including the variable's structure path)
-        tmp = ccdd.getFullVariableName(row, " ")
+        tmp = structureData.getFullVariableName(row, " ")
 
         # Find number of spaces (i.e. " ") in tmp and makes prepad a string
         # containing only that many spaces
@@ -322,39 +282,42 @@ def outputMnemonic(pageFile, row, fltCompName):
                 lastSubStructureName = nextColumnHeader
                 headerNames[row] = lastSubStructureName
                 fullHeaderNames[row] = fullVariableName
-                ccdd.writeToFileLn(pageFile, "(+, " + str(columnOffset) + ", \"" + nextColumnHeader + "\")")
+                pageFile.writeLn("(+, " + str(columnOffset) + ", \"" + nextColumnHeader + "\")")
             # Not a structure; it's a primitive type
             else:
                 if isArrayElement(arraySize):
-                    maxDigits = int(math.ceil(math.log(int(arraySize)) / math.log(10)))
+                    # Get the number of array members
+                    numMembers = macroExpander.getInteger(arraySize)
+
+                    maxDigits = int(math.ceil(math.log(numMembers) / math.log(10)))
 
                     # Output number with leading spaces
-                    index = getIndex(variableName)
+                    index = int(getIndex(variableName))
                     indexPadded = str(index).ljust(maxDigits)
 
                     inMiddleOfArray = True
                     arrayPad = 13
 
                     # This item is first on a row
-                    if int(index) % modNum != 0:
-                        ccdd.writeToFileLn(pageFile, fullVariableName2 + "(=, +, \" :v" + itosFormat + ":\", raw)")
+                    if index % modNum != 0:
+                        pageFile.writeLn(fullVariableName2 + "(=, +, \" :v" + itosFormat + ":\", raw)")
                         lenAll = 0
                     # This array item is NOT first item on a row
                     else:
-                        lastIndex = str(min(int(arraySize) - 1, int(index) + modNum - 1)).ljust(maxDigits)
+                        lastIndex = str(min(numMembers - 1, index + modNum - 1)).ljust(maxDigits)
                         arrayMessage = prepad + "[" + indexPadded + "-" + str(lastIndex) + "]"
-                        lenAll = len(arrayMessage) + (numITOSDigits + 1) * min(modNum, int(arraySize))
-                        ccdd.writeToFileLn(pageFile, fullVariableName2 + "(+, " + str(columnOffset) + ", \"" + arrayMessage + "  :v" + itosFormat + ":\", raw)")
+                        lenAll = len(arrayMessage) + (numITOSDigits + 1) * min(modNum, numMembers)
+                        pageFile.writeLn(fullVariableName2 + "(+, " + str(columnOffset) + ", \"" + arrayMessage + "  :v" + itosFormat + ":\", raw)")
 
-                    if int(index) != int(arraySize) - 1 and (int(index) + 1) % modNum != 0:
+                    if index != numMembers - 1 and (index + 1) % modNum != 0:
                         rowCount = rowCount - 1
 
-                    if int(index) == int(arraySize) - 1:
+                    if index == numMembers - 1:
                         inMiddleOfArray = False
                         nextColumnHeader = lastSubStructureName
                 # Not an array item, print normally
                 else:
-                    ccdd.writeToFileLn(pageFile, fullVariableName2 + "(+, " + str(columnOffset) + ", \"" + prepad + variableName + " :v" + itosFormat + ":\", raw)")
+                    pageFile.writeLn(fullVariableName2 + "(+, " + str(columnOffset) + ", \"" + prepad + variableName + " :v" + itosFormat + ":\", raw)")
 
                     lenAll = len(prepad) + len(variableName) + numITOSDigits + 2
 
@@ -362,13 +325,13 @@ def outputMnemonic(pageFile, row, fltCompName):
         else:
             nextColumnHeader = prepad + variableName + "[" + arraySize + "] - " + itosEncode
             lenAll = len(nextColumnHeader)
-            ccdd.writeToFileLn(pageFile, "array_fmt(+, " + str(columnOffset) + ", \"" + nextColumnHeader + "\")")
+            pageFile.writeLn("array_fmt(+, " + str(columnOffset) + ", \"" + nextColumnHeader + "\")")
 
         if maxColumnLength < lenAll:
-            ccdd.writeToFileLn(pageFile, "## col_max_len is now = " + str(lenAll) + " (was " + str(maxColumnLength) + ")")
+            pageFile.writeLn("## col_max_len is now = " + str(lenAll) + " (was " + str(maxColumnLength) + ")")
             maxColumnLength = lenAll
     else:
-        ccdd.writeToFileLn(pageFile, "#### NOT printing " + variableName)
+        pageFile.writeLn("#### NOT printing " + variableName)
 
     return isOutput
 
@@ -379,7 +342,7 @@ def outputMnemonic(pageFile, row, fltCompName):
 #            reference to the output file
 #
 # @param fltCompName
-#            flight computer name
+#            flight computer name (or the flight computer name placeholder)
 #*****************************************************************************/
 def outputMnemonics(pageFile, fltCompName):
     global numStructRows
@@ -400,13 +363,11 @@ def outputMnemonics(pageFile, fltCompName):
     global modNumDefault
     global modNum
     
-    ccdd.writeToFileLn(pageFile, "# Mnemonics")
+    pageFile.writeLn("# Mnemonics")
 
-    # Step through each of the structure table rows
-    for row in range(ccdd.getStructureTableNumRows()):
-        # Initialize the header name array values to blanks
-        fullHeaderNames.append("")
-        headerNames.append("")
+    # Initialize the header name array values to blanks
+    fullHeaderNames = [""] * numStructRows
+    headerNames = [""] * numStructRows
 
     # Step through each row in the table
     for row in range(ccdd.getStructureTableNumRows()):
@@ -416,15 +377,17 @@ def outputMnemonics(pageFile, fltCompName):
         # Check if a mnemonic definition was output to the file
         if isOutput:
             # Add an end of line to file to get ready for next line
-            ccdd.writeToFileLn(pageFile, "")
+            pageFile.writeLn("")
 
 # *****************************************************************************
-# Output the page file
+# Output the page file for each flight computer. The page files differ only by
+# the flight computer name, so the page is generated once, using a placeholder
+# for the flight computer name, and written to every flight computer's file
 # 
-# @param fltCompName
-#            flight computer name
+# @param fltCompNames
+#            list of the flight computer names
 #*****************************************************************************/
-def outputPageFile(fltCompName):
+def outputPageFiles(fltCompNames):
     global numStructRows
     global fcNames
     global numFlightComputers
@@ -443,6 +406,9 @@ def outputPageFile(fltCompName):
     global modNumDefault
     global modNum
 
+    # Use the placeholder in place of the flight computer name
+    fltCompName = output.PARAMETER_PLACEHOLDER
+
     # Initialize the name, row, and column parameters
     nextColumnHeader = fltCompName + ccdd.getRootStructureTableNames()[0]
     lastSubStructureName = nextColumnHeader
@@ -456,33 +422,46 @@ def outputPageFile(fltCompName):
 
     # Check if structure data is provided
     if numStructRows != 0:
-        # Build the page file name and open the page output file
         baseName = "auto_" + fltCompName + ccdd.getRootStructureTableNames()[0]
-        pageFileName = ccdd.getOutputPath() + baseName + ".page"
-        pageFile = ccdd.openOutputFile(pageFileName)
+        pageFiles = []
+        pageFltCompNames = []
+
+        # Step through each flight computer
+        for fcName in fltCompNames:
+            # Build the page file name and open the page output file
+            pageFileName = ccdd.getOutputPath() + baseName.replace(fltCompName, fcName) + ".page"
+            pageFile = output.openOutputFile(ccdd, pageFileName)
+
+            # Check if the page output file successfully opened
+            if pageFile is not None:
+                pageFiles.append(pageFile)
+                pageFltCompNames.append(fcName)
+            # The page output file cannot be opened
+            else:
+                # Display an error dialog
+                ccdd.showErrorDialog("<html><b>Error opening telemetry output file '</b>" + pageFileName + "<b>'")
+
+        # Check if any page output file successfully opened
+        if len(pageFiles) != 0:
+            # Write the page to every flight computer's page file
+            pageFile = output.ParameterizedFileGroup(pageFiles, pageFltCompNames)
 
-        # Check if the page output file successfully opened
-        if pageFile is not None:
             # Begin building the page display. The "page" statement must be on
             # the first row
-            ccdd.writeToFileLn(pageFile, "page " + baseName)
-            ccdd.writeToFileLn(pageFile, "")
+            pageFile.writeLn("page " + baseName)
+            pageFile.writeLn("")
             outputFileCreationInfo(pageFile)
-            ccdd.writeToFileLn(pageFile, "color default (orange, default)")
-            ccdd.writeToFileLn(pageFile, "color mnedef (text (white, black) )")
-            ccdd.writeToFileLn(pageFile, "color subpage (lightblue, blue)")
-            ccdd.writeToFileLn(pageFile, "color array_fmt (royalblue, black)")
-            ccdd.writeToFileLn(pageFile, "")
+            pageFile.writeLn("color default (orange, default)")
+            pageFile.writeLn("color mnedef (text (white, black) )")
+            pageFile.writeLn("color subpage (lightblue, blue)")
+            pageFile.writeLn("color array_fmt (royalblue, black)")
+            pageFile.writeLn("")
 
             # Output the telemetry display definitions
             outputMnemonics(pageFile, fltCompName)
 
-            # Close the page output file
-            ccdd.closeFile(pageFile)
-        # The page output file cannot be opened
-        else:
-            # Display an error dialog
-            ccdd.showErrorDialog("<html><b>Error opening telemetry output file '</b>" + pageFileName + "<b>'")
+            # Close the page output files
+            pageFile.close()
 
 #  End functions **************************************************************
 
@@ -491,6 +470,18 @@ def outputPageFile(fltCompName):
 # Get the number of structure and command table rows
 numStructRows = ccdd.getStructureTableNumRows()
 
+# Get a snapshot of the structure table data
+structureData = StructureSnapshot(ccdd)
+
+# Get the cache of the table and group data field values
+dataFields = DataFieldCache(ccdd)
+
+# Get the table of the ITOS encoded data types
+encodings = ITOSEncodingTable(ccdd)
+
+# Get the macro expander used to convert array sizes
+macroExpander = macroExpansion.getExpander(ccdd)
+
 fcNames = []
 numFlightComputers = 0
 nextColumnHeader = ""
@@ -501,50 +492,53 @@ columnOffset = 0
 maxNumRows = 0
 rowCount = 0
 columnCount = 0
-headerNames = [numStructRows]
-fullHeaderNames = [numStructRows]
+headerNames = []
+fullHeaderNames = []
 inMiddleOfArray = False
 numITOSDigits = 8
 modNumDefault = 4
 modNum = modNumDefault
 
-# Check if no structure or command data is supplied
-if numStructRows == 0:
-    ccdd.showErrorDialog("No structure or command data supplied to script " + ccdd.getScriptName())
-# Structure and/or command data is supplied
-else:
-    # Get the value of the data field specifying the flight computer base value
-    fcBase = ccdd.getGroupDataFieldValue("globals", "prefix")
-
-    # Check if the data field exists or is empty
-    if fcBase is None or fcBase == "":
-        # Use the default base value
-        fcBase = "FC"
-
-    # Get the value of the data field specifying the number of flight computers
-    numFC = ccdd.getGroupDataFieldValue("globals", "NumComputers")
-
-    # Check if the data field exists, is empty, or isn't an integer value
-    if numFC is None or not re.match("[0-9]+", numFC):
-        # Use the default number of flight computers
-        numFlightComputers = 1
-    # The value is an integer
+try:
+    # Check if no structure or command data is supplied
+    if numStructRows == 0:
+        ccdd.showErrorDialog("No structure or command data supplied to script " + ccdd.getScriptName())
+    # Structure and/or command data is supplied
     else:
-        # Store the number of flight computers
-        numFlightComputers = int(numFC)
+        # Get the value of the data field specifying the flight computer base value
+        fcBase = dataFields.getGroupDataFieldValue("globals", "prefix")
+
+        # Check if the data field exists or is empty
+        if fcBase is None or fcBase == "":
+            # Use the default base value
+            fcBase = "FC"
+
+        # Get the value of the data field specifying the number of flight computers
+        numFC = dataFields.getGroupDataFieldValue("globals", "NumComputers")
+
+        # Check if the data field exists, is empty, or isn't an integer value
+        if numFC is None or not re.match("[0-9]+", numFC):
+            # Use the default number of flight computers
+            numFlightComputers = 1
+        # The value is an integer
+        else:
+            # Store the number of flight computers
+            numFlightComputers = int(numFC)
+
+        # Check if there is more than one flight computer
+        if numFlightComputers > 1:
+            # Step through each flight computer
+            for fcIndex in range(numFlightComputers):
+                # Store the flight computer name prefix and offset value
+                fcNames.append(fcBase + str(fcIndex + 1) + "_")
+        # Only one flight computer
+        else:
+            # No prefix for a single computer
+            fcNames.append("")
 
-    # Check if there is more than one flight computer
-    if numFlightComputers > 1:
-        # Step through each flight computer
-        for fcIndex in range(numFlightComputers):
-            # Store the flight computer name prefix and offset value
-            fcNames.append(fcBase + str(fcIndex + 1) + "_")
-    # Only one flight computer
-    else:
-        # No prefix for a single computer
-        fcNames.append("")
+        # Output the page file for every flight computer
+        outputPageFiles(fcNames)
 
-    # Step through each flight computer
-    for fcIndex in range(numFlightComputers):
-        # Output the page file
-        outputPageFile(fcNames[fcIndex])
+finally:
+    # Close any output files that remain open (e.g., due to an error)
+    output.closeOpenFiles()
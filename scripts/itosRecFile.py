@@ -14,14 +14,53 @@
 # or is empty the name is blank. The project's data type definitions are output
 # to the types header file
 #
+# The record files are output for the selected endianess. Selecting "Multiple"
+# outputs the record files for each endianess chosen; the endianess-independent
+# definitions (conversions, limits, mnemonics, and commands) are generated once
+# for all of these. If both big and little endian are output the shared
+# prototype structures file name includes the endianess (common_BE.rec and
+# common_LE.rec) in place of common.rec
+#
+# If the "globals" group has a data field, "SharedDefinitions", set to "true"
+# then the telemetry discrete conversions and limit definitions are shared:
+# each unique enumeration or limit set is output once, named for the first
+# variable using it, and the mnemonics for the other variables having the same
+# enumeration or limit set refer to this definition
+#
+# If the "globals" group has a data field, "StreamingOutput", set to "true"
+# then the telemetry discrete conversions, limit definitions, polynomial
+# conversions, and mnemonic definitions are generated using a single pass
+# through the structure table rows. The sections following the discrete
+# conversions are collected in buffers that keep a fixed amount of text in
+# memory, the remainder being held in temporary files, and are appended to the
+# telemetry output file(s) once the pass completes
+#
 # Copyright 2017 United States Government as represented by the Administrator
 # of the National Aeronautics and Space Administration. No copyright is claimed
 # in the United States under Title 17, U.S. Code. All Other Rights Reserved.
 #******************************************************************************
 
 from CCDD import CcddScriptDataAccessHandler
+import os
 import re
 import math
+import sys
+
+# Add the script's folder to the module search path so that the shared script
+# support package can be imported
+scriptPath = os.path.dirname(os.path.abspath(ccdd.getScriptName()))
+
+if scriptPath not in sys.path:
+    sys.path.insert(0, scriptPath)
+
+from ccddlib import output
+from ccddlib.commandIndex import CommandRowIndex
+from ccddlib.conversions import ConversionCache
+from ccddlib.dataFields import DataFieldCache
+from ccddlib.itosEncoding import ITOSEncodingTable
+from ccddlib.orderedSet import OrderedSet
+from ccddlib.structureIndex import StructureRowIndex
+from ccddlib.structureSnapshot import StructureSnapshot
 
 #* Functions ******************************************************************
 
@@ -33,17 +72,17 @@ import math
 #******************************************************************************
 def outputFileCreationInfo(file):
     # Add the build information and header to the output file
-    ccdd.writeToFileLn(file, "/* Created : " + ccdd.getDateAndTime() + "\n   User    : " + ccdd.getUser() + "\n   Project : " + ccdd.getProject() + "\n   Script  : " + ccdd.getScriptName())
+    file.writeLn("/* Created : " + ccdd.getDateAndTime() + "\n   User    : " + ccdd.getUser() + "\n   Project : " + ccdd.getProject() + "\n   Script  : " + ccdd.getScriptName())
 
     # Check if any table is associated with the script
     if ccdd.getTableNumRows() != 0:
-        ccdd.writeToFileLn(file, "   Table(s): " + (",\n             ").join(sorted(ccdd.getTableNames())))
+        file.writeLn("   Table(s): " + (",\n             ").join(sorted(ccdd.getTableNames())))
 
     # Check if any groups is associated with the script
     if len(ccdd.getAssociatedGroupNames()) != 0:
-        ccdd.writeToFileLn(file, "   Group(s): " + (",\n             ").join(sorted(ccdd.getAssociatedGroupNames())))
+        file.writeLn("   Group(s): " + (",\n             ").join(sorted(ccdd.getAssociatedGroupNames())))
 
-    ccdd.writeToFileLn(file, "*/")
+    file.writeLn("*/")
 
 #******************************************************************************
 # Determine if the row containing the specified variable is not an array
@@ -75,7 +114,7 @@ def isTelemetry(row):
     isTlm = False
 
     # Get the rate column values for all rate columns in the structure
-    rates = ccdd.getStructureRates(row)
+    rates = structureData.getRates(row)
 
     # Step through each rate column value
     for index in range(len(rates)):
@@ -88,6 +127,50 @@ def isTelemetry(row):
 
     return isTlm
 
+#******************************************************************************
+# Determine the names of the shared discrete conversion and limit definitions.
+# Each unique enumeration and limit set is assigned the full name of the first
+# variable in which it appears; the names are stored by row for use by the
+# discrete conversion, limit, and mnemonic definition outputs
+#******************************************************************************
+def getSharedDefinitionNames():
+    conversionOwners = {}
+    limitOwners = {}
+
+    # Step through each row in the structure table
+    for row in range(numStructRows):
+        # Get the first enumeration and the limits (if extant)
+        enumeration = structureData.getEnumeration(row)
+        limitSets = structureData.getTableData("limit sets", row)
+
+        # Check if the parameter has a discrete conversion or limits, and isn't
+        # an array definition
+        if ((enumeration or limitSets)
+            and isVariable(structureData.getVariableName(row), structureData.getArraySize(row))):
+            fullVariableName = structureData.getFullVariableName(row)
+
+            # Check if the parameter has a discrete conversion
+            if enumeration:
+                # Use the name of the first variable with the same enumeration
+                conversionNames[row] = conversionOwners.setdefault(enumeration, fullVariableName)
+
+            # Check if the parameter has limits
+            if limitSets:
+                # Use the name of the first variable with the same limits
+                limitNames[row] = limitOwners.setdefault(limitSets, fullVariableName)
+
+#******************************************************************************
+# Check if the specified "globals" group data field is set to "true"
+#
+# @param fieldName
+#            data field name
+#
+# @return True if the data field exists and is set to "true"
+#******************************************************************************
+def isGlobalOptionSet(fieldName):
+    value = dataFields.getGroupDataFieldValue("globals", fieldName)
+    return value is not None and value.strip().lower() == "true"
+
 #******************************************************************************
 # Build the command enumeration name
 #
@@ -102,9 +185,28 @@ def isTelemetry(row):
 def getCommandEnumerationName(row, argumentNum):
     return ccdd.getCommandName(row) + "_" + ccdd.getCommandArgName(argumentNum, row) + "_ENUMERATION"
 
+#******************************************************************************
+# Check if the variable in the specified structure row is bit-packed with the
+# variable in the preceding row; i.e., both are bit-wise variables in the same
+# structure instance and have the same byte offset
+#
+# @param row
+#            structure table row index; must be greater than 0
+#
+# @return True if the variable is bit-packed with the preceding row's variable
+#******************************************************************************
+def isPackedWithPrevious(row):
+    return structureData.getBitLength(row) \
+           and structureData.getBitLength(row - 1) \
+           and structureData.getVariableOffset(row) != -1 \
+           and structureData.getVariableOffset(row) == structureData.getVariableOffset(row - 1) \
+           and structureData.getTablePath(row) == structureData.getTablePath(row - 1)
+
 #******************************************************************************
 # Output an array of structure row indices that order the bit-packed variables
-# in the structure table based on endianess
+# in the structure table based on endianess. The rows are checked in a single
+# pass; each run of consecutive bit-packed variables is reversed for little
+# endian
 #
 # @param endian
 #            "BE" (big endian) or "LE" (little endian), depending on what byte
@@ -114,67 +216,28 @@ def getCommandEnumerationName(row, argumentNum):
 #         in the structure table based on endianess
 #******************************************************************************
 def reorderRowsForByteOrder(endian):
-    reOrdered = []
-
     # Create the reordered row array assuming the order is unchanged
-    for row in range(numStructRows):
-        # Default to ID=index
-        reOrdered.append(row)
+    reOrdered = list(range(numStructRows))
 
     # Check if the order is little endian (there's no need to perform the
     # reordering if big endian)
     if endian == "LE":
-        # Step through each structure row
-        for tgtRow in range(numStructRows):
-            # Counter to track the number of variables bit-packed with the
-            # target variable
-            packCount = 1
-
-            # Get the name of the target structure
-            tgtStructName = ccdd.getStructureTableNameByRow(tgtRow)
-
-            # Get the byte offset of the target variable
-            tgtVarPath = ccdd.getFullVariableNameRaw(tgtRow)
-            tgtOffset = ccdd.getVariableOffset(tgtVarPath)
-
-            # Step through the remaining rows so that the structures can be
-            # compared with the target
-            for compRow in range(row + 1, numStructRows - 1):
-                # Check if the target structure is the same as the comparison
-                # structure
-                if tgtStructName == ccdd.getStructureTableNameByRow(compRow):
-                    # Get the byte offset of the comparison variable
-                    compVarPath = ccdd.getFullVariableNameRaw(compRow)
-                    compOffset = ccdd.getVariableOffset(compVarPath)
-
-                    # Check if the target and comparison variables have the
-                    # same offset; i.e., they are bit-packed
-                    if tgtOffset == compOffset:
-                        # Increment the bit-packed variables counter
-                        packCount = packCount + 1
-                    # The variables aren't bit-packed
-                    else:
-                        # Stop searching since no further variables are packed
-                        # with the target
-                        break
-                # The structures aren't the same
-                else:
-                    # Stop searching since the all of the target structure has
-                    # been checked
-                    break
-
-            # Check if the target variable is bit-packed with one or more
-            # variables
-            if packCount > 1:
-                # Step through the bit-packed variables
-                for index in range(packCount):
-                    # Store the bit-packed variable's row, in reverse order of
-                    # its original appearance, in the re-ordered row array
-                    reOrdered[tgtRow + index] = tgtRow + packCount - index - 1
-
-                # Adjust the target row index to skip the bit-packed variables
-                # so that they won't be checked again as the loop progresses
-                tgtRow = tgtRow + packCount - 1
+        packStart = 0
+
+        # Step through each structure row. The row following the last is
+        # included so that a run of bit-packed variables ending with the last
+        # row is reordered
+        for row in range(1, numStructRows + 1):
+            # Check if the variable isn't bit-packed with the preceding one
+            if row == numStructRows or not isPackedWithPrevious(row):
+                # Check if the preceding variables are bit-packed together
+                if row - packStart > 1:
+                    # Store the bit-packed variables' rows in reverse order of
+                    # their original appearance
+                    reOrdered[packStart:row] = range(row - 1, packStart - 1, -1)
+
+                # Start the next run of bit-packed variables with this row
+                packStart = row
 
     return reOrdered
 
@@ -193,115 +256,98 @@ def reorderRowsForByteOrder(endian):
 #******************************************************************************
 def outputStructureDefinition(structureName, isPacket, outFile):
     termLine = False
-    usedVariableNames = []
+    usedVariableNames = OrderedSet()
+
+    # Step through each row belonging to the structure, in the order with the
+    # rows swapped for LE bit fields
+    for row in structureRows.getRows(structureName):
+        # Get the variable name for this row
+        variableName = structureData.getVariableName(row)
+
+        # Add the variable name to the set of those already processed, and
+        # check if it hasn't already been processed; this is necessary to
+        # prevent duplicating the variables in the prototype structure for a
+        # structure that is referenced as an array
+        if usedVariableNames.add(variableName):
+            # Get the array size for this row
+            arraySize = structureData.getArraySize(row)
 
-    # Step through each row in the table
-    for rowIndex in range(numStructRows):
-        # Get the row index when swapped for LE bit fields
-        row = newRowOrder[rowIndex]
-
-        # Check that this row references a variable in the prototype structure
-        if ccdd.getStructureTableNameByRow(row) == structureName:
-            # Get the variable name for this row
-            variableName = ccdd.getStructureVariableName(row)
-
-            isFound = False
-
-            # Step through each name in the array of already processed
-            # variable names
-            for index in range(len(usedVariableNames)):
-                # Check if the target name matches the array name
-                if usedVariableNames[index] == variableName:
-                    # Match found; set the flag and stop searching
-                    isFound = True
-                    break
-
-            # Check if the variable name hasn't already been processed; this is
-            # necessary to prevent duplicating the variables in the prototype
-            # structure for a structure that is referenced as an array
-            if not isFound:
-                # Add the variable name to the list of those already processed
-                usedVariableNames.append(variableName)
-
-                # Get the array size for this row
-                arraySize = ccdd.getStructureArraySize(row)
-
-                # Only output non-array variables or array members (i.e., skip
-                # array definitions)
-                if isVariable(variableName, arraySize):
-                    skipStringMembers = False
-
-                    # Get the variable's data type
-                    dataType = ccdd.getStructureDataType(row)
-
-                    # Check if the variable is a string; a string is handled as
-                    # a single entity rather than an array of characters
-                    if arraySize is not None and arraySize != "" and dataType == "string":
-                        # Check if this is the first character in the string
-                        if variableName.endswith("_0"):
-                            # Remove the array size from the variable name
-                            variableName = variableName.substring(0, len(variableName) - 2)
-
-                            # Add the string length information
-                            otherParameters += "lengthInCharacters = " + arraySize + " , "
-                        # This is a character other than the first one in the
-                        # string
+            # Only output non-array variables or array members (i.e., skip
+            # array definitions)
+            if isVariable(variableName, arraySize):
+                skipStringMembers = False
+
+                # Get the variable's data type
+                dataType = structureData.getDataType(row)
+
+                # Check if the variable is a string; a string is handled as
+                # a single entity rather than an array of characters
+                if arraySize is not None and arraySize != "" and dataType == "string":
+                    # Check if this is the first character in the string
+                    if variableName.endswith("_0"):
+                        # Remove the array size from the variable name
+                        variableName = variableName[:len(variableName) - 2]
+
+                        # Add the string length information
+                        otherParameters += "lengthInCharacters = " + arraySize + " , "
+                    # This is a character other than the first one in the
+                    # string
+                    else:
+                        # Set the flag to skip the remaining string members
+                        skipStringMembers = True
+
+                # Check that this isn't a member of a string (other than
+                # the first one)
+                if not skipStringMembers:
+                    # In case this is an array member replace the square brackets. This also
+                    # prevents returning a duplicate name due to the conversion (e.g.,
+                    # abc_0 and abc[0] would otherwise be converted to the same name, abc_0,
+                    # if the brackets are simply replaced)
+                    variablePath = structureData.getFullVariableName(row, ",")
+                    varIndex = variablePath.rfind(",") + 1
+                    variableName = variablePath[varIndex:]
+
+                    # Check if this is not the first pass
+                    if termLine:
+                        # Check if this is the packet definition
+                        if isPacket:
+                            # Terminate the previous line with a comma
+                            outFile.writeLn(",")
+                        # This is a prototype structure
                         else:
-                            # Set the flag to skip the remaining string members
-                            skipStringMembers = True
-
-                    # Check that this isn't a member of a string (other than
-                    # the first one)
-                    if not skipStringMembers:
-                        # In case this is an array member replace the square brackets. This also
-                        # prevents returning a duplicate name due to the conversion (e.g.,
-                        # abc_0 and abc[0] would otherwise be converted to the same name, abc_0,
-                        # if the brackets are simply replaced)
-                        variablePath = ccdd.getFullVariableName(rowIndex, ",")
-                        varIndex = variablePath.rfind(",") + 1
-                        variableName = variablePath[varIndex:]
-
-                        # Check if this is not the first pass
-                        if termLine:
-                            # Check if this is the packet definition
-                            if isPacket:
-                                # Terminate the previous line with a comma
-                                ccdd.writeToFileLn(outFile, ",")
-                            # This is a prototype structure
-                            else:
-                                # Terminate the previous line with a line feed
-                                ccdd.writeToFileLn(outFile, "")
+                            # Terminate the previous line with a line feed
+                            outFile.writeLn("")
 
-                        termLine = True
+                    termLine = True
 
-                        # Get the length in bits for this row
-                        bitLength = ccdd.getStructureBitLength(row)
-                        otherParameters = ""
+                    # Get the length in bits for this row
+                    bitLength = structureData.getBitLength(row)
+                    otherParameters = ""
 
-                        # Check if the length in bits is specified
-                        if bitLength is not None and bitLength:
-                            # Add the length in bits parameter
-                            otherParameters = "lengthInBits=" + bitLength
+                    # Check if the length in bits is specified
+                    if bitLength is not None and bitLength:
+                        # Add the length in bits parameter
+                        otherParameters = "lengthInBits=" + bitLength
 
-                        # Get the ITOS encoded form of the data type as two
-                        # characters (type + size)
-                        itosEncode2Char = ccdd.getITOSEncodedDataType(dataType, "TWO_CHAR")
+                    # Get the ITOS encoded form of the data type as two
+                    # characters (type + size)
+                    itosEncode2Char = encodings.getITOSEncodedDataType(dataType, "TWO_CHAR")
 
-                        # Check if variable is a primitive data type or a
-                        # structure
-                        if itosEncode2Char is not None:
-                            # Check if other parameters have been defined
-                            if (otherParameters):
-                                # Add a space to separate the parameters
-                                otherParameters += " "
+                    # Check if variable is a primitive data type or a
+                    # structure
+                    if itosEncode2Char is not None:
+                        # Check if other parameters have been defined
+                        if (otherParameters):
+                            # Add a space to separate the parameters
+                            otherParameters += " "
 
-                            # Check if the data type is a recognized primitive
-                            if itosEncode2Char != dataType:
-                                # Add the 'no mnemonic' parameter
-                                otherParameters += "generateMnemonic=\"no\""
+                        # Check if the data type is a recognized primitive
+                        if itosEncode2Char != dataType:
+                            # Add the 'no mnemonic' parameter
+                            otherParameters += "generateMnemonic=\"no\""
 
-                        # Create the parameter definition
-                        ccdd.writeToFile(outFile, "  " + itosEncode2Char + " " + variableName + " {" + otherParameters + "}")
+                    # Create the parameter definition
+                    outFile.write("  " + itosEncode2Char + " " + variableName + " {" + otherParameters + "}")
 
 #******************************************************************************
 # Get the last 12 bits of a hexadecimal message ID
@@ -372,11 +418,32 @@ def outputTelemetryPacket(prefix, structureName, msgID, msgIDOffset):
     msgIDWithOffset = int(msgIDOffset.replace("0x", ""), 16) + int(msgID.replace("0x", ""), 16)
 
     # Output the packet definition
-    ccdd.writeToFileLn(tlmFile, "\nCfeTelemetryPacket " + prefix + structureName)
-    ccdd.writeToFileLn(tlmFile, "{")
-    ccdd.writeToFileLn(tlmFile, "  applyWhen={FieldInRange{field = applicationId, range = " + extractMessageID("{0:x}".format(msgIDWithOffset)) + "}},")
+    tlmFile.writeLn("\nCfeTelemetryPacket " + prefix + structureName)
+    tlmFile.writeLn("{")
+    tlmFile.writeLn("  applyWhen={FieldInRange{field = applicationId, range = " + extractMessageID("{0:x}".format(msgIDWithOffset)) + "}},")
     outputStructureDefinition(structureName, True, tlmFile)
 
+#******************************************************************************
+# Get the message ID for each structure and, for each structure without a
+# message ID, whether or not the structure is referenced by more than one
+# structure. The results are stored for use by outputStructures() so that these
+# are determined once regardless of the number of endianess outputs
+#
+# @param structureNames
+#            array of all structure table names
+#******************************************************************************
+def getStructureOutputInfo(structureNames):
+    # Step through each structure name
+    for structureName in structureNames:
+        # Get the value of the structure's message ID data field (if present)
+        msgID = dataFields.getTableDataFieldValue(structureName, "Message ID")
+        structureMsgIDs[structureName] = msgID
+
+        # Check if the structure doesn't have a message ID
+        if msgID is None or not msgID:
+            # Store if the structure is referenced by more than one structure
+            sharedStructures[structureName] = ccdd.isStructureShared(structureName)
+
 #******************************************************************************
 # Output the telemetry structure prototype and packet definitions
 #
@@ -390,24 +457,24 @@ def outputStructures(structureNames):
         structureName = structureNames[structIndex]
 
         # Get the value of the structure's message ID data field (if present)
-        msgID = ccdd.getTableDataFieldValue(structureName, "Message ID")
+        msgID = structureMsgIDs[structureName]
 
         # Check if the structure doesn't have a message ID
         if msgID is None or not msgID:
             # Check if the structure is referenced by more than one structure
-            if ccdd.isStructureShared(structureName):
+            if sharedStructures[structureName]:
                 # Output the structure prototype to the combined recs file
-                ccdd.writeToFileLn(combFile, "\nprototype Structure " + structureName)
-                ccdd.writeToFileLn(combFile, "{")
+                combFile.writeLn("\nprototype Structure " + structureName)
+                combFile.writeLn("{")
                 outputStructureDefinition(structureName, False, combFile)
-                ccdd.writeToFileLn(combFile, "\n}")
+                combFile.writeLn("\n}")
             # The structure isn't referenced by multiple structures
             else:
                 # Output the structure prototype to the rec file
-                ccdd.writeToFileLn(tlmFile, "\nprototype Structure " + structureName)
-                ccdd.writeToFileLn(tlmFile, "{")
+                tlmFile.writeLn("\nprototype Structure " + structureName)
+                tlmFile.writeLn("{")
                 outputStructureDefinition(structureName, False, tlmFile)
-                ccdd.writeToFileLn(tlmFile, "\n}")
+                tlmFile.writeLn("\n}")
         # The structure has a message ID
         else:
             # Check if there is more than one flight computer
@@ -416,12 +483,12 @@ def outputStructures(structureNames):
                 for fcIndex in range(numFlightComputers):
                     # Output the telemetry packet definition
                     outputTelemetryPacket(fcNames[fcIndex], structureName, msgID, fcOffset[fcIndex])
-                    ccdd.writeToFileLn(tlmFile, "\n}")
+                    tlmFile.writeLn("\n}")
             # There is a single flight computer
             else:
                 # Output the telemetry packet definition
                 outputTelemetryPacket("", structureName, msgID, "0")
-                ccdd.writeToFileLn(tlmFile, "\n}")
+                tlmFile.writeLn("\n}")
 
 #******************************************************************************
 # Output the commands
@@ -436,127 +503,124 @@ def outputStructures(structureNames):
 #            system name
 #******************************************************************************
 def outputCommands(prefix, msgIDOffset, system):
-    # Step through each row in the command table
-    for row in range(numCommandRows):
-        # Get the system with which he command is associated from the command
-        # table's 'System' data field
-        commandSystem = ccdd.getTableDataFieldValue(ccdd.getCommandTableNameByRow(row), "System")
-
-        # Check if the this command table's system matches the target system
-        if system is None or (commandSystem is not None and system == commandSystem):
-            # Get the command name and code, and the message ID for the command
-            # table
-            commandName = ccdd.getCommandName(row)
-            cmdCode = ccdd.getCommandCode(row)
-            msgID = ccdd.getTableDataFieldValue(ccdd.getCommandTableNameByRow(row), "Message ID")
-            msgIDWithOffset = int(msgIDOffset.replace("0x", ""), 16) + int(msgID.replace("0x", ""), 16)
-
-            # Begin the command definition
-            ccdd.writeToFileLn(cmdFile, "")
-            ccdd.writeToFileLn(cmdFile, "CfeSoftwareCommand " + prefix + commandName)
-            ccdd.writeToFileLn(cmdFile, "{")
-            ccdd.writeToFileLn(cmdFile, "  applicationId {range=" + extractCommandID("{0:x}".format(msgIDWithOffset)) + "}")
-            ccdd.writeToFileLn(cmdFile, "  commandCode {range=" + str(int(cmdCode.replace("0x", ""), 16)) + "}")
-
-            # Process all of the command arguments for this command
-            for argumentNum in range(ccdd.getNumCommandArguments(row)):
-                # Get the command argument's name, data type, and array size
-                name = ccdd.getCommandArgName(argumentNum, row)
-                dataType = ccdd.getCommandArgDataType(argumentNum, row)
-
-                # Get the size in bytes based on the data type
-                sizeInBytes = ccdd.getDataTypeSizeInBytes(dataType);
-
-                # Check if the parameter has an argument
-                if name is not None and name and dataType is not None and dataType:
-                    argumentInfo = ""
-
-                    # Get the single character ITOS encoded form of the data
-                    # type
-                    itosEncode1Char = ccdd.getITOSEncodedDataType(dataType, "SINGLE_CHAR")
-
-                    # Check if the parameter is an integer (signed or unsigned)
-                    if itosEncode1Char == "I" or itosEncode1Char == "U":
-                        # Get the command argument's enumeration value
-                        enumeration = ccdd.getCommandArgEnumeration(argumentNum, row)
-
-                        # Check if this command has an enumeration
-                        if enumeration is not None and enumeration:
-                            # Add the associated enumeration definition
-                            argumentInfo += "enumeration = " + getCommandEnumerationName(row, argumentNum) + ", "
-
-                        # Check that the argument has a valid data type
-                        if sizeInBytes != 0:
-                            # Get the command argument's minimum and maximum
-                            # values
-                            minimumValue = ccdd.getCommandArgMinimum(argumentNum, row)
-                            maximumValue = ccdd.getCommandArgMaximum(argumentNum, row)
-
-                            # Check if a minimum value doesn't exist for this
-                            # argument
-                            if minimumValue is None or not minimumValue:
-                                # Set the minimum value to zero, assuming this
-                                # is an unsigned integer
-                                minimumValue = 0
-
-                                # Check if the argument is a signed integer
-                                if itosEncode1Char == "I":
-                                    # Set the minimum value to the largest
-                                    # negative value for this size integer
-                                    minimumValue = -(2 ** (sizeInBytes * 8)) / 2
-
-                            # Check if a maximum value doesn't exist for this
-                            # argument
-                            if maximumValue is None or not maximumValue:
-                                # Set the maximum value to the largest positive
-                                # value for an unsigned integer
-                                maximumValue = 2 ** (sizeInBytes * 8) - 1
-
-                                # Check if the argument is a signed integer
-                                if itosEncode1Char == "I":
-                                    # Adjust the maximum to the largest size
-                                    # for this size integer
-                                    maximumValue -= maximumValue / 2 + 1
-
-                            # Add the command argument range
-                            argumentInfo += "range=" + str(minimumValue) + ".." + str(maximumValue)
-                    # Check if the parameter is a string
-                    elif itosEncode1Char == "S":
-                        # Get the command argument's array size value
-                        arraySize = ccdd.getCommandArgArraySize(argumentNum, row)
-
-                        # Check if there is no array size provided
-                        if arraySize is None or not arraySize:
-                            # Default to a single character
-                            arraySize = "1"
-                        # The array size exists
-                        else:
-                            # Strip off all but the last array index - this is
-                            # the string's length
-                            arraySize = re.sub(r"/.*, ", "", arraySize + "")
+    # Step through each row in the command tables for the target system
+    for row in commandRows.getRows(system):
+        # Get the command name and code, and the message ID for the command
+        # table
+        commandName = ccdd.getCommandName(row)
+        cmdCode = ccdd.getCommandCode(row)
+        msgID = commandRows.getMessageID(row)
+        msgIDWithOffset = int(msgIDOffset.replace("0x", ""), 16) + int(msgID.replace("0x", ""), 16)
+
+        # Begin the command definition
+        cmdFile.writeLn("")
+        cmdFile.writeLn("CfeSoftwareCommand " + prefix + commandName)
+        cmdFile.writeLn("{")
+        cmdFile.writeLn("  applicationId {range=" + extractCommandID("{0:x}".format(msgIDWithOffset)) + "}")
+        cmdFile.writeLn("  commandCode {range=" + str(int(cmdCode.replace("0x", ""), 16)) + "}")
+
+        # Process all of the command arguments for this command
+        for argumentNum in range(ccdd.getNumCommandArguments(row)):
+            # Get the command argument's name, data type, and array size
+            name = ccdd.getCommandArgName(argumentNum, row)
+            dataType = ccdd.getCommandArgDataType(argumentNum, row)
+
+            # Get the size in bytes based on the data type
+            sizeInBytes = encodings.getDataTypeSizeInBytes(dataType);
+
+            # Check if the parameter has an argument
+            if name is not None and name and dataType is not None and dataType:
+                argumentInfo = ""
+
+                # Get the single character ITOS encoded form of the data
+                # type
+                itosEncode1Char = encodings.getITOSEncodedDataType(dataType, "SINGLE_CHAR")
+
+                # Check if the parameter is an integer (signed or unsigned)
+                if itosEncode1Char == "I" or itosEncode1Char == "U":
+                    # Get the command argument's enumeration value
+                    enumeration = ccdd.getCommandArgEnumeration(argumentNum, row)
+
+                    # Check if this command has an enumeration
+                    if enumeration is not None and enumeration:
+                        # Add the associated enumeration definition
+                        argumentInfo += "enumeration = " + getCommandEnumerationName(row, argumentNum) + ", "
+
+                    # Check that the argument has a valid data type
+                    if sizeInBytes != 0:
+                        # Get the command argument's minimum and maximum
+                        # values
+                        minimumValue = ccdd.getCommandArgMinimum(argumentNum, row)
+                        maximumValue = ccdd.getCommandArgMaximum(argumentNum, row)
+
+                        # Check if a minimum value doesn't exist for this
+                        # argument
+                        if minimumValue is None or not minimumValue:
+                            # Set the minimum value to zero, assuming this
+                            # is an unsigned integer
+                            minimumValue = 0
+
+                            # Check if the argument is a signed integer
+                            if itosEncode1Char == "I":
+                                # Set the minimum value to the largest
+                                # negative value for this size integer
+                                minimumValue = -(2 ** (sizeInBytes * 8)) // 2
+
+                        # Check if a maximum value doesn't exist for this
+                        # argument
+                        if maximumValue is None or not maximumValue:
+                            # Set the maximum value to the largest positive
+                            # value for an unsigned integer
+                            maximumValue = 2 ** (sizeInBytes * 8) - 1
+
+                            # Check if the argument is a signed integer
+                            if itosEncode1Char == "I":
+                                # Adjust the maximum to the largest size
+                                # for this size integer
+                                maximumValue -= maximumValue // 2 + 1
+
+                        # Add the command argument range
+                        argumentInfo += "range=" + str(minimumValue) + ".." + str(maximumValue)
+                # Check if the parameter is a string
+                elif itosEncode1Char == "S":
+                    # Get the command argument's array size value
+                    arraySize = ccdd.getCommandArgArraySize(argumentNum, row)
+
+                    # Check if there is no array size provided
+                    if arraySize is None or not arraySize:
+                        # Default to a single character
+                        arraySize = "1"
+                    # The array size exists
+                    else:
+                        # Strip off all but the last array index - this is
+                        # the string's length
+                        arraySize = re.sub(r"/.*, ", "", arraySize + "")
 
-                        # Set the 'lengthInCharacters' argument to capture the
-                        # string's length
-                        sizeInBytes = 1
-                        argumentInfo = "lengthInCharacters = " + arraySize
+                    # Set the 'lengthInCharacters' argument to capture the
+                    # string's length
+                    sizeInBytes = 1
+                    argumentInfo = "lengthInCharacters = " + arraySize
 
-                    # Output the command argument to the file
-                    ccdd.writeToFileLn(cmdFile, "  " + itosEncode1Char + str(sizeInBytes) + " " + name + " {" + argumentInfo + "}")
+                # Output the command argument to the file
+                cmdFile.writeLn("  " + itosEncode1Char + str(sizeInBytes) + " " + name + " {" + argumentInfo + "}")
 
-            ccdd.writeToFileLn(cmdFile, "}")
+        cmdFile.writeLn("}")
 
 #******************************************************************************
 # Output a single mnemonic definition
 #
+# @param file
+#            file to which to write the mnemonic definition
+#
 # @param row
 #            row index in the structure data table
 #******************************************************************************
-def outputMnemonicDefinition(row):
+def outputMnemonicDefinition(file, row):
     # Get the variable data type
-    dataType = ccdd.getStructureDataType(row)
+    dataType = structureData.getDataType(row)
 
      # Get the single character ITOS encoded form of the data type
-    itosEncode = ccdd.getITOSEncodedDataType(dataType, "SINGLE_CHAR")
+    itosEncode = encodings.getITOSEncodedDataType(dataType, "SINGLE_CHAR")
 
     # Check if this data type is a recognized base type, and not a structure
     if itosEncode is not None and itosEncode != dataType:
@@ -566,8 +630,8 @@ def outputMnemonicDefinition(row):
             itosEncode = "U"
 
         # Get the variable name and array size
-        variableName = ccdd.getStructureVariableName(row)
-        arraySize = ccdd.getStructureArraySize(row)
+        variableName = structureData.getVariableName(row)
+        arraySize = structureData.getArraySize(row)
 
         # Check if the variable is not an array definition
         isVar = isVariable(variableName, arraySize)
@@ -587,78 +651,80 @@ def outputMnemonicDefinition(row):
         # Only output non-array variables or array members (i.e., skip array
         # definitions)
         if isOutputMnemonic:
-            structurePath = ccdd.getFullVariableName(row, ".")
+            structurePath = structureData.getFullVariableName(row, ".")
 
             # Get the full variable name for this variable, which includes all
             # of the variable names in its structure path
-            fullVariableName = ccdd.getFullVariableName(row)
-
-            enumeration = None
-
-            # Get the enumeration(s)
-            enumerations = ccdd.getStructureEnumerations(row)
+            fullVariableName = structureData.getFullVariableName(row)
 
-            # Check if any enumeration exists
-            if enumerations is not None and len(enumerations) != 0:
-                # Store the first enumeration
-                enumeration = enumerations[0]
+            # Get the first enumeration (if extant)
+            enumeration = structureData.getEnumeration(row)
 
             # Get the polynomial conversion and limit sets columns (if extant)
-            polynomial = ccdd.getStructureTableData("polynomial coefficients", row)
-            limitSet = ccdd.getStructureTableData("limit sets", row)
+            polynomial = structureData.getTableData("polynomial coefficients", row)
+            limitSet = structureData.getTableData("limit sets", row)
 
-            # Step through each flight computer
-            for fcIndex in range(numFlightComputers):
-                # Output the mnemonic
-                ccdd.writeToFile(tlmFile, itosEncode + " " + fcNames[fcIndex] + fullVariableName + " {sourceFields = {" + fcNames[fcIndex] + structurePath + "}")
+            isConversion = False
+            isMultiple = False
 
-                isConversion = False
+            # Check if the parameter includes an enumeration
+            if enumeration is not None and enumeration:
+                isConversion = True
                 isMultiple = False
 
-                # Check if the parameter includes an enumeration
-                if enumeration is not None and enumeration:
-                    isConversion = True
-                    isMultiple = False
-
-                # Check if this parameter includes a discrete or polynomial
+            # Check if this parameter includes a discrete or polynomial
+            # conversion
+            if polynomial is not None and polynomial:
+                isConversion = True
+                isMultiple = conversions.getPolynomialSets(polynomial).getNumSets() > 1
+
+            # Build the mnemonic definition once, using a placeholder for the
+            # flight computer name
+            fcName = output.PARAMETER_PLACEHOLDER
+            mnemonic = itosEncode + " " + fcName + fullVariableName + " {sourceFields = {" + fcName + structurePath + "}"
+
+            # Check if there is an enumeration or polynomial conversion
+            if isConversion:
+                # Check if there are conversions specific to each flight
+                # computer
+                if isMultiple:
+                    # Add the flight computer-specific conversion reference
+                    mnemonic += " conversion = " + fcName + fullVariableName + "_CONVERSION"
+                # Check if the conversion is a (possibly shared) discrete
                 # conversion
-                if polynomial is not None and polynomial:
-                    isConversion = True
-                    isMultiple = len(polynomial.split("\\;")) > 1
-
-                # Check if there is an enumeration or polynomial conversion
-                if isConversion:
-                    # Check if there are conversions specific to each flight
-                    # computer
-                    if isMultiple:
-                        # Output the flight computer-specific conversion
-                        # reference
-                        ccdd.writeToFile(tlmFile, " conversion = " + fcNames[fcIndex] + fullVariableName + "_CONVERSION")
-                    # There is only a single conversion
-                    else:
-                        # Output the conversion reference
-                        ccdd.writeToFile(tlmFile, " conversion = " + fullVariableName + "_CONVERSION")
+                elif polynomial is None or not polynomial:
+                    # Add the discrete conversion reference
+                    mnemonic += " conversion = " + conversionNames.get(row, fullVariableName) + "_CONVERSION"
+                # There is only a single conversion
+                else:
+                    # Add the conversion reference
+                    mnemonic += " conversion = " + fullVariableName + "_CONVERSION"
 
-                # Check if this parameter includes a limit or limit set
-                if limitSet is not None and limitSet:
-                    # Output the limit reference
-                    ccdd.writeToFile(tlmFile, " limits = " + fullVariableName + "_LIMIT")
+            # Check if this parameter includes a limit or limit set
+            if limitSet is not None and limitSet:
+                # Add the (possibly shared) limit reference
+                mnemonic += " limits = " + limitNames.get(row, fullVariableName) + "_LIMIT"
 
-                ccdd.writeToFileLn(tlmFile, "}")
+            mnemonic += "}"
+
+            # Step through each flight computer
+            for fcIndex in range(numFlightComputers):
+                # Output the mnemonic for the flight computer
+                file.writeLn(mnemonic.replace(fcName, fcNames[fcIndex]))
 
 #******************************************************************************
 # Output all of the mnemonic definitions
 #******************************************************************************
 def outputMnemonicDefinitions():
-    ccdd.writeToFileLn(tlmFile, "")
-    ccdd.writeToFileLn(tlmFile, "/* Mnemonic Definitions */")
+    tlmFile.writeLn("")
+    tlmFile.writeLn("/* Mnemonic Definitions */")
 
     # Step through each row in the table
     for row in range(numStructRows):
         # Check if the variable is not telemetered
         if not isTelemetry(row):
             # Output the mnemonic definition for this row in the data table
-            outputMnemonicDefinition(row)
+            outputMnemonicDefinition(tlmFile, row)
 
 #******************************************************************************
 # Output a single discrete conversion (enumeration)
@@ -673,83 +739,93 @@ def outputMnemonicDefinitions():
 #            conversion name
 #******************************************************************************
 def outputDiscreteConversion(file, discreteConversion, conversionName):
-    # Discrete conversion array indices
-    VALUE = 0
-    DISP_NAME = 1
-    TEXT_COLOR = 2
-    BACK_COLOR = 3
-
-    # Separate the enumerated parameters into an array. The expected format for
-    # the enumerated values is:
+    # Get the parsed enumerated parameters. The expected format for the
+    # enumerated values is:
     # <Discrete Value> | <Display Name> | <Text Color> |
     # <Background Color> [, repeat for each discrete value...]
-    enumerations = ccdd.getArrayFromString(discreteConversion, "|", ",")
+    enumeration = conversions.getEnumeration(discreteConversion)
 
     # Check if the variable has enumerations and the required number of
     # parameters is provided
-    if enumerations is not None and len(enumerations[0]) > 3:
+    if enumeration.getNumParameters() > 3:
         # Output the discrete conversion header
-        ccdd.writeToFileLn(file, "DiscreteConversion " + ccdd.getFullVariableName(conversionName, "_") + "_CONVERSION")
-        ccdd.writeToFileLn(file, "{")
+        file.writeLn("DiscreteConversion " + ccdd.getFullVariableName(conversionName, "_") + "_CONVERSION")
+        file.writeLn("{")
 
         # Step through each enumerated value
-        for discrete in range(len(enumerations)):
+        for discrete in range(enumeration.getNumValues()):
             # Output the discrete conversion
-            ccdd.writeToFile(file, "  Dsc " + enumerations[discrete][DISP_NAME] + " {range = " + enumerations[discrete][VALUE])
+            file.write("  Dsc " + enumeration.getDisplayName(discrete) + " {range = " + enumeration.getValue(discrete))
 
             # Check if a background color is supplied
-            if enumerations[discrete][BACK_COLOR] is not None and enumerations[discrete][BACK_COLOR]:
+            if enumeration.getBackgroundColor(discrete) is not None and enumeration.getBackgroundColor(discrete):
                 # Output the background color
-                ccdd.writeToFile(file, ", bgColor = " + enumerations[discrete][BACK_COLOR])
+                file.write(", bgColor = " + enumeration.getBackgroundColor(discrete))
 
             # Check if a foreground (text) color is supplied
-            if enumerations[discrete][TEXT_COLOR] is not None and enumerations[discrete][TEXT_COLOR]:
+            if enumeration.getTextColor(discrete) is not None and enumeration.getTextColor(discrete):
                 # Output the foreground color
-                ccdd.writeToFile(file, ", fgColor = " + enumerations[discrete][TEXT_COLOR])
+                file.write(", fgColor = " + enumeration.getTextColor(discrete))
 
-            ccdd.writeToFileLn(file, "}")
+            file.writeLn("}")
 
-        ccdd.writeToFileLn(file, "}")
+        file.writeLn("}")
 
 #******************************************************************************
-# Output all of the telemetry discrete conversions
+# Output the telemetry discrete conversion for a single structure table row
+#
+# @param file
+#            file to which to write the discrete conversion
+#
+# @param row
+#            row index in the structure data table
+#
+# @param isFirst
+#            true if no discrete conversion has been output
+#
+# @return true if no discrete conversion has been output
 #******************************************************************************
-def outputTelemetryDiscreteConversions():
-    isFirst = True
-
-    # Step through each row in the structure table
-    for row in range(numStructRows):
-        discreteConversion = None
+def outputTelemetryDiscreteConversion(file, row, isFirst):
+    # Get the first enumeration (if extant)
+    discreteConversion = structureData.getEnumeration(row)
+
+    # Check if the parameter has a discrete conversion
+    if discreteConversion is not None and discreteConversion:
+        # Check if this is the first discrete conversion
+        if isFirst:
+            # Write the discrete conversion header to the file
+            file.writeLn("")
+            file.writeLn("/* Discrete Conversions */")
+            isFirst = False
 
-        # Get the enumeration(s)
-        enumerations = ccdd.getStructureEnumerations(row)
+        # Get the variable name and array size
+        variableName = structureData.getVariableName(row)
+        arraySize = structureData.getArraySize(row)
 
-        # Check if any enumeration exists
-        if len(enumerations) != 0:
-            # Store the first enumeration
-            discreteConversion = enumerations[0]
+        # Only output non-array variables or array members (i.e., skip array
+        # definitions)
+        if isVariable(variableName, arraySize):
+            # Get the full name and path for the variable on this row
+            fullVariableName = structureData.getFullVariableName(row)
 
-        # Check if the parameter has a discrete conversion
-        if discreteConversion is not None and discreteConversion:
-            # Check if this is the first discrete conversion
-            if isFirst:
-                # Write the discrete conversion header to the file
-                ccdd.writeToFileLn(tlmFile, "")
-                ccdd.writeToFileLn(tlmFile, "/* Discrete Conversions */")
-                isFirst = False
+            # Check if the discrete conversion isn't shared with a preceding
+            # variable
+            if conversionNames.get(row, fullVariableName) == fullVariableName:
+                # Output the discrete conversion for this row in the data table
+                outputDiscreteConversion(file, discreteConversion, fullVariableName)
 
-            # Get the variable name and array size
-            variableName = ccdd.getStructureVariableName(row)
-            arraySize = ccdd.getStructureArraySize(row)
+    return isFirst
 
-            # Only output non-array variables or array members (i.e., skip
-            # array definitions)
-            if isVariable(variableName, arraySize):
-                # Get the full name and path for the variable on this row
-                fullVariableName = ccdd.getFullVariableName(row)
+#******************************************************************************
+# Output all of the telemetry discrete conversions
+#******************************************************************************
+def outputTelemetryDiscreteConversions():
+    isFirst = True
 
-                # Output the discrete conversion for this row in the data table
-                outputDiscreteConversion(tlmFile, discreteConversion, fullVariableName)
+    # Step through each row in the structure table
+    for row in range(numStructRows):
+        # Output the discrete conversion for this row in the data table
+        isFirst = outputTelemetryDiscreteConversion(tlmFile, row, isFirst)
 
 #******************************************************************************
 # Output all of the command discrete conversions
@@ -770,8 +846,8 @@ def outputCommandDiscreteConversions():
                 # Check if this is the first discrete conversion
                 if argumentNum == 0:
                     # Write the discrete conversions header to the file
-                    ccdd.writeToFileLn(cmdFile, "")
-                    ccdd.writeToFileLn(cmdFile, "/* Discrete Conversions */")
+                    cmdFile.writeLn("")
+                    cmdFile.writeLn("/* Discrete Conversions */")
 
                 # Build the name for the conversion using the command and
                 # argument names
@@ -790,29 +866,25 @@ def outputCommandDiscreteConversions():
 #            conversion name
 #******************************************************************************
 def outputCommandEnumeration(enumeration, enumerationName):
-    # Enumeration array indices
-    VALUE = 0
-    DISP_NAME = 1
-
-    # Separate the enumerated parameters into an array. The expected
-    # format for the enumerated values is:
+    # Get the parsed enumerated parameters. The expected format for the
+    # enumerated values is:
     # <Discrete Value> | <Display Name> | <Text Color> |
     # <Background Color> ... [, repeat for each discrete value...]
-    enumerations = ccdd.getArrayFromString(enumeration, "|", ",")
+    enumerations = conversions.getEnumeration(enumeration)
 
     # Check if the variable has enumerations and the required number of
     # parameters is provided
-    if enumerations is not None and len(enumerations[0]) > 1:
+    if enumerations.getNumParameters() > 1:
         # Output the enumeration header
-        ccdd.writeToFileLn(cmdFile, "Enumeration " + enumerationName)
-        ccdd.writeToFileLn(cmdFile, "{")
+        cmdFile.writeLn("Enumeration " + enumerationName)
+        cmdFile.writeLn("{")
 
         # Step through each enumerated value
-        for discrete in range(len(enumerations)):
+        for discrete in range(enumerations.getNumValues()):
             # Output the enumerated value
-            ccdd.writeToFileLn(cmdFile, "  EnumerationValue " + enumerations[discrete][DISP_NAME] + " {value = " + enumerations[discrete][VALUE] + "}")
+            cmdFile.writeLn("  EnumerationValue " + enumerations.getDisplayName(discrete) + " {value = " + enumerations.getValue(discrete) + "}")
 
-        ccdd.writeToFileLn(cmdFile, "}")
+        cmdFile.writeLn("}")
 
 #******************************************************************************
 # Output all of the command enumerations
@@ -821,120 +893,121 @@ def outputCommandEnumeration(enumeration, enumerationName):
 #            system name
 #******************************************************************************
 def outputCommandEnumerations(systemName):
-    # Step through each row in the command table
-    for row in range(numCommandRows):
-        # Get the system with which he command is associated from the command
-        # table's 'System' data field
-        commandSystem = ccdd.getTableDataFieldValue(ccdd.getCommandTableNameByRow(row), "System")
-
-        # Check if the this command table's system matches the target system
-        if systemName is None or (commandSystem is not None and systemName == commandSystem):
-            # Step through each of the commands arguments
-            for argumentNum in range(ccdd.getNumCommandArguments(row)):
-                # Get the command argument's enumeration value
-                enumeration = ccdd.getCommandArgEnumeration(argumentNum, row)
-
-                # Check if this command has an enumeration
-                if enumeration is not None and enumeration:
-                    # Check if this is the first enumeration for the command
-                    if argumentNum == 0:
-                        # Write the enumerations header to the file
-                        ccdd.writeToFileLn(cmdFile, "")
-                        ccdd.writeToFileLn(cmdFile, "/* Enumerations */")
-
-                    # Output the enumeration for this row in the data table
-                    outputCommandEnumeration(enumeration, getCommandEnumerationName(row, argumentNum))
+    # Step through each row in the command tables for the target system
+    for row in commandRows.getRows(systemName):
+        # Step through each of the commands arguments
+        for argumentNum in range(ccdd.getNumCommandArguments(row)):
+            # Get the command argument's enumeration value
+            enumeration = ccdd.getCommandArgEnumeration(argumentNum, row)
+
+            # Check if this command has an enumeration
+            if enumeration is not None and enumeration:
+                # Check if this is the first enumeration for the command
+                if argumentNum == 0:
+                    # Write the enumerations header to the file
+                    cmdFile.writeLn("")
+                    cmdFile.writeLn("/* Enumerations */")
+
+                # Output the enumeration for this row in the data table
+                outputCommandEnumeration(enumeration, getCommandEnumerationName(row, argumentNum))
 
 #******************************************************************************
-# Output a single limit or limit set definition
+# Output the limit or limit set definition for a single structure table row
+#
+# @param file
+#            file to which to write the limit definition
 #
 # @param row
 #            row index in the structure data table
 #
-# @param limitSets
-#            limit set(s)
-#
 # @param isFirst
-#            true if this is the first limit definition
+#            true if no limit definition has been output
 #
-# @return true if a limit definition is output
+# @return true if no limit definition has been output
 #******************************************************************************
-def outputLimitDefinition(row, limitSets, isFirst):
+def outputLimitDefinition(file, row, isFirst):
+    # Get the limits for this row
+    limitSets = structureData.getTableData("limit sets", row)
+
     # Get the variable name and array size
-    variableName = ccdd.getStructureVariableName(row)
-    arraySize = ccdd.getStructureArraySize(row)
+    variableName = structureData.getVariableName(row)
+    arraySize = structureData.getArraySize(row)
 
-    # Only output non-array variables or array members (i.e., skip array
+    # Only output limits that aren't shared with a preceding variable, and
+    # only for non-array variables or array members (i.e., skip array
     # definitions)
-    if isVariable(variableName, arraySize):
-        # Separate the limits into an array
-        limits = ccdd.getArrayFromString(limitSets, "|", ",")
+    if (limitSets is not None and limitSets
+        and (row not in limitNames or limitNames[row] == structureData.getFullVariableName(row))
+        and isVariable(variableName, arraySize)):
+        # Get the parsed limits
+        limits = conversions.getLimitSet(limitSets)
 
         # Check if the variable has limits
-        if limits is not None:
+        if limits.isDefined():
             # Check if this is the first limit definition
             if isFirst:
                 # Write the limit definitions header to the file
-                ccdd.writeToFileLn(tlmFile, "")
-                ccdd.writeToFile(tlmFile, "/* Limit Definitions */")
+                file.writeLn("")
+                file.write("/* Limit Definitions */")
                 isFirst = False
 
             # Check if a single limit is specified
-            if len(limits) == 1:
+            if limits.isSingleLimit():
                 # Output the limit header
-                ccdd.writeToFileLn(tlmFile, "")
-                ccdd.writeToFileLn(tlmFile, "Limit " + ccdd.getFullVariableName(row) + "_LIMIT")
-                ccdd.writeToFileLn(tlmFile, "{")
+                file.writeLn("")
+                file.writeLn("Limit " + structureData.getFullVariableName(row) + "_LIMIT")
+                file.writeLn("{")
 
                 # Step through each limit definition
-                for index in range(len(limits[0])):
+                for index in range(len(limits.getLimits(0))):
                     # Check if this is is the red-low, yellow-low, yellow-high,
                     # or red-high limit
-                    if index < 4 and limits[0][index]:
+                    if index < 4 and limits.getLimits(0)[index]:
                         # Output the limit
-                        ccdd.writeToFileLn(tlmFile, "  " + ccdd.getITOSLimitName(index) + " = " + limits[0][index])
+                        file.writeLn("  " + ccdd.getITOSLimitName(index) + " = " + limits.getLimits(0)[index])
 
-                ccdd.writeToFileLn(tlmFile, "}")
+                file.writeLn("}")
             # Multiple limits are specified
-            elif len(limits) > 1:
+            elif limits.isLimitSet():
                 # Output the limit set header
-                ccdd.writeToFileLn(tlmFile, "")
-                ccdd.writeToFileLn(tlmFile, "LimitSet " + ccdd.getFullVariableName(row) + "_LIMIT")
-                ccdd.writeToFileLn(tlmFile, "{")
-                ccdd.writeToFileLn(tlmFile, "  contextMnemonic = " + limits[0][0])
-                ccdd.writeToFileLn(tlmFile, "")
+                file.writeLn("")
+                file.writeLn("LimitSet " + structureData.getFullVariableName(row) + "_LIMIT")
+                file.writeLn("{")
+                file.writeLn("  contextMnemonic = " + limits.getContextMnemonic())
+                file.writeLn("")
 
                 # Step through each limit set
-                for set in range(1, len(limits)):
+                for set in range(1, limits.getNumLimits()):
                     # Check if this is not the first limit value
                     if set != 1:
                         # Output a line feed
-                        ccdd.writeToFileLn(tlmFile, "")
+                        file.writeLn("")
 
                     # Output the limit header
-                    ccdd.writeToFileLn(tlmFile, "  Limit limit" + str(set))
-                    ccdd.writeToFileLn(tlmFile, "  {")
+                    file.writeLn("  Limit limit" + str(set))
+                    file.writeLn("  {")
 
                     limitIndex = 0
+                    limitValues = limits.getLimits(set)
 
                     # Step through each limit definition
-                    for index in range(len(limits[set])):
+                    for index in range(len(limitValues)):
                         # Check if the limit value exists
-                        if limits[set][index]:
+                        if limitValues[index]:
                             # Check if this is the context range
-                            if ".." in limits[set][index]:
+                            if ".." in limitValues[index]:
                                 # Output the context range
-                                ccdd.writeToFileLn(tlmFile, "    contextRange = " + limits[set][index])
+                                file.writeLn("    contextRange = " + limitValues[index])
                             # Not the context range; must be a limit value
                             else:
                                 # Output the limit value
-                                ccdd.writeToFileLn(tlmFile, "    " + ccdd.getITOSLimitName(limitIndex) + " = " + limits[set][index])
+                                file.writeLn("    " + ccdd.getITOSLimitName(limitIndex) + " = " + limitValues[index])
 
                                 limitIndex = limitIndex + 1
 
-                    ccdd.writeToFileLn(tlmFile, "  }")
+                    file.writeLn("  }")
 
-                ccdd.writeToFileLn(tlmFile, "}")
+                file.writeLn("}")
 
     return isFirst
 
@@ -946,17 +1019,15 @@ def outputLimitDefinitions():
 
     # Step through each row in the table
     for row in range(numStructRows):
-        # Get the limits for this row
-        limitSets = ccdd.getStructureTableData("limit sets", row)
-
-        # Check if the parameter has limits
-        if limitSets is not None and limitSets:
-            # Output the limit definition for this row in the data table
-            isFirst = outputLimitDefinition(row, limitSets, isFirst)
+        # Output the limit definition for this row in the data table
+        isFirst = outputLimitDefinition(tlmFile, row, isFirst)
 
 #******************************************************************************
 # Output a single polynomial conversion
 #
+# @param file
+#            file to which to write the polynomial conversion
+#
 # @param prefix
 #            conversion name prefix
 #
@@ -966,46 +1037,65 @@ def outputLimitDefinitions():
 # @param coeffs
 #            polynomial coefficient array
 #******************************************************************************
-def outputPolynomial(prefix, variableName, coeffs):
+def outputPolynomial(file, prefix, variableName, coeffs):
     # Output the polynomial conversion header
-    ccdd.writeToFileLn(tlmFile, "")
-    ccdd.writeToFile(tlmFile, "PolynomialConversion " + prefix + variableName + "_CONVERSION")
-    ccdd.writeToFileLn(tlmFile, "{")
-    ccdd.writeToFile(tlmFile, "  coefficients = {")
+    file.writeLn("")
+    file.write("PolynomialConversion " + prefix + variableName + "_CONVERSION")
+    file.writeLn("{")
+    file.write("  coefficients = {")
 
     # Output the first coefficient (with no preceding comma)
-    ccdd.writeToFile(tlmFile, coeffs[0])
+    file.write(coeffs[0])
 
     # Step through each remaining coefficient value
     for index in range(1, len(coeffs) - 1):
         # Output the coefficient, preceded by a comma
-        ccdd.writeToFile(tlmFile, ", " + coeffs[index])
+        file.write(", " + coeffs[index])
 
-    ccdd.writeToFileLn(tlmFile, "}")
-    ccdd.writeToFileLn(tlmFile, "}")
+    file.writeLn("}")
+    file.writeLn("}")
 
 #******************************************************************************
-# Output a single polynomial conversion
+# Output the polynomial conversion(s) for a single structure table row
+#
+# @param file
+#            file to which to write the polynomial conversion(s)
 #
 # @param row
 #            row index in the structure data table
 #
-# @param polynomialCoefficients
-#            one or more polynomial coefficient sets from the data table
+# @param isFirst
+#            true if no polynomial conversion has been output
+#
+# @return true if no polynomial conversion has been output
 #******************************************************************************
-def outputPolynomialConversion(row, polynomialCoefficients):
+def outputPolynomialConversion(file, row, isFirst):
+    # Get the polynomial coefficients for this row
+    polynomialCoefficients = structureData.getTableData("polynomial coefficients", row)
+
+    # Check if the parameter has no polynomial coefficients
+    if polynomialCoefficients is None or not polynomialCoefficients:
+        return isFirst
+
+    # Check if this is the first polynomial conversion
+    if isFirst:
+        # Write the polynomial conversion header to the file
+        file.writeLn("")
+        file.writeLn("/* Polynomial Conversions  -- a list of constants  {a0,a1,a2,,,an}    ,  where  y= a0 + a1*x + a2*x^2 + ... an*x^n */")
+        isFirst = False
+
     # Get the variable name and array size
-    variableName = ccdd.getStructureVariableName(row)
-    arraySize = ccdd.getStructureArraySize(row)
+    variableName = structureData.getVariableName(row)
+    arraySize = structureData.getArraySize(row)
 
     # Only output non-array variables or array members (i.e., skip array
     # definitions)
     if isVariable(variableName, arraySize):
-        # Separate the sets of the coefficients (if there is more than one)
-        polySets = polynomialCoefficients.split("\\;")
+        # Get the parsed sets of the coefficients (if there is more than one)
+        polySets = conversions.getPolynomialSets(polynomialCoefficients)
 
         # Get the number of coefficient sets
-        numPolySets = len(polySets)
+        numPolySets = polySets.getNumSets()
 
         # Check if the number of flight computers is less than the number of
         # sets detected
@@ -1023,19 +1113,19 @@ def outputPolynomialConversion(row, polynomialCoefficients):
                 # Set the prefix to the flight computer name
                 prefix = fcNames[polyIndex]
 
-            # Separate the polynomial coefficients into an array
-            coeffs = ccdd.getArrayFromString(polySets[polyIndex], "|")
+            # Get the polynomial coefficients array
+            coeffs = polySets.getCoefficients(polyIndex)
 
             # Output the polynomial conversion definition
-            outputPolynomial(prefix, ccdd.getFullVariableName(row), coeffs)
+            outputPolynomial(file, prefix, structureData.getFullVariableName(row), coeffs)
 
         # Check if there is more than one set
         if numPolySets > 1:
             # Get the index of last valid set of coefficients
             lastPolyindex = (polyIndex - 1)
 
-            # Separate the polynomial coefficients into an array
-            coeffs = ccdd.getArrayFromString(polySets[lastPolyindex], "|")
+            # Get the polynomial coefficients array
+            coeffs = polySets.getCoefficients(lastPolyindex)
 
             # Step through any remaining flight computers that don't have a
             # polynomial coefficient set
@@ -1045,7 +1135,9 @@ def outputPolynomialConversion(row, polynomialCoefficients):
 
                 # Output the polynomial conversion definition using the
                 # coefficients from the last defined set
-                outputPolynomial(prefix, ccdd.getFullVariableName(row), coeffs)
+                outputPolynomial(file, prefix, structureData.getFullVariableName(row), coeffs)
+
+    return isFirst
 
 #******************************************************************************
 # Output all of the polynomial conversions
@@ -1055,25 +1147,70 @@ def outputPolynomialConversions():
 
     # Step through each row in the table
     for row in range(numStructRows):
-        # Get the polynomial coefficients for this row
-        polynomialCoefficients = ccdd.getStructureTableData("polynomial coefficients", row)
+        # Output the polynomial conversion(s) for this row in the data table
+        isFirst = outputPolynomialConversion(tlmFile, row, isFirst)
 
-        # Check if the parameter has polynomial coefficients
-        if polynomialCoefficients is not None and polynomialCoefficients:
-            # Check if this is the first polynomial conversion
-            if isFirst:
-                # Write the polynomial conversion header to the file
-                ccdd.writeToFileLn(tlmFile, "")
-                ccdd.writeToFileLn(tlmFile, "/* Polynomial Conversions  -- a list of constants  {a0,a1,a2,,,an}    ,  where  y= a0 + a1*x + a2*x^2 + ... an*x^n */")
-                isFirst = False
-
-            # Output the polynomial conversion for this row in the data table
-            outputPolynomialConversion(row, polynomialCoefficients)
+#******************************************************************************
+# Output the telemetry discrete conversions, limit definitions, polynomial
+# conversions, and mnemonic definitions using a single pass through the
+# structure table rows. The discrete conversions are written directly to the
+# telemetry output file(s); each of the other sections is collected in a spill
+# buffer, which keeps a bounded amount of the text in memory, and the sections
+# are appended to the file(s), in order, once every row is processed
+#******************************************************************************
+def outputTelemetryDefinitionsInOnePass():
+    limitFile = output.SpillBuffer()
+    polynomialFile = output.SpillBuffer()
+    mnemonicFile = output.SpillBuffer()
+    isFirstDiscrete = True
+    isFirstLimit = True
+    isFirstPolynomial = True
+
+    try:
+        mnemonicFile.writeLn("")
+        mnemonicFile.writeLn("/* Mnemonic Definitions */")
+
+        # Step through each row in the structure table
+        for row in range(numStructRows):
+            # Output the discrete conversion, limit definition, and polynomial
+            # conversion(s) for this row in the data table
+            isFirstDiscrete = outputTelemetryDiscreteConversion(tlmFile, row, isFirstDiscrete)
+            isFirstLimit = outputLimitDefinition(limitFile, row, isFirstLimit)
+            isFirstPolynomial = outputPolynomialConversion(polynomialFile, row, isFirstPolynomial)
+
+            # Check if the variable is not telemetered
+            if not isTelemetry(row):
+                # Output the mnemonic definition for this row in the data table
+                outputMnemonicDefinition(mnemonicFile, row)
+
+        # Append the sections to the telemetry output file(s)
+        for section in [limitFile, polynomialFile, mnemonicFile]:
+            section.copyTo(tlmFile)
+    finally:
+        # Discard the sections' buffered text
+        for section in [limitFile, polynomialFile, mnemonicFile]:
+            section.close()
 #* End functions **************************************************************
 
 #* Main ***********************************************************************
 
-newRowOrder = []
+# Radio button selection for outputting more than one endianess
+MULTIPLE_BYTE_ORDERS = "Multiple"
+
+# Output file name extension for each endianess selection
+ENDIAN_EXTENSIONS = { "Big": "BE",
+                      "Big (swap)": "BE",
+                      "Little": "LE",
+                      "Little (swap)": "LE" }
+
+endianExtns = []
+structureRowIndices = []
+structureRows = None
+commandRows = None
+structureMsgIDs = {}
+sharedStructures = {}
+conversionNames = {}
+limitNames = {}
 fcNames = []
 fcOffset = []
 numFlightComputers = 0
@@ -1082,212 +1219,296 @@ numFlightComputers = 0
 numStructRows = ccdd.getStructureTableNumRows()
 numCommandRows = ccdd.getCommandTableNumRows()
 
-# Check if no structure or command data is supplied
-if numStructRows == 0 and numCommandRows == 0:
-    showErrorDialog("No structure or command data supplied to script " + ccdd.getScriptName())
-# Structure and/or command data is supplied
-else:
-    endianess = ""
-    endianExtn = ""
-    tmpVal = 0
-
-    # Get the value of the data field specifying the message ID skip value
-    msgIDSkip = ccdd.getGroupDataFieldValue("globals", "MID_delta")
-
-    # Check if the data field exists or is empty
-    if msgIDSkip is None or not msgIDSkip:
-        # Use the default skip value
-        msgIDSkip = "0x600"
-
-    # Get the value of the data field specifying the flight computer offset
-    # value
-    fcOffsetVal = ccdd.getGroupDataFieldValue("globals", "FC_Offset")
-
-    # Check if the data field exists or is empty
-    if fcOffsetVal is None or not fcOffsetVal:
-        # Use the default offset value
-        fcOffset.append("0x0000")
-
-    # Get the value of the data field specifying the flight computer base value
-    fcBase = ccdd.getGroupDataFieldValue("globals", "prefix")
-
-    # Check if the data field exists or is empty
-    if fcBase is None or not fcBase:
-        # Use the default base value
-        fcBase = "FC"
-
-    # Get the value of the data field specifying the number of flight computers
-    numFC = ccdd.getGroupDataFieldValue("globals", "NumComputers")
-
-    # Check if the data field exists, is empty, or isn't an integer value
-    if numFC is None or not re.match("[0-9]+", numFC):
-        # Use the default number of flight computers (based on the number of
-        # offset values detected)
-        numFlightComputers = len(fcOffset)
-    # The value is an integer
-    else:
-        # Store the number of flight computers
-        numFlightComputers = int(numFC);
-
-    # Check if there is more than one flight computer
-    if numFlightComputers > 1:
-        # Step through each flight computer
-        for fcIndex in range(numFlightComputers):
-            # Store the flight computer name prefix and offset value
-            fcNames.append(fcBase + str(fcIndex + 1) + "_")
-            fcOffset.append(fcOffsetVal)
-
-            # Calculate the next offset based on the current offset and the ID
-            # skip values
-            nextMsgID = int(fcOffsetVal.replace("0x", ""), 16) + int(msgIDSkip.replace("0x", ""), 16)
-            fcOffsetVal = "0x" + "{0:03x}".format(nextMsgID)
-    # Only one flight computer
-    else:
-        # No prefix or offset for a single computer
-        fcOffset.append("0x0000")
-        fcNames.append("")
-
-    # Define the radio button text and descriptions for the dialog
-    buttons = [ [ "Big", "Big endian" ],
-                [ "Big (swap)", "Big endian (word swapped)" ],
-                [ "Little", "Little endian" ],
-                [ "Little (swap)", "Little endian (word swapped)" ] ]
-
-    # Get the endianess choice from the user
-    selected = ccdd.getRadioButtonDialog("Select endianess", buttons)
-
-    # Check that an endianess was selected
-    if selected is not None:
-        # Check if the output should be big endian
-        if selected == "Big":
-            endianess = "BIG_ENDIAN"
-            endianExtn = "BE"
-        # Check if the output should be big endian, word swapped
-        elif selected == "Big (swap)":
-            endianess = "BIG_ENDIAN_SWAP"
-            endianExtn = "BE"
-        # Check if the output is little endian
-        elif selected == "Little":
-            endianess = "LITTLE_ENDIAN"
-            endianExtn = "LE"
-        # Check if the output is little endian, word swapped
-        elif selected == "Little (swap)":
-            endianess = "LITTLE_ENDIAN_SWAP"
-            endianExtn = "LE"
-
-        # Create the structure row order array that rearranges the bit-packed
-        # variables based on endianess
-        newRowOrder = reorderRowsForByteOrder(endianExtn)
-
-        # Get the current date and time
-        dateAndTime = ccdd.getDateAndTime()
-
-        # Check if structure data is provided
-        if numStructRows > 0:
-            # The output file names are based in part on the value of the data
-            # field, 'System', found in the first group or table associated
-            # with the script. If the field can't be found in either then the
-            # value is set to a blank
-            systemName = None
-
-            # Get the group(s) associated with the script (if any)
-            groupNames = ccdd.getAssociatedGroupNames()
-
-            # Check if a group is associated with the script
-            if len(groupNames) != 0:
-                # Get the value of the first group's 'System' data field, if
-                # present
-                systemName = ccdd.getGroupDataFieldValue(groupNames[0], "System")
-
-            # Check if the system name wasn't found in the group data field
-            if systemName is None or not systemName:
-                # Get the value of the first root structure's 'System' data
-                # field
-                systemName = ccdd.getTableDataFieldValue(ccdd.getRootStructureTableNames()[0], "System")
-
-            # Check if the data field doesn't exist in either a group or table
-            if systemName is None:
-                systemName = ""
-
-            # Build the telemetry output file name
-            tlmOutputFile = ccdd.getOutputPath() + systemName + "_" + endianExtn + ".rec"
-
-            # Open the telemetry output file
-            tlmFile = ccdd.openOutputFile(tlmOutputFile)
-            combFile = ccdd.openOutputFile(ccdd.getOutputPath() + "common.rec")
-
-            # Check if the telemetry output file successfully opened
-            if tlmFile is not None or combFile is not None:
-                # Get the names of all structures/sub-structures referenced in
-                # tables
-                structureNames = ccdd.getStructureTablesByReferenceOrder()
-
-                # Add a header to the output files
-                outputFileCreationInfo(combFile)
-                outputFileCreationInfo(tlmFile)
-
-                # Output the structure prototypes and telemetry packet
-                # definitions
-                outputStructures(structureNames)
-
-                # Output the discrete conversions
-                outputTelemetryDiscreteConversions()
-
-                # Output the limit definitions
-                outputLimitDefinitions()
-
-                # Output the polynomial conversions
-                outputPolynomialConversions()
-
-                # Output the mnemonic definitions
-                outputMnemonicDefinitions()
-
-                # Close the telemetry output files
-                ccdd.closeFile(tlmFile)
-                ccdd.closeFile(combFile)
-            # The telemetry output files cannot be opened
-            else:
-                # Display an error dialog
-                ccdd.showErrorDialog("<html><b>Error opening telemetry output file '</b>" + tlmOutputFile + "<b>' or common.rec")
+# Get a snapshot of the structure table data
+structureData = StructureSnapshot(ccdd)
 
-        # Check if command data is provided
-        if numCommandRows > 0:
-            # Get the value of the 'System' data field for first command table
-            firstSystemName = ccdd.getTableDataFieldValue(ccdd.getCommandTableNames()[0], "System")
+# Get the cache of the table and group data field values
+dataFields = DataFieldCache(ccdd)
 
-            # If the system name doesn't exist then substitute a blank
-            if firstSystemName is None:
-                firstSystemName = "";
+# Get the cache of the parsed enumerations, limit sets, and polynomial
+# coefficient sets
+conversions = ConversionCache(ccdd)
 
-            # Step through each flight computer
-            for fcIndex in range(numFlightComputers):
-                msgIDOffset = fcOffset[fcIndex]
-                prefix = fcNames[fcIndex]
+# Get the table of the ITOS encoded data types
+encodings = ITOSEncodingTable(ccdd)
 
-                # Build the command output file name and open the command
-                # output file
-                cmdFileName = ccdd.getOutputPath() + prefix + firstSystemName + "_CMD" + "_" + endianExtn + ".rec"
-                cmdFile = ccdd.openOutputFile(cmdFileName)
+try:
+    # Check if no structure or command data is supplied
+    if numStructRows == 0 and numCommandRows == 0:
+        ccdd.showErrorDialog("No structure or command data supplied to script " + ccdd.getScriptName())
+    # Structure and/or command data is supplied
+    else:
+        tmpVal = 0
+
+        # Get the value of the data field specifying the message ID skip value
+        msgIDSkip = dataFields.getGroupDataFieldValue("globals", "MID_delta")
+
+        # Check if the data field exists or is empty
+        if msgIDSkip is None or not msgIDSkip:
+            # Use the default skip value
+            msgIDSkip = "0x600"
+
+        # Get the value of the data field specifying the flight computer offset
+        # value
+        fcOffsetVal = dataFields.getGroupDataFieldValue("globals", "FC_Offset")
+
+        # Check if the data field exists or is empty
+        if fcOffsetVal is None or not fcOffsetVal:
+            # Use the default offset value
+            fcOffset.append("0x0000")
+
+        # Get the value of the data field specifying the flight computer base value
+        fcBase = dataFields.getGroupDataFieldValue("globals", "prefix")
+
+        # Check if the data field exists or is empty
+        if fcBase is None or not fcBase:
+            # Use the default base value
+            fcBase = "FC"
+
+        # Get the value of the data field specifying the number of flight computers
+        numFC = dataFields.getGroupDataFieldValue("globals", "NumComputers")
+
+        # Check if the data field exists, is empty, or isn't an integer value
+        if numFC is None or not re.match("[0-9]+", numFC):
+            # Use the default number of flight computers (based on the number of
+            # offset values detected)
+            numFlightComputers = len(fcOffset)
+        # The value is an integer
+        else:
+            # Store the number of flight computers
+            numFlightComputers = int(numFC);
 
-                # Check if the command output file successfully opened
-                if cmdFile is not None:
-                    # Add a header to the output file
-                    outputFileCreationInfo(cmdFile)
+        # Check if there is more than one flight computer
+        if numFlightComputers > 1:
+            # Step through each flight computer
+            for fcIndex in range(numFlightComputers):
+                # Store the flight computer name prefix and offset value
+                fcNames.append(fcBase + str(fcIndex + 1) + "_")
+                fcOffset.append(fcOffsetVal)
+
+                # Calculate the next offset based on the current offset and the ID
+                # skip values
+                nextMsgID = int(fcOffsetVal.replace("0x", ""), 16) + int(msgIDSkip.replace("0x", ""), 16)
+                fcOffsetVal = "0x" + "{0:03x}".format(nextMsgID)
+        # Only one flight computer
+        else:
+            # No prefix or offset for a single computer
+            fcOffset.append("0x0000")
+            fcNames.append("")
+
+        # Define the radio button text and descriptions for the dialog
+        buttons = [ [ "Big", "Big endian" ],
+                    [ "Big (swap)", "Big endian (word swapped)" ],
+                    [ "Little", "Little endian" ],
+                    [ "Little (swap)", "Little endian (word swapped)" ],
+                    [ MULTIPLE_BYTE_ORDERS, "Select one or more byte orders" ] ]
+
+        # Get the endianess choice from the user
+        selected = ccdd.getRadioButtonDialog("Select endianess", buttons)
+        selections = []
+
+        # Check if multiple byte orders are to be output
+        if selected == MULTIPLE_BYTE_ORDERS:
+            # Get the byte order choices from the user
+            checked = ccdd.getCheckBoxDialog("Select byte orders", buttons[:len(ENDIAN_EXTENSIONS)])
+
+            # Check if the Cancel button wasn't selected
+            if checked is not None:
+                # Step through each byte order check box
+                for index in range(len(checked)):
+                    # Check if the byte order is selected
+                    if checked[index]:
+                        selections.append(buttons[index][0])
+        # Check that an endianess was selected
+        elif selected is not None:
+            selections.append(selected)
+
+        # Step through each selected endianess
+        for selection in selections:
+            # Check if the endianess's output files haven't already been added
+            # (the output for the word swapped endianess is the same as for the
+            # unswapped endianess)
+            if ENDIAN_EXTENSIONS[selection] not in endianExtns:
+                endianExtns.append(ENDIAN_EXTENSIONS[selection])
+
+        # Check that an endianess was selected
+        if len(endianExtns) != 0:
+            # Create the structure row order array that rearranges the bit-packed
+            # variables based on endianess, and index the reordered structure
+            # table rows by structure name, for each endianess
+            for endianExtn in endianExtns:
+                structureRowIndices.append(StructureRowIndex(ccdd, reorderRowsForByteOrder(endianExtn)))
+
+            # Get the current date and time
+            dateAndTime = ccdd.getDateAndTime()
+
+            # Check if structure data is provided
+            if numStructRows > 0:
+                # The output file names are based in part on the value of the data
+                # field, 'System', found in the first group or table associated
+                # with the script. If the field can't be found in either then the
+                # value is set to a blank
+                systemName = None
+
+                # Get the group(s) associated with the script (if any)
+                groupNames = ccdd.getAssociatedGroupNames()
+
+                # Check if a group is associated with the script
+                if len(groupNames) != 0:
+                    # Get the value of the first group's 'System' data field, if
+                    # present
+                    systemName = dataFields.getGroupDataFieldValue(groupNames[0], "System")
+
+                # Check if the system name wasn't found in the group data field
+                if systemName is None or not systemName:
+                    # Get the value of the first root structure's 'System' data
+                    # field
+                    systemName = dataFields.getTableDataFieldValue(ccdd.getRootStructureTableNames()[0], "System")
+
+                # Check if the data field doesn't exist in either a group or table
+                if systemName is None:
+                    systemName = ""
+
+                tlmFiles = []
+                combFiles = []
+                outputFileNames = []
+
+                # Step through each endianess
+                for endianExtn in endianExtns:
+                    # Build the telemetry output file names. The shared prototype
+                    # structures file name includes the endianess if more than
+                    # one endianess is output
+                    tlmOutputFile = ccdd.getOutputPath() + systemName + "_" + endianExtn + ".rec"
+                    combOutputFile = ccdd.getOutputPath() + "common.rec"
+
+                    if len(endianExtns) > 1:
+                        combOutputFile = ccdd.getOutputPath() + "common_" + endianExtn + ".rec"
+
+                    # Open the telemetry output files
+                    tlmFiles.append(output.openOutputFile(ccdd, tlmOutputFile))
+                    combFiles.append(output.openOutputFile(ccdd, combOutputFile))
+                    outputFileNames += [tlmOutputFile, combOutputFile]
+
+                # Check if the telemetry output files successfully opened
+                if None not in tlmFiles and None not in combFiles:
+                    # Get the names of all structures/sub-structures referenced in
+                    # tables
+                    structureNames = ccdd.getStructureTablesByReferenceOrder()
+
+                    # Add a header to the output files
+                    outputFileCreationInfo(output.OutputFileGroup(combFiles + tlmFiles))
+
+                    # Get the message ID for each structure, and for those
+                    # without a message ID whether or not the structure is
+                    # shared. These are the same for each endianess
+                    getStructureOutputInfo(structureNames)
+
+                    # Check if the discrete conversion and limit definitions
+                    # are shared
+                    if isGlobalOptionSet("SharedDefinitions"):
+                        # Name each unique discrete conversion and limit
+                        # definition
+                        getSharedDefinitionNames()
+
+                    # Step through each endianess
+                    for index in range(len(endianExtns)):
+                        # Output the structure prototypes and telemetry packet
+                        # definitions, which depend on the endianess's order
+                        # of the bit-packed variables
+                        structureRows = structureRowIndices[index]
+                        tlmFile = tlmFiles[index]
+                        combFile = combFiles[index]
+                        outputStructures(structureNames)
+
+                    # The remaining telemetry definitions are the same for each
+                    # endianess; generate them once and output them to every
+                    # telemetry output file
+                    tlmFile = output.OutputFileGroup(tlmFiles)
+
+                    # Check if the telemetry definitions are generated using a
+                    # single pass through the structure table rows
+                    if isGlobalOptionSet("StreamingOutput"):
+                        # Output the discrete conversions, limit definitions,
+                        # polynomial conversions, and mnemonic definitions
+                        outputTelemetryDefinitionsInOnePass()
+                    # Generate each section of the definitions in turn
+                    else:
+                        # Output the discrete conversions
+                        outputTelemetryDiscreteConversions()
 
-                    # Step through each command table
-                    for cmdTblIndex in range(len(ccdd.getCommandTableNames())):
-                        # Get the value of the 'System' data field
-                        systemName = ccdd.getTableDataFieldValue(ccdd.getCommandTableNames()[cmdTblIndex], "System")
+                        # Output the limit definitions
+                        outputLimitDefinitions()
 
-                        # Output the enumerations for this system
-                        outputCommandEnumerations(systemName)
+                        # Output the polynomial conversions
+                        outputPolynomialConversions()
 
-                        # Output the commands for this system
-                        outputCommands(prefix, msgIDOffset, systemName)
+                        # Output the mnemonic definitions
+                        outputMnemonicDefinitions()
 
-                    # Close the command output file
-                    ccdd.closeFile(cmdFile)
-                # The command output file cannot be opened
+                    # Close the telemetry output files
+                    tlmFile.close()
+                    output.OutputFileGroup(combFiles).close()
+                # The telemetry output files cannot be opened
                 else:
                     # Display an error dialog
-                    ccdd.showErrorDialog("<html><b>Error opening command output file '</b>" + cmdFileName + "<b>'")
+                    ccdd.showErrorDialog("<html><b>Error opening telemetry output file(s) '</b>" + "<b>', '</b>".join(outputFileNames) + "<b>'")
+
+            # Check if command data is provided
+            if numCommandRows > 0:
+                # Index the command table rows by system. The index is used for
+                # every flight computer
+                commandRows = CommandRowIndex(ccdd, dataFields)
+
+                # Get the value of the 'System' data field for first command table
+                firstSystemName = commandRows.getTableSystem(commandRows.getTableNames()[0])
+
+                # If the system name doesn't exist then substitute a blank
+                if firstSystemName is None:
+                    firstSystemName = "";
+
+                # Step through each flight computer
+                for fcIndex in range(numFlightComputers):
+                    msgIDOffset = fcOffset[fcIndex]
+                    prefix = fcNames[fcIndex]
+                    cmdFiles = []
+                    cmdFileNames = []
+
+                    # Step through each endianess. The command definitions are
+                    # the same for each endianess
+                    for endianExtn in endianExtns:
+                        # Build the command output file name and open the
+                        # command output file
+                        cmdFileName = ccdd.getOutputPath() + prefix + firstSystemName + "_CMD" + "_" + endianExtn + ".rec"
+                        cmdFiles.append(output.openOutputFile(ccdd, cmdFileName))
+                        cmdFileNames.append(cmdFileName)
+
+                    # Check if the command output files successfully opened
+                    if None not in cmdFiles:
+                        # Generate the command definitions once and output them
+                        # to every command output file
+                        cmdFile = output.OutputFileGroup(cmdFiles)
+
+                        # Add a header to the output file
+                        outputFileCreationInfo(cmdFile)
+
+                        # Step through each command table
+                        for cmdTableName in commandRows.getTableNames():
+                            # Get the value of the 'System' data field
+                            systemName = commandRows.getTableSystem(cmdTableName)
+
+                            # Output the enumerations for this system
+                            outputCommandEnumerations(systemName)
+
+                            # Output the commands for this system
+                            outputCommands(prefix, msgIDOffset, systemName)
+
+                        # Close the command output files
+                        cmdFile.close()
+                    # The command output file cannot be opened
+                    else:
+                        # Display an error dialog
+                        ccdd.showErrorDialog("<html><b>Error opening command output file(s) '</b>" + "<b>', '</b>".join(cmdFileNames) + "<b>'")
+
+finally:
+    # Close any output files that remain open (e.g., due to an error)
+    output.closeOpenFiles()
@@ -10,7 +10,19 @@
 #******************************************************************************
 
 from CCDD import CcddScriptDataAccessHandler
+import os
 import re
+import sys
+
+# Add the script's folder to the module search path so that the shared script
+# support package can be imported
+scriptPath = os.path.dirname(os.path.abspath(ccdd.getScriptName()))
+
+if scriptPath not in sys.path:
+    sys.path.insert(0, scriptPath)
+
+from ccddlib import output
+from ccddlib.dataFields import DataFieldCache
 
 # Get the array of structure names by the order in which they are referenced
 structureNames = ccdd.getStructureTablesByReferenceOrder()
@@ -22,6 +34,9 @@ numCommandRows = ccdd.getCommandTableNumRows()
 # Get the name of the project database
 projectName = ccdd.getProject()
 
+# Get the cache of the table and group data field values
+dataFields = DataFieldCache(ccdd)
+
 #** Functions *****************************************************************
 
 #******************************************************************************
@@ -32,17 +47,17 @@ projectName = ccdd.getProject()
 #******************************************************************************
 def outputFileCreationInfo(file):
     # Add the build information and header to the output file
-    ccdd.writeToFileLn(file, "/* Created : " + ccdd.getDateAndTime() + "\n   User    : " + ccdd.getUser() + "\n   Project : " + ccdd.getProject() + "\n   Script  : " + ccdd.getScriptName())
+    file.writeLn("/* Created : " + ccdd.getDateAndTime() + "\n   User    : " + ccdd.getUser() + "\n   Project : " + ccdd.getProject() + "\n   Script  : " + ccdd.getScriptName())
 
     # Check if any table is associated with the script
     if ccdd.getTableNumRows() != 0:
-        ccdd.writeToFileLn(file, "   Table(s): " + (",\n             ").join(sorted(ccdd.getTableNames())))
+        file.writeLn("   Table(s): " + (",\n             ").join(sorted(ccdd.getTableNames())))
 
     # Check if any groups is associated with the script
     if len(ccdd.getAssociatedGroupNames()) != 0:
-        ccdd.writeToFileLn(file, "   Group(s): " + (",\n             ").join(sorted(ccdd.getAssociatedGroupNames())))
+        file.writeLn("   Group(s): " + (",\n             ").join(sorted(ccdd.getAssociatedGroupNames())))
 
-    ccdd.writeToFileLn(file, "*/\n")
+    file.writeLn("*/\n")
 
 #******************************************************************************
 # Output the telemetry message IDs file
@@ -56,7 +71,7 @@ def makeTelemetryFile(baseFileName):
     headerIncludeFlag = "_" + baseFileName.upper() + "_H_"
 
     # Open the telemetry message IDs output file
-    tlmFile = ccdd.openOutputFile(tlmFileName)
+    tlmFile = output.openOutputFile(ccdd, tlmFileName)
 
     # Check if the telemetry message IDs file successfully opened
     if tlmFile is not None:
@@ -64,12 +79,12 @@ def makeTelemetryFile(baseFileName):
         outputFileCreationInfo(tlmFile)
 
         # Add the header include to prevent loading the file more than once
-        ccdd.writeToFileLn(tlmFile, "#ifndef " + headerIncludeFlag)
-        ccdd.writeToFileLn(tlmFile, "#define " + headerIncludeFlag)
-        ccdd.writeToFileLn(tlmFile, "")
+        tlmFile.writeLn("#ifndef " + headerIncludeFlag)
+        tlmFile.writeLn("#define " + headerIncludeFlag)
+        tlmFile.writeLn("")
 
-        ccdd.writeToFileLn(tlmFile, "#include \"" + projectName + "_base_ids.h\"")
-        ccdd.writeToFileLn(tlmFile, "")
+        tlmFile.writeLn("#include \"" + projectName + "_base_ids.h\"")
+        tlmFile.writeLn("")
 
         # Get an array containing all group names
         groupNames = ccdd.getGroupNames(False)
@@ -79,7 +94,7 @@ def makeTelemetryFile(baseFileName):
         # Step through each structure name
         for nameIndex in range(len(structureNames)):
             # Get the value of the structure's message ID name data field
-            msgIDName = ccdd.getTableDataFieldValue(structureNames[nameIndex], "Message ID Name")
+            msgIDName = dataFields.getTableDataFieldValue(structureNames[nameIndex], "Message ID Name")
 
             # Check if the field exists and isn't empty, and the length exceeds
             # the minimum length found thus far
@@ -90,7 +105,7 @@ def makeTelemetryFile(baseFileName):
         # Step through each group name
         for groupIndex in range(len(groupNames)):
             # Get the value of the group's message ID name data field
-            msgIDName = ccdd.getGroupDataFieldValue(groupNames[groupIndex], "Message ID Name")
+            msgIDName = dataFields.getGroupDataFieldValue(groupNames[groupIndex], "Message ID Name")
 
             # Check if the field exists and isn't empty, and the length exceeds
             # the minimum length found thus far
@@ -101,34 +116,34 @@ def makeTelemetryFile(baseFileName):
         # Build the format string used to align the message ID definitions
         format = "#define %-" + str(minimumLength + 1) + "s %s\n"
 
-        ccdd.writeToFileLn(tlmFile, "/* Structure message IDs: " + str(len(structureNames)) + " structures */")
+        tlmFile.writeLn("/* Structure message IDs: " + str(len(structureNames)) + " structures */")
 
         # Step through each structure name
         for nameIndex in range(len(structureNames)):
             # Get the values of the structure's message ID and ID name data
             # fields
-            msgID = ccdd.getTableDataFieldValue(structureNames[nameIndex], "Message ID")
-            msgIDName = ccdd.getTableDataFieldValue(structureNames[nameIndex], "Message ID Name")
+            msgID = dataFields.getTableDataFieldValue(structureNames[nameIndex], "Message ID")
+            msgIDName = dataFields.getTableDataFieldValue(structureNames[nameIndex], "Message ID Name")
 
             # Output the telemetry message ID to the file
             outputIDDefine(tlmFile, format, msgID, msgIDName)
 
-        ccdd.writeToFileLn(tlmFile, "")
-        ccdd.writeToFileLn(tlmFile, "/* Group message IDs: " + str(len(groupNames)) + " groups */")
+        tlmFile.writeLn("")
+        tlmFile.writeLn("/* Group message IDs: " + str(len(groupNames)) + " groups */")
 
         # Step through each group
         for groupIndex in range(len(groupNames)):
             # Get the values of the group's message ID and ID name data fields
-            msgID = ccdd.getGroupDataFieldValue(groupNames[groupIndex], "Message ID")
-            msgIDName = ccdd.getGroupDataFieldValue(groupNames[groupIndex], "Message ID Name")
+            msgID = dataFields.getGroupDataFieldValue(groupNames[groupIndex], "Message ID")
+            msgIDName = dataFields.getGroupDataFieldValue(groupNames[groupIndex], "Message ID Name")
 
             # Output the telemetry message ID to the file
             outputIDDefine(tlmFile, format, msgID, msgIDName)
 
         # Finish and close the telemetry message IDs output file
-        ccdd.writeToFileLn(tlmFile, "")
-        ccdd.writeToFileLn(tlmFile, "#endif /* #ifndef " + headerIncludeFlag + " */")
-        ccdd.closeFile(tlmFile)
+        tlmFile.writeLn("")
+        tlmFile.writeLn("#endif /* #ifndef " + headerIncludeFlag + " */")
+        tlmFile.close()
     # The telemetry message IDs file failed to open
     else:
         # Display an error dialog
@@ -146,7 +161,7 @@ def makeCommandFile(baseFileName):
     headerIncludeFlag = "_" + baseFileName.upper() + "_H_"
 
     # Open the command codes output file
-    cmdFile = ccdd.openOutputFile(cmdFileName)
+    cmdFile = output.openOutputFile(ccdd, cmdFileName)
 
     # Check if the command codes file successfully opened
     if cmdFile is not None:
@@ -154,9 +169,9 @@ def makeCommandFile(baseFileName):
         outputFileCreationInfo(cmdFile)
 
         # Add the header include to prevent loading the file more than once
-        ccdd.writeToFileLn(cmdFile, "#ifndef " + headerIncludeFlag)
-        ccdd.writeToFileLn(cmdFile, "#define " + headerIncludeFlag)
-        ccdd.writeToFileLn(cmdFile, "")
+        cmdFile.writeLn("#ifndef " + headerIncludeFlag)
+        cmdFile.writeLn("#define " + headerIncludeFlag)
+        cmdFile.writeLn("")
 
         minimumLength = 10
 
@@ -183,12 +198,12 @@ def makeCommandFile(baseFileName):
             # Check if the name and ID exist
             if cmdCode is not None and cmdName is not None:
                 # Output the formatted command code definition to the file
-                ccdd.writeToFileFormat(cmdFile, format, cmdName, cmdCode)
+                cmdFile.writeFormat(format, cmdName, cmdCode)
 
         # Finish and close the command codes output file
-        ccdd.writeToFileLn(cmdFile, "")
-        ccdd.writeToFileLn(cmdFile, "#endif /* #ifndef " + headerIncludeFlag + " */")
-        ccdd.closeFile(cmdFile)
+        cmdFile.writeLn("")
+        cmdFile.writeLn("#endif /* #ifndef " + headerIncludeFlag + " */")
+        cmdFile.close()
     # The command codes file failed to open
     else:
         # Display an error dialog
@@ -240,24 +255,29 @@ def outputIDDefine(file, format, msgID, msgIDName):
     if msgID is not None and msgID and msgIDName is not None and msgIDName:
         # Remove all but the last 12 bits of the ID, format it, and output the
         # #define for the ID to the file with a base value added
-        ccdd.writeToFileFormat(file, format, msgIDName, "( " + ccdd.getProject().upper() + "_TLM_MID_BASE_1 + " + extractMessageID(msgID) + " )")
+        file.writeFormat(format, msgIDName, "( " + ccdd.getProject().upper() + "_TLM_MID_BASE_1 + " + extractMessageID(msgID) + " )")
 
 #** End functions *************************************************************
 
 #** Main **********************************************************************
 
-# Check if structure and/or command data is supplied
-if numStructRows != 0 or numCommandRows != 0:
-    # Check if structure data is supplied
-    if numStructRows != 0:
-        # Output the telemetry message IDs file
-        makeTelemetryFile(projectName + "_tlm_ids")
-
-    # Check if command data is supplied
-    if numCommandRows != 0:
-        # Output the command codes file
-        makeCommandFile(projectName + "_cmd_codes")
-# No structure or command data is supplied
-else:
-    # Display an error dialog
-    ccdd.showErrorDialog("<html><b>No structure or command data supplied for script '</b>" + ccdd.getScriptName() + "<b>'")
+try:
+    # Check if structure and/or command data is supplied
+    if numStructRows != 0 or numCommandRows != 0:
+        # Check if structure data is supplied
+        if numStructRows != 0:
+            # Output the telemetry message IDs file
+            makeTelemetryFile(projectName + "_tlm_ids")
+
+        # Check if command data is supplied
+        if numCommandRows != 0:
+            # Output the command codes file
+            makeCommandFile(projectName + "_cmd_codes")
+    # No structure or command data is supplied
+    else:
+        # Display an error dialog
+        ccdd.showErrorDialog("<html><b>No structure or command data supplied for script '</b>" + ccdd.getScriptName() + "<b>'")
+
+finally:
+    # Close any output files that remain open (e.g., due to an error)
+    output.closeOpenFiles()
@@ -0,0 +1,254 @@
+#******************************************************************************
+# Description: Output a NumPy structured data type module
+#
+# This Python script generates a Python module containing the NumPy structured
+# data type (dtype) definitions for the supplied structure table(s), along with
+# a function that decodes captured telemetry packets of a structure into
+# columns, one per member, with a single vectorized call. The data types use
+# the packed layout given by the CCDD byte offsets, in big or little endian
+# byte order, and bit fields are extracted using a shift and a mask. The
+# generated module requires NumPy; this script doesn't
+#
+# The generated module also maps the application ID of each structure having
+# a message ID to the structure, and provides a function that splits a file
+# of recorded CCSDS packets by application ID (reading the file through a
+# memory map and finding the packet boundaries with a single sweep) and
+# decodes each application's packets using its structure
+#
+# Example use of the generated module:
+#   import SYS1_dtypes
+#   columns = SYS1_dtypes.decode(open("packets.bin", "rb").read(), "Sensor_t", "<")
+#   temperatures = columns["temp"]
+#   for applicationID, (structureName, offsets, columns) in SYS1_dtypes.demultiplex("recorded.bin").items():
+#       ...
+#
+# Assumptions: If the structure has a non-empty data field named "Message ID"
+# then it is assumed to have a CCSDS header, which is added in the same manner
+# as the types header script. The output file name is prepended with a name
+# taken from a data field, "System", found either in the first group
+# associated with the script, or, if not found there then in the first
+# structure table associated with the script; if no "System" data field exists
+# or is empty the name is blank
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+import os
+import sys
+import traceback
+from CCDD import CcddScriptDataAccessHandler
+
+# Add the script's folder to the module search path so that the shared script
+# support package can be imported
+scriptPath = os.path.dirname(os.path.abspath(ccdd.getScriptName()))
+
+if scriptPath not in sys.path:
+    sys.path.insert(0, scriptPath)
+
+from ccddlib import macroExpansion
+from ccddlib import numpyLayout
+from ccddlib import output
+from ccddlib.dataFields import DataFieldCache
+from ccddlib.structureIndex import StructureRowIndex
+from ccddlib.structureLayout import CCSDS_HEADER_SIZE
+from ccddlib.structureSnapshot import StructureSnapshot
+
+# Get the array of structure names by the order in which they are referenced
+structureNames = ccdd.getStructureTablesByReferenceOrder()
+
+# Get the total number of structure table rows
+numStructRows = ccdd.getStructureTableNumRows()
+
+# Get a snapshot of the structure table data
+structureData = StructureSnapshot(ccdd)
+
+# Get the cache of the table and group data field values
+dataFields = DataFieldCache(ccdd)
+
+# Get the macro expander used to convert array sizes and bit lengths
+macroExpander = macroExpansion.getExpander(ccdd)
+
+# Index the structure table rows by structure name
+structureRows = StructureRowIndex(ccdd)
+
+# List of the application ID and structure name for each structure having a
+# message ID
+applicationIDs = []
+
+#** Functions *****************************************************************
+
+#******************************************************************************
+# Output the file creation details to the specified file
+#
+# @param file
+#            reference to the output file
+#******************************************************************************
+def outputFileCreationInfo(file):
+    # Add the build information and header to the output file
+    file.writeLn("# Created : " + ccdd.getDateAndTime() + "\n# User    : " + ccdd.getUser() + "\n# Project : " + ccdd.getProject() + "\n# Script  : " + ccdd.getScriptName())
+
+    # Check if any table is associated with the script
+    if ccdd.getTableNumRows() != 0:
+        file.writeLn("# Table(s): " + (",\n#           ").join(sorted(ccdd.getTableNames())))
+
+    # Check if any groups is associated with the script
+    if len(ccdd.getAssociatedGroupNames()) != 0:
+        file.writeLn("# Group(s): " + (",\n#           ").join(sorted(ccdd.getAssociatedGroupNames())))
+
+    file.writeLn("")
+
+#******************************************************************************
+# Output a structure's layout to the specified file
+#
+# @param file
+#            reference to the data type output file
+#
+# @param structureName
+#            structure name
+#******************************************************************************
+def outputStructure(file, structureName):
+    rows = structureRows.getRows(structureName)
+
+    # Check if the structure has no rows
+    if not rows:
+        return
+
+    # Get the value of the structure's message ID data field
+    msgID = dataFields.getTableDataFieldValue(structureName, "Message ID")
+
+    # Set the flag to add in CCSDS primary and secondary headers if the
+    # structure table has a message ID
+    isCCSDS = msgID is not None and msgID != ""
+    size = ccdd.getDataTypeSizeInBytes(structureName)
+
+    # Check if CCSDS headers are added
+    if isCCSDS:
+        # Include the headers in the structure's size
+        size += CCSDS_HEADER_SIZE
+        applicationID = numpyLayout.getApplicationID(msgID)
+
+        # Check if the message ID is valid
+        if applicationID is not None:
+            applicationIDs.append([applicationID, structureName])
+
+    file.writeLn("")
+    file.writeLn("STRUCTURES[\"" + structureName + "\"] = [" + str(size) + ", [")
+
+    # Step through each member of the structure
+    for member in numpyLayout.getNumpyMembers(ccdd, rows, structureData, macroExpander, isCCSDS):
+        file.writeLn("    " + member.toSource() + ",")
+
+    file.writeLn("]]")
+
+#******************************************************************************
+# Create the NumPy data type module
+#
+# @param baseFileName
+#            base for the data type output file name
+#******************************************************************************
+def makeDtypeFile(baseFileName):
+    dtypeFileName = ccdd.getOutputPath() + baseFileName + ".py"
+
+    # Open the data type output file
+    dtypeFile = output.openOutputFile(ccdd, dtypeFileName)
+
+    # Check if the data type file successfully opened
+    if dtypeFile is not None:
+        # Add the build information to the output file
+        outputFileCreationInfo(dtypeFile)
+
+        dtypeFile.writeLn("from collections import OrderedDict")
+        dtypeFile.writeLn("import mmap")
+        dtypeFile.writeLn("import os")
+        dtypeFile.writeLn("import struct")
+        dtypeFile.writeLn("")
+        dtypeFile.writeLn("import numpy as np")
+        dtypeFile.writeLn("")
+        dtypeFile.writeLn("# Bits of a CCSDS packet's stream ID that contain the application ID")
+        dtypeFile.writeLn("APPLICATION_ID_MASK = 0x%03x" % numpyLayout.APPLICATION_ID_MASK)
+        dtypeFile.writeLn("")
+        dtypeFile.writeLn("# Prefix of the name of a data type member holding the bit fields that share a storage unit; the")
+        dtypeFile.writeLn("# unit's byte offset is appended")
+        dtypeFile.writeLn("BIT_FIELD_UNIT_PREFIX = \"_bits_\"")
+        dtypeFile.writeLn("")
+        dtypeFile.writeLn("# Structure layouts, keyed by structure name. Each contains the structure's size in bytes and its")
+        dtypeFile.writeLn("# members. Each member contains its name, NumPy type code (without the byte order) or structure")
+        dtypeFile.writeLn("# name, byte offset, array dimensions, and, for a bit field, the bit position within the storage")
+        dtypeFile.writeLn("# unit, the length in bits, and whether or not the field is signed")
+        dtypeFile.writeLn("STRUCTURES = OrderedDict()")
+
+        # Step through each structure. This list is in reference order so that
+        # base structures are output before being referenced in another
+        # structure
+        for structureName in structureNames:
+            # Output the structure's layout to the data type file
+            outputStructure(dtypeFile, structureName)
+
+        # Output the structure for each application ID. If more than one
+        # structure has the same application ID the first is used
+        dtypeFile.writeLn("")
+        dtypeFile.writeLn("# Structure names, keyed by the application ID of the structure's message ID")
+        dtypeFile.writeLn("APPLICATION_IDS = OrderedDict()")
+
+        # Step through each structure having a message ID, in application ID
+        # order
+        for applicationID, structureName in sorted(applicationIDs, key=lambda entry: entry[0]):
+            dtypeFile.writeLn("APPLICATION_IDS.setdefault(0x%03x, \"%s\")" % (applicationID, structureName))
+
+        # Output the functions that create the data types, decode packets, and
+        # split a packet file by application ID
+        dtypeFile.writeLn("")
+        dtypeFile.write(numpyLayout.DECODER_SOURCE)
+        dtypeFile.writeLn("")
+        dtypeFile.write(numpyLayout.DEMULTIPLEXER_SOURCE)
+        dtypeFile.close()
+    # The data type file failed to open
+    else:
+        # Display an error dialog
+        ccdd.showErrorDialog("<html><b>Error opening NumPy data type output file '</b>" + dtypeFileName + "<b>'")
+#** End functions *************************************************************
+
+#** Main **********************************************************************
+
+try:
+    # Check if structure data is supplied
+    if numStructRows > 0:
+        # The output file name is based in part on the value of the data field,
+        # 'System', found in the first group or table associated with the
+        # script. If the field can't be found in either then the value is set
+        # to a blank
+        systemName = None
+
+        # Get the group(s) associated with the script (if any)
+        groupNames = ccdd.getAssociatedGroupNames()
+
+        # Check if a group is associated with the script
+        if len(groupNames) != 0:
+            # Get the value of the first group's 'System' data field, if
+            # present
+            systemName = dataFields.getGroupDataFieldValue(groupNames[0], "System")
+
+        # Check if the system name wasn't found in the group data field
+        if systemName is None or not systemName:
+            # Get the value of the first root structure's 'System' data field
+            systemName = dataFields.getTableDataFieldValue(ccdd.getRootStructureTableNames()[0], "System")
+
+        # Check if the data field doesn't exist in either a group or table
+        if systemName is None:
+            systemName = ""
+
+        # Output the NumPy data type module
+        makeDtypeFile(systemName + "_dtypes")
+    # No structure data is supplied
+    else:
+        # Display an error dialog
+        ccdd.showErrorDialog("<html><b>No structure data supplied for script '</b>" + ccdd.getScriptName() + "<b>'")
+
+except:
+    raise Exception(traceback.format_exc())
+
+finally:
+    # Close any output files that remain open (e.g., due to an error)
+    output.closeOpenFiles()
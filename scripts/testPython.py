@@ -2,7 +2,7 @@
 
 from CCDD import CcddScriptDataAccessHandler
 
-print "Test of a Python script using Jython"
+print("Test of a Python script using Jython")
 
 # Define the check boxes
 boxes = [ [ "Box 1", " Box 1 description" ], [ "Box 2", "" ] ]
@@ -23,11 +23,11 @@ if checked is not None:
             status = ""
 
         # Display the check box status
-        print "Check box " \
-              + boxes[index][0] \
-              + " selection state is" \
-              + status \
-              + " checked "
+        print("Check box "
+              + boxes[index][0]
+              + " selection state is"
+              + status
+              + " checked ")
 
 # Open the output file
 file = ccdd.openOutputFile("myFileName")
@@ -0,0 +1,125 @@
+#******************************************************************************
+# Description: Tests for the data field value cache
+#
+# The cache is checked against a data access handler stand-in that matches the
+# owner and field names in the same manner as the application's field handler
+# (case insensitive, with the first matching field used)
+#
+# Usage:
+#   python -m unittest discover -s scripts/tests
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+import os
+import sys
+import unittest
+
+# Add the scripts folder to the module search path so that the script support
+# package can be imported
+scriptPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if scriptPath not in sys.path:
+    sys.path.insert(0, scriptPath)
+
+from ccddlib.dataFields import DataFieldCache
+
+#******************************************************************************
+# Data access handler stand-in providing the data field methods. Each data
+# field contains the owner type, owner name, field name, and value
+#******************************************************************************
+class FieldHandler(object):
+    def __init__(self, fields):
+        self.fields = fields
+        self.calls = []
+
+    def getField(self, ownerType, ownerName, fieldName):
+        for fieldType, fieldOwner, name, value in self.fields:
+            if fieldType == ownerType and fieldOwner.lower() == ownerName.lower() and name.lower() == fieldName.lower():
+                return value
+
+        return None
+
+    def getAllDataFieldValues(self):
+        self.calls.append("getAllDataFieldValues")
+        return [list(field) for field in self.fields if field[1] != "Instance,type.var"]
+
+    def getTableDataFieldValue(self, tableName, fieldName):
+        self.calls.append("getTableDataFieldValue")
+        return self.getField("Table", tableName, fieldName)
+
+    def getGroupDataFieldValue(self, groupName, fieldName):
+        self.calls.append("getGroupDataFieldValue")
+        return self.getField("Group", groupName, fieldName)
+
+    def getDatabaseQuery(self, sqlCommand):
+        return []
+
+# Data fields; the instance table's field isn't included in the bulk read
+FIELDS = [["Table", "Sensor_t", "Message Id", "0x0801"],
+          ["Table", "Sensor_t", "Message ID Name", "SENSOR_MID"],
+          ["Table", "Status_t", "Message ID", "0x0802"],
+          ["Table", "Status_t", "MESSAGE ID", "0x0803"],
+          ["Table", "Instance,type.var", "Rate", "1"],
+          ["Group", "globals", "system", "SYS1"],
+          ["Group", "globals", "prefix", "fsw"]]
+
+#******************************************************************************
+# Data field value cache tests
+#******************************************************************************
+class DataFieldCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.handler = FieldHandler(FIELDS)
+        self.cache = DataFieldCache(self.handler)
+
+    def testValuesMatchHandler(self):
+        requests = [["Table", "Sensor_t", "Message ID"],
+                    ["Table", "SENSOR_T", "message id name"],
+                    ["Table", "Status_t", "Message ID"],
+                    ["Table", "Status_t", "Message Id"],
+                    ["Table", "Sensor_t", "System"],
+                    ["Table", "Unknown_t", "Message ID"],
+                    ["Table", "Instance,type.var", "rate"],
+                    ["Group", "globals", "System"],
+                    ["Group", "Globals", "PREFIX"],
+                    ["Group", "globals", "Message ID"]]
+
+        for ownerType, ownerName, fieldName in requests:
+            expected = self.handler.getField(ownerType, ownerName, fieldName)
+
+            if ownerType == "Table":
+                value = self.cache.getTableDataFieldValue(ownerName, fieldName)
+            else:
+                value = self.cache.getGroupDataFieldValue(ownerName, fieldName)
+
+            self.assertEqual(value, expected, ownerName + " " + fieldName)
+
+    def testFieldNameInDifferentCase(self):
+        self.assertEqual(self.cache.getTableDataFieldValue("Sensor_t", "Message ID"), "0x0801")
+        self.assertEqual(self.cache.getGroupDataFieldValue("globals", "System"), "SYS1")
+
+        # Only the bulk read is needed
+        self.assertEqual(self.handler.calls, ["getAllDataFieldValues"])
+
+    def testFirstOfFieldsDifferingInCase(self):
+        self.assertEqual(self.cache.getTableDataFieldValue("Status_t", "message id"), "0x0802")
+
+    def testMissingFieldOfReadOwner(self):
+        self.assertEqual(self.cache.getTableDataFieldValue("sensor_t", "System"), None)
+        self.assertEqual(self.handler.calls, ["getAllDataFieldValues"])
+
+    def testOwnerOutsideBulkRead(self):
+        self.assertEqual(self.cache.getTableDataFieldValue("Instance,type.var", "Rate"), "1")
+        self.assertEqual(self.cache.getTableDataFieldValue("instance,type.var", "RATE"), "1")
+        self.assertEqual(self.handler.calls, ["getAllDataFieldValues", "getTableDataFieldValue"])
+
+    def testQueryDiscardsValues(self):
+        self.cache.getTableDataFieldValue("Sensor_t", "Message ID")
+        self.cache.getDatabaseQuery("SELECT 1;")
+        self.cache.getTableDataFieldValue("Sensor_t", "Message ID")
+        self.assertEqual(self.handler.calls, ["getAllDataFieldValues", "getAllDataFieldValues"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+#******************************************************************************
+# Description: Tests for the ITOS record file script's bit-packed variable
+# ordering
+#
+# The script is executed with the headless data access handler against a
+# generated project having large structures that are mostly bit-packed
+# fields. The row order used for each byte order is checked against the runs
+# of bit-packed variables found from the handler's structure data: for little
+# endian each run is reversed and every other row is unchanged; for big endian
+# the order is unchanged
+#
+# Usage:
+#   python -m unittest discover -s scripts/tests
+#
+# Copyright 2017 United States Government as represented by the Administrator
+# of the National Aeronautics and Space Administration. No copyright is claimed
+# in the United States under Title 17, U.S. Code. All Other Rights Reserved.
+#******************************************************************************
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add the scripts folder to the module search path so that the script support
+# package can be imported
+scriptPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if scriptPath not in sys.path:
+    sys.path.insert(0, scriptPath)
+
+from ccddlib import benchmark
+from ccddlib import headless
+
+#******************************************************************************
+# Get the runs of bit-packed variables in the structure table data. A run is
+# two or more consecutive rows having a bit length, the same byte offset, and
+# the same structure path
+#
+# @param ccdd
+#            script data access handler
+#
+# @return List of the runs; each is a list containing the first row index and
+#         the index of the row following the run
+#******************************************************************************
+def getPackedRuns(ccdd):
+    columns = dict((column[0], column[1:]) for column in ccdd.getStructureTableColumns())
+    bitLengths = columns["@bit length"]
+    offsets = columns["@variable offset"]
+    paths = columns["@table path"]
+    numRows = ccdd.getStructureTableNumRows()
+    runs = []
+    start = 0
+
+    for row in range(1, numRows + 1):
+        isPacked = row < numRows \
+                   and bitLengths[row] and bitLengths[row - 1] \
+                   and offsets[row] is not None and offsets[row] != "-1" \
+                   and offsets[row] == offsets[row - 1] \
+                   and paths[row] == paths[row - 1]
+
+        if not isPacked:
+            if row - start > 1:
+                runs.append([start, row])
+
+            start = row
+
+    return runs
+
+#******************************************************************************
+# ITOS record file bit-packed variable order tests
+#******************************************************************************
+class BitPackedOrderTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.workFolder = tempfile.mkdtemp(prefix="ccdd_test_")
+        importFileName = os.path.join(cls.workFolder, "project.csv")
+
+        # Generate structures having 120 rows, 96 of which are bit-packed
+        benchmark.generateProject(importFileName,
+                                  benchmark.ProjectParameters(structures=24,
+                                                              rows=120,
+                                                              depth=2,
+                                                              arrays=2,
+                                                              bitFields=96,
+                                                              limitSets=2,
+                                                              polynomials=2,
+                                                              commands=0,
+                                                              seed=7))
+
+        # Select both byte orders so that the row order for each is created
+        cls.ccdd = headless.createHandler([importFileName],
+                                          groupNames=["globals"],
+                                          outputPath=cls.workFolder,
+                                          radioButtonSelection="Multiple",
+                                          dateAndTime="Sun Jan 01 00:00:00 UTC 2017")
+        stdout = sys.stdout
+        sys.stdout = open(os.devnull, "w")
+
+        try:
+            cls.namespace = headless.runScript(os.path.join(scriptPath, "itosRecFile.py"), cls.ccdd)
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+
+        cls.runs = getPackedRuns(cls.ccdd)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.workFolder, ignore_errors=True)
+
+    def testScriptSucceeds(self):
+        self.assertEqual(self.ccdd.errorMessages, [])
+        self.assertEqual(self.namespace["endianExtns"], ["BE", "LE"])
+
+    def testProjectHasPackedRuns(self):
+        # The structures must contain many runs, including ones longer than
+        # two variables, for the order tests to be meaningful
+        self.assertGreater(len(self.runs), 100)
+        self.assertTrue([start for start, end in self.runs if end - start > 2])
+
+    def testLittleEndianReversesEachRun(self):
+        numRows = self.ccdd.getStructureTableNumRows()
+        reOrdered = self.namespace["reorderRowsForByteOrder"]("LE")
+        expected = list(range(numRows))
+
+        for start, end in self.runs:
+            expected[start:end] = reversed(range(start, end))
+
+        self.assertEqual(len(reOrdered), numRows)
+        self.assertEqual(list(reOrdered), expected)
+
+    def testBigEndianOrderIsUnchanged(self):
+        reOrdered = self.namespace["reorderRowsForByteOrder"]("BE")
+        self.assertEqual(list(reOrdered), list(range(self.ccdd.getStructureTableNumRows())))
+
+    def testStructureRowsUseByteOrder(self):
+        bigEndianRows, littleEndianRows = self.namespace["structureRowIndices"]
+        runStarts = dict((start, end) for start, end in self.runs)
+
+        for structureName in bigEndianRows.getStructureNames():
+            bigRows = bigEndianRows.getRows(structureName)
+            littleRows = littleEndianRows.getRows(structureName)
+            self.assertEqual(bigRows, sorted(bigRows))
+
+            # Reverse each packed run within the big endian rows; the result
+            # is the little endian rows
+            expected = []
+            index = 0
+
+            while index < len(bigRows):
+                row = bigRows[index]
+                end = runStarts.get(row)
+
+                if end is not None and bigRows[index:index + end - row] == list(range(row, end)):
+                    expected += list(reversed(range(row, end)))
+                    index += end - row
+                else:
+                    expected.append(row)
+                    index += 1
+
+            self.assertEqual(littleRows, expected, structureName)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,23 +16,74 @@
 # data field exists or is empty the name is blank. The project's data type
 # definitions are output to the types header file
 #
+# If the first group associated with the script (or, if not found there, the
+# first root structure table) has a data field, "TableDrivenSwap", set to
+# "true" then each structure's byte swap function steps through a static table
+# describing the structure's members (their offsets, widths, and counts, with
+# arrays and adjacent members of the same width combined) using a single
+# generic swap function, in place of a swap statement for each member. This
+# produces a much smaller swap source file that uses no global variables
+#
+# In either case the elements of an array member are swapped by a single loop
+# that accesses them as bytes, so no temporary or global variables are used;
+# when the input and output differ the loop's pointers are restrict-qualified
+# so that the compiler can vectorize it. In the per-member swap functions a
+# one-dimensional array with fewer than 16 members is instead swapped by a loop
+# of per-member swap statements, which is faster for so few members
+#
 # Copyright 2017 United States Government as represented by the Administrator
 # of the National Aeronautics and Space Administration. No copyright is claimed
 # in the United States under Title 17, U.S. Code. All Other Rights Reserved.
 #******************************************************************************
 
+import os
+import sys
 import traceback
 from CCDD import CcddScriptDataAccessHandler
 
+# Add the script's folder to the module search path so that the shared script
+# support package can be imported
+scriptPath = os.path.dirname(os.path.abspath(ccdd.getScriptName()))
+
+if scriptPath not in sys.path:
+    sys.path.insert(0, scriptPath)
+
+from ccddlib import macroExpansion
+from ccddlib import output
+from ccddlib import swapTable
+from ccddlib.dataFields import DataFieldCache
+from ccddlib.orderedSet import OrderedSet
+from ccddlib.structureIndex import StructureRowIndex
+from ccddlib.structureLayout import CCSDS_HEADER_SIZE_TEXT, CCSDS_HEADER_VARIABLES, StructureLayout
+from ccddlib.structureSnapshot import StructureSnapshot
+
 # Get the array of structure names by the order in which they are referenced
 structureNames = ccdd.getStructureTablesByReferenceOrder()
 
 # Get the total number of structure table rows
 numStructRows = ccdd.getStructureTableNumRows()
 
+# Get a snapshot of the structure table data
+structureData = StructureSnapshot(ccdd)
+
+# Get the cache of the table and group data field values
+dataFields = DataFieldCache(ccdd)
+
+# Get the macro expander used to convert array sizes and bit lengths
+macroExpander = macroExpansion.getExpander(ccdd)
+
+# Index the structure table rows by structure name
+structureRows = StructureRowIndex(ccdd)
+
 # Get an array containing the data stream names
 dataStreams = ccdd.getDataStreamNames()
 
+# Minimum number of members for which the bytes of a one-dimensional primitive
+# array are swapped by calling the array swap function. A shorter array is
+# swapped by a loop of per-member swap statements, which is faster for so few
+# members
+ARRAY_SWAP_MIN_MEMBERS = 16
+
 #** Functions *****************************************************************
 
 #******************************************************************************
@@ -43,17 +94,17 @@ dataStreams = ccdd.getDataStreamNames()
 #******************************************************************************
 def outputFileCreationInfo(file):
     # Add the build information and header to the output file
-    ccdd.writeToFileLn(file, "/* Created : " + ccdd.getDateAndTime() + "\n   User    : " + ccdd.getUser() + "\n   Project : " + ccdd.getProject() + "\n   Script  : " + ccdd.getScriptName())
+    file.writeLn("/* Created : " + ccdd.getDateAndTime() + "\n   User    : " + ccdd.getUser() + "\n   Project : " + ccdd.getProject() + "\n   Script  : " + ccdd.getScriptName())
 
     # Check if any table is associated with the script
     if ccdd.getTableNumRows() != 0:
-        ccdd.writeToFileLn(file, "   Table(s): " + (",\n             ").join(sorted(ccdd.getTableNames())))
+        file.writeLn("   Table(s): " + (",\n             ").join(sorted(ccdd.getTableNames())))
 
     # Check if any groups is associated with the script
     if len(ccdd.getAssociatedGroupNames()) != 0:
-        ccdd.writeToFileLn(file, "   Group(s): " + (",\n             ").join(sorted(ccdd.getAssociatedGroupNames())))
+        file.writeLn("   Group(s): " + (",\n             ").join(sorted(ccdd.getAssociatedGroupNames())))
 
-    ccdd.writeToFileLn(file, "*/\n")
+    file.writeLn("*/\n")
 
 #******************************************************************************
 # Output a structure's type definition to the specified file
@@ -65,282 +116,58 @@ def outputFileCreationInfo(file):
 #            index of the structure in the structure name array
 #******************************************************************************
 def outputStructure(file, structIndex):
-    firstPass = True
-    isCCSDS = False
-    lastBitFieldType = "none"
-    maxBitsAvailable = 0
-    curFilledBits = 0
-    headerOffset = 0
-    usedVariableNames = []
-    structDescription = ""
-    structSize = 0
-
-    # Set the minimum length required to display the structure information
-    # using the structure name as the initial value. This value is used to
-    # align variable (offset, byte size, rate(s), and description) and
-    # structure (total size) comment text
-    minimumLength = len("} " + structureNames[structIndex] + "; ")
-
-    # A pass is made through the structure rows in order to determine the
-    # longest one, character-wise, so that the output can be formatted. Step
-    # through each structure data row
-    for row in range(numStructRows):
-        # Check if the structure name in the row matches the current structure
-        if structureNames[structIndex] == ccdd.getStructureTableNameByRow(row):
-            # Check if this is the first pass through the structure data
-            if firstPass:
-                firstPass = False
-
-                # Get the value of the structure's message ID data field
-                msgID = ccdd.getTableDataFieldValue(structureNames[structIndex], "Message ID")
-
-                # Check if the structure table has a message ID
-                if msgID is not None and msgID:
-                    # Set the minimum length to that of the CCSDS header
-                    # variable which will be added if the structure has a
-                    # message ID
-                    minimumLength = len("   char CFS_PRI_HEADER[6]; ")
-
-            # Get the variable name for this row
-            variableName = ccdd.getStructureVariableName(row)
-
-            # Check that this isn't an array member; only array definitions
-            # appear in the type definition
-            if not variableName.endswith("]"):
-                # Get the variable's array size
-                arraySize = ccdd.getStructureArraySize(row)
-
-                # Check if the variable is an array
-                if arraySize:
-                    # Add the brackets that will appear around the array size.
-                    # Multi-dimensional arrays have the individual dimensions
-                    # separated by ', '; in the type definition each ', ' is
-                    # replaced with '][' which is the same number of
-                    # characters, so no further padding adjustment needs to
-                    # be made here to account for them
-                    arraySize += "[]"
-
-                # Get the variable's bit length
-                bitLength = ccdd.getStructureBitLength(row)
-
-                # Check if the variable has a bit length
-                if bitLength:
-                    # Add the colon that will appear before the bit length
-                    bitLength += ":"
-
-                # Determine the length of the variable definition by adding up
-                # the individual parts
-                defnLength = len("   " + ccdd.getStructureDataType(row) + " " + variableName + arraySize + bitLength + "; ")
-
-                # Check if the length exceeds the minimum length found thus far
-                if defnLength > minimumLength:
-                    # Store the new minimum length
-                    minimumLength = defnLength
-
-    firstPass = True
-
-    # Step through each structure data row
-    for row in range(numStructRows):
-        deltaSize = 0
-
-        # Check if the structure name in the row matches the target structure
-        if structureNames[structIndex] == ccdd.getStructureTableNameByRow(row):
-            # Get the variable name for this row in the structure
-            variableName = ccdd.getStructureVariableName(row)
-
-            # Check if this is the first pass through the structure data
-            if firstPass:
-                firstPass = False
-
-                # Get the description for the current structure
-                structDescription = ccdd.getTableDescriptionByRow("Structure", row)
-
-                # Get the size of the entire structure, in bytes
-                structSize = ccdd.getDataTypeSizeInBytes(structureNames[structIndex])
-
-                # Get the value of the structure's message ID data field
-                msgID = ccdd.getTableDataFieldValue(structureNames[structIndex], "Message ID")
-
-                # Check if the structure table has a message ID
-                if msgID is not None and msgID:
-                    # Set the flag to add in CCSDS primary and secondary
-                    # headers
-                    isCCSDS = True
-                    structSize = structSize + 12
-
-                # Display the structure name, size, and description prior to
-                # the structure's type definition
-                ccdd.writeToFile(file, "/* Structure: " + structureNames[structIndex] + " (" + str(structSize) + " bytes total)")
-
-                # Check if the structure has a description
-                if structDescription:
-                    # Display the structure's description
-                    ccdd.writeToFile(file, "\n   Description: " + structDescription)
-
-                ccdd.writeToFileLn(file, " */")
-
-                # Begin the structure type definition
-                ccdd.writeToFileLn(file, "typedef struct")
-                ccdd.writeToFileLn(file, "{")
-
-                # Check if CCSDS headers should be added
-                if isCCSDS:
-                    # Set the CCSDS header length, which is used as the byte
-                    # offset for the subsequent variables
-                    headerOffset = 12
-
-                    # Output the variable array that contains the primary
-                    # header values
-                    offsetStr = "0"
-                    ccsdsVar = "   char CFS_PRI_HEADER[6];"
-                    comment = "#CCSDS_PriHdr_t"
-                    sizeString = "(6 bytes)"
-                    ccdd.writeToFileFormat(file, "%-" + str(minimumLength) + "s /* [%5s] " + sizeString + "  " + comment + " */\n", ccsdsVar, offsetStr)
-
-                    # Output the variable array that contains the secondary
-                    # header values
-                    offsetStr = "6"
-                    ccsdsVar = "   char CFS_SEC_HEADER[6];"
-                    comment = "#CCSDS_CmdSecHdr_t"
-                    ccdd.writeToFileFormat(file, "%-" + str(minimumLength) + "s /* [%5s] " + sizeString + "  " + comment + " */\n", ccsdsVar, offsetStr)
-                # No CCSDS header should be added
-                else:
-                    # Set the variable byte offset to zero
-                    headerOffset = 0
-
-            # Check if this is not an array member (only array definitions are
-            # output), and if the variable name hasn't already been processed
-            # (the first instance of the structure is used to obtain the
-            # information to create the type definition, so this is necessary
-            # to prevent duplicating the members in the type definition if
-            # more than one instance of the structure is present in the data)
-            if not variableName.endswith("]") and usedVariableNames.count(variableName) == 0:
-                # Add the variable name to the list of those already processed
-                usedVariableNames.append(variableName)
-
-                # Get the variable's data type, array size, and description
-                dataType = ccdd.getStructureDataType(row)
-                arraySize = ccdd.getStructureArraySize(row)
-                description = ccdd.getStructureDescription(row)
-
-                # Determine the size of the variable, in bytes
-                byteSize = ccdd.getDataTypeSizeInBytes(dataType)
-
-                # Build the variable's full path; this will be used to get the
-                # structure's byte offset
-                variablePath = structureNames[structIndex] + "," + dataType + "." + variableName
-                varOffset = 0
-
-                bitLength = ""
-                sizeString = "(" + str(byteSize) + " bytes)"
-                variableMsg = "   " + dataType + " " + variableName
-
-                # Check if the structure has no variable description column
-                if description is None:
-                    # Set the description to a blank
-                    description = ""
-
-                # Check if the array size is provided; i.e., this is an array
-                # definition
-                if arraySize:
-                    firstDim = ""
-                    sizeMsg = ""
-                    deltaSize = 1
-
-                    # Separate the array size into the individual dimensions
-                    dimensions = arraySize.split(", ")
-
-                    # Step through each dimension in the array
-                    for dim in range(len(dimensions)):
-                        # Add a dimension for the first array member
-                        firstDim += "[0]"
-
-                        # Keep a running total of this dimension's byte
-                        # requirements
-                        deltaSize *= int(dimensions[dim])
-
-                        # Update the comment text that will follow the array
-                        # definition
-                        sizeMsg += dimensions[dim] + "x"
-
-                    # Get the total byte size of the array
-                    deltaSize *= byteSize
-
-                    # Get the byte offset of the first member of this array
-                    # variable within its structure
-                    varOffset = ccdd.getVariableOffset(variablePath + firstDim)
-
-                    # Create the array variable definition, placing brackets
-                    # around the array dimensions
-                    variableMsg = variableMsg + "[" + arraySize.replace(", ", "][") + "]"
-
-                    # Build the comment that shows the array's byte size
-                    sizeString = "(" + sizeMsg + str(byteSize) + "=" + str(deltaSize) + " bytes)"
-
-                    lastBitFieldType = "none"
-                # No array size for this row; i.e., the variable is not an
-                # array definition
-                else:
-                    deltaSize = byteSize
-
-                    # Get the byte offset of the this variable within its
-                    # structure
-                    varOffset = ccdd.getVariableOffset(variablePath)
-
-                    # Get the variable's bit length
-                    bitLength = ccdd.getStructureBitLength(row)
-
-                    # Check if the bit length is provided
-                    if bitLength:
-                        # Append the bit length to the variable
-                        variableMsg = variableMsg + ":" + bitLength
-                        sizeString = ""
-
-                        # Check if the variable won't pack with the preceding
-                        # variable(s) due to being a different data type or
-                        # exceeding the bit length of the data type
-                        if lastBitFieldType != dataType or (curFilledBits + int(bitLength) > maxBitsAvailable):
-                            # Reset the bit packing values
-                            curFilledBits = int(bitLength)
-                            lastBitFieldType = dataType
-                            maxBitsAvailable = 8 * byteSize
-                        # The variable has the same data type and its bits
-                        # will pack with the preceding variable(s)
-                        else:
-                            # Add this variable's bits to the current pack
-                            curFilledBits = curFilledBits + int(bitLength)
-                    # The variable has no bit length
-                    else:
-                        lastBitFieldType = "none"
-
-                # Terminate the variable definition then pad it with spaces to
-                # align the comment text
-                variableMsg += ";"
-
-                # Adjust the variable's byte offset within the structure to
-                # include the header (if present)
-                varOffset = varOffset + headerOffset
-
-                rateInfo = ""
-
-                # Step through each data stream
-                for dataStream in range(len(dataStreams)):
-                    # Get the variable's rate for this data stream
-                    rateValue = ccdd.getStructureTableData(dataStreams[dataStream], row)
-
-                    # Check if the variable has a rate assigned in this stream
-                    if rateValue is not None and rateValue:
-                        # Build the rate information
-                        rateInfo += "{" + dataStreams[dataStream] + " @" + rateValue + " Hz}"
-
-                # Build the full variable definition, along with the byte
-                # offset, size, rate, and description information, then
-                # output it to the types header file
-                ccdd.writeToFileFormat(file, "%-" + str(minimumLength) + "s /* [%5s] " + (sizeString + rateInfo + "  " + description).strip() + " */\n", variableMsg, varOffset)
+    structureName = structureNames[structIndex]
+    closingText = "} " + structureName + ";"
+
+    # Get the layout of the structure's type definition
+    layout = StructureLayout(ccdd, structureName, structureRows.getRows(structureName), structureData, dataFields, macroExpander, dataStreams)
+
+    # Get the length required to display the structure information. This
+    # value is used to align variable (offset, byte size, rate(s), and
+    # description) and structure (total size) comment text
+    minimumLength = layout.getColumnWidth(len(closingText + " "))
+
+    # Check if the structure has any rows
+    if layout.hasRows:
+        # Display the structure name, size, and description prior to the
+        # structure's type definition
+        file.write("/* Structure: " + structureName + " (" + str(layout.size) + " bytes total)")
+
+        # Check if the structure has a description
+        if layout.description:
+            # Display the structure's description
+            file.write("\n   Description: " + layout.description)
+
+        file.writeLn(" */")
+
+        # Begin the structure type definition
+        file.writeLn("typedef struct")
+        file.writeLn("{")
+
+        # Check if CCSDS headers should be added
+        if layout.isCCSDS:
+            # Output the variable arrays that contain the primary and
+            # secondary header values
+            for ccsdsVar, offsetStr, comment in CCSDS_HEADER_VARIABLES:
+                file.writeFormat("%-" + str(minimumLength) + "s /* [%5s] " + CCSDS_HEADER_SIZE_TEXT + "  " + comment + " */\n", ccsdsVar, offsetStr)
+
+    # Step through each member of the type definition
+    for member in layout.members:
+        rateInfo = ""
+
+        # Build the rate information for each data stream in which the
+        # variable has a rate
+        for dataStream, rateValue in member.rates:
+            rateInfo += "{" + dataStream + " @" + rateValue + " Hz}"
+
+        # Build the full variable definition, along with the byte offset,
+        # size, rate, and description information, then output it to the
+        # types header file
+        file.writeFormat("%-" + str(minimumLength) + "s /* [%5s] " + (member.sizeText + rateInfo + "  " + member.description).strip() + " */\n", member.definition, member.offset)
 
     # Conclude the structure's type definition, pad it for length and add the
     # structure's total size, then output this to the types header file
-    ccdd.writeToFileFormat(file, "%-" + str(minimumLength) +"s /* Total size of " + str(structSize) + " bytes */\n", "} " + structureNames[structIndex] + ";")
+    file.writeFormat("%-" + str(minimumLength) +"s /* Total size of " + str(layout.size) + " bytes */\n", closingText)
 
 #******************************************************************************
 # Create the types header file
@@ -354,7 +181,7 @@ def makeHeaders(baseFileName):
     headerIncludeFlag = "_" + baseFileName.upper() + "_H_"
 
     # Open the types header output file
-    typesFile = ccdd.openOutputFile(typesFileName)
+    typesFile = output.openOutputFile(ccdd, typesFileName)
 
     # Check if the types header file successfully opened
     if typesFile is not None:
@@ -362,9 +189,9 @@ def makeHeaders(baseFileName):
         outputFileCreationInfo(typesFile)
 
         # Add the header include to prevent loading the file more than once
-        ccdd.writeToFileLn(typesFile, "#ifndef " + headerIncludeFlag)
-        ccdd.writeToFileLn(typesFile, "#define " + headerIncludeFlag)
-        ccdd.writeToFileLn(typesFile, "")
+        typesFile.writeLn("#ifndef " + headerIncludeFlag)
+        typesFile.writeLn("#define " + headerIncludeFlag)
+        typesFile.writeLn("")
 
         # Get the number of rows for the Includes table data
         numIncludeRows = ccdd.getTableNumRows("Includes")
@@ -374,9 +201,9 @@ def makeHeaders(baseFileName):
             # Step through each row of Includes data
             for row in range(numIncludeRows):
                 # Output the Includes table's 'includes' column data
-                ccdd.writeToFileLn(typesFile, ccdd.getTableData("Includes", "includes", row))
+                typesFile.writeLn(ccdd.getTableData("Includes", "includes", row))
 
-            ccdd.writeToFileLn(typesFile, "")
+            typesFile.writeLn("")
 
         # Get the data type definitions
         defns = ccdd.getDataTypeDefinitions()
@@ -386,9 +213,9 @@ def makeHeaders(baseFileName):
             # Check if the type and C names aren't blank and if they differ
             if defns[index][0] and defns[index][1] and defns[index][0] != defns[index][1]:
                 # Output the definition of the data type
-                ccdd.writeToFileLn(typesFile, "#define " + defns[index][0] + " " + defns[index][1])
+                typesFile.writeLn("#define " + defns[index][0] + " " + defns[index][1])
 
-        ccdd.writeToFileLn(typesFile, "")
+        typesFile.writeLn("")
 
         # Step through each structure. This list is in reference order so that
         # base structures are created before being referenced in another
@@ -396,40 +223,232 @@ def makeHeaders(baseFileName):
         for structIndex in range(len(structureNames)):
             # Output the structure definition to the types header file
             outputStructure(typesFile, structIndex)
-            ccdd.writeToFileLn(typesFile, "")
+            typesFile.writeLn("")
 
         # Add the def prototypes for byte- and bit-swapping at the end of:
         # the types header file
-        ccdd.writeToFileLn(typesFile, "/* Byte and bit swap function prototypes */")
+        typesFile.writeLn("/* Byte and bit swap function prototypes */")
 
         # Step through each structure name
         for structIndex in range(len(structureNames)):
             structureName = structureNames[structIndex]
 
             # Add the def prototype for the structure:
-            ccdd.writeToFileLn(typesFile, "void byte_swap_" + structureName + "(" + structureName + " *inPtr, " + structureName + " *outPtr, int direction);")
-            ccdd.writeToFileLn(typesFile, "void bit_swap_" + structureName + "(" + structureName + " *inPtr, " + structureName + " *outPtr, int direction);")
+            typesFile.writeLn("void byte_swap_" + structureName + "(" + structureName + " *inPtr, " + structureName + " *outPtr, int direction);")
+            typesFile.writeLn("void bit_swap_" + structureName + "(" + structureName + " *inPtr, " + structureName + " *outPtr, int direction);")
 
         # Finish and close the types header output file
-        ccdd.writeToFileLn(typesFile, "")
-        ccdd.writeToFileLn(typesFile, "#endif /* #ifndef " + headerIncludeFlag + " */")
-        ccdd.closeFile(typesFile)
+        typesFile.writeLn("")
+        typesFile.writeLn("#endif /* #ifndef " + headerIncludeFlag + " */")
+        typesFile.close()
     # The types header file failed to open
     else:
         # Display an error dialog
         ccdd.showErrorDialog("<html><b>Error opening types header output file '</b>" + typesFileName + "<b>'")
 
+#******************************************************************************
+# Output the functions that swap the bytes of an array's elements to the swap
+# file. For each element width there is an in-place function, for when the
+# input and output are the same, and a copy function whose restrict-qualified
+# pointers tell the compiler that the input and output don't overlap, so that
+# the compiler is free to vectorize the loop. Both access the elements as
+# bytes, which is valid for any element type and alignment
+#
+# @param swapFile
+#            reference to the swap output file
+#******************************************************************************
+def outputArraySwap(swapFile):
+    # Step through each width of the elements that are swapped
+    for width in swapTable.SWAPPED_WIDTHS:
+        suffix = str(width)
+        swapFile.writeLn("/* Swaps the bytes of each of the 'n' " + suffix + "-byte elements in 'data' */")
+        swapFile.writeLn("static inline void swap_in_place_" + suffix + "(unsigned char *data, size_t n)")
+        swapFile.writeLn("{")
+        swapFile.writeLn("   size_t i;")
+        swapFile.writeLn("   for (i = 0; i < n; i++, data += " + suffix + ")")
+        swapFile.writeLn("   {")
+        swapFile.writeLn("      unsigned char " + ", ".join(["b" + str(index) + " = data[" + str(index) + "]" for index in range(width)]) + ";")
+        swapFile.writeLn("      " + " ".join(["data[" + str(index) + "] = b" + str(width - 1 - index) + ";" for index in range(width)]))
+        swapFile.writeLn("   }")
+        swapFile.writeLn("}")
+        swapFile.writeLn("")
+        swapFile.writeLn("/* Swaps the bytes of each of the 'n' " + suffix + "-byte elements in 'in', storing the result in 'out'; the")
+        swapFile.writeLn("   input and output must not overlap */")
+        swapFile.writeLn("static inline void swap_copy_" + suffix + "(const unsigned char *restrict in, unsigned char *restrict out, size_t n)")
+        swapFile.writeLn("{")
+        swapFile.writeLn("   size_t i;")
+        swapFile.writeLn("   for (i = 0; i < n; i++)")
+        swapFile.writeLn("   {")
+        swapFile.writeLn("      " + " ".join(["out[" + suffix + " * i + " + str(index) + "] = in[" + suffix + " * i + " + str(width - 1 - index) + "];" for index in range(width)]))
+        swapFile.writeLn("   }")
+        swapFile.writeLn("}")
+        swapFile.writeLn("")
+        swapFile.writeLn("/* Swaps the bytes of each of the 'n' " + suffix + "-byte elements in 'in', storing the result in 'out', which is")
+        swapFile.writeLn("   either the same as 'in' or doesn't overlap it */")
+        swapFile.writeLn("static inline void swap_array_" + suffix + "(const void *in, void *out, size_t n)")
+        swapFile.writeLn("{")
+        swapFile.writeLn("   if (in == out)")
+        swapFile.writeLn("   {")
+        swapFile.writeLn("      swap_in_place_" + suffix + "((unsigned char *) out, n);")
+        swapFile.writeLn("   }")
+        swapFile.writeLn("   else")
+        swapFile.writeLn("   {")
+        swapFile.writeLn("      swap_copy_" + suffix + "((const unsigned char *) in, (unsigned char *) out, n);")
+        swapFile.writeLn("   }")
+        swapFile.writeLn("}")
+        swapFile.writeLn("")
+
+#******************************************************************************
+# Output the byte swap descriptor table type, and the generic function that
+# swaps the bytes of the elements described by a table, to the swap file
+#
+# @param swapFile
+#            reference to the swap output file
+#******************************************************************************
+def outputGenericSwap(swapFile):
+    swapFile.writeLn("/* Byte swap descriptor run: the byte offset of the first element, the width of each element in bytes, the")
+    swapFile.writeLn("   number of consecutive elements, and, for a structure, the structure's descriptor table (NULL for a")
+    swapFile.writeLn("   primitive). A descriptor table ends with a run having no elements */")
+    swapFile.writeLn("typedef struct swap_run")
+    swapFile.writeLn("{")
+    swapFile.writeLn("   size_t offset;")
+    swapFile.writeLn("   size_t width;")
+    swapFile.writeLn("   size_t count;")
+    swapFile.writeLn("   const struct swap_run *table;")
+    swapFile.writeLn("} swap_run_t;")
+    swapFile.writeLn("")
+    swapFile.writeLn("/* Swaps the bytes of the elements described by the descriptor table 'runs' from 'in' to 'out', which may")
+    swapFile.writeLn("   be the same */")
+    swapFile.writeLn("static void swap_runs(const swap_run_t *runs, const unsigned char *in, unsigned char *out)")
+    swapFile.writeLn("{")
+    swapFile.writeLn("   const swap_run_t *run;")
+    swapFile.writeLn("   size_t i;")
+    swapFile.writeLn("   for (run = runs; run->count != 0; run++)")
+    swapFile.writeLn("   {")
+    swapFile.writeLn("      if (run->table != NULL)")
+    swapFile.writeLn("      {")
+    swapFile.writeLn("         for (i = 0; i < run->count; i++)")
+    swapFile.writeLn("         {")
+    swapFile.writeLn("            swap_runs(run->table, in + run->offset + i * run->width, out + run->offset + i * run->width);")
+    swapFile.writeLn("         }")
+    swapFile.writeLn("      }")
+    swapFile.writeLn("      else if (run->width == 2)")
+    swapFile.writeLn("      {")
+    swapFile.writeLn("         swap_array_2(in + run->offset, out + run->offset, run->count);")
+    swapFile.writeLn("      }")
+    swapFile.writeLn("      else if (run->width == 4)")
+    swapFile.writeLn("      {")
+    swapFile.writeLn("         swap_array_4(in + run->offset, out + run->offset, run->count);")
+    swapFile.writeLn("      }")
+    swapFile.writeLn("      else")
+    swapFile.writeLn("      {")
+    swapFile.writeLn("         swap_array_8(in + run->offset, out + run->offset, run->count);")
+    swapFile.writeLn("      }")
+    swapFile.writeLn("   }")
+    swapFile.writeLn("}")
+    swapFile.writeLn("")
+
+#******************************************************************************
+# Output each structure's byte swap descriptor table, and its byte swap
+# function that uses the table, to the swap file
+#
+# @param swapFile
+#            reference to the swap output file
+#
+# @return List containing, for each structure, True if the structure has a bit
+#         field variable
+#******************************************************************************
+def outputSwapTables(swapFile):
+    hasBitField = []
+    swappedStructures = set()
+    bitFieldStructures = set()
+
+    # Step through each structure name. This list is in reference order so
+    # that a structure's descriptor table is output before being referenced in
+    # another structure's table
+    for structureName in structureNames:
+        runs, calls, isBitField = swapTable.getSwapRuns(ccdd, structureRows.getRows(structureName), structureData, macroExpander, swappedStructures, bitFieldStructures)
+        hasBitField.append(isBitField)
+        swappedStructures.add(structureName)
+
+        # Check if the structure, or a structure it contains, has a bit field
+        if isBitField or calls:
+            bitFieldStructures.add(structureName)
+
+        # Output the structure's descriptor table
+        swapFile.writeLn("")
+        swapFile.writeLn("/* Byte swap descriptor table for " + structureName + " */")
+        swapFile.writeLn("static const swap_run_t swap_runs_" + structureName + "[] =")
+        swapFile.writeLn("{")
+
+        # Step through each run in the structure
+        for run in runs:
+            # Check if the run is for a primitive
+            if run.structureName is None:
+                swapFile.writeLn("   {offsetof(" + structureName + ", " + run.variableName + "), " + str(run.width) + ", " + str(run.count) + ", NULL},")
+            # The run is for a structure
+            else:
+                swapFile.writeLn("   {offsetof(" + structureName + ", " + run.variableName + "), sizeof(" + run.structureName + "), " + str(run.count) + ", swap_runs_" + run.structureName + "},")
+
+        swapFile.writeLn("   {0, 0, 0, NULL}")
+        swapFile.writeLn("};")
+
+        # Begin building the def to byte swap the structure's variables
+        swapFile.writeLn("")
+        swapFile.writeLn("/* inPtr and outPtr are pointers to the input and output data. 'direction' is a flag for if the conversion ")
+        swapFile.writeLn("   is from foreign to local endian (direction = 1), or from native to foreign byte order (direction = 0) */")
+        swapFile.writeLn("inline void byte_swap_" + structureName + "(" + structureName + " *inPtr, " + structureName + " *outPtr, int direction)")
+        swapFile.writeLn("{")
+
+        # Check if any member structure containing a bit field is an array
+        if [run for run in calls if run.count > 1]:
+            swapFile.writeLn("   size_t i = 0;")
+
+        swapFile.writeLn("   swap_runs(swap_runs_" + structureName + ", (const unsigned char *) inPtr, (unsigned char *) outPtr);")
+
+        # Step through each member structure that contains a bit field. These
+        # are swapped by calling the structure's byte swap function so that
+        # its bit fields are also swapped
+        for run in calls:
+            # Check if the member is a single structure
+            if run.count == 1:
+                swapFile.writeLn("   byte_swap_" + run.structureName + "(&(inPtr->" + run.variableName + "), &(outPtr->" + run.variableName + "), direction);")
+            # The member is an array of structures
+            else:
+                inMember = "((" + run.structureName + " *) &(inPtr->" + run.variableName + "))"
+                outMember = "((" + run.structureName + " *) &(outPtr->" + run.variableName + "))"
+                swapFile.writeLn("   for (i = 0; i < " + str(run.count) + "; i++)")
+                swapFile.writeLn("   {")
+                swapFile.writeLn("      byte_swap_" + run.structureName + "(" + inMember + " + i, " + outMember + " + i, direction);")
+                swapFile.writeLn("   }")
+
+        # Check if the structure has a bit field variable
+        if isBitField:
+            # Add the source code to call the def to swap the bit field(s)
+            # within the structure
+            swapFile.writeLn("   bit_swap_" + structureName + "(inPtr, outPtr, direction); /* Swap all bit fields in this structure */")
+
+        # Add the source code to terminate this structure's byte swap function
+        swapFile.writeLn("} /* End of byte_swap_" + structureName + "(" + structureName + " *inPtr, " + structureName + " *outPtr, int direction) */")
+
+    return hasBitField
+
 #******************************************************************************
 # Create the byte and bit swapping def source code file:
 #
 # @param baseFileName
 #            base for the swap output file name
+#
+# @param isTableDriven
+#            True to output a byte swap descriptor table for each structure,
+#            which a generic swap function steps through; False to output a
+#            swap statement for each variable
 #******************************************************************************
-def makeSwapFile(baseFileName):
+def makeSwapFile(baseFileName, isTableDriven):
     swapFileName = ccdd.getOutputPath() + baseFileName + ".c"
 
     # Open the swap output file
-    swapFile = ccdd.openOutputFile(swapFileName)
+    swapFile = output.openOutputFile(ccdd, swapFileName)
 
     # Check if the output file successfully opened
     if swapFile is not None:
@@ -439,89 +458,98 @@ def makeSwapFile(baseFileName):
         outputFileCreationInfo(swapFile)
 
         # Output the source for the bit field swap and bit reversal functions
-        ccdd.writeToFileLn(swapFile, "#include <byteswap.h>")
-        ccdd.writeToFileLn(swapFile, "#include <string.h>")
-        ccdd.writeToFileLn(swapFile, "#include \"" + baseFileName + ".h" + "\"")
-        ccdd.writeToFileLn(swapFile, "")
-        ccdd.writeToFileLn(swapFile, "uint32 *p32, tmp_32;")
-        ccdd.writeToFileLn(swapFile, "uint64 *p64, tmp_64;")
-        ccdd.writeToFileLn(swapFile, "#define swap_float(pIn, pOut) p32 = (uint32*) pIn; tmp_32 = bswap_32(*p32); memcpy(pOut, &tmp_32, 4)")
-        ccdd.writeToFileLn(swapFile, "#define swap_double(pIn, pOut) p64 = (uint64*) pIn; tmp_64 = bswap_64(*p64); memcpy(pOut, &tmp_64, 8)")
-        ccdd.writeToFileLn(swapFile, "#define swap_pointer_8(pIn, pOut) p64 = (uint64*) pIn; tmp_64 = bswap_64(*p64); memcpy(pOut, &tmp_64, 8)")
-        ccdd.writeToFileLn(swapFile, "#define swap_pointer_4(pIn, pOut) p32 = (uint32*) pIn; tmp_32 = bswap_32(*p32); memcpy(pOut, &tmp_32, 4)")
-        ccdd.writeToFileLn(swapFile, "")
-        ccdd.writeToFileLn(swapFile, "/* Swaps a bit field of value 'val' containing 'num' bits, and returns the resulting 'mirrored' value */")
-        ccdd.writeToFileLn(swapFile, "static int bit_field_swap(int val, int num)")
-        ccdd.writeToFileLn(swapFile, "{")
-        ccdd.writeToFileLn(swapFile, "   int ret_val = 0, n_1 = num - 1, i = 0;")
-        ccdd.writeToFileLn(swapFile, "   for (i = 0; i < num; i++)")
-        ccdd.writeToFileLn(swapFile, "   {")
-        ccdd.writeToFileLn(swapFile, "      ret_val|= (((val>>i) &1) << (n_1 - i));")
-        ccdd.writeToFileLn(swapFile, "   }")
-        ccdd.writeToFileLn(swapFile, "   return ret_val;")
-        ccdd.writeToFileLn(swapFile, "}")
-        ccdd.writeToFileLn(swapFile, "")
-        ccdd.writeToFileLn(swapFile, "/* Reverses the order of the bits in a n-byte object (only supports 1 <= n <= 8) */")
-        ccdd.writeToFileLn(swapFile, "static void reflect_bits(char *data, int n)")
-        ccdd.writeToFileLn(swapFile, "{")
-        ccdd.writeToFileLn(swapFile, "   if (n > 8) return;")
-        ccdd.writeToFileLn(swapFile, "   int i = 0;")
-        ccdd.writeToFileLn(swapFile, "   /* Need to go through all the bytes, since 2 nibbles (1 byte) are reflected each iteration of the 'for' loop */")
-        ccdd.writeToFileLn(swapFile, "   for (i = 0; i < n; i++)")
-        ccdd.writeToFileLn(swapFile, "   {")
-        ccdd.writeToFileLn(swapFile, "      unsigned char *t1 = (unsigned char *) &(data[i]);")
-        ccdd.writeToFileLn(swapFile, "      unsigned char *t2 = (unsigned char *) &(data[n - 1 - i]);")
-        ccdd.writeToFileLn(swapFile, "      unsigned char v1 = ((*t1 & 1)  << 7) + ((*t1 &  2) << 5) + ((*t1 &  4)<<3) + ((*t1 &   8)<<1);")
-        ccdd.writeToFileLn(swapFile, "      unsigned char v2 = ((*t2 & 16) >> 1) + ((*t2 & 32) >> 3) + ((*t2 & 64)>>5) + ((*t2 & 128)>>7);")
-        ccdd.writeToFileLn(swapFile, "      *t1 = ((*t1) & 0xF0) | v2;")
-        ccdd.writeToFileLn(swapFile, "      *t2 = ((*t2) & 0x0F) | v1;")
-        ccdd.writeToFileLn(swapFile, "   }")
-        ccdd.writeToFileLn(swapFile, "}")
-
-        # Step through each structure name
-        for structIndex in range(len(structureNames)):
-            usedVariableNames = []
-            isIDefined = False
-            structureName = structureNames[structIndex]
-            hasBitField.append(False)
-
-            # Begin building the def to byte swap the structure's:
-            # variables
-            ccdd.writeToFileLn(swapFile, "")
-            ccdd.writeToFileLn(swapFile, "/* inPtr and outPtr are pointers to the input and output data. 'direction' is a flag for if the conversion ")
-            ccdd.writeToFileLn(swapFile, "   is from foreign to local endian (direction = 1), or from native to foreign byte order (direction = 0) */")
-            ccdd.writeToFileLn(swapFile, "inline void byte_swap_" + structureName + "(" + structureName + " *inPtr, " + structureName + " *outPtr, int direction)")
-            ccdd.writeToFileLn(swapFile, "{")
-
-            # Step through each row in the table
-            for row in range(numStructRows):
-                # Check if the structure name in the row matches the current
-                # structure
-                if structureNames[structIndex] == ccdd.getStructureTableNameByRow(row):
+        swapFile.writeLn("#include <byteswap.h>")
+        swapFile.writeLn("#include <string.h>")
+        swapFile.writeLn("#include <stddef.h>")
+        swapFile.writeLn("#include \"" + baseFileName + ".h" + "\"")
+        swapFile.writeLn("")
+
+        # Output the functions that swap the bytes of an array's elements
+        outputArraySwap(swapFile)
+
+        # Check if the byte swap functions use descriptor tables
+        if isTableDriven:
+            # Output the descriptor table type and the generic swap function
+            # that steps through a table
+            outputGenericSwap(swapFile)
+        else:
+            # Output the swap macros used by the swap statements
+            swapFile.writeLn("uint32 *p32, tmp_32;")
+            swapFile.writeLn("uint64 *p64, tmp_64;")
+            swapFile.writeLn("#define swap_float(pIn, pOut) p32 = (uint32*) pIn; tmp_32 = bswap_32(*p32); memcpy(pOut, &tmp_32, 4)")
+            swapFile.writeLn("#define swap_double(pIn, pOut) p64 = (uint64*) pIn; tmp_64 = bswap_64(*p64); memcpy(pOut, &tmp_64, 8)")
+            swapFile.writeLn("#define swap_pointer_8(pIn, pOut) p64 = (uint64*) pIn; tmp_64 = bswap_64(*p64); memcpy(pOut, &tmp_64, 8)")
+            swapFile.writeLn("#define swap_pointer_4(pIn, pOut) p32 = (uint32*) pIn; tmp_32 = bswap_32(*p32); memcpy(pOut, &tmp_32, 4)")
+            swapFile.writeLn("")
+
+        swapFile.writeLn("/* Swaps a bit field of value 'val' containing 'num' bits, and returns the resulting 'mirrored' value */")
+        swapFile.writeLn("static int bit_field_swap(int val, int num)")
+        swapFile.writeLn("{")
+        swapFile.writeLn("   int ret_val = 0, n_1 = num - 1, i = 0;")
+        swapFile.writeLn("   for (i = 0; i < num; i++)")
+        swapFile.writeLn("   {")
+        swapFile.writeLn("      ret_val|= (((val>>i) &1) << (n_1 - i));")
+        swapFile.writeLn("   }")
+        swapFile.writeLn("   return ret_val;")
+        swapFile.writeLn("}")
+        swapFile.writeLn("")
+        swapFile.writeLn("/* Reverses the order of the bits in a n-byte object (only supports 1 <= n <= 8) */")
+        swapFile.writeLn("static void reflect_bits(char *data, int n)")
+        swapFile.writeLn("{")
+        swapFile.writeLn("   if (n > 8) return;")
+        swapFile.writeLn("   int i = 0;")
+        swapFile.writeLn("   /* Need to go through all the bytes, since 2 nibbles (1 byte) are reflected each iteration of the 'for' loop */")
+        swapFile.writeLn("   for (i = 0; i < n; i++)")
+        swapFile.writeLn("   {")
+        swapFile.writeLn("      unsigned char *t1 = (unsigned char *) &(data[i]);")
+        swapFile.writeLn("      unsigned char *t2 = (unsigned char *) &(data[n - 1 - i]);")
+        swapFile.writeLn("      unsigned char v1 = ((*t1 & 1)  << 7) + ((*t1 &  2) << 5) + ((*t1 &  4)<<3) + ((*t1 &   8)<<1);")
+        swapFile.writeLn("      unsigned char v2 = ((*t2 & 16) >> 1) + ((*t2 & 32) >> 3) + ((*t2 & 64)>>5) + ((*t2 & 128)>>7);")
+        swapFile.writeLn("      *t1 = ((*t1) & 0xF0) | v2;")
+        swapFile.writeLn("      *t2 = ((*t2) & 0x0F) | v1;")
+        swapFile.writeLn("   }")
+        swapFile.writeLn("}")
+
+        # Check if the byte swap functions use descriptor tables
+        if isTableDriven:
+            # Output the descriptor tables and the byte swap functions that
+            # use them
+            hasBitField = outputSwapTables(swapFile)
+        # Output a swap statement for each variable
+        else:
+            # Step through each structure name
+            for structIndex in range(len(structureNames)):
+                usedVariableNames = OrderedSet()
+                isIDefined = False
+                structureName = structureNames[structIndex]
+                hasBitField.append(False)
+
+                # Begin building the def to byte swap the structure's:
+                # variables
+                swapFile.writeLn("")
+                swapFile.writeLn("/* inPtr and outPtr are pointers to the input and output data. 'direction' is a flag for if the conversion ")
+                swapFile.writeLn("   is from foreign to local endian (direction = 1), or from native to foreign byte order (direction = 0) */")
+                swapFile.writeLn("inline void byte_swap_" + structureName + "(" + structureName + " *inPtr, " + structureName + " *outPtr, int direction)")
+                swapFile.writeLn("{")
+
+                # Step through each row belonging to the structure
+                for row in structureRows.getRows(structureName):
                     # Get the variable name for this row in the structure
-                    variableName = ccdd.getStructureVariableName(row)
+                    variableName = structureData.getVariableName(row)
 
                     # Check if this is not an array member; array definitions
                     # are output, but not members
                     if not variableName.endswith("]"):
-                        isFound = False
-
-                        # Step through each name in the array of already
-                        # processed variable names
-                        for index in range(len(usedVariableNames)):
-                            # Check if the target name matches the array name
-                            if usedVariableNames[index] == variableName:
-                                # Match found; set the flag and stop searching
-                                isFound = True
-                                break
+                        # Check if the variable name has already been processed
+                        isFound = variableName in usedVariableNames
 
                         byteSwap = "bswap_16"
 
                         # Get the variable's data type, bit length, and array
                         # size
-                        dataType = ccdd.getStructureDataType(row)
-                        bitLength = ccdd.getStructureBitLength(row)
-                        arraySize = ccdd.getStructureArraySize(row)
+                        dataType = structureData.getDataType(row)
+                        bitLength = structureData.getBitLength(row)
+                        arraySize = structureData.getArraySize(row)
 
                         # Flag that's 'true' if the variable is an array
                         isArray = arraySize != ""
@@ -531,6 +559,24 @@ def makeSwapFile(baseFileName):
                         baseType = ccdd.getBaseDataType(dataType)
                         variableSize = ccdd.getDataTypeSizeInBytes(dataType)
 
+                        # Width, in bytes, of each of the array members
+                        # swapped if the variable is an array
+                        swapWidth = variableSize
+
+                        # Flag that's 'true' if the variable is an array
+                        # whose members are swapped by calling the array swap
+                        # function
+                        isArraySwap = False
+
+                        # Check if the variable is an array. An array with
+                        # more than one dimension, or whose size can't be
+                        # determined, is always swapped by the array swap
+                        # function, which obtains the number of members using
+                        # sizeof
+                        if isArray:
+                            dimensions = macroExpander.getArrayDimensions(arraySize)
+                            isArraySwap = len(dimensions) != 1 or dimensions[0] >= ARRAY_SWAP_MIN_MEMBERS
+
                         # Check if the variable has a bit length
                         if bitLength:
                             # Set the flag to indicate the variable has been
@@ -539,7 +585,7 @@ def makeSwapFile(baseFileName):
                             # of those processed
                             isFound = True
                             hasBitField[structIndex] = True
-                            usedVariableNames.append(variableName)
+                            usedVariableNames.add(variableName)
                         # Check if the type is a character or integer (signed
                         # or unsigned)
                         elif baseType == "character" or baseType == "signed integer" or baseType == "unsigned integer":
@@ -549,7 +595,7 @@ def makeSwapFile(baseFileName):
                             # as processed
                             if variableSize == 1:
                                 isFound = True
-                                usedVariableNames.append(variableName)
+                                usedVariableNames.add(variableName)
                             elif variableSize == 2:
                                 byteSwap = "bswap_16"
                             elif variableSize == 4:
@@ -574,21 +620,30 @@ def makeSwapFile(baseFileName):
                                 byteSwap = "swap_pointer_8"
                             else:
                                 byteSwap = "swap_pointer_4"
+                                swapWidth = 4
 
                         # Check if the variable name hasn't already been
                         # processed; this is necessary to prevent duplicating
                         # the members in the type definition for a structure
                         # that is referenced as an array
                         if not isFound:
-                            # Add the variable name to the list of those
+                            # Add the variable name to the set of those
                             # already processed
-                            usedVariableNames.append(variableName)
+                            usedVariableNames.add(variableName)
 
                             # Check if the type is a character or integer
                             # (signed or unsigned)
                             if baseType == "character" or baseType == "signed integer" or baseType == "unsigned integer":
+                                # Check if the variable is an array swapped by
+                                # the array swap function
+                                if isArraySwap:
+                                    # Add the source code to call the def to
+                                    # swap the bytes of all of the variable's
+                                    # array members (including those of every
+                                    # dimension) in a single loop
+                                    swapFile.writeLn("   swap_array_" + str(swapWidth) + "(inPtr->" + variableName + ", outPtr->" + variableName + ", sizeof(inPtr->" + variableName + ") / " + str(swapWidth) + ");")
                                 # Check if the variable is an array
-                                if isArray:
+                                elif isArray:
                                     # Check if the variable 'i' hasn't already
                                     # been defined in the file
                                     if not isIDefined:
@@ -596,26 +651,34 @@ def makeSwapFile(baseFileName):
                                         # defined and output its definition to
                                         # the file
                                         isIDefined = True
-                                        ccdd.writeToFileLn(swapFile, "   int i = 0;")
+                                        swapFile.writeLn("   int i = 0;")
 
                                     # Add the source code to call the
                                     # appropriate def to swap the bytes in:
                                     # each of the variable's array members
-                                    ccdd.writeToFileLn(swapFile, "   for (i = 0; i < " + arraySize + "; i++)")
-                                    ccdd.writeToFileLn(swapFile, "   {")
-                                    ccdd.writeToFileLn(swapFile, "      outPtr->" + variableName + "[i] = " + byteSwap + "(inPtr->" + variableName + "[i]);")
-                                    ccdd.writeToFileLn(swapFile, "   }")
+                                    swapFile.writeLn("   for (i = 0; i < " + arraySize + "; i++)")
+                                    swapFile.writeLn("   {")
+                                    swapFile.writeLn("      outPtr->" + variableName + "[i] = " + byteSwap + "(inPtr->" + variableName + "[i]);")
+                                    swapFile.writeLn("   }")
                                 # The variable isn't an array
                                 else:
                                     # Add the source code to call the
                                     # appropriate
                                     # def to swap the variable's bytes:
-                                    ccdd.writeToFileLn(swapFile, "   outPtr->" + variableName + " = " + byteSwap + "(inPtr->" + variableName + ");")
+                                    swapFile.writeLn("   outPtr->" + variableName + " = " + byteSwap + "(inPtr->" + variableName + ");")
                             # Check if the variable is a 'float, 'double', or
                             # pointer
                             elif baseType == "floating point" or baseType == "pointer":
+                                # Check if the variable is an array swapped by
+                                # the array swap function
+                                if isArraySwap:
+                                    # Add the source code to call the def to
+                                    # swap the bytes of all of the variable's
+                                    # array members (including those of every
+                                    # dimension) in a single loop
+                                    swapFile.writeLn("   swap_array_" + str(swapWidth) + "(inPtr->" + variableName + ", outPtr->" + variableName + ", sizeof(inPtr->" + variableName + ") / " + str(swapWidth) + ");")
                                 # Check if the variable is an array
-                                if isArray:
+                                elif isArray:
                                     # Check if the variable 'i' hasn't already
                                     # been defined in the file
                                     if not isIDefined:
@@ -623,21 +686,21 @@ def makeSwapFile(baseFileName):
                                         # defined and output its definition to
                                         # the file
                                         isIDefined = True
-                                        ccdd.writeToFileLn(swapFile, "   int i = 0;")
+                                        swapFile.writeLn("   int i = 0;")
 
                                     # Add the source code to call the
                                     # appropriate def to swap the bytes in:
                                     # each of the variable's array members
-                                    ccdd.writeToFileLn(swapFile, "   for (i = 0; i < " + arraySize + "; i++)")
-                                    ccdd.writeToFileLn(swapFile, "   {")
-                                    ccdd.writeToFileLn(swapFile, "      " + byteSwap + "(&(inPtr->" + variableName + "[i]), &(outPtr->" + variableName + "[i]));")
-                                    ccdd.writeToFileLn(swapFile, "   }")
+                                    swapFile.writeLn("   for (i = 0; i < " + arraySize + "; i++)")
+                                    swapFile.writeLn("   {")
+                                    swapFile.writeLn("      " + byteSwap + "(&(inPtr->" + variableName + "[i]), &(outPtr->" + variableName + "[i]));")
+                                    swapFile.writeLn("   }")
                                 # The variable isn't an array
                                 else:
                                     # Add the source code to call the
                                     # appropriate def to swap the:
                                     # variable's bytes
-                                    ccdd.writeToFileLn(swapFile, "   " + byteSwap + "(&(inPtr->" + variableName + "), &(outPtr->" + variableName + "));")
+                                    swapFile.writeLn("   " + byteSwap + "(&(inPtr->" + variableName + "), &(outPtr->" + variableName + "));")
                             # The variable is a structure
                             else:
                                 # Check if the variable is an array
@@ -649,35 +712,35 @@ def makeSwapFile(baseFileName):
                                         # defined and output its definition to
                                         # the file
                                         isIDefined = True
-                                        ccdd.writeToFileLn(swapFile, "   int i = 0;")
+                                        swapFile.writeLn("   int i = 0;")
 
                                     # Add the source code to call the
                                     # appropriate def to swap the bytes in:
                                     # each of the variable's array members
-                                    ccdd.writeToFileLn(swapFile, "   for (i = 0; i < " + arraySize + "; i++)")
-                                    ccdd.writeToFileLn(swapFile, "   {")
-                                    ccdd.writeToFileLn(swapFile, "      byte_swap_" + dataType + "(&(inPtr->" + variableName + "[i]), &(outPtr->" + variableName + "[i]),direction);")
-                                    ccdd.writeToFileLn(swapFile, "   }")
+                                    swapFile.writeLn("   for (i = 0; i < " + arraySize + "; i++)")
+                                    swapFile.writeLn("   {")
+                                    swapFile.writeLn("      byte_swap_" + dataType + "(&(inPtr->" + variableName + "[i]), &(outPtr->" + variableName + "[i]),direction);")
+                                    swapFile.writeLn("   }")
                                 # The variable isn't an array
                                 else:
                                     # Add the source code to call the
                                     # appropriate def to swap the:
                                     # variable's bytes
-                                    ccdd.writeToFileLn(swapFile, "   byte_swap_" + dataType + "(&(inPtr->" + variableName + "), &(outPtr->" + variableName + "), direction);")
+                                    swapFile.writeLn("   byte_swap_" + dataType + "(&(inPtr->" + variableName + "), &(outPtr->" + variableName + "), direction);")
 
-            # Check if the structure has a bit field variable
-            if hasBitField[structIndex]:
-                # Add the source code to call the def to swap the bit:
-                # field(s) within the structure
-                ccdd.writeToFileLn(swapFile, "   bit_swap_" + structureName + "(inPtr, outPtr, direction); /* Swap all bit fields in this structure */")
+                # Check if the structure has a bit field variable
+                if hasBitField[structIndex]:
+                    # Add the source code to call the def to swap the bit:
+                    # field(s) within the structure
+                    swapFile.writeLn("   bit_swap_" + structureName + "(inPtr, outPtr, direction); /* Swap all bit fields in this structure */")
 
-            # Add the source code to terminate this structure's byte swap
-            # function
-            ccdd.writeToFileLn(swapFile, "} /* End of byte_swap_" + structureName + "(" + structureName + " *inPtr, " + structureName + " *outPtr, int direction) */")
+                # Add the source code to terminate this structure's byte swap
+                # function
+                swapFile.writeLn("} /* End of byte_swap_" + structureName + "(" + structureName + " *inPtr, " + structureName + " *outPtr, int direction) */")
 
         # Step through each structure name
         for structIndex in range(len(structureNames)):
-            usedVariableNames = []
+            usedVariableNames = OrderedSet()
             lastBitFieldType = "none"
             curFilledBits = 0
             maxBitsAvailable = 0
@@ -689,169 +752,165 @@ def makeSwapFile(baseFileName):
             if hasBitField[structIndex]:
                 # Begin building the def to bit swap the structure's bit:
                 # field variables
-                ccdd.writeToFileLn(swapFile, "")
-                ccdd.writeToFileLn(swapFile, "/* inPtr and outPtr are pointers to the input and output data. 'direction' is a flag for if the conversion ")
-                ccdd.writeToFileLn(swapFile, "   is from foreign-to-local endian (direction = 1), or from native to foreign byte order (direction = 0) */")
-                ccdd.writeToFileLn(swapFile, "inline void bit_swap_" + structureName + "(" + structureName + " *inPtr, " + structureName + " *outPtr, int direction)")
-                ccdd.writeToFileLn(swapFile, "{")
-
-                # Step through each row in the table
-                for row in range(numStructRows):
-                    # Check if the structure name in the row matches the
-                    # current structure
-                    if structureNames[structIndex] == ccdd.getStructureTableNameByRow(row):
-                        # Get the variable name for this row in the structure
-                        variableName = ccdd.getStructureVariableName(row)
-
-                        # Get the variable's path and use it to get the byte
-                        # offset
-                        variablePath = structureNames[structIndex] + "," + ccdd.getStructureDataType(row) + "." + ccdd.getStructureVariableName(row)
-                        varOffset = ccdd.getVariableOffset(variablePath)
-
-                        # Check if this is not an array member; array
-                        # definitions are output, but not members
-                        if not variableName.endswith("]"):
-                            isFound = False
-
-                            # Step through each name in the array of already
-                            # processed variable names
-                            for index in range(len(usedVariableNames)):
-                                # Check if the target name matches the array
-                                # name
-                                if usedVariableNames[index] == variableName:
-                                    # Match found; set the flag and stop
-                                    # searching
-                                    isFound = True
-                                    break
-
-                            # Get the variable's data type, bit length, and
-                            # array size
-                            dataType = ccdd.getStructureDataType(row)
-                            bitLength = ccdd.getStructureBitLength(row)
-                            arraySize = ccdd.getStructureArraySize(row)
-
-                            # Flag that's 'true' if it's an array
-                            isArray = arraySize != ""
-
-                            for index in range(len(usedVariableNames)):
-                                # Check if the target name matches the array
-                                # name
-                                if usedVariableNames[index] == variableName:
-                                    # Match found; set the flag and stop
-                                    # searching
-                                    isFound = True
-                                    break
-
-                            # Check if the variable name hasn't already been
-                            # processed; this is necessary to prevent
-                            # duplicating the members in the type definition
-                            # for a structure that is referenced as an array
-                            if not isFound:
-                                # Add the variable to the list of those
-                                # processed
-                                usedVariableNames.append(variableName)
-
-                                # Check if the variable has a bit length
-                                if bitLength:
-                                    # Check if the data type of the variable
-                                    # differs from the previous one or if the
-                                    # variable's bits won't fit within the
-                                    # current packing space
-                                    if lastBitFieldType != dataType or (curFilledBits + int(bitLength) > maxBitsAvailable):
-                                        # Get the variable's size in bytes
-                                        byteSize = ccdd.getDataTypeSizeInBytes(dataType)
-
-                                        # Check if a bit swap call was made in
-                                        # the structure
-                                        if lastBitFieldString is not None:
-                                            # Create the code to reverse the
-                                            # packed bits following a bit swap
-                                            # if the direction is from native
-                                            # to foreign byte order
-                                            ccdd.writeToFileLn(swapFile, "   if (!direction)")
-                                            ccdd.writeToFileLn(swapFile, "   {")
-                                            ccdd.writeToFileLn(swapFile, "      " + lastBitFieldString)
-                                            ccdd.writeToFileLn(swapFile, "   }")
-
-                                        # Create the code to reverse the packed
-                                        # bits prior to a bit swap if the
-                                        # direction is from foreign to local
-                                        # endian
-                                        lastBitFieldString = "reflect_bits(&(((char*)(inPtr))[" + str(varOffset) + "]), " + str(byteSize) + ");"
-                                        curFilledBits = int(bitLength)
-                                        lastBitFieldType = dataType
-                                        maxBitsAvailable = 8 * byteSize
-                                        ccdd.writeToFileLn(swapFile, "   if (direction)")
-                                        ccdd.writeToFileLn(swapFile, "   {")
-                                        ccdd.writeToFileLn(swapFile, "      " + lastBitFieldString)
-                                        ccdd.writeToFileLn(swapFile, "   }")
-                                    # The data types match and the bits will
-                                    # pack together
-                                    else:
-                                        # Add this variable's bits to the
-                                        # current pack
-                                        curFilledBits = curFilledBits + int(bitLength)
-
-                                    # Check if the bit length is greater than 1
-                                    if bitLength != "1":
-                                        ccdd.writeToFileLn(swapFile, "   outPtr->" + variableName + " = bit_field_swap(inPtr->" + variableName + ", " + bitLength + ");")
-                                # Check if the data type is a primitive
-                                elif ccdd.isDataTypePrimitive(dataType):
-                                    lastBitFieldType = "none"
-                                # The data type is a structure
+                swapFile.writeLn("")
+                swapFile.writeLn("/* inPtr and outPtr are pointers to the input and output data. 'direction' is a flag for if the conversion ")
+                swapFile.writeLn("   is from foreign-to-local endian (direction = 1), or from native to foreign byte order (direction = 0) */")
+                swapFile.writeLn("inline void bit_swap_" + structureName + "(" + structureName + " *inPtr, " + structureName + " *outPtr, int direction)")
+                swapFile.writeLn("{")
+
+                # Step through each row belonging to the structure
+                for row in structureRows.getRows(structureName):
+                    # Get the variable name for this row in the structure
+                    variableName = structureData.getVariableName(row)
+
+                    # Get the variable's byte offset within its structure
+                    varOffset = structureData.getVariableOffset(row)
+
+                    # Check if this is not an array member; array
+                    # definitions are output, but not members
+                    if not variableName.endswith("]"):
+                        # Get the variable's data type, bit length, and
+                        # array size
+                        dataType = structureData.getDataType(row)
+                        bitLength = structureData.getBitLength(row)
+                        arraySize = structureData.getArraySize(row)
+
+                        # Flag that's 'true' if it's an array
+                        isArray = arraySize != ""
+
+                        # Add the variable to the set of those processed,
+                        # and check if it hasn't already been processed;
+                        # this is necessary to prevent duplicating the
+                        # members in the type definition for a structure
+                        # that is referenced as an array
+                        if usedVariableNames.add(variableName):
+
+                            # Check if the variable has a bit length
+                            if bitLength:
+                                # Check if the data type of the variable
+                                # differs from the previous one or if the
+                                # variable's bits won't fit within the
+                                # current packing space
+                                if lastBitFieldType != dataType or (curFilledBits + macroExpander.getInteger(bitLength) > maxBitsAvailable):
+                                    # Get the variable's size in bytes
+                                    byteSize = ccdd.getDataTypeSizeInBytes(dataType)
+
+                                    # Check if a bit swap call was made in
+                                    # the structure
+                                    if lastBitFieldString is not None:
+                                        # Create the code to reverse the
+                                        # packed bits following a bit swap
+                                        # if the direction is from native
+                                        # to foreign byte order
+                                        swapFile.writeLn("   if (!direction)")
+                                        swapFile.writeLn("   {")
+                                        swapFile.writeLn("      " + lastBitFieldString)
+                                        swapFile.writeLn("   }")
+
+                                    # Create the code to reverse the packed
+                                    # bits prior to a bit swap if the
+                                    # direction is from foreign to local
+                                    # endian
+                                    lastBitFieldString = "reflect_bits(&(((char*)(inPtr))[" + str(varOffset) + "]), " + str(byteSize) + ");"
+                                    curFilledBits = macroExpander.getInteger(bitLength)
+                                    lastBitFieldType = dataType
+                                    maxBitsAvailable = 8 * byteSize
+                                    swapFile.writeLn("   if (direction)")
+                                    swapFile.writeLn("   {")
+                                    swapFile.writeLn("      " + lastBitFieldString)
+                                    swapFile.writeLn("   }")
+                                # The data types match and the bits will
+                                # pack together
                                 else:
-                                    lastBitFieldType = "none"
-
-                                    # Step through each structure name
-                                    for index in range(len(structureNames)):
-                                        # Check if the structure names match
-                                        if dataType == structureNames[index]:
-                                            # Check if the target structure
-                                            # includes a bit field variable
-                                            if hasBitField[index]:
-                                                # Check if the variable is an
-                                                # array
-                                                if isArray:
-                                                    # Add the source code to
-                                                    # call the appropriate
-                                                    # def to swap the bits:
-                                                    # in each of the variable's
-                                                    # array members
-                                                    ccdd.writeToFileLn(swapFile, "   for (i = 0; i < " + arraySize + "; i++)")
-                                                    ccdd.writeToFileLn(swapFile, "   {")
-                                                    ccdd.writeToFileLn(swapFile, "      bit_swap_" + dataType + "(&(inPtr->" + variableName + "[i]), &(outPtr->" + variableName + "[i]));")
-                                                    ccdd.writeToFileLn(swapFile, "   }")
-                                                # The variable isn't an array
-                                                else:
-                                                    # Add the source code to
-                                                    # call the appropriate
-                                                    # def to swap the:
-                                                    # variable's bits
-                                                    ccdd.writeToFileLn(swapFile, "   bit_swap_" + dataType + "(&(inPtr->" + variableName + "), &(outPtr->" + variableName + "));")
-
-                                            # Stop searching since the target
-                                            # structure has found
-                                            break
+                                    # Add this variable's bits to the
+                                    # current pack
+                                    curFilledBits = curFilledBits + macroExpander.getInteger(bitLength)
+
+                                # Check if the bit length is greater than 1
+                                if bitLength != "1":
+                                    swapFile.writeLn("   outPtr->" + variableName + " = bit_field_swap(inPtr->" + variableName + ", " + bitLength + ");")
+                            # Check if the data type is a primitive
+                            elif ccdd.isDataTypePrimitive(dataType):
+                                lastBitFieldType = "none"
+                            # The data type is a structure
+                            else:
+                                lastBitFieldType = "none"
+
+                                # Step through each structure name
+                                for index in range(len(structureNames)):
+                                    # Check if the structure names match
+                                    if dataType == structureNames[index]:
+                                        # Check if the target structure
+                                        # includes a bit field variable
+                                        if hasBitField[index]:
+                                            # Check if the variable is an
+                                            # array
+                                            if isArray:
+                                                # Add the source code to
+                                                # call the appropriate
+                                                # def to swap the bits:
+                                                # in each of the variable's
+                                                # array members
+                                                swapFile.writeLn("   for (i = 0; i < " + arraySize + "; i++)")
+                                                swapFile.writeLn("   {")
+                                                swapFile.writeLn("      bit_swap_" + dataType + "(&(inPtr->" + variableName + "[i]), &(outPtr->" + variableName + "[i]));")
+                                                swapFile.writeLn("   }")
+                                            # The variable isn't an array
+                                            else:
+                                                # Add the source code to
+                                                # call the appropriate
+                                                # def to swap the:
+                                                # variable's bits
+                                                swapFile.writeLn("   bit_swap_" + dataType + "(&(inPtr->" + variableName + "), &(outPtr->" + variableName + "));")
+
+                                        # Stop searching since the target
+                                        # structure has found
+                                        break
 
                 # Check if a bit swap call was made in the structure
                 if lastBitFieldString is not None:
                     # Create the code to reverse the packed bits following a
                     # bit swap if the direction is from native to foreign byte
                     # order
-                    ccdd.writeToFileLn(swapFile, "   if (!direction)")
-                    ccdd.writeToFileLn(swapFile, "   {")
-                    ccdd.writeToFileLn(swapFile, "      " + lastBitFieldString)
-                    ccdd.writeToFileLn(swapFile, "   }")
+                    swapFile.writeLn("   if (!direction)")
+                    swapFile.writeLn("   {")
+                    swapFile.writeLn("      " + lastBitFieldString)
+                    swapFile.writeLn("   }")
 
                 # Add the source code to terminate this structure's bit swap
                 # function
-                ccdd.writeToFileLn(swapFile, "} /* End of bit_swap_" + structureName + "(" + structureName + " *inPtr, " + structureName + " *outPtr, int direction) */")
+                swapFile.writeLn("} /* End of bit_swap_" + structureName + "(" + structureName + " *inPtr, " + structureName + " *outPtr, int direction) */")
 
-        ccdd.closeFile(swapFile)
+        swapFile.close()
     # The swap file failed to open
     else:
         # Display an error dialog
         ccdd.showErrorDialog("<html><b>Error opening byte/bit swap output file '</b>" + swapFileName + "<b>'")
+#******************************************************************************
+# Check if the specified option data field is set to "true". The data field is
+# found in the first group associated with the script, or, if not found there,
+# in the first root structure table
+#
+# @param fieldName
+#            data field name
+#
+# @return True if the data field exists and is set to "true"
+#******************************************************************************
+def isOptionSet(fieldName):
+    value = None
+
+    # Get the group(s) associated with the script (if any)
+    groupNames = ccdd.getAssociatedGroupNames()
+
+    # Check if a group is associated with the script
+    if len(groupNames) != 0:
+        value = dataFields.getGroupDataFieldValue(groupNames[0], fieldName)
+
+    # Check if the data field wasn't found in the group
+    if value is None or not value:
+        value = dataFields.getTableDataFieldValue(ccdd.getRootStructureTableNames()[0], fieldName)
+
+    return value is not None and value.strip().lower() == "true"
 #** End functions *************************************************************
 
 #** Main **********************************************************************
@@ -870,12 +929,12 @@ try:
         # Check if a group is associated with the script
         if len(groupNames) != 0:
             # Get the value of the first group's 'System' data field, if present
-            systemName = ccdd.getGroupDataFieldValue(groupNames[0], "System")
+            systemName = dataFields.getGroupDataFieldValue(groupNames[0], "System")
     
         # Check if the system name wasn't found in the group data field
         if systemName is None or not systemName:
             # Get the value of the first root structure's 'System' data field
-            systemName = ccdd.getTableDataFieldValue(ccdd.getRootStructureTableNames()[0], "System")
+            systemName = dataFields.getTableDataFieldValue(ccdd.getRootStructureTableNames()[0], "System")
     
         # Check if the data field doesn't exist in either a group or table
         if systemName == None:
@@ -887,7 +946,7 @@ try:
         # Output the types header and byte-/bit-swap files
         makeHeaders(baseFileName)
             
-        makeSwapFile(baseFileName)
+        makeSwapFile(baseFileName, isOptionSet("TableDrivenSwap"))
     # No structure data is supplied
     else:
         # Display an error dialog
@@ -895,3 +954,7 @@ try:
 
 except:
     raise Exception(traceback.format_exc())
+
+finally:
+    # Close any output files that remain open (e.g., due to an error)
+    output.closeOpenFiles()
@@ -15,7 +15,9 @@ import java.awt.Color;
 import java.awt.Component;
 import java.util.ArrayList;
 import java.util.Arrays;
+import java.util.HashMap;
 import java.util.List;
+import java.util.Map;
 import java.util.regex.Matcher;
 import java.util.regex.Pattern;
 
@@ -56,6 +58,12 @@ public class CcddMacroHandler
     // the macro value
     private List<String> expandedMacroValues;
 
+    // Map containing the expanded text strings, keyed by the unexpanded text. Unless a macro's
+    // value definition changes the expanded text remains the same. Using the stored text saves the
+    // time needed to parse and reevaluate text that is expanded repeatedly (e.g., array sizes and
+    // bit lengths)
+    private Map<String, String> expandedTexts;
+
     // Macro name pattern
     private final Pattern macroPattern;
 
@@ -274,12 +282,14 @@ public class CcddMacroHandler
     }
 
     /**********************************************************************************************
-     * Clear the list of expanded macro values. This should be done following any change to a
-     * macro's unexpanded value so that the unexpanded value is reevaluated when next requested
+     * Clear the list of expanded macro values and the stored expanded text strings. This should be
+     * done following any change to a macro's unexpanded value so that the unexpanded value is
+     * reevaluated when next requested
      *********************************************************************************************/
     protected void clearStoredValues()
     {
         expandedMacroValues = new ArrayList<String>(macros.size());
+        expandedTexts = new HashMap<String, String>();
 
         // Initialize the expanded macro values to null
         for (int index = 0; index < macros.size(); index++)
@@ -693,8 +703,19 @@ public class CcddMacroHandler
         String expandedText;
         int lastEnd = 0;
 
+        // Set the flag to indicate if the expanded text can be stored. Text isn't stored if there
+        // are data type constraints or if it contains a sizeof() call, since a data type's size
+        // can change independently of the macros
+        boolean isStorable = validDataTypes == null && !CcddVariableHandler.hasSizeof(text);
+
+        // Check if the text can be stored and has already been expanded
+        if (isStorable && expandedTexts.containsKey(text))
+        {
+            // Get the stored expanded text
+            expandedText = expandedTexts.get(text);
+        }
         // Check if the text string contains a macro or sizeof() call
-        if (hasMacro(text) || CcddVariableHandler.hasSizeof(text))
+        else if (hasMacro(text) || CcddVariableHandler.hasSizeof(text))
         {
             expandedText = "";
             this.validDataTypes = validDataTypes;
@@ -757,8 +778,8 @@ public class CcddMacroHandler
                     // Check if the text is a valid mathematical expression
                     if (exprResult != null)
                     {
-                        // Set the value to expression result
-                        expandedText = String.valueOf((int) ((double) exprResult));
+                        // Append the expression result and a comma to the text
+                        multiText += String.valueOf((int) ((double) exprResult)) + ",";
                     }
                     // The substring isn't an expression
                     else
@@ -779,6 +800,13 @@ public class CcddMacroHandler
                 }
             }
 
+            // Check if the text can be stored and doesn't contain a recursive reference
+            if (isStorable && !isMacroRecursive)
+            {
+                // Store the expanded text so that it isn't reevaluated when next requested
+                expandedTexts.put(text, expandedText);
+            }
+
             // Reset the valid data types so this list doesn't inadvertently affect macro checks
             // where there is no data type constraint
             this.validDataTypes = null;
@@ -3696,6 +3696,53 @@ public class CcddScriptDataAccessHandler
         return fieldValues.toArray(new String[0][0]);
     }
 
+    /**********************************************************************************************
+     * Get the value of every data field belonging to the tables referenced in the table data and
+     * to the groups. This provides the means for a script to obtain the table and group data field
+     * values using a single call in place of a call for each owner and field
+     *
+     * @return Array containing the owner type ("Table" or "Group"), owner name, field name, and
+     *         field value for each data field; returns an empty array if no table or group has a
+     *         data field
+     *********************************************************************************************/
+    public String[][] getAllDataFieldValues()
+    {
+        List<String[]> fieldValues = new ArrayList<String[]>();
+
+        // Step through every table of every type referenced in the table data
+        for (String tableName : getTableNames())
+        {
+            // Step through each data field associated with the table
+            for (FieldInformation fieldInfo : fieldHandler.getFieldInformationByOwner(tableName))
+            {
+                // Add the table name, field name, and field value to the list
+                fieldValues.add(new String[] {"Table",
+                                              tableName,
+                                              fieldInfo.getFieldName(),
+                                              getDataFieldValue(tableName, fieldInfo.getFieldName())});
+            }
+        }
+
+        // Step through every group
+        for (String groupName : getGroupNames(false))
+        {
+            // Get the group's data field owner name
+            String ownerName = CcddFieldHandler.getFieldGroupName(groupName);
+
+            // Step through each data field associated with the group
+            for (FieldInformation fieldInfo : fieldHandler.getFieldInformationByOwner(ownerName))
+            {
+                // Add the group name, field name, and field value to the list
+                fieldValues.add(new String[] {"Group",
+                                              groupName,
+                                              fieldInfo.getFieldName(),
+                                              getDataFieldValue(ownerName, fieldInfo.getFieldName())});
+            }
+        }
+
+        return fieldValues.toArray(new String[0][0]);
+    }
+
     /**********************************************************************************************
      * Get the value for the specified table's specified data field
      *
@@ -3907,6 +3954,228 @@ public class CcddScriptDataAccessHandler
         return getTableData(TYPE_STRUCTURE, columnName, row);
     }
 
+    /**********************************************************************************************
+     * Get the structure table data arranged by column, with any macro replaced by its
+     * corresponding value. This provides the means for a script to obtain the contents of every
+     * structure table row using a single call in place of a call for each row and column. The
+     * columns of every structure table type referenced in the data are included; columns in
+     * different structure table types having the same name (case insensitive) are combined. These
+     * are followed by columns that are derived from the table data; the names of the derived
+     * columns begin with an '@' so that they can't be confused with a table column:
+     * <ul>
+     * <li>@table name - the prototype structure table name (see getStructureTableNameByRow)
+     * <li>@table path - the structure table path (see getStructurePathByRow)
+     * <li>@table type - the structure table type name (see getStructureTypeNameByRow)
+     * <li>@variable name - the variable name (see getStructureVariableName)
+     * <li>@data type - the data type (see getStructureDataType)
+     * <li>@array size - the array size (see getStructureArraySize)
+     * <li>@bit length - the bit length (see getStructureBitLength)
+     * <li>@description - the description (see getStructureDescription)
+     * <li>@units - the units (see getStructureUnits)
+     * <li>@enumeration - the first enumeration (see getStructureEnumerations); null if the table
+     * type has no enumeration column
+     * <li>@rates - the rates (see getStructureRates), separated by a comma and a space
+     * <li>@full variable name - the variable's full name, with the variables in the structure path
+     * separated by underscores (see getFullVariableName)
+     * <li>@variable offset - the variable's byte offset within its prototype structure. For an
+     * array definition this is the offset of the array's first member
+     * </ul>
+     *
+     * @return Array containing the structure table data columns. The first element of each column
+     *         array is the column name; the remaining elements are the column's value for each row
+     *         of the structure table data, in row order. The value is null if the column doesn't
+     *         exist in the row's table type. An empty array is returned if there is no structure
+     *         table data
+     *********************************************************************************************/
+    public String[][] getStructureTableColumns()
+    {
+        List<String[]> columns = new ArrayList<String[]>();
+        int numRows = getStructureTableNumRows();
+
+        // Check if there is any structure table data
+        if (numRows != 0)
+        {
+            List<String> columnNames = new ArrayList<String>();
+            List<String> typeNames = new ArrayList<String>();
+
+            // Step through each row in the structure table data
+            for (int row = 0; row < numRows; row++)
+            {
+                // Get the name of the table type referenced by the row
+                String typeName = getStructureTypeNameByRow(row);
+
+                // Check if the columns for this table type haven't already been added
+                if (!typeNames.contains(typeName))
+                {
+                    typeNames.add(typeName);
+
+                    // Step through each column in the table type
+                    for (String columnName : getStructureTableColumnNames(row))
+                    {
+                        boolean isFound = false;
+
+                        // Step through the column names already added
+                        for (String name : columnNames)
+                        {
+                            // Check if the column name matches; ignore case sensitivity
+                            if (name.equalsIgnoreCase(columnName))
+                            {
+                                // Set the flag to indicate the column is already included and
+                                // stop searching
+                                isFound = true;
+                                break;
+                            }
+                        }
+
+                        // Check if the column isn't already included
+                        if (!isFound)
+                        {
+                            columnNames.add(columnName);
+                        }
+                    }
+                }
+            }
+
+            // Step through each table column
+            for (String columnName : columnNames)
+            {
+                String[] column = new String[numRows + 1];
+                column[0] = columnName;
+
+                // Step through each row in the structure table data
+                for (int row = 0; row < numRows; row++)
+                {
+                    // Store the column value for this row
+                    column[row + 1] = getStructureTableData(columnName, row);
+                }
+
+                columns.add(column);
+            }
+
+            // Create the derived columns
+            String[] tableName = new String[numRows + 1];
+            String[] tablePath = new String[numRows + 1];
+            String[] tableType = new String[numRows + 1];
+            String[] variableName = new String[numRows + 1];
+            String[] dataType = new String[numRows + 1];
+            String[] arraySize = new String[numRows + 1];
+            String[] bitLength = new String[numRows + 1];
+            String[] description = new String[numRows + 1];
+            String[] units = new String[numRows + 1];
+            String[] enumeration = new String[numRows + 1];
+            String[] rates = new String[numRows + 1];
+            String[] fullName = new String[numRows + 1];
+            String[] offset = new String[numRows + 1];
+            tableName[0] = "@table name";
+            tablePath[0] = "@table path";
+            tableType[0] = "@table type";
+            variableName[0] = "@variable name";
+            dataType[0] = "@data type";
+            arraySize[0] = "@array size";
+            bitLength[0] = "@bit length";
+            description[0] = "@description";
+            units[0] = "@units";
+            enumeration[0] = "@enumeration";
+            rates[0] = "@rates";
+            fullName[0] = "@full variable name";
+            offset[0] = "@variable offset";
+
+            // Step through each row in the structure table data
+            for (int row = 0; row < numRows; row++)
+            {
+                tableName[row + 1] = getStructureTableNameByRow(row);
+                tablePath[row + 1] = getStructurePathByRow(row);
+                tableType[row + 1] = getStructureTypeNameByRow(row);
+                variableName[row + 1] = getStructureVariableName(row);
+                dataType[row + 1] = getStructureDataType(row);
+                arraySize[row + 1] = getStructureArraySize(row);
+                bitLength[row + 1] = getStructureBitLength(row);
+                description[row + 1] = getStructureDescription(row);
+                units[row + 1] = getStructureUnits(row);
+                rates[row + 1] = CcddUtilities.convertArrayToString(getStructureRates(row));
+                fullName[row + 1] = getFullVariableName(row);
+
+                // Get the enumerations for this row
+                String[] enumerations = getStructureEnumerations(row);
+
+                // Check if the row's table type has an enumeration column
+                if (enumerations.length != 0)
+                {
+                    // Store the first enumeration
+                    enumeration[row + 1] = enumerations[0];
+                }
+
+                // Check if the row has a variable name and data type
+                if (variableName[row + 1] != null && dataType[row + 1] != null)
+                {
+                    // Build the variable's path within its prototype structure
+                    String variablePath = tableName[row + 1]
+                                          + ","
+                                          + dataType[row + 1]
+                                          + "."
+                                          + variableName[row + 1];
+
+                    // Check if the row is an array definition
+                    if (arraySize[row + 1] != null
+                        && !arraySize[row + 1].isEmpty()
+                        && !variableName[row + 1].endsWith("]"))
+                    {
+                        // Step through each of the array's dimensions
+                        for (int index = 0; index < arraySize[row + 1].split(",").length; index++)
+                        {
+                            // Add the dimension for the array's first member
+                            variablePath += "[0]";
+                        }
+                    }
+
+                    // Store the variable's byte offset within its prototype structure
+                    offset[row + 1] = String.valueOf(getVariableOffset(variablePath));
+                }
+            }
+
+            columns.add(tableName);
+            columns.add(tablePath);
+            columns.add(tableType);
+            columns.add(variableName);
+            columns.add(dataType);
+            columns.add(arraySize);
+            columns.add(bitLength);
+            columns.add(description);
+            columns.add(units);
+            columns.add(enumeration);
+            columns.add(rates);
+            columns.add(fullName);
+            columns.add(offset);
+        }
+
+        return columns.toArray(new String[0][0]);
+    }
+
+    /**********************************************************************************************
+     * Get the full names of the variables in every row of the structure table data. Each full name
+     * includes the variables in the structure path separated by the specified separator
+     * character(s), and has the data types removed (see getFullVariableName)
+     *
+     * @param varPathSeparator
+     *            character(s) to place between variable path members
+     *
+     * @return Array containing the full name of the variable in each row of the structure table
+     *         data, in row order; a name is blank if the row doesn't contain a variable
+     *********************************************************************************************/
+    public String[] getFullVariableNames(String varPathSeparator)
+    {
+        String[] fullNames = new String[getStructureTableNumRows()];
+
+        // Step through each row in the structure table data
+        for (int row = 0; row < fullNames.length; row++)
+        {
+            // Store the variable's full name
+            fullNames[row] = getFullVariableName(row, varPathSeparator);
+        }
+
+        return fullNames;
+    }
+
     /**********************************************************************************************
      * Get the command table data at the row and column indicated, with any macro replaced by its
      * corresponding value. The column is specified by name. Convenience method that assumes the